@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+r"""Benchmark the Deep Research graph offline with fake models and search.
+
+Runs the compiled deep_researcher graph end to end without calling any
+model provider or search API:
+
+- every chat model is replaced by a deterministic fake with a fixed
+  latency and output size, which delegates a fixed number of research
+  units, runs a fixed number of searches per unit and writes the report
+- search goes through a local MCP server exposing a fake
+  GoogleWebSearchTool that returns pages of a fixed length after a delay
+
+The graph is run for every combination of the matrix options and the
+report shows, per combination, runs/sec, p50/p99 run latency, model and
+tool calls per run and peak memory. With zero model and search latency
+the numbers measure the orchestration overhead of the graph itself.
+
+Usage (from the deep-research directory):
+
+    python -m benchmarks.graph_benchmark
+    python -m benchmarks.graph_benchmark --units 1,4,8 --iterations 1,3 \
+        --content-length 2000,50000 --runs 10 --parallel-runs 2
+    python -m benchmarks.graph_benchmark --llm-latency-ms 0 --search-latency-ms 0 --json
+
+Pass --trace-memory to measure peak Python heap allocations with
+tracemalloc; it slows every run down, so latencies measured with it are
+not comparable to those measured without it.
+"""
+
+import argparse
+import asyncio
+import gc
+import hashlib
+import itertools
+import json
+import logging
+import os
+import resource
+import socket
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Sequence
+
+import uvicorn
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from mcp.server.fastmcp import FastMCP
+
+import agent.model_pool
+from agent.graph import build_graph
+from agent.model_pool import get_model_pool
+from agent.utils import invalidate_tool_registry
+
+FAKE_MODEL = "openai:gpt-4.1"
+
+# Settings the benchmark controls; environment overrides would skew the matrix
+CONTROLLED_SETTINGS = (
+    "allow_clarification",
+    "max_concurrent_research_units",
+    "max_researcher_iterations",
+    "max_react_tool_calls",
+    "max_content_length",
+    "summary_cache_max_entries",
+    "summary_cache_path",
+    "final_report_mode",
+    "enable_run_trace",
+    "run_trace_dir",
+    "research_model",
+    "compression_model",
+    "final_report_model",
+    "summarization_model",
+)
+
+STRUCTURED_OUTPUTS = {"ClarifyWithUser", "ResearchQuestion", "Summary", "ReportOutline"}
+
+
+def fake_text(seed: str, words: int) -> str:
+    """Deterministic filler text of a given number of words."""
+    digest = hashlib.sha256(seed.encode()).hexdigest()
+    vocabulary = [digest[i:i + 6] for i in range(0, len(digest) - 6, 3)]
+    return " ".join(vocabulary[i % len(vocabulary)] for i in range(words))
+
+
+def first_human_text(messages: Sequence[BaseMessage]) -> str:
+    """Content of the first human message in a conversation."""
+    for message in messages:
+        if isinstance(message, HumanMessage):
+            return str(message.content)
+    return ""
+
+
+class FakeResearchModel(BaseChatModel):
+    """Deterministic chat model that plays every role in the graph.
+
+    The role is inferred from the bound tools: the supervisor delegates
+    research_units topics and then completes, researchers call
+    WebSearchTool searches_per_unit times and then stop, structured output
+    calls return a fixed instance of the schema, and everything else gets
+    output_tokens words of text.
+    """
+
+    latency_seconds: float = 0.0
+    output_tokens: int = 200
+    research_units: int = 3
+    searches_per_unit: int = 2
+    tool_names: List[str] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-research-model"
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> "FakeResearchModel":
+        """Record the names of the bound tools; tool_choice is ignored."""
+        names = [convert_to_openai_tool(t)["function"]["name"] for t in tools]
+        return self.model_copy(update={"tool_names": names})
+
+    def _respond(self, messages: List[BaseMessage]) -> AIMessage:
+        """Build the response for the role implied by the bound tools."""
+        names = set(self.tool_names)
+        tool_messages = [m for m in messages if isinstance(m, ToolMessage)]
+        call_id = f"call_{len(messages)}"
+
+        if "ConductResearch" in names:
+            if any(m.name == "ConductResearch" for m in tool_messages):
+                return AIMessage(
+                    content="",
+                    tool_calls=[{"name": "ResearchComplete", "args": {}, "id": call_id}],
+                )
+            return AIMessage(content="", tool_calls=[
+                {
+                    "name": "ConductResearch",
+                    "args": {"research_topic": f"Benchmark topic {i}: {fake_text(str(i), 20)}"},
+                    "id": f"{call_id}_{i}",
+                }
+                for i in range(self.research_units)
+            ])
+
+        if "WebSearchTool" in names:
+            searches = sum(1 for m in tool_messages if m.name == "WebSearchTool")
+            if searches < self.searches_per_unit:
+                topic = first_human_text(messages)
+                return AIMessage(content="", tool_calls=[{
+                    "name": "WebSearchTool",
+                    "args": {"query": f"{topic[:60]} #{searches}"},
+                    "id": call_id,
+                }])
+            return AIMessage(content="Research complete.")
+
+        if len(names) == 1 and names <= STRUCTURED_OUTPUTS:
+            name = self.tool_names[0]
+            return AIMessage(
+                content="",
+                tool_calls=[{"name": name, "args": self._structured_args(name, messages), "id": call_id}],
+            )
+
+        seed = first_human_text(messages)[:200]
+        return AIMessage(content=f"## Findings\n\n{fake_text(seed, self.output_tokens)}\n")
+
+    def _structured_args(self, name: str, messages: List[BaseMessage]) -> Dict[str, Any]:
+        """Arguments of a fixed structured output."""
+        seed = first_human_text(messages)[:200]
+        if name == "ClarifyWithUser":
+            return {"need_clarification": False, "question": "", "verification": "Starting research."}
+        if name == "ResearchQuestion":
+            return {"research_brief": f"Benchmark brief: {seed}"}
+        if name == "Summary":
+            return {
+                "summary": fake_text(seed, self.output_tokens),
+                "key_excerpts": fake_text(seed[::-1], self.output_tokens // 4),
+            }
+        return {
+            "title": "Benchmark Report",
+            "sections": [
+                {"name": f"Section {i}", "description": fake_text(f"{seed}{i}", 12)}
+                for i in range(3)
+            ],
+        }
+
+    def _result(self, messages: List[BaseMessage]) -> ChatResult:
+        """Wrap a response with usage metadata."""
+        message = self._respond(messages)
+        input_tokens = sum(len(str(m.content)) for m in messages) // 4
+        output_tokens = len(str(message.content)) // 4 + 20 * len(message.tool_calls)
+        message.usage_metadata = {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        return self._result(messages)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        return self._result(messages)
+
+
+def create_search_server(delay_seconds: float, results_per_search: int, content_length: int) -> FastMCP:
+    """Create an MCP server with a fake GoogleWebSearchTool."""
+    server = FastMCP("benchmark-search", streamable_http_path="/_plugins/_ml/mcp", log_level="WARNING")
+
+    @server.tool(name="GoogleWebSearchTool")
+    async def google_web_search(query: str, engine: str = "google", api_key: str = "", engine_id: str = "") -> str:
+        """Search the web."""
+        if delay_seconds:
+            await asyncio.sleep(delay_seconds)
+        words = max(1, content_length // 7)
+        return json.dumps({"items": [
+            {
+                "url": f"https://example.com/{hashlib.sha1(f'{query}{i}'.encode()).hexdigest()[:12]}",
+                "title": f"Result {i} for {query[:40]}",
+                "content": fake_text(f"{query}{i}", words)[:content_length],
+            }
+            for i in range(results_per_search)
+        ]})
+
+    return server
+
+
+async def start_search_server(
+    args: argparse.Namespace,
+    content_length: int,
+    port: int = 0,
+) -> "tuple[uvicorn.Server, asyncio.Task, str]":
+    """Serve the fake search server on a localhost port, a free one by default."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", port))
+    port = sock.getsockname()[1]
+
+    search = create_search_server(args.search_latency_ms / 1000.0, args.results_per_search, content_length)
+    server = uvicorn.Server(
+        uvicorn.Config(search.streamable_http_app(), log_level="warning", access_log=False)
+    )
+    task = asyncio.create_task(server.serve(sockets=[sock]))
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+
+    return server, task, f"http://127.0.0.1:{port}"
+
+
+def install_fake_model(model: FakeResearchModel) -> None:
+    """Route every model the graph creates to the fake model."""
+    agent.model_pool.init_chat_model = lambda *args, **kwargs: model
+    get_model_pool().clear()
+
+
+def benchmark_config(args: argparse.Namespace, units: int, iterations: int, content_length: int, url: str) -> Dict[str, Any]:
+    """Build the run configuration for one matrix combination."""
+    return {
+        "recursion_limit": 1000,
+        "configurable": {
+            "allow_clarification": False,
+            "max_concurrent_research_units": units,
+            "max_researcher_iterations": 2,
+            # One extra call so researchers stop on their own after the searches
+            "max_react_tool_calls": iterations + 1,
+            "max_content_length": content_length,
+            "summary_cache_max_entries": args.summary_cache_entries,
+            "summary_cache_path": None,
+            "final_report_mode": args.final_report_mode,
+            "enable_run_trace": True,
+            "run_trace_dir": None,
+            "research_model": FAKE_MODEL,
+            "compression_model": FAKE_MODEL,
+            "final_report_model": FAKE_MODEL,
+            "summarization_model": FAKE_MODEL,
+            "mcp_config": {"url": url, "tools": []},
+        },
+    }
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of the process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def run_combination(
+    args: argparse.Namespace,
+    units: int,
+    iterations: int,
+    content_length: int,
+) -> Dict[str, Any]:
+    """Benchmark one combination of the matrix."""
+    install_fake_model(FakeResearchModel(
+        latency_seconds=args.llm_latency_ms / 1000.0,
+        output_tokens=args.llm_output_tokens,
+        research_units=units,
+        searches_per_unit=iterations,
+    ))
+    server, server_task, url = await start_search_server(args, content_length)
+    graph = build_graph()
+    config = benchmark_config(args, units, iterations, content_length, url)
+
+    async def execute(index: int) -> Dict[str, Any]:
+        question = f"Benchmark question {index}: {fake_text(str(index), 30)}"
+        start = time.perf_counter()
+        state = await graph.ainvoke({"messages": [HumanMessage(content=question)]}, config)
+        return {"latency": time.perf_counter() - start, "state": state}
+
+    try:
+        for index in range(args.warmup):
+            await execute(-1 - index)
+
+        gc.collect()
+        if args.trace_memory:
+            tracemalloc.start()
+
+        runs: List[Dict[str, Any]] = []
+        semaphore = asyncio.Semaphore(args.parallel_runs)
+
+        async def execute_limited(index: int) -> None:
+            async with semaphore:
+                runs.append(await execute(index))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(execute_limited(index) for index in range(args.runs)))
+        elapsed = time.perf_counter() - start
+
+        heap_peak_mb = None
+        if args.trace_memory:
+            heap_peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+    finally:
+        await invalidate_tool_registry()
+        server.should_exit = True
+        await server_task
+
+    latencies = [run["latency"] for run in runs]
+    summaries = [run["state"].get("run_trace_summary") or {} for run in runs]
+
+    def per_run(key: str) -> float:
+        return statistics.mean(summary.get("totals", {}).get(key, 0) for summary in summaries)
+
+    return {
+        "research_units": units,
+        "searches_per_unit": iterations,
+        "content_length": content_length,
+        "runs": len(runs),
+        "elapsed_seconds": elapsed,
+        "runs_per_second": len(runs) / elapsed,
+        "latency_p50_ms": statistics.median(latencies) * 1000.0,
+        "latency_p99_ms": percentile(latencies, 0.99) * 1000.0,
+        "llm_calls_per_run": per_run("llm_calls"),
+        "tool_calls_per_run": per_run("tool_calls"),
+        "tokens_per_run": per_run("input_tokens") + per_run("output_tokens"),
+        "report_chars": statistics.mean(len(run["state"].get("final_report", "")) for run in runs),
+        "heap_peak_mb": heap_peak_mb,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+async def benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the benchmark for every combination of the matrix."""
+    results = []
+    for units, iterations, content_length in itertools.product(
+        args.units, args.iterations, args.content_length
+    ):
+        results.append(await run_combination(args, units, iterations, content_length))
+
+    return {
+        "runs_per_combination": args.runs,
+        "parallel_runs": args.parallel_runs,
+        "llm_latency_ms": args.llm_latency_ms,
+        "llm_output_tokens": args.llm_output_tokens,
+        "search_latency_ms": args.search_latency_ms,
+        "final_report_mode": args.final_report_mode,
+        "combinations": results,
+    }
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    """Print benchmark results as a readable report."""
+    print(  # noqa: T201
+        f"{results['runs_per_combination']} runs per combination "
+        f"(parallel_runs={results['parallel_runs']}, llm_latency={results['llm_latency_ms']}ms, "
+        f"llm_output_tokens={results['llm_output_tokens']}, "
+        f"search_latency={results['search_latency_ms']}ms, "
+        f"final_report_mode={results['final_report_mode']})"
+    )
+    print(  # noqa: T201
+        f"  {'units':>5} {'iters':>5} {'content':>8} {'runs/s':>8} {'p50 ms':>9} {'p99 ms':>9} "
+        f"{'llm/run':>8} {'tools/run':>9} {'heap MB':>8} {'rss MB':>8}"
+    )
+    for row in results["combinations"]:
+        heap = "n/a" if row["heap_peak_mb"] is None else f"{row['heap_peak_mb']:.1f}"
+        print(  # noqa: T201
+            f"  {row['research_units']:>5} {row['searches_per_unit']:>5} {row['content_length']:>8} "
+            f"{row['runs_per_second']:>8.2f} {row['latency_p50_ms']:>9.1f} {row['latency_p99_ms']:>9.1f} "
+            f"{row['llm_calls_per_run']:>8.1f} {row['tool_calls_per_run']:>9.1f} "
+            f"{heap:>8} {row['peak_rss_mb']:>8.1f}"
+        )
+
+
+def int_list(value: str) -> List[int]:
+    """Parse a comma separated list of integers."""
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Measured runs per combination")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured warm-up runs per combination")
+    parser.add_argument("--parallel-runs", type=int, default=1, help="Runs executed at once")
+    parser.add_argument(
+        "--units", type=int_list, default=[1, 3], help="Research units per run, e.g. 1,3,5"
+    )
+    parser.add_argument(
+        "--iterations", type=int_list, default=[2], help="Searches per research unit, e.g. 1,3"
+    )
+    parser.add_argument(
+        "--content-length", type=int_list, default=[5000], help="Characters per search result page"
+    )
+    parser.add_argument("--results-per-search", type=int, default=2, help="Pages per search")
+    parser.add_argument("--llm-latency-ms", type=float, default=50.0, help="Fake model latency")
+    parser.add_argument("--llm-output-tokens", type=int, default=200, help="Fake model output words")
+    parser.add_argument("--search-latency-ms", type=float, default=100.0, help="Fake search latency")
+    parser.add_argument(
+        "--final-report-mode",
+        choices=["standard", "streaming", "sections"],
+        default="standard",
+        help="Final report mode"
+    )
+    parser.add_argument(
+        "--summary-cache-entries",
+        type=int,
+        default=0,
+        help="Webpage summary cache size (default 0, so repeated runs are not served from cache)"
+    )
+    parser.add_argument(
+        "--trace-memory", action="store_true", help="Measure peak heap usage with tracemalloc"
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line."""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    for setting in CONTROLLED_SETTINGS:
+        os.environ.pop(setting.upper(), None)
+    # The Google search wrapper is only added when credentials are present
+    os.environ["GOOGLE_API_KEY"] = "benchmark"
+    os.environ["GOOGLE_ENGINE_ID"] = "benchmark"
+
+    results = asyncio.run(benchmark(args))
+
+    if args.json:
+        print(json.dumps(results, indent=2))  # noqa: T201
+    else:
+        print_report(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
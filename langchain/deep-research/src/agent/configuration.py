@@ -16,6 +16,13 @@ class SearchAPI(Enum):
     TAVILY = "tavily"
     NONE = "none"
 
+class FinalReportMode(Enum):
+    """Enumeration of ways to generate the final report."""
+    
+    STANDARD = "standard"
+    STREAMING = "streaming"
+    SECTIONS = "sections"
+
 class MCPConfig(BaseModel):
     """Configuration for Model Context Protocol (MCP) servers."""
     
@@ -80,7 +87,7 @@ class Configuration(BaseModel):
                 "min": 1,
                 "max": 20,
                 "step": 1,
-                "description": "Maximum number of research units to run concurrently. This will allow the researcher to use multiple sub-agents to conduct research. Note: with more concurrency, you may run into rate limits."
+                "description": "Maximum number of research units to run concurrently. This will allow the researcher to use multiple sub-agents to conduct research. Additional research units are queued and start as soon as a running one finishes. Note: with more concurrency, you may run into rate limits."
             }
         }
     )
@@ -160,6 +167,74 @@ class Configuration(BaseModel):
             }
         }
     )
+    summarization_max_concurrency: int = Field(
+        default=8,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "default": 8,
+                "min": 1,
+                "max": 100,
+                "description": "Maximum number of webpage summarizations running at once per summarization model, shared across researchers"
+            }
+        }
+    )
+    summarization_tokens_per_minute: int = Field(
+        default=0,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "default": 0,
+                "min": 0,
+                "description": "Estimated token budget per minute for webpage summarization per model. Set to 0 for no budget."
+            }
+        }
+    )
+    summarization_timeout_seconds: float = Field(
+        default=60.0,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "default": 60,
+                "min": 5,
+                "max": 600,
+                "description": "Timeout for a single webpage summarization once it has been scheduled"
+            }
+        }
+    )
+    summary_cache_max_entries: int = Field(
+        default=1000,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "default": 1000,
+                "min": 0,
+                "max": 100000,
+                "description": "Maximum number of webpage summaries cached in memory and shared across researchers. Set to 0 to disable the summary cache."
+            }
+        }
+    )
+    summary_cache_ttl_seconds: int = Field(
+        default=604800,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "default": 604800,
+                "min": 60,
+                "description": "How long a cached webpage summary stays valid"
+            }
+        }
+    )
+    summary_cache_path: Optional[str] = Field(
+        default=None,
+        optional=True,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "text",
+                "description": "Optional SQLite file that persists webpage summaries across runs"
+            }
+        }
+    )
     research_model: str = Field(
         default="bedrock:us.anthropic.claude-sonnet-4-20250514-v1:0",
         metadata={
@@ -220,6 +295,78 @@ class Configuration(BaseModel):
             }
         }
     )
+    final_report_mode: FinalReportMode = Field(
+        default=FinalReportMode.STANDARD,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "select",
+                "default": "standard",
+                "description": "How to generate the final report. Streaming emits report tokens and section boundaries as they are generated; Sections drafts the sections of an outline in parallel and stitches them together.",
+                "options": [
+                    {"label": "Standard", "value": FinalReportMode.STANDARD.value},
+                    {"label": "Streaming", "value": FinalReportMode.STREAMING.value},
+                    {"label": "Parallel Sections", "value": FinalReportMode.SECTIONS.value}
+                ]
+            }
+        }
+    )
+    max_concurrent_report_sections: int = Field(
+        default=5,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "slider",
+                "default": 5,
+                "min": 1,
+                "max": 20,
+                "step": 1,
+                "description": "Maximum number of report sections drafted concurrently in Parallel Sections mode"
+            }
+        }
+    )
+    context_budget_margin: float = Field(
+        default=0.1,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "slider",
+                "default": 0.1,
+                "min": 0.0,
+                "max": 0.5,
+                "step": 0.05,
+                "description": "Fraction of a model's context window kept free when compacting research for compression and the final report"
+            }
+        }
+    )
+    research_memo_ttl_seconds: int = Field(
+        default=86400,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "default": 86400,
+                "min": 0,
+                "description": "How long completed research units are reused by resumed runs or re-runs with the same topic and settings. Requires a store; set to 0 to disable."
+            }
+        }
+    )
+    enable_run_trace: bool = Field(
+        default=True,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "boolean",
+                "default": True,
+                "description": "Record wall time, LLM calls, tokens and tool latencies per node and researcher, and summarize them at the end of each run"
+            }
+        }
+    )
+    run_trace_dir: Optional[str] = Field(
+        default=None,
+        optional=True,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "text",
+                "description": "Optional directory where the JSON trace of each run is written"
+            }
+        }
+    )
     # MCP server configuration
     mcp_config: Optional[MCPConfig] = Field(
         default_factory=lambda: MCPConfig(
@@ -247,6 +394,18 @@ class Configuration(BaseModel):
             }
         }
     )
+    tool_cache_ttl_seconds: int = Field(
+        default=600,
+        metadata={
+            "x_oap_ui_config": {
+                "type": "number",
+                "default": 600,
+                "min": 0,
+                "max": 86400,
+                "description": "How long assembled research tools are reused, and how long an idle MCP session stays open, before tools are reloaded from the MCP server. Set to 0 to load tools on every call."
+            }
+        }
+    )
 
 
     @classmethod
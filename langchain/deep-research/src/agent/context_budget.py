@@ -0,0 +1,257 @@
+"""Token budgets for the prompts the Deep Research agent sends.
+
+Prompts are measured before they are sent and compacted up front to fit the
+model's context window, instead of recovering from token limit errors with
+extra round-trips.
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional, Sequence
+
+from langchain_core.messages import MessageLikeRepresentation, ToolMessage
+
+# Tokens added per message for role and formatting by chat APIs
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Notes are never trimmed below this many tokens; notes that would be are dropped
+MIN_NOTE_TOKENS = 256
+
+TRUNCATION_MARKER = "\n\n[... truncated to fit the context window ...]"
+
+_URL_PATTERN = re.compile(r"https?://\S+")
+
+
+class TokenCounter:
+    """Counts and truncates text by tokens using a character heuristic."""
+
+    def __init__(self, chars_per_token: float = 4.0):
+        """Initialize the counter.
+
+        Args:
+            chars_per_token: Average number of characters per token
+        """
+        self.chars_per_token = chars_per_token
+
+    def count(self, text: str) -> int:
+        """Count the tokens in a text."""
+        return int(len(text) / self.chars_per_token) + 1
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Cut a text down to at most max_tokens tokens."""
+        return text[:int(max_tokens * self.chars_per_token)]
+
+
+class TiktokenCounter(TokenCounter):
+    """Counts and truncates text with a tiktoken encoding."""
+
+    def __init__(self, encoding_name: str = "cl100k_base"):
+        """Initialize the counter.
+
+        Args:
+            encoding_name: Name of the tiktoken encoding
+
+        Raises:
+            ImportError: If tiktoken is not installed
+        """
+        import tiktoken
+
+        super().__init__()
+        self.encoding = tiktoken.get_encoding(encoding_name)
+
+    def count(self, text: str) -> int:
+        """Count the tokens in a text."""
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Cut a text down to at most max_tokens tokens."""
+        tokens = self.encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return self.encoding.decode(tokens[:max_tokens])
+
+
+# Token counters keyed by model name prefix, e.g. "openai:" or "bedrock:us.amazon"
+_token_counters: Dict[str, TokenCounter] = {}
+_default_counter: Optional[TokenCounter] = None
+
+def register_token_counter(model_prefix: str, counter: TokenCounter) -> None:
+    """Use a token counter for all models whose name starts with a prefix.
+
+    Args:
+        model_prefix: Model name prefix the counter applies to
+        counter: Token counter for those models
+    """
+    _token_counters[model_prefix] = counter
+
+def get_token_counter(model_name: str) -> TokenCounter:
+    """Get the token counter for a model.
+
+    Uses the registered counter with the longest matching prefix, falling
+    back to tiktoken's cl100k_base encoding, or to a character heuristic
+    when tiktoken or its encoding is unavailable.
+
+    Args:
+        model_name: Model identifier, e.g. "openai:gpt-4.1"
+
+    Returns:
+        Token counter for the model
+    """
+    global _default_counter
+
+    matches = [prefix for prefix in _token_counters if model_name.startswith(prefix)]
+    if matches:
+        return _token_counters[max(matches, key=len)]
+
+    if _default_counter is None:
+        try:
+            _default_counter = TiktokenCounter()
+        except Exception as e:
+            logging.warning(f"tiktoken unavailable, estimating tokens from characters: {e}")
+            _default_counter = TokenCounter()
+    return _default_counter
+
+
+def get_prompt_token_budget(
+    model_token_limit: Optional[int],
+    max_output_tokens: int,
+    safety_margin: float = 0.1,
+) -> Optional[int]:
+    """Compute how many prompt tokens can be sent to a model.
+
+    Args:
+        model_token_limit: Context window of the model, None if unknown
+        max_output_tokens: Tokens reserved for the model's response
+        safety_margin: Fraction of the context window kept free for
+            differences between the counter and the model's tokenizer
+
+    Returns:
+        Prompt token budget, or None if the context window is unknown
+    """
+    if not model_token_limit:
+        return None
+    budget = int(model_token_limit * (1.0 - safety_margin)) - max_output_tokens
+    return max(budget, 0)
+
+def count_message_tokens(
+    messages: Sequence[MessageLikeRepresentation],
+    counter: TokenCounter,
+) -> int:
+    """Count the tokens of a list of messages, including tool call arguments.
+
+    Args:
+        messages: Messages to measure
+        counter: Token counter for the target model
+
+    Returns:
+        Estimated prompt tokens
+    """
+    total = 0
+    for message in messages:
+        total += MESSAGE_OVERHEAD_TOKENS + counter.count(str(message.content))
+        for tool_call in getattr(message, "tool_calls", None) or []:
+            total += counter.count(f"{tool_call['name']}{tool_call['args']}")
+    return total
+
+
+def _water_level(sizes: List[int], budget: int) -> int:
+    """Find the largest per-item cap such that the capped sizes fit the budget."""
+    remaining = budget
+    ordered = sorted(sizes)
+    for index, size in enumerate(ordered):
+        share = remaining // (len(ordered) - index)
+        if size > share:
+            return share
+        remaining -= size
+    return ordered[-1] if ordered else 0
+
+def _truncate(text: str, max_tokens: int, counter: TokenCounter) -> str:
+    """Truncate a text to max_tokens, marking that it was cut."""
+    marker_tokens = counter.count(TRUNCATION_MARKER)
+    return counter.truncate(text, max(max_tokens - marker_tokens, 0)) + TRUNCATION_MARKER
+
+def fit_messages_to_budget(
+    messages: List[MessageLikeRepresentation],
+    budget: int,
+    counter: TokenCounter,
+) -> List[MessageLikeRepresentation]:
+    """Shrink tool outputs so a conversation fits a token budget.
+
+    Tool messages are the bulk of a researcher's context. They are capped
+    to a common size, so short outputs are kept whole and only the largest
+    ones are trimmed. Message order and tool call pairing are preserved.
+
+    Args:
+        messages: Conversation to fit
+        budget: Prompt token budget
+        counter: Token counter for the target model
+
+    Returns:
+        The original messages if they fit, otherwise a compacted copy
+    """
+    total = count_message_tokens(messages, counter)
+    if total <= budget:
+        return messages
+
+    tool_indexes = [i for i, m in enumerate(messages) if isinstance(m, ToolMessage)]
+    sizes = [counter.count(str(messages[i].content)) for i in tool_indexes]
+    fixed = total - sum(sizes)
+    cap = _water_level(sizes, max(budget - fixed, 0))
+
+    compacted = list(messages)
+    for index, size in zip(tool_indexes, sizes):
+        if size > cap:
+            message = messages[index]
+            compacted[index] = message.model_copy(
+                update={"content": _truncate(str(message.content), cap, counter)}
+            )
+    return compacted
+
+
+def note_value(note: str) -> int:
+    """Score a research note by the number of distinct sources it cites."""
+    return len(set(_URL_PATTERN.findall(note)))
+
+def fit_notes_to_budget(
+    notes: List[str],
+    budget: int,
+    counter: TokenCounter,
+    min_note_tokens: int = MIN_NOTE_TOKENS,
+) -> List[str]:
+    """Compact research notes to fit a token budget.
+
+    Notes are capped to a common size so short notes are kept whole and the
+    longest ones are trimmed. If that would leave notes shorter than
+    min_note_tokens, the lowest-value notes (fewest cited sources, latest
+    first) are dropped until the rest fit. Note order is preserved.
+
+    Args:
+        notes: Research notes to fit
+        budget: Token budget for all notes together
+        counter: Token counter for the target model
+        min_note_tokens: Smallest useful size of a trimmed note
+
+    Returns:
+        The original notes if they fit, otherwise a compacted copy
+    """
+    sizes = [counter.count(note) for note in notes]
+    if sum(sizes) <= budget:
+        return notes
+
+    # Least valuable notes come first in the drop order
+    drop_order = sorted(range(len(notes)), key=lambda i: (note_value(notes[i]), -i))
+    kept = set(range(len(notes)))
+    for index in drop_order:
+        cap = _water_level([sizes[i] for i in kept], budget)
+        if cap >= min_note_tokens or len(kept) == 1:
+            break
+        kept.discard(index)
+
+    cap = _water_level([sizes[i] for i in kept], budget)
+    dropped = len(notes) - len(kept)
+    if dropped:
+        logging.warning(f"Dropped {dropped} of {len(notes)} research notes to fit the context window")
+    return [
+        notes[i] if sizes[i] <= cap else _truncate(notes[i], cap, counter)
+        for i in sorted(kept)
+    ]
@@ -1,9 +1,9 @@
 """Main LangGraph implementation for the Deep Research agent."""
 
 import asyncio
+import re
 from typing import Literal
 
-from langchain.chat_models import init_chat_model
 from langchain_core.messages import (
     AIMessage,
     HumanMessage,
@@ -18,25 +18,39 @@ from langgraph.types import Command
 
 from agent.configuration import (
     Configuration,
+    FinalReportMode,
 )
+from agent.context_budget import (
+    fit_messages_to_budget,
+    fit_notes_to_budget,
+    get_prompt_token_budget,
+    get_token_counter,
+)
+from agent.instrumentation import traced_node
+from agent.model_pool import get_model_pool
 from agent.prompts import (
     clarify_with_user_instructions,
     compress_research_simple_human_message,
     compress_research_system_prompt,
     final_report_generation_prompt,
+    final_report_outline_prompt,
+    final_report_section_prompt,
     lead_researcher_prompt,
     research_system_prompt,
     transform_messages_into_research_topic_prompt,
 )
+from agent.research_pool import ResearchUnitPool
 from agent.state import (
     AgentInputState,
     AgentState,
     ClarifyWithUser,
     ConductResearch,
+    ReportOutline,
     ResearchComplete,
     ResearcherOutputState,
     ResearcherState,
     ResearchQuestion,
+    SupervisorInputState,
     SupervisorState,
 )
 from agent.utils import (
@@ -44,20 +58,23 @@ from agent.utils import (
     build_model_config,
     get_all_tools,
     get_api_key_for_model,
+    get_memoized_research,
     get_model_token_limit,
     get_notes_from_tool_calls,
+    get_progress_writer,
     get_today_str,
     is_token_limit_exceeded,
+    memoize_research,
     openai_websearch_called,
     remove_up_to_last_ai_message,
+    research_memo_key,
     think_tool,
 )
 
-# Initialize a configurable model that we will use throughout the agent
-configurable_model = init_chat_model(
-    configurable_fields=("model", "max_tokens", "api_key"),
-)
+# Chat models are shared across nodes and researchers through the model pool
+model_pool = get_model_pool()
 
+@traced_node(reset=True)
 async def clarify_with_user(state: AgentState, config: RunnableConfig) -> Command[Literal["write_research_brief", "__end__"]]:
     """Analyze user messages and ask clarifying questions if the research scope is unclear.
     
@@ -87,11 +104,10 @@ async def clarify_with_user(state: AgentState, config: RunnableConfig) -> Comman
     )
     
     # Configure model with structured output and retry logic
-    clarification_model = (
-        configurable_model
-        .with_structured_output(ClarifyWithUser)
-        .with_retry(stop_after_attempt=configurable.max_structured_output_retries)
-        .with_config(model_config)
+    clarification_model = model_pool.get_model(
+        model_config,
+        structured_output=ClarifyWithUser,
+        retries=configurable.max_structured_output_retries
     )
     
     # Step 3: Analyze whether clarification is needed
@@ -116,6 +132,7 @@ async def clarify_with_user(state: AgentState, config: RunnableConfig) -> Comman
         )
 
 
+@traced_node()
 async def write_research_brief(state: AgentState, config: RunnableConfig) -> Command[Literal["research_supervisor"]]:
     """Transform user messages into a structured research brief and initialize supervisor.
     
@@ -140,11 +157,10 @@ async def write_research_brief(state: AgentState, config: RunnableConfig) -> Com
     )
     
     # Configure model for structured research question generation
-    research_model = (
-        configurable_model
-        .with_structured_output(ResearchQuestion)
-        .with_retry(stop_after_attempt=configurable.max_structured_output_retries)
-        .with_config(research_model_config)
+    research_model = model_pool.get_model(
+        research_model_config,
+        structured_output=ResearchQuestion,
+        retries=configurable.max_structured_output_retries
     )
     
     # Step 2: Generate structured research brief from user messages
@@ -176,6 +192,7 @@ async def write_research_brief(state: AgentState, config: RunnableConfig) -> Com
     )
 
 
+@traced_node()
 async def supervisor(state: SupervisorState, config: RunnableConfig) -> Command[Literal["supervisor_tools"]]:
     """Lead research supervisor that plans research strategy and delegates to researchers.
     
@@ -203,11 +220,10 @@ async def supervisor(state: SupervisorState, config: RunnableConfig) -> Command[
     lead_researcher_tools = [ConductResearch, ResearchComplete, think_tool]
     
     # Configure model with tools, retry logic, and model settings
-    research_model = (
-        configurable_model
-        .bind_tools(lead_researcher_tools)
-        .with_retry(stop_after_attempt=configurable.max_structured_output_retries)
-        .with_config(research_model_config)
+    research_model = model_pool.get_model(
+        research_model_config,
+        tools=lead_researcher_tools,
+        retries=configurable.max_structured_output_retries
     )
     
     # Step 2: Generate supervisor response based on current context
@@ -223,6 +239,43 @@ async def supervisor(state: SupervisorState, config: RunnableConfig) -> Command[
         }
     )
 
+async def conduct_research(research_topic: str, config: RunnableConfig) -> dict:
+    """Run a researcher on a topic, or reuse the memoized result of a completed run.
+    
+    Results are memoized in the graph's store by topic and research settings,
+    so a resumed run or a re-run with the same brief skips finished research.
+    
+    Args:
+        research_topic: Topic delegated by the supervisor
+        config: Runtime configuration with research and memo settings
+        
+    Returns:
+        Researcher output with compressed_research and raw_notes
+    """
+    memoized = await get_memoized_research(research_topic, config)
+    if memoized is not None:
+        return memoized
+    
+    # Tag the researcher's runs so the run trace can attribute them to this unit
+    research_unit_config = {
+        **config,
+        "metadata": {
+            **config.get("metadata", {}),
+            "research_unit": research_memo_key(research_topic, config)[:12],
+            "research_topic": research_topic[:200]
+        }
+    }
+    observation = await researcher_subgraph.ainvoke({
+        "researcher_messages": [
+            HumanMessage(content=research_topic)
+        ],
+        "research_topic": research_topic
+    }, research_unit_config)
+    
+    await memoize_research(research_topic, observation, config)
+    return observation
+
+@traced_node()
 async def supervisor_tools(state: SupervisorState, config: RunnableConfig) -> Command[Literal["supervisor", "__end__"]]:
     """Execute tools called by the supervisor, including research delegation and strategic thinking.
     
@@ -288,39 +341,26 @@ async def supervisor_tools(state: SupervisorState, config: RunnableConfig) -> Co
     
     if conduct_research_calls:
         try:
-            # Limit concurrent research units to prevent resource exhaustion
-            allowed_conduct_research_calls = conduct_research_calls[:configurable.max_concurrent_research_units]
-            overflow_conduct_research_calls = conduct_research_calls[configurable.max_concurrent_research_units:]
-            
-            # Execute research tasks in parallel
-            research_tasks = [
-                researcher_subgraph.ainvoke({
-                    "researcher_messages": [
-                        HumanMessage(content=tool_call["args"]["research_topic"])
-                    ],
-                    "research_topic": tool_call["args"]["research_topic"]
-                }, config) 
-                for tool_call in allowed_conduct_research_calls
-            ]
-            
-            tool_results = await asyncio.gather(*research_tasks)
+            # Queue every research unit on a bounded worker pool; each worker
+            # starts the next unit as soon as its current one finishes
+            research_pool = ResearchUnitPool(
+                lambda research_topic: conduct_research(research_topic, config),
+                max_workers=configurable.max_concurrent_research_units,
+                on_event=get_progress_writer()
+            )
+            tool_results = await research_pool.run([
+                tool_call["args"]["research_topic"]
+                for tool_call in conduct_research_calls
+            ])
             
             # Create tool messages with research results
-            for observation, tool_call in zip(tool_results, allowed_conduct_research_calls):
+            for observation, tool_call in zip(tool_results, conduct_research_calls):
                 all_tool_messages.append(ToolMessage(
                     content=observation.get("compressed_research", "Error synthesizing research report: Maximum retries exceeded"),
                     name=tool_call["name"],
                     tool_call_id=tool_call["id"]
                 ))
             
-            # Handle overflow research calls with error messages
-            for overflow_call in overflow_conduct_research_calls:
-                all_tool_messages.append(ToolMessage(
-                    content=f"Error: Did not run this research as you have already exceeded the maximum number of concurrent research units. Please try again with {configurable.max_concurrent_research_units} or fewer research units.",
-                    name="ConductResearch",
-                    tool_call_id=overflow_call["id"]
-                ))
-            
             # Aggregate raw notes from all research results
             raw_notes_concat = "\n".join([
                 "\n".join(observation.get("raw_notes", [])) 
@@ -351,7 +391,11 @@ async def supervisor_tools(state: SupervisorState, config: RunnableConfig) -> Co
 
 # Supervisor Subgraph Construction
 # Creates the supervisor workflow that manages research delegation and coordination
-supervisor_builder = StateGraph(SupervisorState, config_schema=Configuration)
+supervisor_builder = StateGraph(
+    SupervisorState,
+    input=SupervisorInputState,
+    config_schema=Configuration
+)
 
 # Add supervisor nodes for research management
 supervisor_builder.add_node("supervisor", supervisor)           # Main supervisor logic
@@ -404,11 +448,10 @@ async def researcher(state: ResearcherState, config: RunnableConfig) -> Command[
     )
     
     # Configure model with tools, retry logic, and settings
-    research_model = (
-        configurable_model
-        .bind_tools(tools)
-        .with_retry(stop_after_attempt=configurable.max_structured_output_retries)
-        .with_config(research_model_config)
+    research_model = model_pool.get_model(
+        research_model_config,
+        tools=tools,
+        retries=configurable.max_structured_output_retries
     )
     
     # Step 3: Generate researcher response with system context
@@ -532,13 +575,32 @@ async def compress_research(state: ResearcherState, config: RunnableConfig):
         config,
         tags=["langsmith:nostream"]
     )
-    synthesizer_model = configurable_model.with_config(compression_model_config)
+    synthesizer_model = model_pool.get_model(compression_model_config)
     
     # Step 2: Prepare messages for compression
     researcher_messages = state.get("researcher_messages", [])
     
     # Add instruction to switch from research mode to compression mode
     researcher_messages.append(HumanMessage(content=compress_research_simple_human_message))
+    all_researcher_messages = researcher_messages
+    
+    # Create system prompt focused on compression task
+    compression_prompt = compress_research_system_prompt.format(date=get_today_str())
+    
+    # Measure the prompt up front and shrink oversized tool outputs so the
+    # first compression call fits the model's context window
+    # The first lookup may download the tokenizer encoding, so keep it off the event loop
+    token_counter = await asyncio.to_thread(get_token_counter, configurable.compression_model)
+    prompt_budget = get_prompt_token_budget(
+        get_model_token_limit(configurable.compression_model),
+        configurable.compression_model_max_tokens,
+        configurable.context_budget_margin
+    )
+    if prompt_budget is not None:
+        prompt_budget -= token_counter.count(compression_prompt)
+        researcher_messages = fit_messages_to_budget(
+            all_researcher_messages, prompt_budget, token_counter
+        )
     
     # Step 3: Attempt compression with retry logic for token limit issues
     synthesis_attempts = 0
@@ -546,17 +608,15 @@ async def compress_research(state: ResearcherState, config: RunnableConfig):
     
     while synthesis_attempts < max_attempts:
         try:
-            # Create system prompt focused on compression task
-            compression_prompt = compress_research_system_prompt.format(date=get_today_str())
             messages = [SystemMessage(content=compression_prompt)] + researcher_messages
             
             # Execute compression
             response = await synthesizer_model.ainvoke(messages)
             
-            # Extract raw notes from all tool and AI messages
+            # Extract raw notes from the uncompacted tool and AI messages
             raw_notes_content = "\n".join([
                 str(message.content) 
-                for message in filter_messages(researcher_messages, include_types=["tool", "ai"])
+                for message in filter_messages(all_researcher_messages, include_types=["tool", "ai"])
             ])
             
             # Return successful compression result
@@ -568,9 +628,16 @@ async def compress_research(state: ResearcherState, config: RunnableConfig):
         except Exception as e:
             synthesis_attempts += 1
             
-            # Handle token limit exceeded by removing older messages
-            if is_token_limit_exceeded(e, configurable.research_model):
-                researcher_messages = remove_up_to_last_ai_message(researcher_messages)
+            # Handle token limit exceeded by tightening the budget, or by
+            # removing older messages if the context window is unknown
+            if is_token_limit_exceeded(e, configurable.compression_model):
+                if prompt_budget is not None:
+                    prompt_budget = int(prompt_budget * 0.75)
+                    researcher_messages = fit_messages_to_budget(
+                        all_researcher_messages, prompt_budget, token_counter
+                    )
+                else:
+                    researcher_messages = remove_up_to_last_ai_message(researcher_messages)
                 continue
             
             # For other errors, continue retrying
@@ -579,7 +646,7 @@ async def compress_research(state: ResearcherState, config: RunnableConfig):
     # Step 4: Return error result if all attempts failed
     raw_notes_content = "\n".join([
         str(message.content) 
-        for message in filter_messages(researcher_messages, include_types=["tool", "ai"])
+        for message in filter_messages(all_researcher_messages, include_types=["tool", "ai"])
     ])
     
     return {
@@ -607,6 +674,180 @@ researcher_builder.add_edge("compress_research", END)      # Exit point after co
 # Compile researcher subgraph for parallel execution by supervisor
 researcher_subgraph = researcher_builder.compile()
 
+# Markdown headings that start a section (# title or ## section) in a streamed report
+SECTION_HEADING = re.compile(r"^\s*(#{1,2})\s+(.+?)\s*#*\s*$")
+
+# Inline Markdown links cited in report sections
+MARKDOWN_LINK = re.compile(r"\[([^\]]+)\]\((https?://[^)\s]+)\)")
+
+def get_message_text(message) -> str:
+    """Extract the text of a message or message chunk, whose content may be a list of blocks."""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block if isinstance(block, str) else block.get("text", "")
+        for block in content
+        if isinstance(block, str) or block.get("type") == "text"
+    )
+
+async def stream_final_report(writer_model, messages) -> AIMessage:
+    """Generate the final report while streaming its tokens and section boundaries.
+    
+    Each token is written to the LangGraph custom stream as a
+    "final_report_delta" event, and each # or ## heading as a
+    "final_report_section" event once its line is complete. The tokens also
+    reach the graph's "messages" stream.
+    
+    Args:
+        writer_model: Final report model configured without the nostream tag
+        messages: Prompt messages for the report
+        
+    Returns:
+        The complete report as an AI message
+    """
+    stream_writer = get_progress_writer()
+    report_parts = []
+    line_buffer = ""
+    section_index = 0
+    
+    def emit_section(line: str):
+        nonlocal section_index
+        heading = SECTION_HEADING.match(line)
+        if heading:
+            stream_writer({
+                "type": "final_report_section",
+                "index": section_index,
+                "level": len(heading.group(1)),
+                "title": heading.group(2)
+            })
+            section_index += 1
+    
+    async for chunk in writer_model.astream(messages):
+        delta = get_message_text(chunk)
+        if not delta:
+            continue
+        report_parts.append(delta)
+        stream_writer({"type": "final_report_delta", "content": delta})
+        
+        # Detect section headings line by line as the text arrives
+        line_buffer += delta
+        *complete_lines, line_buffer = line_buffer.split("\n")
+        for line in complete_lines:
+            emit_section(line)
+    emit_section(line_buffer)
+    
+    return AIMessage(content="".join(report_parts))
+
+def stitch_report_sections(title: str, sections: list[str]) -> str:
+    """Join independently drafted sections into one report with numbered sources.
+    
+    Inline [Title](URL) citations are numbered by first appearance across the
+    whole report and listed in a final Sources section.
+    
+    Args:
+        title: Report title
+        sections: Markdown of each section, in reading order
+        
+    Returns:
+        The complete report in Markdown
+    """
+    source_numbers = {}
+    source_titles = {}
+    
+    def cite(match):
+        source_title, url = match.group(1), match.group(2)
+        if url not in source_numbers:
+            source_numbers[url] = len(source_numbers) + 1
+            source_titles[url] = source_title
+        return f"{match.group(0)} [{source_numbers[url]}]"
+    
+    body = "\n\n".join(MARKDOWN_LINK.sub(cite, section.strip()) for section in sections)
+    report = f"# {title}\n\n{body}"
+    if source_numbers:
+        sources = "\n".join(
+            f"- [{number}] {source_titles[url]}: {url}"
+            for url, number in source_numbers.items()
+        )
+        report += f"\n\n### Sources\n\n{sources}"
+    return report
+
+async def write_final_report_by_sections(
+    state: AgentState,
+    findings: str,
+    writer_model_config: dict,
+    configurable: Configuration
+) -> AIMessage:
+    """Generate the final report by drafting the sections of an outline concurrently.
+    
+    The writer model first plans an outline, then drafts every section in
+    parallel from the same findings. The drafts are stitched together with a
+    shared, numbered list of sources. Each completed section is written to
+    the LangGraph custom stream as a "final_report_section" event.
+    
+    Args:
+        state: Agent state with the research brief and messages
+        findings: Research findings, already fitted to the model's context window
+        writer_model_config: Model configuration for the final report model
+        configurable: Agent configuration
+        
+    Returns:
+        The complete report as an AI message
+    """
+    research_brief = state.get("research_brief", "")
+    messages = get_buffer_string(state.get("messages", []))
+    
+    # Step 1: Plan the outline
+    outline_model = model_pool.get_model(
+        writer_model_config,
+        structured_output=ReportOutline,
+        retries=configurable.max_structured_output_retries
+    )
+    outline = await outline_model.ainvoke([HumanMessage(content=final_report_outline_prompt.format(
+        research_brief=research_brief,
+        messages=messages,
+        findings=findings,
+        date=get_today_str()
+    ))])
+    outline_text = "\n".join(
+        f"{i + 1}. {section.name}: {section.description}"
+        for i, section in enumerate(outline.sections)
+    )
+    
+    # Step 2: Draft all sections concurrently
+    stream_writer = get_progress_writer()
+    writer_model = model_pool.get_model(writer_model_config)
+    semaphore = asyncio.Semaphore(configurable.max_concurrent_report_sections)
+    
+    async def draft_section(index: int, section) -> str:
+        async with semaphore:
+            response = await writer_model.ainvoke([HumanMessage(content=final_report_section_prompt.format(
+                research_brief=research_brief,
+                messages=messages,
+                findings=findings,
+                report_title=outline.title,
+                outline=outline_text,
+                section_name=section.name,
+                section_description=section.description,
+                date=get_today_str()
+            ))])
+        content = get_message_text(response)
+        stream_writer({
+            "type": "final_report_section",
+            "index": index,
+            "title": section.name,
+            "content": content
+        })
+        return content
+    
+    sections = await asyncio.gather(*(
+        draft_section(index, section) for index, section in enumerate(outline.sections)
+    ))
+    
+    # Step 3: Stitch the sections together
+    return AIMessage(content=stitch_report_sections(outline.title, sections))
+
+@traced_node(finalize=True)
 async def final_report_generation(state: AgentState, config: RunnableConfig):
     """Generate the final comprehensive research report with retry logic for token limits.
     
@@ -631,28 +872,54 @@ async def final_report_generation(state: AgentState, config: RunnableConfig):
         configurable.final_report_model,
         configurable.final_report_model_max_tokens,
         config,
-        tags=["langsmith:nostream"]
+        # Let the report's tokens reach the graph's messages stream when streaming
+        tags=None if configurable.final_report_mode == FinalReportMode.STREAMING else ["langsmith:nostream"]
     )
+    writer_model = model_pool.get_model(writer_model_config)
+    
+    def build_final_report_prompt(findings: str) -> str:
+        """Create comprehensive prompt with all research context."""
+        return final_report_generation_prompt.format(
+            research_brief=state.get("research_brief", ""),
+            messages=get_buffer_string(state.get("messages", [])),
+            findings=findings,
+            date=get_today_str()
+        )
     
-    # Step 3: Attempt report generation with token limit retry logic
+    # Step 3: Measure the prompt up front and compact the findings so the
+    # first call fits the model's context window
+    # The first lookup may download the tokenizer encoding, so keep it off the event loop
+    token_counter = await asyncio.to_thread(get_token_counter, configurable.final_report_model)
+    model_token_limit = get_model_token_limit(configurable.final_report_model)
+    findings_budget = get_prompt_token_budget(
+        model_token_limit,
+        configurable.final_report_model_max_tokens,
+        configurable.context_budget_margin
+    )
+    if findings_budget is not None:
+        findings_budget -= token_counter.count(build_final_report_prompt(""))
+        findings = "\n".join(fit_notes_to_budget(notes, findings_budget, token_counter))
+    
+    # Step 4: Attempt report generation with token limit retry logic
     max_retries = 3
     current_retry = 0
-    findings_token_limit = None
     
     while current_retry <= max_retries:
         try:
-            # Create comprehensive prompt with all research context
-            final_report_prompt = final_report_generation_prompt.format(
-                research_brief=state.get("research_brief", ""),
-                messages=get_buffer_string(state.get("messages", [])),
-                findings=findings,
-                date=get_today_str()
-            )
-            
-            # Generate the final report
-            final_report = await configurable_model.with_config(writer_model_config).ainvoke([
-                HumanMessage(content=final_report_prompt)
-            ])
+            # Generate the final report in the configured mode
+            if configurable.final_report_mode == FinalReportMode.SECTIONS:
+                final_report = await write_final_report_by_sections(
+                    state, findings, writer_model_config, configurable
+                )
+            elif configurable.final_report_mode == FinalReportMode.STREAMING:
+                final_report = await stream_final_report(
+                    writer_model,
+                    [HumanMessage(content=build_final_report_prompt(findings))]
+                )
+            else:
+                final_report = await writer_model.ainvoke([
+                    HumanMessage(content=build_final_report_prompt(findings))
+                ])
             
             # Return successful report generation
             return {
@@ -662,27 +929,20 @@ async def final_report_generation(state: AgentState, config: RunnableConfig):
             }
             
         except Exception as e:
-            # Handle token limit exceeded errors with progressive truncation
+            # Handle token limit exceeded errors by tightening the findings budget
             if is_token_limit_exceeded(e, configurable.final_report_model):
                 current_retry += 1
                 
-                if current_retry == 1:
-                    # First retry: determine initial truncation limit
-                    model_token_limit = get_model_token_limit(configurable.final_report_model)
-                    if not model_token_limit:
-                        return {
-                            "final_report": f"Error generating final report: Token limit exceeded, however, we could not determine the model's maximum context length. Please update the model map in deep_researcher/utils.py with this information. {e}",
-                            "messages": [AIMessage(content="Report generation failed due to token limits")],
-                            **cleared_state
-                        }
-                    # Use 4x token limit as character approximation for truncation
-                    findings_token_limit = model_token_limit * 4
-                else:
-                    # Subsequent retries: reduce by 10% each time
-                    findings_token_limit = int(findings_token_limit * 0.9)
+                if findings_budget is None:
+                    return {
+                        "final_report": f"Error generating final report: Token limit exceeded, however, we could not determine the model's maximum context length. Please update the model map in deep_researcher/utils.py with this information. {e}",
+                        "messages": [AIMessage(content="Report generation failed due to token limits")],
+                        **cleared_state
+                    }
                 
-                # Truncate findings and retry
-                findings = findings[:findings_token_limit]
+                # The token counter underestimated the prompt; compact further and retry
+                findings_budget = int(findings_budget * 0.75)
+                findings = "\n".join(fit_notes_to_budget(notes, findings_budget, token_counter))
                 continue
             else:
                 # Non-token-limit error: return error immediately
@@ -692,7 +952,7 @@ async def final_report_generation(state: AgentState, config: RunnableConfig):
                     **cleared_state
                 }
     
-    # Step 4: Return failure result if all retries exhausted
+    # Step 5: Return failure result if all retries exhausted
     return {
         "final_report": "Error generating final report: Maximum retries exceeded",
         "messages": [AIMessage(content="Report generation failed after maximum retries")],
@@ -718,5 +978,23 @@ deep_researcher_builder.add_edge(START, "clarify_with_user")
 deep_researcher_builder.add_edge("research_supervisor", "final_report_generation") # Research to report
 deep_researcher_builder.add_edge("final_report_generation", END)                   # Final exit point
 
+def build_graph(checkpointer=None, store=None):
+    """Compile the deep researcher workflow with optional persistence.
+    
+    With a checkpointer, the state of the main graph, the supervisor and
+    every researcher is saved after each node, so an interrupted run can
+    be resumed by invoking the graph again with None as input and the same
+    thread_id. With a store, completed research units are memoized across
+    runs. The LangGraph server provides both for the exported graph.
+    
+    Args:
+        checkpointer: Any LangGraph checkpoint saver, e.g. from open_sqlite_persistence
+        store: Any LangGraph store used for research memoization
+        
+    Returns:
+        Compiled deep researcher graph
+    """
+    return deep_researcher_builder.compile(checkpointer=checkpointer, store=store)
+
 # Compile the complete deep researcher workflow
-graph = deep_researcher_builder.compile()
\ No newline at end of file
+graph = build_graph()
\ No newline at end of file
@@ -0,0 +1,359 @@
+"""Per-node latency and token accounting for Deep Research runs.
+
+Each traced node records its wall time, plus every LLM call (with input and
+output tokens), tool call and nested subgraph node run beneath it, as flat
+trace records in the graph state. The final node aggregates them per node,
+researcher, model and tool, logs the summary and optionally exports the
+whole trace as JSON.
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler, BaseCallbackManager
+from langchain_core.outputs import LLMResult
+from langgraph.types import Command
+
+from agent.configuration import Configuration
+
+TraceRecord = Dict[str, Any]
+
+
+class NodeTracer(BaseCallbackHandler):
+    """Callback handler recording the LLM calls, tool calls and nested node runs of a node."""
+
+    # Record synchronously on the event loop instead of in a thread pool
+    run_inline = True
+
+    def __init__(self):
+        """Initialize an empty tracer."""
+        self.records: List[TraceRecord] = []
+        self._pending: Dict[UUID, TraceRecord] = {}
+        self._lock = threading.Lock()
+
+    def _start(self, run_id: UUID, kind: str, name: str, metadata: Optional[Dict[str, Any]]) -> None:
+        """Open a record for a run."""
+        metadata = metadata or {}
+        record = {
+            "kind": kind,
+            "name": name,
+            "node": metadata.get("langgraph_node"),
+            "research_unit": metadata.get("research_unit"),
+            "research_topic": metadata.get("research_topic"),
+            "started_at": time.time(),
+            "duration_seconds": 0.0,
+            "error": False,
+        }
+        if kind == "llm":
+            record.update(input_tokens=0, output_tokens=0)
+        with self._lock:
+            self._pending[run_id] = record
+
+    def _finish(self, run_id: UUID, error: bool = False, **fields: Any) -> None:
+        """Close the record of a run."""
+        with self._lock:
+            record = self._pending.pop(run_id, None)
+            if record is None:
+                return
+            record["duration_seconds"] = time.time() - record["started_at"]
+            record["error"] = error
+            record.update(fields)
+            self.records.append(record)
+
+    def on_chain_start(self, serialized, inputs, *, run_id, metadata=None, **kwargs: Any) -> None:
+        """Record nested subgraph nodes, e.g. researcher and compress_research."""
+        name = kwargs.get("name")
+        if name and metadata and metadata.get("langgraph_node") == name:
+            self._start(run_id, "node", name, metadata)
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs: Any) -> None:
+        """Close a nested node record."""
+        self._finish(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs: Any) -> None:
+        """Close a nested node record after an error."""
+        self._finish(run_id, error=True)
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, **kwargs: Any) -> None:
+        """Open an LLM call record."""
+        name = (metadata or {}).get("ls_model_name") or kwargs.get("name") or "unknown"
+        self._start(run_id, "llm", name, metadata)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, metadata=None, **kwargs: Any) -> None:
+        """Open an LLM call record for completion models."""
+        self.on_chat_model_start(serialized, prompts, run_id=run_id, metadata=metadata, **kwargs)
+
+    def on_llm_end(self, response: LLMResult, *, run_id, **kwargs: Any) -> None:
+        """Close an LLM call record with its token usage."""
+        input_tokens, output_tokens = get_token_usage(response)
+        self._finish(run_id, input_tokens=input_tokens, output_tokens=output_tokens)
+
+    def on_llm_error(self, error, *, run_id, **kwargs: Any) -> None:
+        """Close an LLM call record after an error."""
+        self._finish(run_id, error=True)
+
+    def on_tool_start(self, serialized, input_str, *, run_id, metadata=None, **kwargs: Any) -> None:
+        """Open a tool call record."""
+        name = kwargs.get("name") or (serialized or {}).get("name") or "unknown"
+        self._start(run_id, "tool", name, metadata)
+
+    def on_tool_end(self, output, *, run_id, **kwargs: Any) -> None:
+        """Close a tool call record."""
+        self._finish(run_id)
+
+    def on_tool_error(self, error, *, run_id, **kwargs: Any) -> None:
+        """Close a tool call record after an error."""
+        self._finish(run_id, error=True)
+
+
+def get_token_usage(response: LLMResult) -> "tuple[int, int]":
+    """Extract input and output tokens from an LLM result.
+
+    Args:
+        response: Result passed to on_llm_end
+
+    Returns:
+        Tuple of (input tokens, output tokens), zero if the provider reports none
+    """
+    input_tokens = output_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                input_tokens += usage.get("input_tokens", 0)
+                output_tokens += usage.get("output_tokens", 0)
+    if not (input_tokens or output_tokens) and response.llm_output:
+        usage = response.llm_output.get("token_usage") or response.llm_output.get("usage") or {}
+        input_tokens = usage.get("prompt_tokens", usage.get("input_tokens", 0)) or 0
+        output_tokens = usage.get("completion_tokens", usage.get("output_tokens", 0)) or 0
+    return input_tokens, output_tokens
+
+
+def traced_node(reset: bool = False, finalize: bool = False) -> Callable:
+    """Decorate a graph node to record its trace in the run_trace state key.
+
+    The node's wall time is recorded, and a NodeTracer is attached to the
+    node's callbacks so every LLM call, tool call and nested subgraph node
+    beneath it is recorded as well.
+
+    Args:
+        reset: Start a new trace, for the entry node of the graph
+        finalize: Summarize the run after this node, for the final node of the
+            graph. The summary is logged, stored as run_trace_summary and, if
+            run_trace_dir is configured, exported with the trace as JSON.
+
+    Returns:
+        Decorator for async node functions taking (state, config)
+    """
+    def decorator(node: Callable) -> Callable:
+        @functools.wraps(node)
+        async def wrapper(state, config):
+            configurable = Configuration.from_runnable_config(config)
+            if not configurable.enable_run_trace:
+                return await node(state, config)
+
+            tracer = NodeTracer()
+            callbacks = config.get("callbacks")
+            if isinstance(callbacks, BaseCallbackManager):
+                # The node's callback manager is shared with the runnable
+                # context, so calls made without passing config are traced too
+                callbacks.add_handler(tracer, inherit=True)
+
+            start = time.time()
+            try:
+                update = await node(state, config)
+            finally:
+                if isinstance(callbacks, BaseCallbackManager):
+                    callbacks.remove_handler(tracer)
+
+            records = [{
+                "kind": "node",
+                "name": node.__name__,
+                "node": node.__name__,
+                "research_unit": None,
+                "research_topic": None,
+                "started_at": start,
+                "duration_seconds": time.time() - start,
+                "error": False,
+            }] + tracer.records
+            trace_update: Dict[str, Any] = {
+                "run_trace": {"type": "override", "value": records} if reset else records
+            }
+
+            if finalize:
+                run_records = list(state.get("run_trace", [])) + records
+                summary = summarize_run_trace(run_records)
+                trace_update["run_trace_summary"] = summary
+                logging.info(format_run_summary(summary))
+                if configurable.run_trace_dir:
+                    try:
+                        path = await asyncio.to_thread(
+                            export_run_trace,
+                            run_records,
+                            summary,
+                            configurable.run_trace_dir,
+                            config.get("configurable", {}).get("thread_id")
+                        )
+                        logging.info(f"Run trace written to {path}")
+                    except OSError as e:
+                        logging.warning(f"Failed to export run trace: {e}")
+
+            if isinstance(update, Command):
+                return Command(
+                    graph=update.graph,
+                    goto=update.goto,
+                    resume=update.resume,
+                    update={**(update.update or {}), **trace_update},
+                )
+            return {**(update or {}), **trace_update}
+        return wrapper
+    return decorator
+
+
+def summarize_run_trace(records: List[TraceRecord]) -> Dict[str, Any]:
+    """Aggregate trace records per node, researcher, model and tool.
+
+    Args:
+        records: Trace records of one run
+
+    Returns:
+        Summary with totals and per node, researcher, model and tool breakdowns
+    """
+    def bucket() -> Dict[str, Any]:
+        return {
+            "runs": 0,
+            "wall_time_seconds": 0.0,
+            "llm_calls": 0,
+            "llm_time_seconds": 0.0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "tool_calls": 0,
+            "tool_time_seconds": 0.0,
+            "errors": 0,
+        }
+
+    nodes: Dict[str, Dict[str, Any]] = defaultdict(bucket)
+    researchers: Dict[str, Dict[str, Any]] = defaultdict(bucket)
+    models: Dict[str, Dict[str, Any]] = defaultdict(bucket)
+    tools: Dict[str, Dict[str, Any]] = defaultdict(bucket)
+    totals = bucket()
+
+    for record in records:
+        kind = record["kind"]
+        targets = [nodes[record["node"] or record["name"]]]
+        if record.get("research_unit"):
+            researcher = researchers[record["research_unit"]]
+            researcher["research_topic"] = record.get("research_topic")
+            targets.append(researcher)
+
+        if kind == "node":
+            # A researcher's wall time is the sum of its node runs
+            for stats in targets:
+                stats["runs"] += 1
+                stats["wall_time_seconds"] += record["duration_seconds"]
+                stats["errors"] += record["error"]
+            continue
+
+        if kind == "llm":
+            targets += [models[record["name"]], totals]
+            for stats in targets:
+                stats["llm_calls"] += 1
+                stats["llm_time_seconds"] += record["duration_seconds"]
+                stats["input_tokens"] += record.get("input_tokens", 0)
+                stats["output_tokens"] += record.get("output_tokens", 0)
+                stats["errors"] += record["error"]
+        elif kind == "tool":
+            targets += [tools[record["name"]], totals]
+            for stats in targets:
+                stats["tool_calls"] += 1
+                stats["tool_time_seconds"] += record["duration_seconds"]
+                stats["errors"] += record["error"]
+
+    if records:
+        started_at = min(record["started_at"] for record in records)
+        ended_at = max(record["started_at"] + record["duration_seconds"] for record in records)
+        totals["wall_time_seconds"] = ended_at - started_at
+
+    def compact(groups: Dict[str, Dict[str, Any]], keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {key: round(value, 3) if isinstance(value, float) else value
+                   for key, value in stats.items() if key in keys or key == "research_topic"}
+            for name, stats in sorted(groups.items())
+        }
+
+    usage_keys = ["llm_calls", "llm_time_seconds", "input_tokens", "output_tokens",
+                  "tool_calls", "tool_time_seconds", "errors"]
+    return {
+        "totals": compact({"run": totals}, ["wall_time_seconds"] + usage_keys)["run"],
+        "nodes": compact(nodes, ["runs", "wall_time_seconds"] + usage_keys),
+        "researchers": compact(researchers, ["wall_time_seconds"] + usage_keys),
+        "models": compact(models, ["llm_calls", "llm_time_seconds", "input_tokens", "output_tokens", "errors"]),
+        "tools": compact(tools, ["tool_calls", "tool_time_seconds", "errors"]),
+    }
+
+
+def format_run_summary(summary: Dict[str, Any]) -> str:
+    """Format a run trace summary as a readable table.
+
+    Args:
+        summary: Result of summarize_run_trace
+
+    Returns:
+        Multi-line summary text
+    """
+    totals = summary["totals"]
+    lines = [
+        f"Deep research run: {totals['wall_time_seconds']:.1f}s, "
+        f"{totals['llm_calls']} LLM calls, {totals['input_tokens']} input / "
+        f"{totals['output_tokens']} output tokens, {totals['tool_calls']} tool calls",
+        "Nodes:",
+    ]
+    for name, stats in summary["nodes"].items():
+        lines.append(
+            f"  {name:<26} runs={stats['runs']:<4} wall={stats['wall_time_seconds']:8.1f}s "
+            f"llm={stats['llm_calls']:<4} tokens={stats['input_tokens']}/{stats['output_tokens']} "
+            f"tools={stats['tool_calls']} ({stats['tool_time_seconds']:.1f}s)"
+        )
+    for title, key in (("Models", "models"), ("Tools", "tools")):
+        lines.append(f"{title}:")
+        for name, stats in summary[key].items():
+            details = " ".join(
+                f"{field}={value}" for field, value in stats.items() if field != "research_topic"
+            )
+            lines.append(f"  {name}: {details}")
+    return "\n".join(lines)
+
+
+def export_run_trace(
+    records: List[TraceRecord],
+    summary: Dict[str, Any],
+    trace_dir: str,
+    run_name: Optional[str] = None,
+) -> str:
+    """Write a run trace and its summary to a JSON file.
+
+    Args:
+        records: Trace records of the run
+        summary: Result of summarize_run_trace
+        trace_dir: Directory for trace files
+        run_name: Optional file name prefix, e.g. the thread id
+
+    Returns:
+        Path of the written file
+    """
+    os.makedirs(trace_dir, exist_ok=True)
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    path = os.path.join(trace_dir, f"{run_name or uuid.uuid4().hex}-{timestamp}.json")
+    with open(path, "w") as f:
+        json.dump({"summary": summary, "records": records}, f, indent=2, default=str)
+    return path
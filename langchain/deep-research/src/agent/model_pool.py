@@ -0,0 +1,156 @@
+"""Shared pool of configured chat models for the Deep Research agent."""
+
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+
+from langchain.chat_models import init_chat_model
+from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import Runnable
+
+
+def model_client_key(model_config: Dict[str, Any]) -> Tuple[str, Optional[int], str]:
+    """Build the pool key of the chat model client for a model configuration.
+
+    Args:
+        model_config: Result of build_model_config
+
+    Returns:
+        Tuple of (model, max_tokens, API key digest); the key itself is not
+        kept in the pool key so it never shows up in reprs or logs
+    """
+    api_key = model_config.get("api_key")
+    key_digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest() if api_key else ""
+    return model_config["model"], model_config.get("max_tokens"), key_digest
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Get the running event loop, or None when called outside one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class ModelClientPool:
+    """Memoizes configured chat models and the runnables built on them.
+
+    A chat model is created once per (model, max_tokens, API key) and
+    event loop, so its HTTP or boto client and connection pool are shared
+    by every node and researcher instead of being created for every call.
+    Runnables wrapping it with structured output, retries and tags are
+    memoized as well. The least recently used entries are dropped beyond
+    max_entries.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        """Initialize the pool.
+
+        Args:
+            max_entries: Maximum number of chat models and runnables kept
+        """
+        self.max_entries = max(1, max_entries)
+        self._models: OrderedDict[Hashable, Tuple[Any, BaseChatModel]] = OrderedDict()
+        self._runnables: OrderedDict[Hashable, Tuple[Any, Runnable]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_chat_model(self, model_config: Dict[str, Any]) -> BaseChatModel:
+        """Get the shared chat model for a model configuration.
+
+        Args:
+            model_config: Result of build_model_config
+
+        Returns:
+            Chat model without tags, tools or structured output
+        """
+        key = model_client_key(model_config)
+        loop = _running_loop()
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is not None and entry[0] is loop:
+                self._models.move_to_end(key)
+                return entry[1]
+
+        # Async HTTP clients are bound to the event loop they were created on
+        model = init_chat_model(**{
+            name: model_config[name]
+            for name in ("model", "max_tokens", "api_key")
+            if model_config.get(name) is not None
+        })
+        with self._lock:
+            self._models[key] = (loop, model)
+            self._models.move_to_end(key)
+            while len(self._models) > self.max_entries:
+                self._models.popitem(last=False)
+        return model
+
+    def get_model(
+        self,
+        model_config: Dict[str, Any],
+        structured_output: Optional[type] = None,
+        tools: Optional[Sequence[Any]] = None,
+        retries: int = 0,
+    ) -> Runnable:
+        """Get a chat model configured for one kind of call.
+
+        Runnables with structured output or without tools are memoized.
+        Tool bindings are not, since toolsets change between
+        configurations; they are bound on the shared chat model instead.
+
+        Args:
+            model_config: Result of build_model_config
+            structured_output: Optional schema the model responds with
+            tools: Optional tools bound to the model
+            retries: Attempts per call, 0 for no retry wrapper
+
+        Returns:
+            Runnable invoking the shared chat model
+        """
+        model = self.get_chat_model(model_config)
+        if tools is not None:
+            return self._wrap(model.bind_tools(tools), model_config, retries)
+
+        key = (model_client_key(model_config), tuple(model_config.get("tags") or ()), structured_output, retries)
+        with self._lock:
+            entry = self._runnables.get(key)
+            if entry is not None and entry[0] is model:
+                self._runnables.move_to_end(key)
+                return entry[1]
+
+        runnable = model if structured_output is None else model.with_structured_output(structured_output)
+        runnable = self._wrap(runnable, model_config, retries)
+        with self._lock:
+            self._runnables[key] = (model, runnable)
+            self._runnables.move_to_end(key)
+            while len(self._runnables) > self.max_entries:
+                self._runnables.popitem(last=False)
+        return runnable
+
+    def clear(self) -> None:
+        """Drop all pooled models and runnables."""
+        with self._lock:
+            self._models.clear()
+            self._runnables.clear()
+
+    @staticmethod
+    def _wrap(runnable: Runnable, model_config: Dict[str, Any], retries: int) -> Runnable:
+        """Add the retry wrapper and tags of a model configuration."""
+        if retries:
+            runnable = runnable.with_retry(stop_after_attempt=retries)
+        if model_config.get("tags"):
+            runnable = runnable.with_config(tags=list(model_config["tags"]))
+        return runnable
+
+
+# Process-wide pool shared by every node, researcher and search tool
+_pool = ModelClientPool()
+
+def get_model_pool() -> ModelClientPool:
+    """Get the process-wide model client pool.
+
+    Returns:
+        Shared ModelClientPool instance
+    """
+    return _pool
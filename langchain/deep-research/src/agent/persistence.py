@@ -0,0 +1,50 @@
+"""Local SQLite persistence for resumable Deep Research runs."""
+
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Tuple
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.store.base import BaseStore
+
+
+@asynccontextmanager
+async def open_sqlite_persistence(path: str) -> AsyncIterator[Tuple[BaseCheckpointSaver, BaseStore]]:
+    """Open a SQLite checkpointer and store for running the graph locally.
+
+    Requires the optional ``langgraph-checkpoint-sqlite`` dependency
+    (``pip install "deep_research[sqlite]"``). Any other checkpoint saver
+    or store can be passed to build_graph instead.
+
+    Example:
+        async with open_sqlite_persistence("research.db") as (checkpointer, store):
+            graph = build_graph(checkpointer=checkpointer, store=store)
+            config = {"configurable": {"thread_id": "my-run"}}
+            await graph.ainvoke({"messages": [...]}, config)
+            # After a crash, resume from the last completed node
+            await graph.ainvoke(None, config)
+
+    Args:
+        path: SQLite database file holding checkpoints and memoized research
+
+    Yields:
+        Tuple of (checkpointer, store)
+    """
+    try:
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+        from langgraph.store.sqlite.aio import AsyncSqliteStore
+    except ImportError as e:
+        raise ImportError(
+            "SQLite persistence requires langgraph-checkpoint-sqlite: "
+            "pip install langgraph-checkpoint-sqlite"
+        ) from e
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    async with AsyncSqliteSaver.from_conn_string(path) as checkpointer:
+        async with AsyncSqliteStore.from_conn_string(path) as store:
+            await checkpointer.setup()
+            await store.setup()
+            yield checkpointer, store
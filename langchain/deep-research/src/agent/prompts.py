@@ -308,6 +308,75 @@ Format the report in clear markdown with proper structure and include source ref
 """
 
 
+final_report_outline_prompt = """Based on all the research conducted, plan the outline of a comprehensive, well-structured answer to the overall research brief:
+<Research Brief>
+{research_brief}
+</Research Brief>
+
+For more context, here is all of the messages so far. Focus on the research brief above, but consider these messages as well for more context.
+<Messages>
+{messages}
+</Messages>
+
+Today's date is {date}.
+
+Here are the findings from the research that you conducted:
+<Findings>
+{findings}
+</Findings>
+
+Plan a report title and the sections of the report. Each section will be written independently by a separate writer who sees the same findings and your outline, so:
+1. Make each section self-contained and cover a distinct part of the answer. Avoid overlapping sections.
+2. Describe in each section's description exactly what the section should cover, including which findings it should use.
+3. Use only as many sections as the question needs. A list or a simple answer may need a single section; an overview or comparison may need an introduction, several body sections and a conclusion.
+4. Do not plan a "Sources" section. Sources are compiled automatically.
+
+CRITICAL: Write the title, section names and descriptions in the same language as the human messages!
+"""
+
+final_report_section_prompt = """You are writing one section of a comprehensive research report that answers the overall research brief:
+<Research Brief>
+{research_brief}
+</Research Brief>
+
+For more context, here is all of the messages so far. Focus on the research brief above, but consider these messages as well for more context.
+<Messages>
+{messages}
+</Messages>
+CRITICAL: Make sure the section is written in the same language as the human messages!
+
+Today's date is {date}.
+
+Here are the findings from the research that you conducted:
+<Findings>
+{findings}
+</Findings>
+
+The report is titled "{report_title}" and has the following outline. Other writers are writing the other sections at the same time:
+<Outline>
+{outline}
+</Outline>
+
+Write ONLY this section:
+<Section>
+{section_name}: {section_description}
+</Section>
+
+For the section, do the following:
+- Start with the section title as a ## Markdown heading, and use ### for subsections
+- Use simple, clear language, and include specific facts and insights from the research
+- Only cover what this section is responsible for. Do not repeat content that belongs to other sections of the outline, and do not write an introduction or conclusion for the whole report unless this section is one
+- Do NOT ever refer to yourself as the writer of the report, and do not say what you are doing. This should be a professional report without any self-referential language.
+- Be as long as necessary to deeply answer this part of the question with the information you have gathered.
+- Use bullet points to list out information when appropriate, but by default, write in paragraph form.
+
+<Citation Rules>
+- Cite sources inline as Markdown links using their title and URL, e.g. [Source Title](https://example.com)
+- Use the exact URLs from the findings
+- Do NOT number citations and do NOT add a Sources section; numbered sources are compiled for the whole report automatically
+</Citation Rules>
+"""
+
 summarize_webpage_prompt = """You are tasked with summarizing the raw content of a webpage retrieved from a web search. Your goal is to create a summary that preserves the most important information from the original web page. This summary will be used by a downstream research agent, so it's crucial to maintain the key details without losing essential information.
 
 Here is the raw content of the webpage:
@@ -0,0 +1,98 @@
+"""Worker pool that runs the research units delegated by the supervisor."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+class ResearchUnitPool:
+    """Runs research units on a fixed number of workers.
+
+    Every requested unit is queued and each worker starts the next unit as
+    soon as its current one finishes, so a slow unit only holds up its own
+    worker instead of the whole batch. A progress event is emitted when a
+    unit is queued, started and completed.
+    """
+
+    def __init__(
+        self,
+        run_unit: Callable[[str], Awaitable[Dict[str, Any]]],
+        max_workers: int,
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            run_unit: Coroutine function researching one topic
+            max_workers: Maximum number of units running at once
+            on_event: Optional callback receiving progress events
+        """
+        self.run_unit = run_unit
+        self.max_workers = max(1, max_workers)
+        self.on_event = on_event
+
+    async def run(self, research_topics: List[str]) -> List[Dict[str, Any]]:
+        """Research all topics and return their results in request order.
+
+        If a unit raises, the remaining units are cancelled and the error
+        is propagated.
+
+        Args:
+            research_topics: Topics to research
+
+        Returns:
+            Result of every unit, in the order of research_topics
+        """
+        queue: asyncio.Queue[Tuple[int, str]] = asyncio.Queue()
+        for index, research_topic in enumerate(research_topics):
+            queue.put_nowait((index, research_topic))
+            self._emit("queued", index, research_topic)
+
+        results: List[Dict[str, Any]] = [{} for _ in research_topics]
+        completed = 0
+
+        async def worker():
+            nonlocal completed
+            while True:
+                try:
+                    index, research_topic = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                self._emit("started", index, research_topic)
+                start = time.monotonic()
+                results[index] = await self.run_unit(research_topic)
+                completed += 1
+                self._emit(
+                    "completed",
+                    index,
+                    research_topic,
+                    duration_seconds=round(time.monotonic() - start, 3),
+                    completed=completed,
+                    total=len(research_topics),
+                    compressed_research=results[index].get("compressed_research", ""),
+                )
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.max_workers, len(research_topics)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        return results
+
+    def _emit(self, status: str, index: int, research_topic: str, **details: Any) -> None:
+        """Send a progress event for a research unit."""
+        if self.on_event is not None:
+            self.on_event({
+                "type": "research_unit",
+                "status": status,
+                "index": index,
+                "research_topic": research_topic,
+                **details,
+            })
@@ -40,6 +40,26 @@ class ClarifyWithUser(BaseModel):
         description="Verify message that we will start research after the user has provided the necessary information.",
     )
 
+class ReportSection(BaseModel):
+    """A section in the outline of the final report."""
+    
+    name: str = Field(
+        description="Title of the section.",
+    )
+    description: str = Field(
+        description="What the section covers and which findings it should use.",
+    )
+
+class ReportOutline(BaseModel):
+    """Outline of the final report used to draft sections in parallel."""
+    
+    title: str = Field(
+        description="Title of the report.",
+    )
+    sections: list[ReportSection] = Field(
+        description="Sections of the report, in reading order. Do not include a Sources section.",
+    )
+
 class ResearchQuestion(BaseModel):
     """Research question and brief for guiding research."""
     
@@ -70,6 +90,21 @@ class AgentState(MessagesState):
     raw_notes: Annotated[list[str], override_reducer] = []
     notes: Annotated[list[str], override_reducer] = []
     final_report: str
+    run_trace: Annotated[list[dict], override_reducer] = []
+    run_trace_summary: Optional[dict]
+
+class SupervisorInputState(TypedDict):
+    """Input to the supervisor subgraph, without the parent's run_trace.
+
+    The subgraph's run_trace then holds only the records of its own nodes,
+    which the parent appends to its trace when the subgraph returns.
+    """
+    
+    supervisor_messages: Annotated[list[MessageLikeRepresentation], override_reducer]
+    research_brief: str
+    notes: Annotated[list[str], override_reducer] = []
+    research_iterations: int = 0
+    raw_notes: Annotated[list[str], override_reducer] = []
 
 class SupervisorState(TypedDict):
     """State for the supervisor that manages research tasks."""
@@ -79,6 +114,7 @@ class SupervisorState(TypedDict):
     notes: Annotated[list[str], override_reducer] = []
     research_iterations: int = 0
     raw_notes: Annotated[list[str], override_reducer] = []
+    run_trace: Annotated[list[dict], override_reducer] = []
 
 class ResearcherState(TypedDict):
     """State for individual researchers conducting research."""
@@ -0,0 +1,154 @@
+"""Scheduling of webpage summarization calls for the Deep Research agent."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+
+def estimate_summarization_tokens(webpage_content: str, max_output_tokens: int) -> int:
+    """Estimate the tokens a summarization call consumes.
+
+    Args:
+        webpage_content: Webpage content that is summarized
+        max_output_tokens: Maximum output tokens of the summarization model
+
+    Returns:
+        Rough token count using about four characters per token
+    """
+    return len(webpage_content) // 4 + max_output_tokens
+
+
+class SummarizationScheduler:
+    """Admission control for summarization calls to one model.
+
+    Calls are admitted in priority order (lower first, e.g. search rank)
+    while fewer than max_concurrency calls are running and their estimated
+    tokens fit the tokens-per-minute budget. The budget is a token bucket
+    that refills continuously at tokens_per_minute / 60 per second; a
+    budget of 0 disables token budgeting.
+    """
+
+    def __init__(self, max_concurrency: int = 8, tokens_per_minute: int = 0):
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrency: Maximum number of calls running at once
+            tokens_per_minute: Token budget per minute, 0 for unlimited
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.tokens_per_minute = max(0, tokens_per_minute)
+        self.running = 0
+        self._tokens = float(self.tokens_per_minute)
+        self._refilled_at = time.monotonic()
+        self._waiters: List[Tuple[int, int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting to be admitted."""
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    @asynccontextmanager
+    async def slot(self, priority: int = 0, tokens: int = 0) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the enclosed block.
+
+        Args:
+            priority: Admission priority, lower values are admitted first
+            tokens: Estimated tokens the call consumes
+        """
+        await self.acquire(priority, tokens)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: int = 0, tokens: int = 0) -> None:
+        """Wait until a call may start.
+
+        Args:
+            priority: Admission priority, lower values are admitted first
+            tokens: Estimated tokens the call consumes
+        """
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), tokens, future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted right before being cancelled; hand the slot back
+                self.release()
+            else:
+                # A cancelled waiter may have been blocking the queue
+                self._dispatch()
+            raise
+
+    def release(self) -> None:
+        """Release a slot and admit waiting calls."""
+        self.running -= 1
+        self._dispatch()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill to the bucket."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.tokens_per_minute),
+            self._tokens + (now - self._refilled_at) * self.tokens_per_minute / 60.0
+        )
+        self._refilled_at = now
+
+    def _dispatch(self) -> None:
+        """Admit waiting calls in priority order while capacity allows."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._waiters and self.running < self.max_concurrency:
+            _, _, tokens, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+
+            if self.tokens_per_minute:
+                self._refill()
+                # Calls larger than the whole budget only wait for a full bucket
+                needed = min(tokens, self.tokens_per_minute)
+                if self._tokens < needed:
+                    delay = (needed - self._tokens) * 60.0 / self.tokens_per_minute
+                    self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                    return
+                self._tokens -= needed
+
+            heapq.heappop(self._waiters)
+            self.running += 1
+            future.set_result(None)
+
+
+# Shared schedulers keyed by model and limits, so every researcher in the
+# process draws from the same concurrency and token budget per model
+_schedulers: Dict[Tuple[str, int, int], SummarizationScheduler] = {}
+
+def get_summarization_scheduler(
+    model_name: str,
+    max_concurrency: int,
+    tokens_per_minute: int = 0,
+) -> SummarizationScheduler:
+    """Get the shared summarization scheduler for a model.
+
+    Args:
+        model_name: Summarization model identifier
+        max_concurrency: Maximum number of calls running at once
+        tokens_per_minute: Token budget per minute, 0 for unlimited
+
+    Returns:
+        Process-wide SummarizationScheduler instance
+    """
+    key = (model_name, max_concurrency, tokens_per_minute)
+    scheduler = _schedulers.get(key)
+    if scheduler is None:
+        scheduler = _schedulers[key] = SummarizationScheduler(max_concurrency, tokens_per_minute)
+    return scheduler
@@ -0,0 +1,235 @@
+"""Shared cache of webpage summaries for the Deep Research agent."""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+
+def summary_cache_key(url: str, content: str, model_name: str) -> str:
+    """Build the cache key for a webpage summary.
+
+    Args:
+        url: URL of the webpage
+        content: Webpage content that is summarized
+        model_name: Summarization model identifier
+
+    Returns:
+        Hex digest identifying the (URL, content, model) combination
+    """
+    content_hash = hashlib.sha256(content.encode()).hexdigest()
+    return hashlib.sha256(f"{model_name}\n{url}\n{content_hash}".encode()).hexdigest()
+
+
+class SummaryCache:
+    """Two-tier cache of webpage summaries.
+
+    Summaries are kept in an in-process LRU shared by all researchers and,
+    if a path is given, in a SQLite database so they survive across runs.
+    Both tiers expire entries after the TTL. Concurrent requests for the
+    same key are summarized once.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl_seconds: float = 7 * 24 * 3600,
+        path: Optional[str] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of summaries kept in memory
+            ttl_seconds: Seconds a summary stays valid
+            path: Optional SQLite database file for the persistent tier
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        if path:
+            self._init_db()
+
+    async def get_or_summarize(
+        self,
+        key: str,
+        summarize: Callable[[], Awaitable[Optional[str]]],
+        url: str = "",
+    ) -> Optional[str]:
+        """Return the cached summary for a key, summarizing on a miss.
+
+        Args:
+            key: Cache key from summary_cache_key
+            summarize: Coroutine function producing the summary; a None
+                result is returned but not cached
+            url: URL of the webpage, stored for inspection only
+
+        Returns:
+            Cached or newly produced summary
+        """
+        while True:
+            summary = await self.get(key)
+            if summary is not None:
+                return summary
+
+            # Another researcher is already summarizing this page
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The summarizing researcher was cancelled, not this one;
+                # look the page up again and summarize it here if needed
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            summary = await summarize()
+        except asyncio.CancelledError:
+            del self._inflight[key]
+            future.cancel()
+            raise
+        except BaseException as e:
+            del self._inflight[key]
+            future.set_exception(e)
+            # Mark retrieved so an unobserved failure is not logged
+            future.exception()
+            raise
+
+        del self._inflight[key]
+        future.set_result(summary)
+        if summary is not None:
+            await self.put(key, summary, url)
+        return summary
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look a summary up in memory, then on disk.
+
+        Args:
+            key: Cache key from summary_cache_key
+
+        Returns:
+            Cached summary, or None if missing or expired
+        """
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            created_at, summary = entry
+            if now - created_at < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return summary
+            del self._entries[key]
+
+        if self.path:
+            row = await asyncio.to_thread(self._db_get, key, now - self.ttl_seconds)
+            if row is not None:
+                created_at, summary = row
+                self._remember(key, summary, created_at)
+                self.hits += 1
+                return summary
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, summary: str, url: str = "") -> None:
+        """Store a summary in both tiers.
+
+        Args:
+            key: Cache key from summary_cache_key
+            summary: Summary to store
+            url: URL of the webpage, stored for inspection only
+        """
+        created_at = time.time()
+        self._remember(key, summary, created_at)
+        if self.path:
+            try:
+                await asyncio.to_thread(self._db_put, key, url, summary, created_at)
+            except sqlite3.Error as e:
+                logging.warning(f"Failed to persist summary to {self.path}: {e}")
+
+    def _remember(self, key: str, summary: str, created_at: float) -> None:
+        """Add a summary to the in-memory LRU, evicting the oldest entries."""
+        self._entries[key] = (created_at, summary)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the SQLite tier."""
+        return sqlite3.connect(self.path, timeout=10.0)
+
+    def _init_db(self) -> None:
+        """Create the SQLite table if it does not exist."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                "key TEXT PRIMARY KEY, url TEXT, summary TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS summaries_created_at ON summaries (created_at)"
+            )
+
+    def _db_get(self, key: str, oldest: float) -> Optional[Tuple[float, str]]:
+        """Read a non-expired summary from SQLite."""
+        try:
+            with self._connect() as conn:
+                return conn.execute(
+                    "SELECT created_at, summary FROM summaries WHERE key = ? AND created_at >= ?",
+                    (key, oldest),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logging.warning(f"Failed to read summary cache {self.path}: {e}")
+            return None
+
+    def _db_put(self, key: str, url: str, summary: str, created_at: float) -> None:
+        """Write a summary to SQLite and purge expired rows."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, url, summary, created_at) VALUES (?, ?, ?, ?)",
+                (key, url, summary, created_at),
+            )
+            conn.execute(
+                "DELETE FROM summaries WHERE created_at < ?",
+                (created_at - self.ttl_seconds,),
+            )
+
+
+# Shared caches keyed by their settings, so all researchers and runs in the
+# process use the same cache for the same configuration
+_summary_caches: Dict[Tuple[int, float, Optional[str]], SummaryCache] = {}
+
+def get_summary_cache(
+    max_entries: int,
+    ttl_seconds: float,
+    path: Optional[str] = None,
+) -> SummaryCache:
+    """Get the shared summary cache for the given settings.
+
+    Args:
+        max_entries: Maximum number of summaries kept in memory
+        ttl_seconds: Seconds a summary stays valid
+        path: Optional SQLite database file for the persistent tier
+
+    Returns:
+        Process-wide SummaryCache instance
+    """
+    settings = (max_entries, ttl_seconds, path or None)
+    cache = _summary_caches.get(settings)
+    if cache is None:
+        cache = _summary_caches[settings] = SummaryCache(max_entries, ttl_seconds, path or None)
+    return cache
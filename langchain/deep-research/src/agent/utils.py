@@ -1,14 +1,16 @@
 """Utility functions and helpers for the Deep Research agent."""
 
 import asyncio
+import hashlib
+import json
 import logging
 import os
+import time
 import warnings
 from datetime import datetime, timedelta, timezone
 from typing import Annotated, Any, Dict, List, Literal, Optional
 
 import aiohttp
-from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import (
     AIMessage,
@@ -25,13 +27,20 @@ from langchain_core.tools import (
     tool,
 )
 from langchain_mcp_adapters.client import MultiServerMCPClient
-from langgraph.config import get_store
+from langchain_mcp_adapters.tools import load_mcp_tools as load_mcp_session_tools
+from langgraph.config import get_store, get_stream_writer
 from mcp import McpError
 from tavily import AsyncTavilyClient
 
 from agent.configuration import Configuration, SearchAPI
+from agent.model_pool import get_model_pool
 from agent.prompts import summarize_webpage_prompt
 from agent.state import ResearchComplete, Summary
+from agent.summarization_scheduler import (
+    estimate_summarization_tokens,
+    get_summarization_scheduler,
+)
+from agent.summary_cache import get_summary_cache, summary_cache_key
 
 ##########################
 # AWS Credentials Setup
@@ -86,10 +95,10 @@ async def tavily_search(
     # Step 2: Deduplicate results by URL to avoid processing the same content multiple times
     unique_results = {}
     for response in search_results:
-        for result in response['results']:
+        for rank, result in enumerate(response['results']):
             url = result['url']
             if url not in unique_results:
-                unique_results[url] = {**result, "query": response['query']}
+                unique_results[url] = {**result, "query": response['query'], "rank": rank}
     
     # Step 3: Set up the summarization model with configuration
     configurable = Configuration.from_runnable_config(config)
@@ -104,28 +113,19 @@ async def tavily_search(
         config,
         tags=["langsmith:nostream"]
     )
-    summarization_model = init_chat_model(
-        **summarization_model_config
-    ).with_structured_output(Summary).with_retry(
-        stop_after_attempt=configurable.max_structured_output_retries
+    summarization_model = get_model_pool().get_model(
+        summarization_model_config,
+        structured_output=Summary,
+        retries=configurable.max_structured_output_retries
     )
     
-    # Step 4: Create summarization tasks (skip empty content)
-    async def noop():
-        """No-op function for results without raw content."""
-        return None
-    
-    summarization_tasks = [
-        noop() if not result.get("raw_content") 
-        else summarize_webpage(
-            summarization_model, 
-            result['raw_content'][:max_char_to_include]
-        )
-        for result in unique_results.values()
-    ]
-    
-    # Step 5: Execute all summarization tasks in parallel
-    summaries = await asyncio.gather(*summarization_tasks)
+    # Step 4-5: Summarize all results through the shared scheduler (skip empty content)
+    summaries = await summarize_search_results(
+        summarization_model,
+        unique_results,
+        max_char_to_include,
+        config
+    )
     
     # Step 6: Combine results with their summaries
     summarized_results = {
@@ -190,12 +190,17 @@ async def tavily_search_async(
     search_results = await asyncio.gather(*search_tasks)
     return search_results
 
-async def summarize_webpage(model: BaseChatModel, webpage_content: str) -> str:
+async def summarize_webpage(
+    model: BaseChatModel,
+    webpage_content: str,
+    timeout: float = 60.0
+) -> str:
     """Summarize webpage content using AI model with timeout protection.
     
     Args:
         model: The chat model configured for summarization
         webpage_content: Raw webpage content to be summarized
+        timeout: Seconds to wait for the summarization
         
     Returns:
         Formatted summary with key excerpts, or original content if summarization fails
@@ -210,7 +215,7 @@ async def summarize_webpage(model: BaseChatModel, webpage_content: str) -> str:
         # Execute summarization with timeout to prevent hanging
         summary = await asyncio.wait_for(
             model.ainvoke([HumanMessage(content=prompt_content)]),
-            timeout=60.0  # 60 second timeout for summarization
+            timeout=timeout
         )
         
         # Format the summary with structured sections
@@ -223,13 +228,137 @@ async def summarize_webpage(model: BaseChatModel, webpage_content: str) -> str:
         
     except asyncio.TimeoutError:
         # Timeout during summarization - return original content
-        logging.warning("Summarization timed out after 60 seconds, returning original content")
+        logging.warning(f"Summarization timed out after {timeout} seconds, returning original content")
         return webpage_content
     except Exception as e:
         # Other errors during summarization - log and return original content
         logging.warning(f"Summarization failed with error: {str(e)}, returning original content")
         return webpage_content
 
+async def schedule_summarization(
+    model: BaseChatModel,
+    webpage_content: str,
+    config: RunnableConfig,
+    priority: int = 0,
+) -> str:
+    """Summarize webpage content once the shared scheduler admits the call.
+    
+    All researchers share one scheduler per summarization model, which
+    bounds concurrent calls and the estimated tokens per minute. The
+    summarization timeout only starts once the call is admitted.
+    
+    Args:
+        model: The chat model configured for summarization
+        webpage_content: Raw webpage content to be summarized
+        config: Runtime configuration with summarization settings
+        priority: Admission priority, lower values (better search ranks) first
+        
+    Returns:
+        Formatted summary with key excerpts, or original content if summarization fails
+    """
+    configurable = Configuration.from_runnable_config(config)
+    scheduler = get_summarization_scheduler(
+        configurable.summarization_model,
+        configurable.summarization_max_concurrency,
+        configurable.summarization_tokens_per_minute
+    )
+    tokens = estimate_summarization_tokens(
+        webpage_content,
+        configurable.summarization_model_max_tokens
+    )
+    async with scheduler.slot(priority, tokens):
+        return await summarize_webpage(
+            model,
+            webpage_content,
+            timeout=configurable.summarization_timeout_seconds
+        )
+
+async def summarize_webpage_cached(
+    model: BaseChatModel,
+    url: str,
+    webpage_content: str,
+    config: RunnableConfig,
+    priority: int = 0,
+) -> str:
+    """Summarize webpage content, reusing summaries other researchers or runs produced.
+    
+    Summaries are cached by URL, content hash and summarization model, so a
+    page is only summarized again when its content or the model changes.
+    
+    Args:
+        model: The chat model configured for summarization
+        url: URL of the webpage
+        webpage_content: Raw webpage content to be summarized
+        config: Runtime configuration with summarization and cache settings
+        priority: Admission priority, lower values (better search ranks) first
+        
+    Returns:
+        Formatted summary with key excerpts, or original content if summarization fails
+    """
+    configurable = Configuration.from_runnable_config(config)
+    if configurable.summary_cache_max_entries <= 0:
+        return await schedule_summarization(model, webpage_content, config, priority)
+    
+    cache = get_summary_cache(
+        configurable.summary_cache_max_entries,
+        configurable.summary_cache_ttl_seconds,
+        configurable.summary_cache_path
+    )
+    key = summary_cache_key(url, webpage_content, configurable.summarization_model)
+    
+    async def summarize():
+        summary = await schedule_summarization(model, webpage_content, config, priority)
+        # Failed summarizations fall back to the raw content; never cache those
+        return None if summary == webpage_content else summary
+    
+    summary = await cache.get_or_summarize(key, summarize, url=url)
+    return webpage_content if summary is None else summary
+
+async def summarize_search_results(
+    model: BaseChatModel,
+    unique_results: Dict[str, dict],
+    max_char_to_include: int,
+    config: RunnableConfig,
+) -> List[Optional[str]]:
+    """Summarize deduplicated search results, streaming each summary as it completes.
+    
+    Results are scheduled by their search rank. Every finished summary is
+    written to the LangGraph custom stream as a "search_summary" event so
+    clients can show partial results before the whole search completes.
+    
+    Args:
+        model: The chat model configured for summarization
+        unique_results: Search results keyed by URL, with raw_content and rank
+        max_char_to_include: Character limit for content passed to the model
+        config: Runtime configuration with summarization settings
+        
+    Returns:
+        Summaries in the order of unique_results, None for results without content
+    """
+    stream_writer = get_progress_writer()
+    
+    async def summarize(url: str, result: dict) -> Optional[str]:
+        if not result.get("raw_content"):
+            return None
+        summary = await summarize_webpage_cached(
+            model,
+            url,
+            result["raw_content"][:max_char_to_include],
+            config,
+            priority=result.get("rank", 0)
+        )
+        stream_writer({
+            "type": "search_summary",
+            "url": url,
+            "title": result.get("title", ""),
+            "summary": summary
+        })
+        return summary
+    
+    return await asyncio.gather(*(
+        summarize(url, result) for url, result in unique_results.items()
+    ))
+
 ##########################
 # Reflection Tool Utils
 ##########################
@@ -515,8 +644,11 @@ async def load_mcp_tools(
     
     # Step 4: Load tools from MCP server
     try:
-        client = MultiServerMCPClient(mcp_server_config)
-        available_mcp_tools = await client.get_tools()
+        available_mcp_tools = await get_mcp_session_tools(
+            "server_1",
+            mcp_server_config["server_1"],
+            configurable.tool_cache_ttl_seconds
+        )
     except Exception:
         # If MCP server connection fails, return empty list
         return []
@@ -535,13 +667,148 @@ async def load_mcp_tools(
         if mcp_tool.name not in set(configurable.mcp_config.tools):
             continue
         
-        # Wrap tool with authentication handling and add to list
-        enhanced_tool = wrap_mcp_authenticate_tool(mcp_tool)
+        # Wrap a copy with authentication handling, since tools from a
+        # persistent session are shared between calls, and add to list
+        enhanced_tool = wrap_mcp_authenticate_tool(mcp_tool.model_copy())
         configured_tools.append(enhanced_tool)
     
     return configured_tools
 
 
+##########################
+# MCP Session Pool
+##########################
+
+class _MCPSession:
+    """A persistent MCP session and the tools bound to it.
+    
+    The session is opened and closed by a dedicated background task, since
+    the MCP client's task groups must be exited by the task that entered them.
+    """
+    
+    def __init__(self, server_name: str, connection: dict[str, Any]):
+        """Start opening a session to an MCP server.
+        
+        Args:
+            server_name: Name of the MCP server connection
+            connection: Connection settings for MultiServerMCPClient
+        """
+        self.loop = asyncio.get_running_loop()
+        self.last_used = time.monotonic()
+        self._server_name = server_name
+        self._connection = connection
+        self._tools: Optional[List[BaseTool]] = None
+        self._error: Optional[BaseException] = None
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+    
+    @property
+    def is_open(self) -> bool:
+        """Whether the session is usable from the running event loop."""
+        return (
+            self.loop is asyncio.get_running_loop()
+            and not self._closing.is_set()
+            and not self._task.done()
+        )
+    
+    async def _run(self):
+        """Open the session, load its tools and keep it open until closed."""
+        try:
+            client = MultiServerMCPClient({self._server_name: self._connection})
+            async with client.session(self._server_name) as session:
+                self._tools = await load_mcp_session_tools(session)
+                self._ready.set()
+                await self._closing.wait()
+        except Exception as e:
+            self._error = e
+            if self._tools is not None:
+                logging.warning(f"MCP session to {self._server_name} closed unexpectedly: {e}")
+        finally:
+            self._ready.set()
+    
+    async def get_tools(self) -> List[BaseTool]:
+        """Wait for the session to open and return its tools.
+        
+        Returns:
+            Tools whose calls run over this session
+            
+        Raises:
+            Exception: The error that prevented the session from opening
+        """
+        await self._ready.wait()
+        if self._tools is None:
+            raise self._error or RuntimeError(f"MCP session to {self._server_name} was closed")
+        self.last_used = time.monotonic()
+        return self._tools
+    
+    async def aclose(self):
+        """Close the session and wait for its background task to finish."""
+        self._closing.set()
+        if self.loop is asyncio.get_running_loop():
+            await asyncio.wait([self._task], timeout=5.0)
+
+# Open MCP sessions keyed by server name and connection settings
+_mcp_sessions: Dict[str, _MCPSession] = {}
+
+def _fingerprint(value: Any) -> str:
+    """Stable hash of a JSON-serializable value, used as a cache key."""
+    serialized = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+async def get_mcp_session_tools(
+    server_name: str,
+    connection: dict[str, Any],
+    idle_ttl_seconds: float,
+) -> List[BaseTool]:
+    """Load tools from an MCP server over a persistent, shared session.
+    
+    Repeated calls with the same connection settings reuse the open session
+    instead of performing a new MCP handshake. Sessions unused for longer
+    than the idle TTL are closed.
+    
+    Args:
+        server_name: Name of the MCP server connection
+        connection: Connection settings for MultiServerMCPClient
+        idle_ttl_seconds: Seconds an unused session stays open; 0 disables
+            persistent sessions
+            
+    Returns:
+        List of tools available on the MCP server
+    """
+    if idle_ttl_seconds <= 0:
+        client = MultiServerMCPClient({server_name: connection})
+        return await client.get_tools()
+    
+    key = _fingerprint([server_name, connection])
+    session = _mcp_sessions.get(key)
+    if session is None or not session.is_open:
+        session = _mcp_sessions[key] = _MCPSession(server_name, connection)
+    
+    try:
+        tools = await session.get_tools()
+    except Exception:
+        if _mcp_sessions.get(key) is session:
+            del _mcp_sessions[key]
+        raise
+    
+    # Close other sessions nobody has used within the idle TTL
+    now = time.monotonic()
+    for idle_key, idle_session in list(_mcp_sessions.items()):
+        if idle_session is not session and now - idle_session.last_used > idle_ttl_seconds:
+            del _mcp_sessions[idle_key]
+            await idle_session.aclose()
+    
+    return tools
+
+async def close_mcp_sessions():
+    """Close all persistent MCP sessions."""
+    sessions = list(_mcp_sessions.values())
+    _mcp_sessions.clear()
+    for session in sessions:
+        await session.aclose()
+
+
 ##########################
 # OpenSearch Search Tool (via MCP)
 ##########################
@@ -748,8 +1015,11 @@ async def _load_mcp_tools(config: RunnableConfig) -> List[BaseTool]:
                 mcp_server_config["opensearch"]["headers"] = auth_headers
             
             # Load tools from MCP server
-            client = MultiServerMCPClient(mcp_server_config)
-            available_tools = await client.get_tools()
+            available_tools = await get_mcp_session_tools(
+                "opensearch",
+                mcp_server_config["opensearch"],
+                configurable.tool_cache_ttl_seconds
+            )
             
             break  # Success, exit loop
             
@@ -837,14 +1107,15 @@ async def _summarize_opensearch_results(result: dict, config: RunnableConfig) ->
     
     # Step 1: Extract and deduplicate results by URL (same as Tavily)
     unique_results = {}
-    for item in items:
+    for rank, item in enumerate(items):
         if item and isinstance(item, dict) and item.get("url"):
             url = item["url"]
             if url not in unique_results:
                 unique_results[url] = {
                     "url": url,
                     "title": item.get("title", ""),
-                    "raw_content": item.get("content", "")  # Use same key name as Tavily
+                    "raw_content": item.get("content", ""),  # Use same key name as Tavily
+                    "rank": rank
                 }
     
     if not unique_results:
@@ -858,28 +1129,19 @@ async def _summarize_opensearch_results(result: dict, config: RunnableConfig) ->
         config,
         tags=["langsmith:nostream"]
     )
-    summarization_model = init_chat_model(
-        **summarization_model_config
-    ).with_structured_output(Summary).with_retry(
-        stop_after_attempt=configurable.max_structured_output_retries
+    summarization_model = get_model_pool().get_model(
+        summarization_model_config,
+        structured_output=Summary,
+        retries=configurable.max_structured_output_retries
     )
     
-    # Step 3: Create summarization tasks (reuse Tavily's pattern)
-    async def noop():
-        """No-op function for results without raw content."""
-        return None
-    
-    summarization_tasks = [
-        noop() if not result.get("raw_content")
-        else summarize_webpage(
-            summarization_model,
-            result["raw_content"][:max_char_to_include]
-        )
-        for result in unique_results.values()
-    ]
-    
-    # Step 4: Execute all summarization tasks in parallel (reuse Tavily's pattern)
-    summaries = await asyncio.gather(*summarization_tasks)
+    # Step 3-4: Summarize all results through the shared scheduler (reuse Tavily's pattern)
+    summaries = await summarize_search_results(
+        summarization_model,
+        unique_results,
+        max_char_to_include,
+        config
+    )
     
     # Step 5: Combine results with their summaries (reuse Tavily's pattern)
     summarized_results = {
@@ -949,15 +1211,85 @@ async def get_search_tool(search_api: SearchAPI):
     # Default fallback for unknown search API types
     return []
     
+class _ToolRegistryEntry:
+    """Tools assembled for one configuration, shared until they expire."""
+    
+    def __init__(self, task: asyncio.Task, expires_at: float):
+        self.task = task
+        self.expires_at = expires_at
+        self.loop = asyncio.get_running_loop()
+
+# Assembled toolsets keyed by the fingerprint of the settings they depend on
+_tool_registry: Dict[str, _ToolRegistryEntry] = {}
+
+def _tool_registry_key(config: RunnableConfig, configurable: Configuration) -> str:
+    """Fingerprint the configuration values that determine the toolset."""
+    mcp_config = configurable.mcp_config
+    parts = [
+        mcp_config.model_dump() if mcp_config else None,
+        get_config_value(configurable.search_api),
+    ]
+    if mcp_config and mcp_config.auth_required:
+        # Authenticated MCP tools carry per-user credentials
+        parts.append(config.get("metadata", {}).get("owner"))
+        parts.append(config.get("configurable", {}).get("x-supabase-access-token"))
+    return _fingerprint(parts)
+
 async def get_all_tools(config: RunnableConfig):
     """Assemble complete toolkit including research, search, and MCP tools.
     
+    Toolsets are cached per configuration fingerprint for the configured
+    tool cache TTL, so the researcher loop does not reload MCP tools on
+    every iteration. Concurrent callers share a single assembly.
+    
     Args:
         config: Runtime configuration specifying search API and MCP settings
         
     Returns:
         List of all configured and available tools for research operations
     """
+    configurable = Configuration.from_runnable_config(config)
+    ttl = configurable.tool_cache_ttl_seconds
+    if ttl <= 0:
+        return await _assemble_tools(config)
+    
+    key = _tool_registry_key(config, configurable)
+    loop = asyncio.get_running_loop()
+    entry = _tool_registry.get(key)
+    if entry is None or entry.expires_at <= time.monotonic() or entry.loop is not loop:
+        entry = _ToolRegistryEntry(
+            loop.create_task(_assemble_tools(config)),
+            time.monotonic() + ttl
+        )
+        _tool_registry[key] = entry
+    
+    try:
+        tools = await asyncio.shield(entry.task)
+    except Exception:
+        # Do not cache failures; the next call tries again
+        if _tool_registry.get(key) is entry:
+            del _tool_registry[key]
+        raise
+    
+    return list(tools)
+
+async def invalidate_tool_registry(config: Optional[RunnableConfig] = None):
+    """Drop cached toolsets so the next call reloads them.
+    
+    Args:
+        config: Configuration whose toolset to drop. If omitted, every cached
+            toolset is dropped and all persistent MCP sessions are closed.
+    """
+    if config is None:
+        _tool_registry.clear()
+        await close_mcp_sessions()
+        return
+    
+    configurable = Configuration.from_runnable_config(config)
+    _tool_registry.pop(_tool_registry_key(config, configurable), None)
+
+async def _assemble_tools(config: RunnableConfig):
+    """Build the research toolset for a configuration without caching."""
     # Start with core research tools
     tools = [tool(ResearchComplete), think_tool]
     
@@ -998,6 +1330,111 @@ def get_notes_from_tool_calls(messages: list[MessageLikeRepresentation]):
     """Extract notes from tool call messages."""
     return [tool_msg.content for tool_msg in filter_messages(messages, include_types="tool")]
 
+##########################
+# Research Memo Utils
+##########################
+
+RESEARCH_MEMO_NAMESPACE = ("research_memo",)
+
+def research_memo_key(research_topic: str, config: RunnableConfig) -> str:
+    """Build the memo key for a research unit.
+    
+    Args:
+        research_topic: Topic delegated to the researcher
+        config: Runtime configuration with research settings
+        
+    Returns:
+        Hash of the topic and the settings that shape its research, including
+        the MCP toolset and, for authenticated MCP servers, the user, so
+        research gathered with one user's tools is never served to another
+    """
+    configurable = Configuration.from_runnable_config(config)
+    return _fingerprint({
+        "research_topic": research_topic.strip(),
+        "research_model": configurable.research_model,
+        "compression_model": configurable.compression_model,
+        "search_api": configurable.search_api.value,
+        "max_react_tool_calls": configurable.max_react_tool_calls,
+        "toolset": _tool_registry_key(config, configurable),
+    })
+
+def _get_memo_store(config: RunnableConfig):
+    """Get the graph's store if research memoization is enabled."""
+    configurable = Configuration.from_runnable_config(config)
+    if configurable.research_memo_ttl_seconds <= 0:
+        return None
+    try:
+        return get_store()
+    except RuntimeError:
+        # Not running inside a graph
+        return None
+
+async def get_memoized_research(research_topic: str, config: RunnableConfig) -> Optional[dict]:
+    """Retrieve the result of a completed research unit with the same topic and settings.
+    
+    Args:
+        research_topic: Topic delegated to the researcher
+        config: Runtime configuration with research and memo settings
+        
+    Returns:
+        Researcher output with compressed_research and raw_notes, or None if not memoized
+    """
+    store = _get_memo_store(config)
+    if store is None:
+        return None
+    
+    key = research_memo_key(research_topic, config)
+    try:
+        item = await store.aget(RESEARCH_MEMO_NAMESPACE, key)
+    except Exception as e:
+        logging.warning(f"Failed to read research memo: {e}")
+        return None
+    if not item:
+        return None
+    
+    # Check memo expiration (some stores return naive UTC timestamps)
+    configurable = Configuration.from_runnable_config(config)
+    created_at = item.created_at
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    expiration_time = created_at + timedelta(seconds=configurable.research_memo_ttl_seconds)
+    if datetime.now(timezone.utc) > expiration_time:
+        await store.adelete(RESEARCH_MEMO_NAMESPACE, key)
+        return None
+    
+    return {
+        "compressed_research": item.value["compressed_research"],
+        "raw_notes": item.value.get("raw_notes", [])
+    }
+
+async def memoize_research(research_topic: str, observation: dict, config: RunnableConfig):
+    """Store the result of a completed research unit so re-runs can skip it.
+    
+    Failed research units are not memoized.
+    
+    Args:
+        research_topic: Topic delegated to the researcher
+        observation: Researcher output with compressed_research and raw_notes
+        config: Runtime configuration with research and memo settings
+    """
+    store = _get_memo_store(config)
+    compressed_research = observation.get("compressed_research")
+    if store is None or not compressed_research or compressed_research.startswith("Error"):
+        return
+    
+    try:
+        await store.aput(
+            RESEARCH_MEMO_NAMESPACE,
+            research_memo_key(research_topic, config),
+            {
+                "research_topic": research_topic,
+                "compressed_research": compressed_research,
+                "raw_notes": observation.get("raw_notes", [])
+            }
+        )
+    except Exception as e:
+        logging.warning(f"Failed to memoize research: {e}")
+
 ##########################
 # Model Provider Native Websearch Utils
 ##########################
@@ -1223,6 +1660,8 @@ MODEL_TOKEN_LIMITS = {
     "bedrock:us.anthropic.claude-3-7-sonnet-20250219-v1:0": 200000,
     "bedrock:us.anthropic.claude-sonnet-4-20250514-v1:0": 200000,
     "bedrock:us.anthropic.claude-opus-4-20250514-v1:0": 200000,
+    "bedrock:global.anthropic.claude-sonnet-4-20250514-v1:0": 200000,
+    "bedrock:global.anthropic.claude-opus-4-20250514-v1:0": 200000,
     "anthropic.claude-opus-4-1-20250805-v1:0": 200000,
 }
 
@@ -1267,6 +1706,17 @@ def remove_up_to_last_ai_message(messages: list[MessageLikeRepresentation]) -> l
 # Misc Utils
 ##########################
 
+def get_progress_writer():
+    """Get a writer for progress events on the LangGraph custom stream.
+    
+    Returns:
+        The graph's stream writer, or a no-op writer when not running inside a graph
+    """
+    try:
+        return get_stream_writer()
+    except (RuntimeError, KeyError):
+        return lambda chunk: None
+
 def get_today_str() -> str:
     """Get current date formatted for display in prompts and outputs.
     
@@ -0,0 +1,95 @@
+"""Shared fixtures for running the Deep Research graph offline."""
+
+import asyncio
+import socket
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from agent.graph import build_graph
+from agent.utils import invalidate_tool_registry
+from benchmarks.graph_benchmark import (
+    CONTROLLED_SETTINGS,
+    FakeResearchModel,
+    benchmark_config,
+    install_fake_model,
+    parse_args,
+    start_search_server,
+)
+
+
+@pytest.fixture(autouse=True)
+def controlled_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep environment overrides from changing the configuration under test."""
+    for setting in CONTROLLED_SETTINGS:
+        monkeypatch.delenv(setting.upper(), raising=False)
+    # The Google search wrapper is only added when credentials are present
+    monkeypatch.setenv("GOOGLE_API_KEY", "test")
+    monkeypatch.setenv("GOOGLE_ENGINE_ID", "test")
+
+
+@pytest.fixture
+def search_port() -> int:
+    """Reserve a free localhost port for the fake search server of one test.
+
+    Every run of a test serves search on the same port, so runs share the
+    MCP configuration that toolsets and research memos are keyed by.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def run_graph_async(search_port: int) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """Run the full graph with the benchmark's fake model and search server.
+
+    The returned coroutine function takes the number of research units the
+    supervisor delegates, the number of searches per unit and configurable
+    overrides, and returns the final graph state. Custom stream events are
+    appended to events when a list is given.
+    """
+    async def run(
+        units: int = 2,
+        searches: int = 1,
+        graph: Any = None,
+        events: Optional[List[Dict[str, Any]]] = None,
+        **configurable: Any,
+    ) -> Dict[str, Any]:
+        args = parse_args(["--llm-latency-ms", "0", "--search-latency-ms", "0"])
+        install_fake_model(FakeResearchModel(research_units=units, searches_per_unit=searches))
+
+        server, server_task, url = await start_search_server(args, 500, search_port)
+        try:
+            config = benchmark_config(args, units, searches, 500, url)
+            config["configurable"].update(configurable)
+            inputs = {"messages": [HumanMessage(content="Test question")]}
+            if events is None:
+                return await (graph or build_graph()).ainvoke(inputs, config)
+
+            # Collect the custom stream events alongside the final state
+            state: Dict[str, Any] = {}
+            async for mode, chunk in (graph or build_graph()).astream(
+                inputs, config, stream_mode=["values", "custom"]
+            ):
+                if mode == "custom":
+                    events.append(chunk)
+                else:
+                    state = chunk
+            return state
+        finally:
+            await invalidate_tool_registry()
+            server.should_exit = True
+            await server_task
+
+    return run
+
+
+@pytest.fixture
+def run_graph(run_graph_async: Callable[..., Awaitable[Dict[str, Any]]]) -> Callable[..., Dict[str, Any]]:
+    """Run the full graph offline in a new event loop; see run_graph_async."""
+    def run(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        return asyncio.run(run_graph_async(*args, **kwargs))
+
+    return run
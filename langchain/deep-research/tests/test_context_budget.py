@@ -0,0 +1,82 @@
+"""Tests for prompt token budgets."""
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from agent.context_budget import (
+    TRUNCATION_MARKER,
+    TokenCounter,
+    count_message_tokens,
+    fit_messages_to_budget,
+    fit_notes_to_budget,
+    get_prompt_token_budget,
+    get_token_counter,
+    note_value,
+    register_token_counter,
+)
+
+counter = TokenCounter()
+
+
+def test_prompt_token_budget():
+    assert get_prompt_token_budget(None, 1000) is None
+    assert get_prompt_token_budget(10000, 1000, safety_margin=0.1) == 8000
+    assert get_prompt_token_budget(1000, 5000) == 0
+
+
+def test_registered_counter_with_longest_prefix():
+    short, long = TokenCounter(2.0), TokenCounter(3.0)
+    register_token_counter("test:", short)
+    register_token_counter("test:model", long)
+
+    assert get_token_counter("test:other") is short
+    assert get_token_counter("test:model-large") is long
+
+
+def test_messages_that_fit_are_unchanged():
+    messages = [HumanMessage(content="question"), ToolMessage(content="short", tool_call_id="1")]
+
+    assert fit_messages_to_budget(messages, 1000, counter) is messages
+
+
+def test_only_the_largest_tool_outputs_are_trimmed():
+    messages = [
+        HumanMessage(content="question"),
+        AIMessage(content="", tool_calls=[
+            {"name": "search", "args": {"query": str(i)}, "id": str(i)} for i in range(3)
+        ]),
+        ToolMessage(content="a" * 200, tool_call_id="0"),
+        ToolMessage(content="b" * 8000, tool_call_id="1"),
+        ToolMessage(content="c" * 8000, tool_call_id="2"),
+    ]
+    budget = 1500
+
+    fitted = fit_messages_to_budget(messages, budget, counter)
+
+    assert count_message_tokens(fitted, counter) <= budget
+    assert [type(m) for m in fitted] == [type(m) for m in messages]
+    assert fitted[2].content == "a" * 200
+    assert fitted[3].content.endswith(TRUNCATION_MARKER)
+    assert fitted[4].tool_call_id == "2"
+    # The original conversation is not modified
+    assert messages[3].content == "b" * 8000
+
+
+def test_notes_are_capped_to_a_common_size():
+    notes = ["short note", "x" * 8000, "y" * 8000]
+
+    fitted = fit_notes_to_budget(notes, 1000, counter, min_note_tokens=10)
+
+    assert fitted[0] == "short note"
+    assert sum(counter.count(note) for note in fitted) <= 1000 + 3
+    assert all(note.endswith(TRUNCATION_MARKER) for note in fitted[1:])
+
+
+def test_low_value_notes_are_dropped_first():
+    cited = "https://a https://b " + "x" * 4000
+    uncited = "y" * 4000
+
+    fitted = fit_notes_to_budget([uncited, cited], 600, counter, min_note_tokens=400)
+
+    assert note_value(cited) == 2
+    assert len(fitted) == 1
+    assert fitted[0].startswith("https://a")
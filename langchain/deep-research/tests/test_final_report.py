@@ -0,0 +1,47 @@
+"""Tests for the final report generation modes."""
+
+from agent.graph import stitch_report_sections
+
+
+def test_standard_mode(run_graph):
+    state = run_graph(final_report_mode="standard")
+
+    assert state["final_report"].startswith("## Findings")
+
+
+def test_streaming_mode_emits_deltas_and_sections(run_graph):
+    events = []
+    state = run_graph(final_report_mode="streaming", events=events)
+
+    deltas = [e["content"] for e in events if e.get("type") == "final_report_delta"]
+    sections = [e for e in events if e.get("type") == "final_report_section"]
+    assert "".join(deltas) == state["final_report"]
+    assert [(s["index"], s["level"], s["title"]) for s in sections] == [(0, 2, "Findings")]
+
+
+def test_sections_mode_drafts_every_outline_section(run_graph):
+    events = []
+    state = run_graph(final_report_mode="sections", events=events)
+
+    sections = sorted(
+        (e for e in events if e.get("type") == "final_report_section"),
+        key=lambda e: e["index"],
+    )
+    # The fake model outlines three sections
+    assert [s["title"] for s in sections] == ["Section 0", "Section 1", "Section 2"]
+    assert state["final_report"].startswith("# Benchmark Report")
+    for section in sections:
+        assert section["content"].strip() in state["final_report"]
+
+
+def test_stitch_report_sections_numbers_sources_across_sections():
+    report = stitch_report_sections("Title", [
+        "## A\n\nSee [One](https://one) and [Two](https://two).\n",
+        "## B\n\nAgain [One](https://one).",
+    ])
+
+    assert report.startswith("# Title\n\n## A")
+    assert report.index("## A") < report.index("## B")
+    assert report.count("(https://one) [1]") == 2
+    assert "(https://two) [2]" in report
+    assert report.endswith("- [1] One: https://one\n- [2] Two: https://two")
@@ -0,0 +1,49 @@
+"""Tests for the offline graph benchmark."""
+
+import json
+
+from benchmarks.graph_benchmark import fake_text, int_list, main
+
+
+def test_fake_text_is_deterministic():
+    assert fake_text("seed", 10) == fake_text("seed", 10)
+    assert len(fake_text("seed", 10).split()) == 10
+    assert fake_text("seed", 10) != fake_text("other", 10)
+
+
+def test_int_list():
+    assert int_list("1, 3,5,") == [1, 3, 5]
+
+
+def test_json_report_for_every_combination(capsys):
+    assert main([
+        "--runs", "2", "--warmup", "0", "--parallel-runs", "2",
+        "--units", "1,2", "--iterations", "1", "--content-length", "200",
+        "--llm-latency-ms", "0", "--search-latency-ms", "0", "--trace-memory", "--json",
+    ]) == 0
+
+    results = json.loads(capsys.readouterr().out)
+    assert results["parallel_runs"] == 2
+    combinations = results["combinations"]
+    assert [row["research_units"] for row in combinations] == [1, 2]
+    for row in combinations:
+        assert row["runs"] == 2
+        assert row["runs_per_second"] > 0
+        assert row["latency_p99_ms"] >= row["latency_p50_ms"]
+        assert row["heap_peak_mb"] > 0
+        assert row["report_chars"] > 0
+    # Every unit runs one search, so more units mean more tool calls
+    assert combinations[1]["tool_calls_per_run"] > combinations[0]["tool_calls_per_run"]
+    assert combinations[1]["llm_calls_per_run"] > combinations[0]["llm_calls_per_run"]
+
+
+def test_text_report(capsys):
+    assert main([
+        "--runs", "1", "--warmup", "0", "--units", "1", "--iterations", "1",
+        "--content-length", "200", "--llm-latency-ms", "0", "--search-latency-ms", "0",
+    ]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("1 runs per combination")
+    assert lines[1].split()[:3] == ["units", "iters", "content"]
+    assert lines[2].split()[:3] == ["1", "1", "200"]
@@ -0,0 +1,60 @@
+"""Tests for the per-node run trace."""
+
+from collections import Counter
+
+from langgraph.checkpoint.memory import InMemorySaver
+
+from agent.graph import build_graph
+from agent.instrumentation import summarize_run_trace
+from agent.state import override_reducer
+
+
+def node_runs(state):
+    return Counter(record["name"] for record in state["run_trace"] if record["kind"] == "node")
+
+
+def test_run_trace_records_each_node_once(run_graph):
+    state = run_graph(units=2, searches=1)
+
+    runs = node_runs(state)
+    # The supervisor subgraph must not hand the parent's records back to it
+    assert runs["clarify_with_user"] == 1
+    assert runs["write_research_brief"] == 1
+    assert runs["final_report_generation"] == 1
+    # Delegate, then complete after the research results come back
+    assert runs["supervisor"] == 2
+    assert runs["supervisor_tools"] == 2
+    assert runs["compress_research"] == 2
+
+
+def test_run_trace_summary_matches_records(run_graph):
+    state = run_graph(units=3, searches=2)
+
+    records = state["run_trace"]
+    summary = state["run_trace_summary"]
+    assert summary == summarize_run_trace(records)
+    assert summary["totals"]["llm_calls"] == sum(1 for r in records if r["kind"] == "llm")
+    assert summary["totals"]["tool_calls"] == sum(1 for r in records if r["kind"] == "tool")
+    assert summary["totals"]["input_tokens"] > 0
+    assert len(summary["researchers"]) == 3
+
+
+def test_run_trace_is_reset_by_the_entry_node(run_graph):
+    graph = build_graph(checkpointer=InMemorySaver())
+    first = run_graph(graph=graph, thread_id="trace-reset")
+    second = run_graph(graph=graph, thread_id="trace-reset")
+
+    assert len(second["run_trace"]) == len(first["run_trace"])
+    assert node_runs(second)["clarify_with_user"] == 1
+
+
+def test_run_trace_disabled(run_graph):
+    state = run_graph(enable_run_trace=False)
+
+    assert not state.get("run_trace")
+    assert state.get("run_trace_summary") is None
+
+
+def test_override_reducer():
+    assert override_reducer([1], [2]) == [1, 2]
+    assert override_reducer([1], {"type": "override", "value": [3]}) == [3]
@@ -0,0 +1,76 @@
+"""Tests for the shared model client pool."""
+
+import asyncio
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+import agent.model_pool
+from agent.model_pool import ModelClientPool, model_client_key
+
+
+@pytest.fixture
+def created(monkeypatch):
+    """Record every chat model the pool creates."""
+    models = []
+
+    def init_chat_model(**kwargs):
+        model = FakeListChatModel(responses=["ok"])
+        models.append(kwargs)
+        return model
+
+    monkeypatch.setattr(agent.model_pool, "init_chat_model", init_chat_model)
+    return models
+
+
+def config(model="openai:gpt-4.1", api_key="secret", **extra):
+    return {"model": model, "max_tokens": 100, "api_key": api_key, **extra}
+
+
+def test_key_hides_the_api_key():
+    key = model_client_key(config())
+
+    assert "secret" not in repr(key)
+    assert key != model_client_key(config(api_key="other"))
+
+
+def test_chat_model_is_shared_per_configuration(created):
+    pool = ModelClientPool()
+
+    assert pool.get_chat_model(config()) is pool.get_chat_model(config(tags=["a"]))
+    assert pool.get_chat_model(config()) is not pool.get_chat_model(config(model="openai:o3"))
+    assert len(created) == 2
+
+
+def test_chat_model_is_created_per_event_loop(created):
+    pool = ModelClientPool()
+
+    async def get():
+        return pool.get_chat_model(config())
+
+    first = asyncio.run(get())
+    second = asyncio.run(get())
+
+    assert first is not second
+    assert len(created) == 2
+
+
+def test_runnables_are_memoized(created):
+    pool = ModelClientPool()
+
+    tagged = pool.get_model(config(tags=["a"]), retries=3)
+
+    assert pool.get_model(config(tags=["a"]), retries=3) is tagged
+    assert pool.get_model(config(tags=["b"]), retries=3) is not tagged
+    assert len(created) == 1
+
+
+def test_least_recently_used_entries_are_dropped(created):
+    pool = ModelClientPool(max_entries=2)
+
+    first = pool.get_chat_model(config(model="a"))
+    pool.get_chat_model(config(model="b"))
+    pool.get_chat_model(config(model="c"))
+
+    assert pool.get_chat_model(config(model="a")) is not first
+    assert len(created) == 4
@@ -0,0 +1,91 @@
+"""Tests for checkpointed runs and research memoization."""
+
+import asyncio
+from collections import Counter
+
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.store.memory import InMemoryStore
+
+from agent.graph import build_graph
+from agent.persistence import open_sqlite_persistence
+from agent.utils import RESEARCH_MEMO_NAMESPACE, research_memo_key
+
+
+def node_runs(state):
+    return Counter(record["name"] for record in state["run_trace"] if record["kind"] == "node")
+
+
+def test_memo_key_depends_on_topic_and_research_settings():
+    config = {"configurable": {"research_model": "openai:gpt-4.1"}}
+    key = research_memo_key("Topic", config)
+
+    assert key == research_memo_key("  Topic ", config)
+    assert key != research_memo_key("Other topic", config)
+    assert key != research_memo_key("Topic", {"configurable": {"research_model": "openai:o3"}})
+
+
+def test_memo_key_depends_on_the_mcp_toolset_and_authenticated_user():
+    def config(owner, mcp_url="http://mcp", auth_required=False):
+        return {
+            "metadata": {"owner": owner},
+            "configurable": {
+                "mcp_config": {
+                    "url": mcp_url,
+                    "tools": [],
+                    "auth_required": auth_required,
+                    "username": "user",
+                    "password": "secret",
+                },
+                "x-supabase-access-token": f"token-{owner}",
+            },
+        }
+
+    assert research_memo_key("Topic", config("a")) == research_memo_key("Topic", config("b"))
+    assert research_memo_key("Topic", config("a")) != research_memo_key("Topic", config("a", "http://other"))
+    assert (
+        research_memo_key("Topic", config("a", auth_required=True))
+        != research_memo_key("Topic", config("b", auth_required=True))
+    )
+
+
+def test_completed_research_units_are_memoized(run_graph):
+    graph = build_graph(checkpointer=InMemorySaver(), store=InMemoryStore())
+
+    first = run_graph(units=2, graph=graph, thread_id="first")
+    second = run_graph(units=2, graph=graph, thread_id="second")
+
+    assert node_runs(first)["compress_research"] == 2
+    # The re-run finds both units in the store and skips their researchers
+    assert node_runs(second)["compress_research"] == 0
+    assert second["notes"] == first["notes"]
+
+
+def test_memoization_disabled_with_zero_ttl(run_graph):
+    graph = build_graph(checkpointer=InMemorySaver(), store=InMemoryStore())
+
+    run_graph(units=1, graph=graph, thread_id="first", research_memo_ttl_seconds=0)
+    second = run_graph(units=1, graph=graph, thread_id="second", research_memo_ttl_seconds=0)
+
+    assert node_runs(second)["compress_research"] == 1
+
+
+def test_sqlite_persistence_survives_reopening(run_graph_async, tmp_path):
+    path = str(tmp_path / "research.db")
+    config = {"configurable": {"thread_id": "run"}}
+
+    async def main():
+        async with open_sqlite_persistence(path) as (checkpointer, store):
+            graph = build_graph(checkpointer=checkpointer, store=store)
+            state = await run_graph_async(units=1, graph=graph, thread_id="run")
+
+        async with open_sqlite_persistence(path) as (checkpointer, store):
+            graph = build_graph(checkpointer=checkpointer, store=store)
+            snapshot = await graph.aget_state(config)
+            memos = await store.asearch(RESEARCH_MEMO_NAMESPACE)
+        return state, snapshot, memos
+
+    state, snapshot, memos = asyncio.run(main())
+
+    assert snapshot.values["final_report"] == state["final_report"]
+    assert not snapshot.next
+    assert len(memos) == 1
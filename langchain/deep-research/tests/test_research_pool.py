@@ -0,0 +1,62 @@
+"""Tests for the research unit worker pool."""
+
+import asyncio
+
+import pytest
+
+from agent.research_pool import ResearchUnitPool
+
+
+def test_results_in_request_order_with_bounded_workers():
+    running = 0
+    peak = 0
+
+    async def run_unit(topic):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        # Later topics finish first
+        await asyncio.sleep(0.01 * (5 - int(topic)))
+        running -= 1
+        return {"compressed_research": f"research {topic}"}
+
+    pool = ResearchUnitPool(run_unit, max_workers=2)
+    results = asyncio.run(pool.run([str(i) for i in range(5)]))
+
+    assert [r["compressed_research"] for r in results] == [f"research {i}" for i in range(5)]
+    assert peak == 2
+
+
+def test_progress_events():
+    events = []
+
+    async def run_unit(topic):
+        return {"compressed_research": topic.upper()}
+
+    pool = ResearchUnitPool(run_unit, max_workers=3, on_event=events.append)
+    asyncio.run(pool.run(["a", "b"]))
+
+    statuses = [(e["status"], e["index"]) for e in events]
+    assert statuses[:2] == [("queued", 0), ("queued", 1)]
+    completed = [e for e in events if e["status"] == "completed"]
+    assert sorted(e["compressed_research"] for e in completed) == ["A", "B"]
+    assert completed[-1]["completed"] == completed[-1]["total"] == 2
+
+
+def test_error_cancels_remaining_units():
+    cancelled = []
+
+    async def run_unit(topic):
+        if topic == "bad":
+            raise ValueError(topic)
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(topic)
+            raise
+        return {}
+
+    pool = ResearchUnitPool(run_unit, max_workers=3)
+    with pytest.raises(ValueError):
+        asyncio.run(pool.run(["slow", "bad", "other"]))
+    assert sorted(cancelled) == ["other", "slow"]
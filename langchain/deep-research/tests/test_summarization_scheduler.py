@@ -0,0 +1,88 @@
+"""Tests for the summarization scheduler."""
+
+import asyncio
+import time
+
+from agent.summarization_scheduler import (
+    SummarizationScheduler,
+    estimate_summarization_tokens,
+    get_summarization_scheduler,
+)
+
+
+def test_estimate_tokens():
+    assert estimate_summarization_tokens("x" * 400, 50) == 150
+
+
+def test_concurrency_is_bounded():
+    scheduler = SummarizationScheduler(max_concurrency=2)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with scheduler.slot():
+            peak = max(peak, scheduler.running)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(main())
+    assert peak == 2
+    assert scheduler.running == 0
+
+
+def test_admission_in_priority_order():
+    scheduler = SummarizationScheduler(max_concurrency=1)
+    order = []
+
+    async def call(priority):
+        async with scheduler.slot(priority=priority):
+            order.append(priority)
+
+    async def main():
+        # Hold the only slot so the others queue up
+        await scheduler.acquire()
+        tasks = [asyncio.create_task(call(priority)) for priority in (3, 1, 2)]
+        await asyncio.sleep(0)
+        assert scheduler.queued == 3
+        scheduler.release()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert order == [1, 2, 3]
+
+
+def test_token_budget_delays_admission():
+    # 6000 tokens per minute refill 100 tokens per second
+    scheduler = SummarizationScheduler(max_concurrency=4, tokens_per_minute=6000)
+
+    async def main():
+        await scheduler.acquire(tokens=6000)
+        start = time.monotonic()
+        await scheduler.acquire(tokens=10)
+        return time.monotonic() - start
+
+    waited = asyncio.run(main())
+    assert 0.05 <= waited < 1.0
+
+
+def test_cancelled_waiter_does_not_block_the_queue():
+    scheduler = SummarizationScheduler(max_concurrency=1)
+
+    async def main():
+        await scheduler.acquire()
+        blocked = asyncio.create_task(scheduler.acquire(priority=0))
+        waiting = asyncio.create_task(scheduler.acquire(priority=1))
+        await asyncio.sleep(0)
+        blocked.cancel()
+        scheduler.release()
+        await asyncio.wait_for(waiting, 1.0)
+        return scheduler.running
+
+    assert asyncio.run(main()) == 1
+
+
+def test_shared_scheduler_per_model():
+    assert get_summarization_scheduler("m", 2) is get_summarization_scheduler("m", 2)
+    assert get_summarization_scheduler("m", 2) is not get_summarization_scheduler("n", 2)
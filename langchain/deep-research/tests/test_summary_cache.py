@@ -0,0 +1,136 @@
+"""Tests for the webpage summary cache."""
+
+import asyncio
+
+from agent.summary_cache import SummaryCache, get_summary_cache, summary_cache_key
+
+
+def test_key_depends_on_url_content_and_model():
+    key = summary_cache_key("https://a", "content", "model")
+
+    assert key == summary_cache_key("https://a", "content", "model")
+    assert key != summary_cache_key("https://b", "content", "model")
+    assert key != summary_cache_key("https://a", "changed", "model")
+    assert key != summary_cache_key("https://a", "content", "other")
+
+
+def test_hit_skips_summarization():
+    cache = SummaryCache()
+    calls = []
+
+    async def summarize():
+        calls.append(1)
+        return "summary"
+
+    async def main():
+        first = await cache.get_or_summarize("key", summarize)
+        second = await cache.get_or_summarize("key", summarize)
+        return first, second
+
+    assert asyncio.run(main()) == ("summary", "summary")
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_concurrent_requests_summarize_once():
+    cache = SummaryCache()
+    calls = []
+
+    async def summarize():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "summary"
+
+    async def main():
+        return await asyncio.gather(*(cache.get_or_summarize("key", summarize) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["summary"] * 5
+    assert len(calls) == 1
+
+
+def test_cancelled_summarizer_does_not_cancel_waiters():
+    cache = SummaryCache()
+    calls = []
+
+    async def summarize():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "summary"
+
+    async def main():
+        owner = asyncio.create_task(cache.get_or_summarize("key", summarize))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(cache.get_or_summarize("key", summarize)) for _ in range(3)]
+        await asyncio.sleep(0)
+        owner.cancel()
+        results = await asyncio.gather(*waiters)
+        return owner.cancelled(), results
+
+    assert asyncio.run(main()) == (True, ["summary"] * 3)
+    assert len(calls) == 2
+
+
+def test_cancelled_waiter_leaves_the_summarizer_running():
+    cache = SummaryCache()
+
+    async def summarize():
+        await asyncio.sleep(0.01)
+        return "summary"
+
+    async def main():
+        owner = asyncio.create_task(cache.get_or_summarize("key", summarize))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_summarize("key", summarize))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        return await owner, await asyncio.gather(waiter, return_exceptions=True)
+
+    summary, (waited,) = asyncio.run(main())
+    assert summary == "summary"
+    assert isinstance(waited, asyncio.CancelledError)
+
+
+def test_none_is_not_cached():
+    cache = SummaryCache()
+    calls = []
+
+    async def summarize():
+        calls.append(1)
+        return None
+
+    async def main():
+        await cache.get_or_summarize("key", summarize)
+        await cache.get_or_summarize("key", summarize)
+
+    asyncio.run(main())
+    assert len(calls) == 2
+
+
+def test_lru_bound_and_ttl():
+    async def main():
+        cache = SummaryCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            await cache.put(key, key)
+        evicted = await cache.get("a")
+        kept = await cache.get("c")
+
+        expired = SummaryCache(ttl_seconds=0)
+        await expired.put("a", "a")
+        return evicted, kept, await expired.get("a")
+
+    assert asyncio.run(main()) == (None, "c", None)
+
+
+def test_sqlite_tier_survives_a_new_cache(tmp_path):
+    path = str(tmp_path / "summaries.db")
+
+    async def main():
+        await SummaryCache(path=path).put("key", "summary", url="https://a")
+        return await SummaryCache(path=path).get("key")
+
+    assert asyncio.run(main()) == "summary"
+
+
+def test_shared_cache_per_settings():
+    assert get_summary_cache(10, 60.0) is get_summary_cache(10, 60.0)
+    assert get_summary_cache(10, 60.0) is not get_summary_cache(20, 60.0)
@@ -0,0 +1,129 @@
+"""Tests for the cached research toolsets and persistent MCP sessions."""
+
+import asyncio
+
+import pytest
+
+import agent.utils
+from agent.utils import (
+    _mcp_sessions,
+    close_mcp_sessions,
+    get_all_tools,
+    get_mcp_session_tools,
+    invalidate_tool_registry,
+)
+from benchmarks.graph_benchmark import parse_args, start_search_server
+
+
+@pytest.fixture
+def assemblies(monkeypatch):
+    """Count toolset assemblies without connecting to any server."""
+    calls = []
+
+    async def assemble_tools(config):
+        calls.append(config)
+        await asyncio.sleep(0.01)
+        return ["tool"]
+
+    monkeypatch.setattr(agent.utils, "_assemble_tools", assemble_tools)
+    yield calls
+    agent.utils._tool_registry.clear()
+
+
+def config(**configurable):
+    return {"configurable": {"mcp_config": {"url": "http://mcp", "tools": []}, **configurable}}
+
+
+def test_toolset_is_assembled_once_per_configuration(assemblies):
+    async def main():
+        results = await asyncio.gather(*(get_all_tools(config()) for _ in range(3)))
+        results.append(await get_all_tools(config()))
+        await get_all_tools(config(search_api="none"))
+        return results
+
+    results = asyncio.run(main())
+
+    assert results == [["tool"]] * 4
+    # Callers get copies they can extend without touching the cached list
+    assert results[0] is not results[1]
+    assert len(assemblies) == 2
+
+
+def test_toolset_cache_disabled_or_invalidated(assemblies):
+    async def main():
+        await get_all_tools(config(tool_cache_ttl_seconds=0))
+        await get_all_tools(config(tool_cache_ttl_seconds=0))
+        await get_all_tools(config())
+        await invalidate_tool_registry(config())
+        await get_all_tools(config())
+
+    asyncio.run(main())
+    assert len(assemblies) == 4
+
+
+def test_failed_assembly_is_not_cached(monkeypatch):
+    calls = []
+
+    async def assemble_tools(config):
+        calls.append(config)
+        if len(calls) == 1:
+            raise ConnectionError("MCP server unavailable")
+        return ["tool"]
+
+    monkeypatch.setattr(agent.utils, "_assemble_tools", assemble_tools)
+
+    async def main():
+        with pytest.raises(ConnectionError):
+            await get_all_tools(config())
+        return await get_all_tools(config())
+
+    try:
+        assert asyncio.run(main()) == ["tool"]
+    finally:
+        agent.utils._tool_registry.clear()
+
+
+def test_mcp_session_is_reused_until_closed():
+    args = parse_args(["--search-latency-ms", "0"])
+
+    async def main():
+        server, server_task, url = await start_search_server(args, 100)
+        connection = {"transport": "streamable_http", "url": url + "/_plugins/_ml/mcp"}
+        try:
+            first = await get_mcp_session_tools("search", connection, 60)
+            second = await get_mcp_session_tools("search", connection, 60)
+            open_sessions = len(_mcp_sessions)
+            result = await first[0].ainvoke({"query": "test"})
+            await close_mcp_sessions()
+            return first, second, open_sessions, result
+        finally:
+            server.should_exit = True
+            await server_task
+
+    first, second, open_sessions, result = asyncio.run(main())
+
+    assert [tool.name for tool in first] == ["GoogleWebSearchTool"]
+    assert second is first
+    assert open_sessions == 1
+    assert "Result 0 for test" in str(result)
+    assert not _mcp_sessions
+
+
+def test_idle_mcp_sessions_are_closed():
+    args = parse_args(["--search-latency-ms", "0"])
+
+    async def main():
+        server, server_task, url = await start_search_server(args, 100)
+        connection = {"transport": "streamable_http", "url": url + "/_plugins/_ml/mcp"}
+        try:
+            await get_mcp_session_tools("idle", connection, 0.05)
+            await asyncio.sleep(0.1)
+            await get_mcp_session_tools("active", {**connection, "headers": {"X-Test": "1"}}, 0.05)
+            remaining = len(_mcp_sessions)
+            await close_mcp_sessions()
+            return remaining
+        finally:
+            server.should_exit = True
+            await server_task
+
+    assert asyncio.run(main()) == 1
@@ -36,6 +36,52 @@ class CreateApplicationProfileRequest(BaseModel):
         alias="customHeaders",
         description="Custom HTTP headers"
     )
+    max_concurrency: int = Field(
+        default=1,
+        ge=1,
+        le=100,
+        alias="maxConcurrency",
+        description="Maximum number of test cases in flight during a run"
+    )
+    requests_per_second: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        le=1000.0,
+        alias="requestsPerSecond",
+        description="Optional cap on requests sent per second"
+    )
+    http2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 with the application"
+    )
+    max_connections: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        alias="maxConnections",
+        description="Maximum open connections to the application endpoint"
+    )
+    max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        le=1000,
+        alias="maxKeepaliveConnections",
+        description="Maximum idle connections kept alive for reuse"
+    )
+    keepalive_expiry: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=300.0,
+        alias="keepaliveExpiry",
+        description="Seconds an idle connection is kept alive"
+    )
+    websocket_connections: int = Field(
+        default=1,
+        ge=1,
+        le=32,
+        alias="websocketConnections",
+        description="Number of WebSocket connections opened per run (ws/wss endpoints)"
+    )
     
     class Config:
         populate_by_name = True  # Accept both snake_case and camelCase
@@ -52,7 +98,14 @@ class CreateApplicationProfileRequest(BaseModel):
                 },
                 "customHeaders": {
                     "X-Custom-Header": "value"
-                }
+                },
+                "maxConcurrency": 8,
+                "requestsPerSecond": 20.0,
+                "http2": False,
+                "maxConnections": 100,
+                "maxKeepaliveConnections": 20,
+                "keepaliveExpiry": 5.0,
+                "websocketConnections": 1
             }
         }
 
@@ -73,6 +126,52 @@ class UpdateApplicationProfileRequest(BaseModel):
         alias="customHeaders",
         description="Custom HTTP headers"
     )
+    max_concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        le=100,
+        alias="maxConcurrency",
+        description="Maximum number of test cases in flight during a run"
+    )
+    requests_per_second: Optional[float] = Field(
+        None,
+        gt=0.0,
+        le=1000.0,
+        alias="requestsPerSecond",
+        description="Optional cap on requests sent per second"
+    )
+    http2: Optional[bool] = Field(
+        None,
+        description="Negotiate HTTP/2 with the application"
+    )
+    max_connections: Optional[int] = Field(
+        None,
+        ge=1,
+        le=1000,
+        alias="maxConnections",
+        description="Maximum open connections to the application endpoint"
+    )
+    max_keepalive_connections: Optional[int] = Field(
+        None,
+        ge=0,
+        le=1000,
+        alias="maxKeepaliveConnections",
+        description="Maximum idle connections kept alive for reuse"
+    )
+    keepalive_expiry: Optional[float] = Field(
+        None,
+        ge=0.0,
+        le=300.0,
+        alias="keepaliveExpiry",
+        description="Seconds an idle connection is kept alive"
+    )
+    websocket_connections: Optional[int] = Field(
+        None,
+        ge=1,
+        le=32,
+        alias="websocketConnections",
+        description="Number of WebSocket connections opened per run (ws/wss endpoints)"
+    )
     
     class Config:
         populate_by_name = True  # Accept both snake_case and camelCase
@@ -159,7 +258,14 @@ async def create_application_profile(
             timeout=request.timeout,
             retries=request.retries,
             authentication=request.authentication,
-            custom_headers=request.custom_headers
+            custom_headers=request.custom_headers,
+            max_concurrency=request.max_concurrency,
+            requests_per_second=request.requests_per_second,
+            http2=request.http2,
+            max_connections=request.max_connections,
+            max_keepalive_connections=request.max_keepalive_connections,
+            keepalive_expiry=request.keepalive_expiry,
+            websocket_connections=request.websocket_connections
         )
         return ApplicationProfileResponse.from_application_profile(profile)
     except ValueError as e:
@@ -311,7 +417,14 @@ async def update_application_profile(
             request.timeout,
             request.retries,
             request.authentication,
-            request.custom_headers
+            request.custom_headers,
+            request.max_concurrency,
+            request.requests_per_second,
+            request.http2,
+            request.max_connections,
+            request.max_keepalive_connections,
+            request.keepalive_expiry,
+            request.websocket_connections
         ]):
             raise ValidationError("At least one field must be provided for update")
         
@@ -322,7 +435,14 @@ async def update_application_profile(
             timeout=request.timeout,
             retries=request.retries,
             authentication=request.authentication,
-            custom_headers=request.custom_headers
+            custom_headers=request.custom_headers,
+            max_concurrency=request.max_concurrency,
+            requests_per_second=request.requests_per_second,
+            http2=request.http2,
+            max_connections=request.max_connections,
+            max_keepalive_connections=request.max_keepalive_connections,
+            keepalive_expiry=request.keepalive_expiry,
+            websocket_connections=request.websocket_connections
         )
         return ApplicationProfileResponse.from_application_profile(profile)
     except ValueError as e:
@@ -5,9 +5,9 @@ import io
 import logging
 import os
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, File, Form, Request, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, Query, Request, UploadFile, status
 from pydantic import BaseModel, Field
 
 from app.database.connection import database_manager
@@ -130,6 +130,7 @@ class DatasetResponse(BaseModel):
     description: str
     file_path: str = Field(..., alias="filePath")
     test_cases: List[TestCaseResponse] = Field(..., alias="testCases")
+    test_case_count: int = Field(0, alias="testCaseCount")
     created_at: str = Field(..., alias="createdAt")
     updated_at: str = Field(..., alias="updatedAt")
     
@@ -138,7 +139,11 @@ class DatasetResponse(BaseModel):
         by_alias = True  # Serialize using aliases (camelCase)
     
     @classmethod
-    def from_dataset(cls, dataset: Dataset) -> "DatasetResponse":
+    def from_dataset(
+        cls,
+        dataset: Dataset,
+        test_case_count: Optional[int] = None
+    ) -> "DatasetResponse":
         """Convert Dataset model to response."""
         return cls(
             id=dataset.id,
@@ -148,6 +153,9 @@ class DatasetResponse(BaseModel):
             description=dataset.description,
             file_path=dataset.file_path,
             test_cases=[TestCaseResponse.from_test_case(tc) for tc in dataset.test_cases],
+            test_case_count=(
+                test_case_count if test_case_count is not None else len(dataset.test_cases)
+            ),
             created_at=dataset.created_at.isoformat(),
             updated_at=dataset.updated_at.isoformat()
         )
@@ -160,6 +168,15 @@ def get_dataset_service() -> DatasetService:
     return DatasetService(repository)
 
 
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    """Read an uploaded file in chunks."""
+    while True:
+        chunk = await file.read(settings.upload_chunk_size_bytes)
+        if not chunk:
+            break
+        yield chunk
+
+
 # Dependency to get customer_id from request state
 def get_customer_id(request: Request) -> str:
     """
@@ -192,12 +209,17 @@ async def create_dataset(
     name: str = Form(...),
     description: str = Form(default=""),
     file: UploadFile = File(...),
+    include_test_cases: bool = Query(True),
     customer_id: str = Depends(get_customer_id),
     service: DatasetService = Depends(get_dataset_service)
 ) -> DatasetResponse:
     """
     Create a new dataset with CSV file upload.
     
+    The upload is streamed to disk in chunks and parsed incrementally,
+    with test cases inserted in batches, so large files do not have to
+    fit in memory.
+    
     CSV Format:
     - Required column: input
     - Optional columns: expected_output, any additional columns become metadata
@@ -207,6 +229,8 @@ async def create_dataset(
         name: Dataset name
         description: Dataset description
         file: CSV file containing test cases
+        include_test_cases: Whether to return the test cases; set to false
+            for large uploads to only return the test case count
         customer_id: Customer ID from request context
         service: Dataset service instance
         
@@ -217,36 +241,37 @@ async def create_dataset(
         ValidationError: If validation fails or CSV format is invalid
         UnauthorizedError: If customer context missing
     """
-    from app.utils.csv_parser import parse_csv_to_test_cases, validate_csv_file
+    from app.utils.csv_parser import validate_csv_file
     
     try:
         # Validate file
         validate_csv_file(file.filename, file.size, settings.max_file_size_mb)
         
-        # Read file content
-        file_content = await file.read()
-        
-        # Parse CSV to test cases
-        test_cases = parse_csv_to_test_cases(file_content)
-        
-        # Save file to disk
-        file_path = await service.save_dataset_file(
+        # Stream file to disk
+        file_path = await service.save_dataset_file_stream(
             customer_id=customer_id,
             filename=file.filename,
-            content=file_content
+            chunks=_iter_upload(file),
+            max_size_bytes=settings.max_file_size_mb * 1024 * 1024
         )
         
-        # Create dataset
-        dataset = await service.create_dataset(
+        # Parse CSV and insert test cases in batches
+        dataset, test_case_count = await service.create_dataset_from_file(
             customer_id=customer_id,
             application_profile_id=application_profile_id,
             name=name,
             description=description,
-            file_path=file_path,
-            test_cases=test_cases
+            file_path=file_path
         )
         
-        return DatasetResponse.from_dataset(dataset)
+        if not include_test_cases:
+            return DatasetResponse.from_dataset(
+                dataset.model_copy(update={"test_cases": []}),
+                test_case_count
+            )
+        
+        stored_dataset = await service.get_dataset(dataset.id, customer_id)
+        return DatasetResponse.from_dataset(stored_dataset or dataset, test_case_count)
         
     except ValueError as e:
         raise ValidationError(str(e))
@@ -1,15 +1,21 @@
 """Evaluation execution API endpoints (tenant-scoped)."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi import Response as HTTPResponse
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from app.config import settings
 from app.database.connection import database_manager
 from app.database.repository import DataRepository
 from app.engine.evaluation_engine import EvaluationEngine
+from app.engine.job_queue import evaluation_job_queue
 from app.engine.metrics_calculator import MetricsCalculator
+from app.engine.progress import RunProgress
+from app.engine.response_cache import response_cache
 from app.middleware.error_handler import NotFoundError, ValidationError, UnauthorizedError
 from app.models.evaluation_run import EvaluationRun
 from app.models.metrics import AggregatedMetrics, IndividualMetrics
@@ -25,6 +31,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/evaluations", tags=["evaluations"])
 
+# Seconds between keep-alive comments on an idle progress stream
+PROGRESS_KEEPALIVE_SECONDS = 15.0
+
 
 # Request/Response models
 class StartEvaluationRequest(BaseModel):
@@ -84,6 +93,7 @@ class ResponseResponse(BaseModel):
     timestamp: str
     error: Optional[str] = None
     individual_metrics: Optional[IndividualMetricsResponse] = Field(None, alias="individualMetrics")
+    cached: bool = False
     
     class Config:
         populate_by_name = True
@@ -99,7 +109,57 @@ class ResponseResponse(BaseModel):
             latency=response.latency,
             timestamp=response.timestamp.isoformat(),
             error=response.error,
-            individual_metrics=IndividualMetricsResponse.from_metrics(response.individual_metrics)
+            individual_metrics=IndividualMetricsResponse.from_metrics(response.individual_metrics),
+            cached=response.cached
+        )
+
+
+class ResponsePageResponse(BaseModel):
+    """Response model for a page of evaluation responses."""
+    
+    items: List[ResponseResponse]
+    total: int
+    skip: int
+    limit: int
+
+
+class EvaluationJobResponse(BaseModel):
+    """Response model for an evaluation run queued in background mode."""
+    
+    run_id: str = Field(..., alias="runId")
+    status: str
+    progress_url: str = Field(..., alias="progressUrl")
+    events_url: str = Field(..., alias="eventsUrl")
+    
+    class Config:
+        populate_by_name = True
+        by_alias = True  # Serialize using aliases (camelCase)
+
+
+class RunProgressResponse(BaseModel):
+    """Response model for evaluation run progress."""
+    
+    run_id: str = Field(..., alias="runId")
+    status: str
+    total: int
+    completed: int
+    failed: int
+    latency_p50: Optional[float] = Field(None, alias="latencyP50")
+    latency_p95: Optional[float] = Field(None, alias="latencyP95")
+    latency_p99: Optional[float] = Field(None, alias="latencyP99")
+    error: Optional[str] = None
+    updated_at: Optional[str] = Field(None, alias="updatedAt")
+    
+    class Config:
+        populate_by_name = True
+        by_alias = True  # Serialize using aliases (camelCase)
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> "RunProgressResponse":
+        """Convert a RunProgress snapshot to response."""
+        updated_at = snapshot.get("updated_at")
+        return cls(
+            **{**snapshot, "updated_at": updated_at.isoformat() if updated_at else None}
         )
 
 
@@ -248,7 +308,12 @@ class CompareRunsResponse(BaseModel):
 def get_evaluation_engine() -> EvaluationEngine:
     """Get evaluation engine instance."""
     repository = DataRepository(database_manager.database)
-    return EvaluationEngine(repository)
+    return EvaluationEngine(
+        repository,
+        MetricsCalculator(),
+        response_cache=response_cache if settings.response_cache_enabled else None,
+        deduplicate_inputs=settings.evaluation_deduplicate_inputs
+    )
 
 
 # Dependency to get metrics calculator
@@ -283,20 +348,180 @@ def get_customer_id(request: Request) -> str:
     return customer_id
 
 
+async def _calculate_run_metrics(
+    run: EvaluationRun,
+    repository: DataRepository,
+    calculator: MetricsCalculator
+) -> None:
+    """
+    Calculate and store individual and aggregated metrics for a run.
+    
+    Metrics are only calculated for completed runs with responses that
+    were not already scored by the engine during execution. The run
+    object is updated in place.
+    
+    Args:
+        run: Evaluation run with its responses loaded
+        repository: Data repository instance
+        calculator: Metrics calculator instance
+    """
+    if run.status != "completed" or not run.responses or run.metrics is not None:
+        return
+    
+    # Get dataset to access test cases for expected outputs
+    dataset = await repository.get_dataset_by_id(run.dataset_id, run.customer_id)
+    
+    if not dataset:
+        return
+    
+    # Score each response and aggregate in a single pass
+    accumulator = calculator.start_run(dataset.test_cases)
+    for response in run.responses:
+        accumulator.add(response)
+    aggregated_metrics = accumulator.result()
+    
+    # Store per-response metrics on the response documents and
+    # aggregated metrics on the run
+    await repository.update_response_metrics(run.id, run.responses)
+    await repository.update_evaluation_run(
+        run.id,
+        run.customer_id,
+        {"metrics": aggregated_metrics.model_dump()}
+    )
+    
+    # Update local run object
+    run.metrics = aggregated_metrics
+
+
+async def _execute_in_background(
+    run: EvaluationRun,
+    progress: RunProgress,
+    engine: EvaluationEngine,
+    calculator: MetricsCalculator,
+    repository: DataRepository
+) -> None:
+    """
+    Execute a queued run and calculate its metrics.
+    
+    Progress is only marked finished once metrics are stored, so clients
+    that see a completed run can read its results straight away.
+    
+    Args:
+        run: Pending evaluation run
+        progress: Progress tracker for the run
+        engine: Evaluation engine instance
+        calculator: Metrics calculator instance
+        repository: Data repository instance
+    """
+    run = await engine.execute_pending_run(run, progress)
+    await _calculate_run_metrics(run, repository, calculator)
+    await progress.finish(run.status)
+
+
+async def _get_progress_snapshot(
+    run_id: str,
+    customer_id: str,
+    repository: DataRepository
+) -> Dict[str, Any]:
+    """
+    Get progress for a run, from the job queue or from the database.
+    
+    Runs that are not tracked by this process (executed synchronously,
+    by another instance, or before a restart) are summarised from the
+    stored run and its response count.
+    
+    Args:
+        run_id: Evaluation run ID
+        customer_id: Customer ID for tenant isolation
+        repository: Data repository instance
+        
+    Returns:
+        Progress snapshot dictionary
+        
+    Raises:
+        NotFoundError: If evaluation run not found
+    """
+    progress = evaluation_job_queue.get_progress(run_id, customer_id)
+    if progress is not None:
+        return progress.snapshot()
+    
+    run = await repository.get_evaluation_run_by_id(
+        run_id,
+        customer_id,
+        include_responses=False
+    )
+    
+    if run is None:
+        raise NotFoundError(f"Evaluation run not found: {run_id}")
+    
+    completed = await repository.count_responses(run_id, customer_id)
+    metrics = run.metrics
+    
+    return {
+        "run_id": run.id,
+        "status": run.status,
+        "total": metrics.total_test_cases if metrics else completed,
+        "completed": completed,
+        "failed": metrics.failed_test_cases if metrics else 0,
+        "latency_p50": metrics.median_latency if metrics else None,
+        "latency_p95": metrics.p95_latency if metrics else None,
+        "latency_p99": None,
+        "error": None,
+        "updated_at": run.end_time or run.start_time,
+    }
+
+
+def _format_event(event: str, snapshot: Dict[str, Any]) -> str:
+    """Format a progress snapshot as a Server-Sent Event."""
+    data = RunProgressResponse.from_snapshot(snapshot).model_dump_json(by_alias=True)
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def _progress_events(progress: RunProgress) -> AsyncIterator[str]:
+    """
+    Stream progress updates for a run until it finishes.
+    
+    Updates that arrive faster than the client reads are coalesced; each
+    event carries the latest snapshot.
+    
+    Args:
+        progress: Progress tracker for the run
+        
+    Yields:
+        Server-Sent Event strings
+    """
+    while True:
+        version = progress.version
+        
+        if progress.is_finished:
+            yield _format_event("complete", progress.snapshot())
+            return
+        
+        yield _format_event("progress", progress.snapshot())
+        
+        if not await progress.wait_for_update(version, PROGRESS_KEEPALIVE_SECONDS):
+            yield ": keep-alive\n\n"
+
+
 @router.post(
     "",
-    response_model=EvaluationRunResponse,
+    response_model=Union[EvaluationRunResponse, EvaluationJobResponse],
     status_code=status.HTTP_201_CREATED,
     summary="Start evaluation run",
-    description="Start a new evaluation run for a dataset against an application profile"
+    description=(
+        "Start a new evaluation run for a dataset against an application profile. "
+        "With background=true the run is queued and its ID returned immediately."
+    )
 )
 async def start_evaluation_run(
     request_data: StartEvaluationRequest,
+    http_response: HTTPResponse,
+    background: bool = Query(False, description="Queue the run and return immediately"),
     customer_id: str = Depends(get_customer_id),
     engine: EvaluationEngine = Depends(get_evaluation_engine),
     calculator: MetricsCalculator = Depends(get_metrics_calculator),
     repository: DataRepository = Depends(get_repository)
-) -> EvaluationRunResponse:
+) -> Union[EvaluationRunResponse, EvaluationJobResponse]:
     """
     Start a new evaluation run.
     
@@ -307,15 +532,23 @@ async def start_evaluation_run(
     4. Calculates individual and aggregated metrics
     5. Returns the completed evaluation run with all results
     
+    In background mode, steps 2-4 are handed to the evaluation job queue
+    and the endpoint responds with 202 Accepted and the run ID. Progress
+    can then be polled from /{run_id}/progress or streamed from
+    /{run_id}/events.
+    
     Args:
         request_data: Evaluation run request
+        http_response: Outgoing response, used to set the status code
+        background: Whether to execute the run in the background
         customer_id: Customer ID from request context
         engine: Evaluation engine instance
         calculator: Metrics calculator instance
         repository: Data repository instance
         
     Returns:
-        Created evaluation run with responses and metrics
+        Created evaluation run with responses and metrics, or the
+        queued job in background mode
         
     Raises:
         ValidationError: If validation fails
@@ -327,6 +560,30 @@ async def start_evaluation_run(
         validated_dataset_id = validate_dataset_id(request_data.dataset_id)
         validated_profile_id = validate_application_profile_id(request_data.application_profile_id)
         
+        if background:
+            # Validate and create the run now, execute it on a worker
+            run = await engine.create_pending_run(
+                customer_id=customer_id,
+                dataset_id=validated_dataset_id,
+                application_profile_id=validated_profile_id
+            )
+            
+            async def job(progress: RunProgress) -> None:
+                await _execute_in_background(run, progress, engine, calculator, repository)
+            
+            async def abort(error_message: str) -> None:
+                await engine.fail_pending_run(run, error_message)
+            
+            evaluation_job_queue.submit(run.id, customer_id, job, abort)
+            
+            http_response.status_code = status.HTTP_202_ACCEPTED
+            return EvaluationJobResponse(
+                run_id=run.id,
+                status=run.status,
+                progress_url=f"{router.prefix}/{run.id}/progress",
+                events_url=f"{router.prefix}/{run.id}/events"
+            )
+        
         # Execute the evaluation run
         run = await engine.execute_run(
             customer_id=customer_id,
@@ -335,46 +592,7 @@ async def start_evaluation_run(
         )
         
         # Calculate metrics if run completed successfully
-        if run.status == "completed" and run.responses:
-            # Get dataset to access test cases for expected outputs
-            dataset = await repository.get_dataset_by_id(
-                validated_dataset_id,
-                customer_id
-            )
-            
-            if dataset:
-                # Calculate individual metrics for each response
-                for response in run.responses:
-                    # Find the corresponding test case
-                    test_case = next(
-                        (tc for tc in dataset.test_cases if tc.id == response.test_case_id),
-                        None
-                    )
-                    
-                    if test_case and not response.error:
-                        response.individual_metrics = calculator.calculate_individual_metrics(
-                            response,
-                            test_case.expected_output
-                        )
-                
-                # Calculate aggregated metrics
-                aggregated_metrics = calculator.aggregate_metrics(
-                    run.responses,
-                    dataset.test_cases
-                )
-                
-                # Update run with metrics
-                await repository.update_evaluation_run(
-                    run.id,
-                    customer_id,
-                    {
-                        "metrics": aggregated_metrics.model_dump(),
-                        "responses": [r.model_dump() for r in run.responses]
-                    }
-                )
-                
-                # Update local run object
-                run.metrics = aggregated_metrics
+        await _calculate_run_metrics(run, repository, calculator)
         
         return EvaluationRunResponse.from_evaluation_run(run)
         
@@ -472,6 +690,170 @@ async def get_evaluation_run(
         raise ValidationError(f"Failed to get evaluation run: {str(e)}")
 
 
+@router.get(
+    "/{run_id}/progress",
+    response_model=RunProgressResponse,
+    summary="Get evaluation run progress",
+    description="Get completed, failed and total test cases and rolling latency percentiles"
+)
+async def get_evaluation_progress(
+    run_id: str,
+    customer_id: str = Depends(get_customer_id),
+    repository: DataRepository = Depends(get_repository)
+) -> RunProgressResponse:
+    """
+    Get progress of an evaluation run.
+    
+    Args:
+        run_id: Evaluation run ID
+        customer_id: Customer ID from request context
+        repository: Data repository instance
+        
+    Returns:
+        Current progress of the run
+        
+    Raises:
+        NotFoundError: If evaluation run not found
+        UnauthorizedError: If customer context missing
+        ValidationError: If run ID is invalid
+    """
+    try:
+        # Validate run_id format
+        validated_run_id = validate_evaluation_run_id(run_id)
+        
+        snapshot = await _get_progress_snapshot(validated_run_id, customer_id, repository)
+        return RunProgressResponse.from_snapshot(snapshot)
+        
+    except (NotFoundError, ValidationError):
+        raise
+    except Exception as e:
+        logger.error(f"Error getting evaluation progress: {e}")
+        raise ValidationError(f"Failed to get evaluation progress: {str(e)}")
+
+
+@router.get(
+    "/{run_id}/events",
+    summary="Stream evaluation run progress",
+    description="Server-Sent Events stream of progress updates until the run finishes"
+)
+async def stream_evaluation_progress(
+    run_id: str,
+    customer_id: str = Depends(get_customer_id),
+    repository: DataRepository = Depends(get_repository)
+) -> StreamingResponse:
+    """
+    Stream progress of an evaluation run as Server-Sent Events.
+    
+    Sends a 'progress' event on every change and a final 'complete'
+    event when the run finishes. Runs not executing in this process get
+    a single event with their stored progress.
+    
+    Args:
+        run_id: Evaluation run ID
+        customer_id: Customer ID from request context
+        repository: Data repository instance
+        
+    Returns:
+        Streaming text/event-stream response
+        
+    Raises:
+        NotFoundError: If evaluation run not found
+        UnauthorizedError: If customer context missing
+        ValidationError: If run ID is invalid
+    """
+    try:
+        # Validate run_id format
+        validated_run_id = validate_evaluation_run_id(run_id)
+        
+        progress = evaluation_job_queue.get_progress(validated_run_id, customer_id)
+        
+        if progress is not None:
+            events = _progress_events(progress)
+        else:
+            snapshot = await _get_progress_snapshot(validated_run_id, customer_id, repository)
+            event = "complete" if snapshot["status"] in ("completed", "failed") else "progress"
+            
+            async def single_event() -> AsyncIterator[str]:
+                yield _format_event(event, snapshot)
+            
+            events = single_event()
+        
+        return StreamingResponse(
+            events,
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+        
+    except (NotFoundError, ValidationError):
+        raise
+    except Exception as e:
+        logger.error(f"Error streaming evaluation progress: {e}")
+        raise ValidationError(f"Failed to stream evaluation progress: {str(e)}")
+
+
+@router.get(
+    "/{run_id}/responses",
+    response_model=ResponsePageResponse,
+    summary="List evaluation run responses",
+    description="Get a page of responses for a specific evaluation run"
+)
+async def list_evaluation_responses(
+    run_id: str,
+    skip: int = Query(0, ge=0, description="Number of responses to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of responses to return"),
+    customer_id: str = Depends(get_customer_id),
+    repository: DataRepository = Depends(get_repository)
+) -> ResponsePageResponse:
+    """
+    Get responses for an evaluation run, one page at a time.
+    
+    Responses are returned in the order they were recorded.
+    
+    Args:
+        run_id: Evaluation run ID
+        skip: Number of responses to skip
+        limit: Maximum number of responses to return
+        customer_id: Customer ID from request context
+        repository: Data repository instance
+        
+    Returns:
+        Page of responses with the total response count
+        
+    Raises:
+        NotFoundError: If evaluation run not found
+        UnauthorizedError: If customer context missing
+        ValidationError: If run ID is invalid
+    """
+    try:
+        # Validate run_id format
+        validated_run_id = validate_evaluation_run_id(run_id)
+        
+        total = await repository.count_responses(validated_run_id, customer_id)
+        responses = await repository.get_responses(
+            validated_run_id,
+            customer_id,
+            skip=skip,
+            limit=limit
+        )
+        
+        return ResponsePageResponse(
+            items=[ResponseResponse.from_response(r) for r in responses],
+            total=total,
+            skip=skip,
+            limit=limit
+        )
+        
+    except (NotFoundError, ValidationError):
+        raise
+    except ValueError as e:
+        if "not found" in str(e).lower():
+            raise NotFoundError(f"Evaluation run not found: {run_id}")
+        raise ValidationError(str(e))
+    except Exception as e:
+        logger.error(f"Error listing evaluation responses: {e}")
+        raise ValidationError(f"Failed to list evaluation responses: {str(e)}")
+
+
 @router.post(
     "/compare",
     response_model=CompareRunsResponse,
@@ -514,7 +896,11 @@ async def compare_runs(
             # Validate each run_id format
             validated_run_id = validate_evaluation_run_id(run_id)
             
-            run = await repository.get_evaluation_run_by_id(validated_run_id, customer_id)
+            run = await repository.get_evaluation_run_by_id(
+                validated_run_id,
+                customer_id,
+                include_responses=False
+            )
             
             if run is None:
                 raise NotFoundError(f"Evaluation run not found: {validated_run_id}")
@@ -23,6 +23,33 @@ class Settings(BaseSettings):
     upload_dir: str = "uploads/datasets"
     max_file_size_mb: int = 10
 
+    # Dataset Ingestion
+    # Uploads are streamed to disk in chunks and test cases inserted in batches
+    upload_chunk_size_bytes: int = 1024 * 1024
+    dataset_insert_batch_size: int = 1000
+
+    # Evaluation Response Persistence
+    # Responses are buffered and written in bulk when either threshold is reached
+    response_flush_batch_size: int = 100
+    response_flush_interval_seconds: float = 2.0
+
+    # Background Evaluation Jobs
+    # Number of runs executed concurrently and latencies kept for progress percentiles
+    evaluation_worker_count: int = 4
+    evaluation_progress_latency_window: int = 100
+
+    # Response Reuse (opt-in)
+    # Cache successful responses per profile version and input, and send
+    # identical inputs within a run only once
+    response_cache_enabled: bool = False
+    response_cache_ttl_seconds: float = 3600.0
+    response_cache_max_entries: int = 10000
+    evaluation_deduplicate_inputs: bool = False
+
+    # Instrumentation
+    # Expose stage, database and request timings at /metrics (Prometheus format)
+    metrics_enabled: bool = True
+
     # Logging
     log_level: str = "INFO"
 
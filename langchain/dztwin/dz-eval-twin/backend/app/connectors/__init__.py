@@ -6,10 +6,12 @@ from app.connectors.plugin import (
     BaseApplicationPlugin,
 )
 from app.connectors.http_plugin import HTTPPlugin
+from app.connectors.websocket_plugin import WebSocketPlugin
 
 __all__ = [
     "ApplicationPlugin",
     "ApplicationResponse",
     "BaseApplicationPlugin",
     "HTTPPlugin",
+    "WebSocketPlugin",
 ]
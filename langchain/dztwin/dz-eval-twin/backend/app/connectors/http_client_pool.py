@@ -0,0 +1,201 @@
+"""Process-wide pool of HTTP clients shared across evaluation runs.
+
+Runs against the same application endpoint with the same connection
+settings share a single ``httpx.AsyncClient``, so concurrent and
+back-to-back runs reuse open connections and TLS sessions instead of
+each performing its own handshakes.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.models.connection_config import ConnectionConfig
+
+logger = logging.getLogger(__name__)
+
+# Clients are shared only between runs with identical settings
+ClientKey = Tuple[str, FrozenSet[Tuple[str, str]], float, bool, int, int, float]
+
+
+@dataclass
+class _PooledClient:
+    """A shared client and its bookkeeping."""
+    client: httpx.AsyncClient
+    loop: asyncio.AbstractEventLoop
+    keepalive_expiry: float
+    references: int = 0
+    idle_since: Optional[float] = None
+
+
+def http2_available() -> bool:
+    """Whether the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class HTTPClientPool:
+    """
+    Reference-counted pool of HTTP clients keyed by endpoint origin.
+
+    ``acquire`` returns the shared client for a configuration, creating
+    it on first use, and ``release`` hands it back. A client nobody
+    holds is kept open for the configured keep-alive expiry so the next
+    run can reuse its connections, then closed on a later acquire or by
+    ``close_all``.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self._clients: Dict[ClientKey, _PooledClient] = {}
+
+    @property
+    def size(self) -> int:
+        """Number of clients currently held by the pool."""
+        return len(self._clients)
+
+    async def acquire(
+        self,
+        config: ConnectionConfig,
+        headers: Dict[str, str]
+    ) -> httpx.AsyncClient:
+        """
+        Get a shared client for a connection configuration.
+
+        Args:
+            config: Connection configuration of the application
+            headers: Default headers sent with every request
+
+        Returns:
+            HTTP client shared with other runs using the same settings
+        """
+        loop = asyncio.get_running_loop()
+        key = self._key(config, headers)
+
+        # Bookkeeping is synchronous so concurrent acquires cannot race
+        expired = self._remove_idle(loop)
+
+        pooled = self._clients.get(key)
+        if pooled is None or pooled.loop is not loop:
+            pooled = _PooledClient(
+                client=self._create_client(config, headers),
+                loop=loop,
+                keepalive_expiry=config.keepalive_expiry
+            )
+            self._clients[key] = pooled
+            logger.debug(f"Created pooled HTTP client for {key[0]}")
+
+        pooled.references += 1
+        pooled.idle_since = None
+
+        for stale in expired:
+            await self._close(stale)
+
+        return pooled.client
+
+    async def release(self, client: httpx.AsyncClient) -> None:
+        """
+        Return a client obtained from ``acquire``.
+
+        Args:
+            client: Client to release
+        """
+        for pooled in self._clients.values():
+            if pooled.client is client:
+                pooled.references = max(0, pooled.references - 1)
+                if pooled.references == 0:
+                    pooled.idle_since = time.monotonic()
+                return
+
+        # Not pooled (e.g. the pool was closed meanwhile), close it directly
+        await client.aclose()
+
+    async def close_all(self) -> None:
+        """Close every client in the pool."""
+        clients, self._clients = self._clients, {}
+        for pooled in clients.values():
+            await self._close(pooled)
+
+    def _remove_idle(self, loop: asyncio.AbstractEventLoop) -> List[_PooledClient]:
+        """Remove unused clients past their keep-alive expiry."""
+        now = time.monotonic()
+        removed = []
+        for key, pooled in list(self._clients.items()):
+            # Clients bound to another (closed) event loop cannot be reused
+            stale_loop = pooled.loop is not loop and pooled.references == 0
+            expired = (
+                pooled.idle_since is not None
+                and now - pooled.idle_since >= pooled.keepalive_expiry
+            )
+            if stale_loop or expired:
+                removed.append(self._clients.pop(key))
+        return removed
+
+    async def _close(self, pooled: _PooledClient) -> None:
+        """Close a client, skipping clients of another event loop."""
+        if pooled.loop is not asyncio.get_running_loop():
+            return
+        try:
+            await pooled.client.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close pooled HTTP client: {e}")
+
+    @staticmethod
+    def _key(config: ConnectionConfig, headers: Dict[str, str]) -> ClientKey:
+        """Build the key identifying clients that can be shared."""
+        parts = urlsplit(str(config.endpoint))
+        origin = f"{parts.scheme}://{parts.netloc}".lower()
+        return (
+            origin,
+            frozenset(headers.items()),
+            float(config.timeout),
+            config.http2,
+            config.max_connections,
+            config.max_keepalive_connections,
+            config.keepalive_expiry,
+        )
+
+    @staticmethod
+    def _create_client(
+        config: ConnectionConfig,
+        headers: Dict[str, str]
+    ) -> httpx.AsyncClient:
+        """Create a client with the configured timeouts and limits."""
+        timeout = httpx.Timeout(
+            timeout=float(config.timeout),
+            connect=10.0,  # Connection timeout
+            read=float(config.timeout),  # Read timeout
+            write=10.0,  # Write timeout
+            pool=5.0  # Pool timeout
+        )
+
+        limits = httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry
+        )
+
+        http2 = config.http2
+        if http2 and not http2_available():
+            logger.warning(
+                "HTTP/2 requested but the 'h2' package is not installed, "
+                "falling back to HTTP/1.1"
+            )
+            http2 = False
+
+        return httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            follow_redirects=True
+        )
+
+
+# Global HTTP client pool instance
+http_client_pool = HTTPClientPool()
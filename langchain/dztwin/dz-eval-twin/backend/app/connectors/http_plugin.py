@@ -5,14 +5,20 @@ configurable endpoints, authentication, timeouts, and retry logic.
 """
 
 import asyncio
+import random
 import time
 from typing import Any, Dict, Optional
 
 import httpx
 
+from app.connectors.http_client_pool import HTTPClientPool, http_client_pool
 from app.connectors.plugin import ApplicationResponse, BaseApplicationPlugin
 from app.models.connection_config import ConnectionConfig
 
+# Retry backoff: full jitter over an exponentially growing, capped window
+RETRY_BACKOFF_BASE_SECONDS = 1.0
+RETRY_BACKOFF_MAX_SECONDS = 30.0
+
 
 class HTTPPlugin(BaseApplicationPlugin):
     """
@@ -22,7 +28,8 @@ class HTTPPlugin(BaseApplicationPlugin):
     - Configurable HTTP endpoints
     - Multiple authentication methods (Bearer, API Key, Basic)
     - Timeout configuration
-    - Automatic retry logic with exponential backoff
+    - Automatic retry logic with jittered exponential backoff
+    - Connections pooled per endpoint and shared across runs
     - Custom headers
     - Response parsing and error handling
     
@@ -30,17 +37,26 @@ class HTTPPlugin(BaseApplicationPlugin):
     the input text and expects JSON responses with an output field.
     """
     
-    def __init__(self):
-        """Initialize the HTTP plugin."""
+    def __init__(self, client_pool: Optional[HTTPClientPool] = None):
+        """
+        Initialize the HTTP plugin.
+        
+        Args:
+            client_pool: Pool providing shared HTTP clients
+                        (defaults to the process-wide pool)
+        """
         super().__init__("http")
+        self._client_pool = client_pool or http_client_pool
         self._client: Optional[httpx.AsyncClient] = None
+        self._auth: Optional[httpx.BasicAuth] = None
     
     async def connect(self, config: ConnectionConfig) -> None:
         """
         Establish HTTP client with configuration.
         
-        Creates an async HTTP client with the specified timeout,
-        authentication, and custom headers.
+        Acquires a pooled async HTTP client for the endpoint with the
+        specified timeout, connection limits, authentication, and custom
+        headers. Runs with identical settings share the same client.
         
         Args:
             config: Connection configuration including endpoint,
@@ -56,20 +72,10 @@ class HTTPPlugin(BaseApplicationPlugin):
         # Build headers
         headers = self._build_headers(config)
         
-        # Create HTTP client with timeout
-        timeout = httpx.Timeout(
-            timeout=float(config.timeout),
-            connect=10.0,  # Connection timeout
-            read=float(config.timeout),  # Read timeout
-            write=10.0,  # Write timeout
-            pool=5.0  # Pool timeout
-        )
+        self._auth = self._build_auth(config)
         
-        self._client = httpx.AsyncClient(
-            headers=headers,
-            timeout=timeout,
-            follow_redirects=True
-        )
+        # Get a shared HTTP client for this endpoint and settings
+        self._client = await self._client_pool.acquire(config, headers)
         
         # Test connection with a simple request (optional)
         # This helps catch configuration errors early
@@ -77,9 +83,10 @@ class HTTPPlugin(BaseApplicationPlugin):
             # Verify the endpoint is reachable
             await self._test_connection()
         except Exception as e:
-            # Clean up client if connection test fails
-            await self._client.aclose()
+            # Release client if connection test fails
+            await self._client_pool.release(self._client)
             self._client = None
+            self._auth = None
             self._connected = False
             raise ConnectionError(
                 f"Failed to connect to {config.endpoint}: {str(e)}"
@@ -87,13 +94,15 @@ class HTTPPlugin(BaseApplicationPlugin):
     
     async def disconnect(self) -> None:
         """
-        Close HTTP client and clean up resources.
+        Release HTTP client and clean up resources.
         
-        Closes the async HTTP client and resets connection state.
+        Returns the shared HTTP client to the pool and resets
+        connection state.
         """
         if self._client:
-            await self._client.aclose()
+            await self._client_pool.release(self._client)
             self._client = None
+        self._auth = None
         
         await super().disconnect()
     
@@ -217,6 +226,46 @@ class HTTPPlugin(BaseApplicationPlugin):
         
         return headers
     
+    def _build_auth(self, config: ConnectionConfig) -> Optional[httpx.BasicAuth]:
+        """
+        Build request authentication from configuration.
+        
+        Basic auth is applied per request rather than through headers.
+        
+        Args:
+            config: Connection configuration
+        
+        Returns:
+            BasicAuth if basic authentication is configured, None otherwise
+        """
+        if not config.authentication:
+            return None
+        
+        if config.authentication.get("type", "").lower() != "basic":
+            return None
+        
+        username = config.authentication.get("username")
+        password = config.authentication.get("password")
+        if username and password:
+            return httpx.BasicAuth(username, password)
+        return None
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Get the delay before retrying a failed attempt.
+        
+        Uses full jitter so that concurrent requests failing together
+        do not retry in lockstep.
+        
+        Args:
+            attempt: Zero-based number of the failed attempt
+        
+        Returns:
+            Seconds to wait before the next attempt
+        """
+        window = min(RETRY_BACKOFF_MAX_SECONDS, RETRY_BACKOFF_BASE_SECONDS * 2 ** attempt)
+        return random.uniform(0, window)
+    
     async def _test_connection(self) -> None:
         """
         Test the connection to the endpoint.
@@ -246,7 +295,7 @@ class HTTPPlugin(BaseApplicationPlugin):
         """
         Send HTTP request with retry logic.
         
-        Implements exponential backoff retry strategy for transient failures.
+        Implements jittered exponential backoff for transient failures.
         
         Args:
             payload: JSON payload to send
@@ -267,21 +316,11 @@ class HTTPPlugin(BaseApplicationPlugin):
         
         for attempt in range(max_retries + 1):
             try:
-                # Add basic auth if configured
-                auth = None
-                if self.config.authentication:
-                    auth_type = self.config.authentication.get("type", "").lower()
-                    if auth_type == "basic":
-                        username = self.config.authentication.get("username")
-                        password = self.config.authentication.get("password")
-                        if username and password:
-                            auth = httpx.BasicAuth(username, password)
-                
-                # Send POST request
+                # Send POST request (basic auth is built once on connect)
                 response = await self._client.post(
                     str(self.config.endpoint),
                     json=payload,
-                    auth=auth
+                    auth=self._auth
                 )
                 
                 # Raise exception for HTTP errors (4xx, 5xx)
@@ -301,9 +340,8 @@ class HTTPPlugin(BaseApplicationPlugin):
                 # Retry on 5xx errors, not on 4xx (client errors)
                 if e.response.status_code >= 500 and attempt < max_retries:
                     last_exception = e
-                    # Exponential backoff: 1s, 2s, 4s, 8s...
-                    wait_time = 2 ** attempt
-                    await asyncio.sleep(wait_time)
+                    # Jittered exponential backoff: up to 1s, 2s, 4s, 8s...
+                    await asyncio.sleep(self._backoff_delay(attempt))
                     continue
                 else:
                     # Don't retry on 4xx or if out of retries
@@ -313,8 +351,7 @@ class HTTPPlugin(BaseApplicationPlugin):
                 # Retry on connection errors
                 if attempt < max_retries:
                     last_exception = e
-                    wait_time = 2 ** attempt
-                    await asyncio.sleep(wait_time)
+                    await asyncio.sleep(self._backoff_delay(attempt))
                     continue
                 else:
                     raise ConnectionError(
@@ -2,13 +2,16 @@
 
 This module implements a WebSocket connector plugin that supports
 real-time streaming applications with connection lifecycle management
-and message framing.
+and message framing. Requests are tagged with correlation ids so many
+test cases can be in flight on the same socket at once.
 """
 
 import asyncio
 import json
+import logging
 import time
-from typing import Any, Dict, Optional
+import uuid
+from typing import Any, Dict, List, Optional
 
 import websockets
 from websockets.client import WebSocketClientProtocol
@@ -21,6 +24,153 @@ from websockets.exceptions import (
 from app.connectors.plugin import ApplicationResponse, BaseApplicationPlugin
 from app.models.connection_config import ConnectionConfig
 
+logger = logging.getLogger(__name__)
+
+# Message field carrying the correlation id of a request and its reply
+CORRELATION_ID_FIELD = "id"
+
+
+class _MultiplexedConnection:
+    """
+    A WebSocket carrying many concurrent requests.
+    
+    Each request is sent with a unique correlation id and waits on its
+    own future. A reader task, running while requests are in flight,
+    receives replies and resolves the future whose id the reply echoes.
+    Replies without an id are handed to the oldest waiting request, so
+    applications that answer strictly in order still work.
+    """
+    
+    def __init__(self, websocket: WebSocketClientProtocol):
+        """
+        Initialize the connection.
+        
+        Args:
+            websocket: Open WebSocket connection
+        """
+        self.websocket = websocket
+        self.closed = False
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._reader: Optional[asyncio.Task] = None
+    
+    @property
+    def is_open(self) -> bool:
+        """Whether the socket can carry new requests."""
+        return not self.closed and self.websocket.open
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of requests awaiting a reply."""
+        return len(self._pending)
+    
+    async def request(self, message: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """
+        Send a message and wait for its reply.
+        
+        Args:
+            message: Message dictionary to send
+            timeout: Seconds to wait for sending and for the reply each
+        
+        Returns:
+            Parsed JSON reply
+        
+        Raises:
+            TimeoutError: If sending or the reply times out
+            ConnectionClosed: If the connection is closed
+            ValueError: If the reply is not valid JSON
+        """
+        request_id = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        
+        try:
+            await asyncio.wait_for(
+                self.websocket.send(
+                    json.dumps({**message, CORRELATION_ID_FIELD: request_id})
+                ),
+                timeout=timeout
+            )
+            
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read())
+            
+            return await asyncio.wait_for(future, timeout=timeout)
+        except ConnectionClosed:
+            self.closed = True
+            raise
+        finally:
+            # A late reply for an abandoned request is dropped
+            self._pending.pop(request_id, None)
+    
+    async def close(self) -> None:
+        """Stop the reader, fail waiting requests and close the socket."""
+        self.closed = True
+        
+        if self._reader and not self._reader.done():
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+        self._reader = None
+        
+        self._fail_pending(ConnectionError("WebSocket connection closed"))
+        await self.websocket.close()
+    
+    async def _read(self) -> None:
+        """Receive replies and dispatch them while requests are waiting."""
+        try:
+            while self._pending:
+                self._dispatch(await self.websocket.recv())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if isinstance(e, ConnectionClosed):
+                self.closed = True
+            self._fail_pending(e)
+    
+    def _dispatch(self, raw_message: Any) -> None:
+        """Resolve the request a received message answers."""
+        try:
+            reply = json.loads(raw_message)
+        except (json.JSONDecodeError, TypeError) as e:
+            self._resolve_oldest(error=ValueError(f"Invalid JSON response: {str(e)}"))
+            return
+        
+        request_id = reply.get(CORRELATION_ID_FIELD) if isinstance(reply, dict) else None
+        if request_id is None:
+            self._resolve_oldest(reply=reply)
+            return
+        
+        future = self._pending.pop(str(request_id), None)
+        if future is None:
+            logger.debug(f"Dropping WebSocket reply for unknown request {request_id}")
+        elif not future.done():
+            future.set_result(reply)
+    
+    def _resolve_oldest(
+        self,
+        reply: Optional[Any] = None,
+        error: Optional[Exception] = None
+    ) -> None:
+        """Hand an uncorrelated reply or error to the oldest waiting request."""
+        for request_id, future in list(self._pending.items()):
+            del self._pending[request_id]
+            if future.done():
+                continue
+            if error:
+                future.set_exception(error)
+            else:
+                future.set_result(reply)
+            return
+    
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every waiting request with the given error."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
 
 class WebSocketPlugin(BaseApplicationPlugin):
     """
@@ -29,6 +179,8 @@ class WebSocketPlugin(BaseApplicationPlugin):
     Supports:
     - WebSocket connection lifecycle management
     - Message framing and serialization
+    - Concurrent requests multiplexed over correlation ids
+    - An optional pool of sockets per run
     - Configurable timeouts
     - Automatic reconnection on connection loss
     - JSON message format
@@ -41,13 +193,16 @@ class WebSocketPlugin(BaseApplicationPlugin):
     Message format (sent):
         {
             "type": "input",
-            "input": "<input_text>"
+            "input": "<input_text>",
+            "id": "<correlation_id>"
         }
     
     Expected response format:
         {
             "type": "output",
             "output": "<generated_text>",
+            "id": "<correlation_id>",  // echoed; replies without it are
+                                       // matched in request order
             "metadata": { ... }  // optional
         }
     """
@@ -55,15 +210,23 @@ class WebSocketPlugin(BaseApplicationPlugin):
     def __init__(self):
         """Initialize the WebSocket plugin."""
         super().__init__("websocket")
-        self._websocket: Optional[WebSocketClientProtocol] = None
+        self._connections: List[_MultiplexedConnection] = []
         self._connection_lock = asyncio.Lock()
     
+    @property
+    def _websocket(self) -> Optional[WebSocketClientProtocol]:
+        """The first pooled socket, or None when not connected."""
+        if not self._connections:
+            return None
+        return self._connections[0].websocket
+    
     async def connect(self, config: ConnectionConfig) -> None:
         """
         Establish WebSocket connection with configuration.
         
-        Creates a WebSocket connection to the specified endpoint with
-        authentication headers and timeout settings.
+        Opens ``config.websocket_connections`` WebSocket connections to
+        the specified endpoint with authentication headers and timeout
+        settings. Requests are spread over the pooled sockets.
         
         Args:
             config: Connection configuration including endpoint,
@@ -86,53 +249,73 @@ class WebSocketPlugin(BaseApplicationPlugin):
         # Build connection headers
         headers = self._build_headers(config)
         
-        # Attempt connection with retries
+        async with self._connection_lock:
+            try:
+                for _ in range(config.websocket_connections):
+                    websocket = await self._open_websocket(config, headers)
+                    self._connections.append(_MultiplexedConnection(websocket))
+            except Exception:
+                # Close sockets opened before the failure
+                await self._close_connections()
+                self._connected = False
+                raise
+    
+    async def _open_websocket(
+        self,
+        config: ConnectionConfig,
+        headers: Dict[str, str]
+    ) -> WebSocketClientProtocol:
+        """
+        Open a single WebSocket connection with retries.
+        
+        Args:
+            config: Connection configuration
+            headers: Connection headers
+        
+        Returns:
+            Open WebSocket connection
+        
+        Raises:
+            ValueError: If the URI is invalid
+            ConnectionError: If the connection cannot be established
+        """
         last_exception = None
         max_retries = config.retries
         
         for attempt in range(max_retries + 1):
             try:
-                async with self._connection_lock:
-                    # Connect to WebSocket endpoint
-                    self._websocket = await asyncio.wait_for(
-                        websockets.connect(
-                            str(config.endpoint),
-                            extra_headers=headers,
-                            ping_interval=20,  # Send ping every 20s
-                            ping_timeout=10,   # Wait 10s for pong
-                            close_timeout=10,  # Wait 10s for close handshake
-                        ),
-                        timeout=float(config.timeout)
-                    )
-                    
-                    # Connection successful
-                    self._connected = True
-                    return
+                # Connect to WebSocket endpoint
+                return await asyncio.wait_for(
+                    websockets.connect(
+                        str(config.endpoint),
+                        extra_headers=headers,
+                        ping_interval=20,  # Send ping every 20s
+                        ping_timeout=10,   # Wait 10s for pong
+                        close_timeout=10,  # Wait 10s for close handshake
+                    ),
+                    timeout=float(config.timeout)
+                )
             
             except asyncio.TimeoutError as e:
                 last_exception = TimeoutError(
                     f"WebSocket connection timeout after {config.timeout}s"
                 )
                 if attempt >= max_retries:
-                    self._connected = False
                     raise ConnectionError(str(last_exception)) from e
             
             except InvalidURI as e:
                 # Don't retry on invalid URI
-                self._connected = False
                 raise ValueError(f"Invalid WebSocket URI: {str(e)}") from e
             
             except WebSocketException as e:
                 last_exception = e
                 if attempt >= max_retries:
-                    self._connected = False
                     raise ConnectionError(
                         f"Failed to connect to WebSocket after {max_retries} retries: {str(e)}"
                     ) from e
             
             except Exception as e:
                 # Unexpected error - don't retry
-                self._connected = False
                 raise ConnectionError(f"WebSocket connection failed: {str(e)}") from e
             
             # Wait before retry with exponential backoff
@@ -141,39 +324,43 @@ class WebSocketPlugin(BaseApplicationPlugin):
                 await asyncio.sleep(wait_time)
         
         # If we get here, all retries failed
-        self._connected = False
-        if last_exception:
-            raise ConnectionError(str(last_exception)) from last_exception
+        raise ConnectionError(str(last_exception)) from last_exception
     
     async def disconnect(self) -> None:
         """
         Close WebSocket connection and clean up resources.
         
-        Closes the WebSocket connection gracefully and resets connection state.
+        Closes all pooled WebSocket connections gracefully, failing any
+        requests still waiting for a reply, and resets connection state.
         """
         async with self._connection_lock:
-            if self._websocket:
-                try:
-                    await self._websocket.close()
-                except Exception:
-                    # Ignore errors during close
-                    pass
-                finally:
-                    self._websocket = None
+            await self._close_connections()
         
         await super().disconnect()
     
+    async def _close_connections(self) -> None:
+        """Close and forget all pooled connections."""
+        connections, self._connections = self._connections, []
+        for connection in connections:
+            try:
+                await connection.close()
+            except Exception:
+                # Ignore errors during close
+                pass
+    
     async def send_input(self, input_text: str) -> ApplicationResponse:
         """
         Send input to the WebSocket endpoint and receive response.
         
-        Sends a JSON message with the input text, measures latency,
-        and parses the response.
+        Sends a JSON message with the input text on the least busy
+        pooled socket, measures latency, and parses the response. Many
+        inputs may be in flight at once.
         
         Message format:
             {
                 "type": "input",
-                "input": "<input_text>"
+                "input": "<input_text>",
+                "id": "<correlation_id>"
             }
         
         Expected response format:
@@ -217,8 +404,9 @@ class WebSocketPlugin(BaseApplicationPlugin):
             error_message = f"Request timeout: {str(e)}"
         except ConnectionClosed as e:
             error_message = f"WebSocket connection closed: {str(e)}"
-            # Mark as disconnected
-            self._connected = False
+            # Mark as disconnected once no pooled socket is left open
+            if not self._open_connections():
+                self._connected = False
         except WebSocketException as e:
             error_message = f"WebSocket error: {str(e)}"
         except Exception as e:
@@ -243,13 +431,13 @@ class WebSocketPlugin(BaseApplicationPlugin):
         Check if the WebSocket is connected.
         
         Returns:
-            True if connected and WebSocket is open, False otherwise
+            True if connected and a pooled WebSocket is open, False otherwise
         """
-        return (
-            self._connected
-            and self._websocket is not None
-            and self._websocket.open
-        )
+        return self._connected and bool(self._open_connections())
+    
+    def _open_connections(self) -> List[_MultiplexedConnection]:
+        """Pooled connections that can carry new requests."""
+        return [c for c in self._connections if c.is_open]
     
     def _is_valid_websocket_uri(self, uri: str) -> bool:
         """
@@ -303,7 +491,10 @@ class WebSocketPlugin(BaseApplicationPlugin):
     
     async def _send_and_receive(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Send message and receive response via WebSocket.
+        Send message and receive its response via WebSocket.
+        
+        The message is sent on the pooled socket with the fewest
+        requests in flight and tagged with a correlation id.
         
         Args:
             message: Message dictionary to send
@@ -317,30 +508,12 @@ class WebSocketPlugin(BaseApplicationPlugin):
             WebSocketException: If WebSocket error occurs
             ValueError: If response is not valid JSON
         """
-        if not self._websocket or not self.config:
+        connections = self._open_connections()
+        if not connections or not self.config:
             raise RuntimeError("WebSocket not initialized")
         
-        # Serialize message to JSON
-        message_json = json.dumps(message)
-        
-        # Send message
-        await asyncio.wait_for(
-            self._websocket.send(message_json),
-            timeout=float(self.config.timeout)
-        )
-        
-        # Receive response
-        response_text = await asyncio.wait_for(
-            self._websocket.recv(),
-            timeout=float(self.config.timeout)
-        )
-        
-        # Parse JSON response
-        try:
-            response_data = json.loads(response_text)
-            return response_data
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON response: {str(e)}") from e
+        connection = min(connections, key=lambda c: c.in_flight)
+        return await connection.request(message, timeout=float(self.config.timeout))
     
     def _parse_response(
         self,
@@ -123,6 +123,12 @@ class DatabaseManager:
         await self._database.evaluationRuns.create_index([("customerId", 1), ("status", 1)])
         await self._database.evaluationRuns.create_index([("customerId", 1), ("startTime", -1)])
 
+        # Evaluation responses - one per test case, paged in insertion order
+        await self._database.evaluationResponses.create_index(
+            [("runId", 1), ("testCaseId", 1)], unique=True
+        )
+        await self._database.evaluationResponses.create_index([("runId", 1), ("sequence", 1)])
+
         logger.info("Database indexes created successfully")
 
 
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReplaceOne, UpdateOne
 from pymongo.errors import DuplicateKeyError, PyMongoError
 
 from app.models.application_profile import ApplicationProfile
@@ -13,6 +14,8 @@ from app.models.customer import Customer
 from app.models.dataset import Dataset
 from app.models.evaluation_run import EvaluationRun
 from app.models.response import Response
+from app.models.test_case import TestCase
+from app.utils.instrumentation import timed_operation
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +25,8 @@ class DataRepository:
     Repository for data persistence operations with tenant isolation.
     
     All tenant-scoped operations (datasets, evaluation runs) enforce
-    customer_id filtering to ensure complete data isolation.
+    customer_id filtering to ensure complete data isolation. Every
+    public operation is timed for the metrics endpoint.
     """
 
     def __init__(self, database: AsyncIOMotorDatabase):
@@ -36,6 +40,7 @@ class DataRepository:
 
     # ==================== Customer Operations ====================
 
+    @timed_operation
     async def create_customer(self, customer: Customer) -> Customer:
         """
         Create a new customer.
@@ -66,6 +71,7 @@ class DataRepository:
             logger.error(f"Failed to create customer: {e}")
             raise RuntimeError(f"Database error creating customer: {e}") from e
 
+    @timed_operation
     async def get_customers(self) -> List[Customer]:
         """
         Get all customers.
@@ -90,6 +96,7 @@ class DataRepository:
             logger.error(f"Failed to get customers: {e}")
             raise RuntimeError(f"Database error retrieving customers: {e}") from e
 
+    @timed_operation
     async def get_customer_by_id(self, id: str) -> Optional[Customer]:
         """
         Get customer by ID.
@@ -116,6 +123,7 @@ class DataRepository:
             logger.error(f"Failed to get customer {id}: {e}")
             raise RuntimeError(f"Database error retrieving customer: {e}") from e
 
+    @timed_operation
     async def update_customer(self, id: str, updates: Dict[str, Any]) -> Customer:
         """
         Update customer.
@@ -155,6 +163,7 @@ class DataRepository:
             logger.error(f"Failed to update customer {id}: {e}")
             raise RuntimeError(f"Database error updating customer: {e}") from e
 
+    @timed_operation
     async def delete_customer(self, id: str) -> None:
         """
         Delete customer.
@@ -182,6 +191,7 @@ class DataRepository:
 
     # ==================== Application Profile Operations ====================
 
+    @timed_operation
     async def create_application_profile(self, profile: ApplicationProfile) -> ApplicationProfile:
         """
         Create a new application profile.
@@ -222,6 +232,7 @@ class DataRepository:
             logger.error(f"Failed to create application profile: {e}")
             raise RuntimeError(f"Database error creating application profile: {e}") from e
 
+    @timed_operation
     async def get_application_profiles(self, customer_id: Optional[str] = None) -> List[ApplicationProfile]:
         """
         Get application profiles, optionally filtered by customer.
@@ -256,6 +267,7 @@ class DataRepository:
             logger.error(f"Failed to get application profiles: {e}")
             raise RuntimeError(f"Database error retrieving application profiles: {e}") from e
 
+    @timed_operation
     async def get_application_profile_by_id(self, id: str) -> Optional[ApplicationProfile]:
         """
         Get application profile by ID.
@@ -284,6 +296,7 @@ class DataRepository:
             logger.error(f"Failed to get application profile {id}: {e}")
             raise RuntimeError(f"Database error retrieving application profile: {e}") from e
 
+    @timed_operation
     async def update_application_profile(self, id: str, updates: Dict[str, Any]) -> ApplicationProfile:
         """
         Update application profile.
@@ -331,6 +344,7 @@ class DataRepository:
             logger.error(f"Failed to update application profile {id}: {e}")
             raise RuntimeError(f"Database error updating application profile: {e}") from e
 
+    @timed_operation
     async def delete_application_profile(self, id: str) -> None:
         """
         Delete application profile.
@@ -358,6 +372,7 @@ class DataRepository:
 
     # ==================== Dataset Operations (Tenant-Scoped) ====================
 
+    @timed_operation
     async def create_dataset(self, dataset: Dataset) -> Dataset:
         """
         Create a new dataset.
@@ -392,6 +407,7 @@ class DataRepository:
             logger.error(f"Failed to create dataset: {e}")
             raise RuntimeError(f"Database error creating dataset: {e}") from e
 
+    @timed_operation
     async def get_datasets(self, customer_id: str) -> List[Dataset]:
         """
         Get all datasets for a customer (tenant-scoped).
@@ -421,6 +437,7 @@ class DataRepository:
             logger.error(f"Failed to get datasets for customer {customer_id}: {e}")
             raise RuntimeError(f"Database error retrieving datasets: {e}") from e
 
+    @timed_operation
     async def get_dataset_by_id(self, id: str, customer_id: str) -> Optional[Dataset]:
         """
         Get dataset by ID with tenant check.
@@ -450,6 +467,7 @@ class DataRepository:
             logger.error(f"Failed to get dataset {id}: {e}")
             raise RuntimeError(f"Database error retrieving dataset: {e}") from e
 
+    @timed_operation
     async def update_dataset(self, id: str, customer_id: str, updates: Dict[str, Any]) -> Dataset:
         """
         Update dataset with tenant check.
@@ -496,6 +514,52 @@ class DataRepository:
             logger.error(f"Failed to update dataset {id}: {e}")
             raise RuntimeError(f"Database error updating dataset: {e}") from e
 
+    @timed_operation
+    async def add_test_cases(
+        self,
+        id: str,
+        customer_id: str,
+        test_cases: List[TestCase]
+    ) -> None:
+        """
+        Append a batch of test cases to a dataset with tenant check.
+        
+        Used to load large datasets incrementally: the dataset is created
+        empty and its test cases are appended in batches.
+        
+        Args:
+            id: Dataset ID
+            customer_id: Customer ID for tenant isolation
+            test_cases: Test cases to append, in order
+            
+        Raises:
+            ValueError: If dataset not found or doesn't belong to customer
+            RuntimeError: If database operation fails
+        """
+        if not test_cases:
+            return
+        
+        try:
+            result = await self._db.datasets.update_one(
+                {"_id": id, "customerId": customer_id},
+                {
+                    "$push": {"testCases": {"$each": [tc.model_dump() for tc in test_cases]}},
+                    "$set": {"updated_at": datetime.utcnow()}
+                }
+            )
+            
+            if result.matched_count == 0:
+                raise ValueError(f"Dataset with ID {id} not found for customer {customer_id}")
+            
+            logger.debug(f"Added {len(test_cases)} test cases to dataset: {id}")
+            
+        except ValueError:
+            raise
+        except PyMongoError as e:
+            logger.error(f"Failed to add test cases to dataset {id}: {e}")
+            raise RuntimeError(f"Database error adding test cases: {e}") from e
+
+    @timed_operation
     async def delete_dataset(self, id: str, customer_id: str) -> None:
         """
         Delete dataset with tenant check.
@@ -524,10 +588,14 @@ class DataRepository:
 
     # ==================== Evaluation Run Operations (Tenant-Scoped) ====================
 
+    @timed_operation
     async def create_evaluation_run(self, run: EvaluationRun) -> EvaluationRun:
         """
         Create a new evaluation run.
         
+        Responses are not embedded in the run document; any responses on
+        the run are written to the evaluationResponses collection.
+        
         Args:
             run: EvaluationRun object to create
             
@@ -542,6 +610,7 @@ class DataRepository:
             run_dict = run.model_dump()
             run_dict["_id"] = run.id
             run_dict.pop("id", None)
+            run_dict.pop("responses", None)
             
             # Convert snake_case to camelCase for MongoDB
             run_dict["customerId"] = run_dict.pop("customer_id")
@@ -554,6 +623,9 @@ class DataRepository:
             result = await self._db.evaluationRuns.insert_one(run_dict)
             logger.info(f"Created evaluation run: {run.id} for customer: {run.customer_id}")
             
+            if run.responses:
+                await self.add_responses(run.id, run.responses)
+            
             return run
             
         except DuplicateKeyError:
@@ -562,10 +634,14 @@ class DataRepository:
             logger.error(f"Failed to create evaluation run: {e}")
             raise RuntimeError(f"Database error creating evaluation run: {e}") from e
 
+    @timed_operation
     async def get_evaluation_runs(self, customer_id: str) -> List[EvaluationRun]:
         """
         Get all evaluation runs for a customer (tenant-scoped).
         
+        Response bodies are not loaded; the returned runs have an empty
+        responses list. Use get_responses to page through responses.
+        
         Args:
             customer_id: Customer ID for tenant isolation
             
@@ -576,7 +652,10 @@ class DataRepository:
             RuntimeError: If database operation fails
         """
         try:
-            cursor = self._db.evaluationRuns.find({"customerId": customer_id})
+            cursor = self._db.evaluationRuns.find(
+                {"customerId": customer_id},
+                self._RUN_SUMMARY_PROJECTION
+            )
             runs = []
             
             async for doc in cursor:
@@ -587,6 +666,7 @@ class DataRepository:
                 doc["start_time"] = doc.pop("startTime")
                 if "endTime" in doc:
                     doc["end_time"] = doc.pop("endTime")
+                doc["responses"] = []
                 runs.append(EvaluationRun(**doc))
             
             return runs
@@ -595,13 +675,20 @@ class DataRepository:
             logger.error(f"Failed to get evaluation runs for customer {customer_id}: {e}")
             raise RuntimeError(f"Database error retrieving evaluation runs: {e}") from e
 
-    async def get_evaluation_run_by_id(self, id: str, customer_id: str) -> Optional[EvaluationRun]:
+    @timed_operation
+    async def get_evaluation_run_by_id(
+        self,
+        id: str,
+        customer_id: str,
+        include_responses: bool = True
+    ) -> Optional[EvaluationRun]:
         """
         Get evaluation run by ID with tenant check.
         
         Args:
             id: Evaluation run ID
             customer_id: Customer ID for tenant isolation
+            include_responses: Whether to load all responses for the run
             
         Returns:
             EvaluationRun if found and belongs to customer, None otherwise
@@ -610,7 +697,13 @@ class DataRepository:
             RuntimeError: If database operation fails
         """
         try:
-            doc = await self._db.evaluationRuns.find_one({"_id": id, "customerId": customer_id})
+            # Runs written before responses moved to their own collection
+            # still embed them, so only project them out when not needed
+            projection = None if include_responses else self._RUN_SUMMARY_PROJECTION
+            doc = await self._db.evaluationRuns.find_one(
+                {"_id": id, "customerId": customer_id},
+                projection
+            )
             
             if doc:
                 doc["id"] = str(doc.pop("_id"))
@@ -620,6 +713,15 @@ class DataRepository:
                 doc["start_time"] = doc.pop("startTime")
                 if "endTime" in doc:
                     doc["end_time"] = doc.pop("endTime")
+                
+                embedded = doc.pop("responses", None) or []
+                if not include_responses:
+                    doc["responses"] = []
+                elif embedded:
+                    doc["responses"] = [self._response_from_document(r) for r in embedded]
+                else:
+                    doc["responses"] = await self._find_responses(id)
+                
                 return EvaluationRun(**doc)
             
             return None
@@ -628,10 +730,13 @@ class DataRepository:
             logger.error(f"Failed to get evaluation run {id}: {e}")
             raise RuntimeError(f"Database error retrieving evaluation run: {e}") from e
 
+    @timed_operation
     async def update_evaluation_run(self, id: str, customer_id: str, updates: Dict[str, Any]) -> EvaluationRun:
         """
         Update evaluation run with tenant check.
         
+        The returned run does not include responses.
+        
         Args:
             id: Evaluation run ID
             customer_id: Customer ID for tenant isolation
@@ -652,6 +757,7 @@ class DataRepository:
             result = await self._db.evaluationRuns.find_one_and_update(
                 {"_id": id, "customerId": customer_id},
                 {"$set": updates},
+                projection=self._RUN_SUMMARY_PROJECTION,
                 return_document=True
             )
             
@@ -665,6 +771,7 @@ class DataRepository:
             result["start_time"] = result.pop("startTime")
             if "endTime" in result:
                 result["end_time"] = result.pop("endTime")
+            result["responses"] = []
             logger.info(f"Updated evaluation run: {id}")
             
             return EvaluationRun(**result)
@@ -677,6 +784,7 @@ class DataRepository:
 
     # ==================== Response Operations ====================
 
+    @timed_operation
     async def add_response(self, run_id: str, response: Response) -> None:
         """
         Add response to evaluation run.
@@ -689,64 +797,263 @@ class DataRepository:
             ValueError: If run not found
             RuntimeError: If database operation fails
         """
-        try:
-            response_dict = response.model_dump()
-            
-            # Convert snake_case to camelCase for MongoDB
-            if "test_case_id" in response_dict:
-                response_dict["testCaseId"] = response_dict.pop("test_case_id")
-            if "individual_metrics" in response_dict:
-                response_dict["individualMetrics"] = response_dict.pop("individual_metrics")
+        await self.add_responses(run_id, [response])
+
+    @timed_operation
+    async def add_responses(self, run_id: str, responses: List[Response]) -> None:
+        """
+        Add a batch of responses to evaluation run.
+        
+        Responses are stored in the evaluationResponses collection, one
+        document per (runId, testCaseId). A sequence number is reserved on
+        the run document for each response so pages come back in the
+        order responses were added. Writes are upserts, so retrying a
+        batch after a failure does not create duplicates.
+        
+        Args:
+            run_id: Evaluation run ID
+            responses: Response objects to add, in order
             
-            result = await self._db.evaluationRuns.update_one(
+        Raises:
+            ValueError: If run not found
+            RuntimeError: If database operation fails
+        """
+        if not responses:
+            return
+        
+        try:
+            # Reserve a block of sequence numbers and verify the run exists
+            run_doc = await self._db.evaluationRuns.find_one_and_update(
                 {"_id": run_id},
-                {"$push": {"responses": response_dict}}
+                {"$inc": {"responseSequence": len(responses)}},
+                projection={"customerId": 1, "responseSequence": 1},
+                return_document=False
             )
             
-            if result.matched_count == 0:
+            if not run_doc:
                 raise ValueError(f"Evaluation run with ID {run_id} not found")
             
-            logger.debug(f"Added response to evaluation run: {run_id}")
+            first_sequence = run_doc.get("responseSequence", 0)
+            operations = []
+            for offset, response in enumerate(responses):
+                response_dict = self._response_to_document(response)
+                response_dict["runId"] = run_id
+                response_dict["customerId"] = run_doc.get("customerId")
+                response_dict["sequence"] = first_sequence + offset
+                operations.append(
+                    ReplaceOne(
+                        {"runId": run_id, "testCaseId": response_dict["testCaseId"]},
+                        response_dict,
+                        upsert=True
+                    )
+                )
+            
+            await self._db.evaluationResponses.bulk_write(operations, ordered=True)
+            
+            logger.debug(f"Added {len(operations)} responses to evaluation run: {run_id}")
             
         except ValueError:
             raise
         except PyMongoError as e:
-            logger.error(f"Failed to add response to run {run_id}: {e}")
-            raise RuntimeError(f"Database error adding response: {e}") from e
+            logger.error(f"Failed to add responses to run {run_id}: {e}")
+            raise RuntimeError(f"Database error adding responses: {e}") from e
 
-    async def get_responses(self, run_id: str) -> List[Response]:
+    @timed_operation
+    async def get_responses(
+        self,
+        run_id: str,
+        customer_id: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Response]:
         """
-        Get all responses for evaluation run.
+        Get responses for evaluation run, optionally paginated.
         
         Args:
             run_id: Evaluation run ID
+            customer_id: Optional customer ID for tenant isolation
+            skip: Number of responses to skip
+            limit: Maximum number of responses to return (all if None)
             
         Returns:
-            List of responses
+            List of responses in the order they were added
             
         Raises:
             ValueError: If run not found
             RuntimeError: If database operation fails
         """
         try:
-            doc = await self._db.evaluationRuns.find_one({"_id": run_id}, {"responses": 1})
+            query: Dict[str, Any] = {"_id": run_id}
+            if customer_id:
+                query["customerId"] = customer_id
+            
+            doc = await self._db.evaluationRuns.find_one(query, {"responses": 1})
             
             if not doc:
                 raise ValueError(f"Evaluation run with ID {run_id} not found")
             
-            responses = []
-            for response_dict in doc.get("responses", []):
-                # Convert camelCase to snake_case for Pydantic
-                if "testCaseId" in response_dict:
-                    response_dict["test_case_id"] = response_dict.pop("testCaseId")
-                if "individualMetrics" in response_dict:
-                    response_dict["individual_metrics"] = response_dict.pop("individualMetrics")
-                responses.append(Response(**response_dict))
+            # Runs created before responses moved out still embed them
+            embedded = doc.get("responses") or []
+            if embedded:
+                end = None if limit is None else skip + limit
+                return [
+                    Response(**self._response_from_document(r))
+                    for r in embedded[skip:end]
+                ]
             
-            return responses
+            return [
+                Response(**r)
+                for r in await self._find_responses(run_id, skip=skip, limit=limit)
+            ]
             
         except ValueError:
             raise
         except PyMongoError as e:
             logger.error(f"Failed to get responses for run {run_id}: {e}")
             raise RuntimeError(f"Database error retrieving responses: {e}") from e
+
+    @timed_operation
+    async def count_responses(self, run_id: str, customer_id: Optional[str] = None) -> int:
+        """
+        Count responses stored for evaluation run.
+        
+        Args:
+            run_id: Evaluation run ID
+            customer_id: Optional customer ID for tenant isolation
+            
+        Returns:
+            Number of responses for the run
+            
+        Raises:
+            ValueError: If run not found
+            RuntimeError: If database operation fails
+        """
+        try:
+            query: Dict[str, Any] = {"_id": run_id}
+            if customer_id:
+                query["customerId"] = customer_id
+            
+            doc = await self._db.evaluationRuns.find_one(query, {"responses": 1})
+            
+            if not doc:
+                raise ValueError(f"Evaluation run with ID {run_id} not found")
+            
+            embedded = doc.get("responses") or []
+            if embedded:
+                return len(embedded)
+            
+            return await self._db.evaluationResponses.count_documents({"runId": run_id})
+            
+        except ValueError:
+            raise
+        except PyMongoError as e:
+            logger.error(f"Failed to count responses for run {run_id}: {e}")
+            raise RuntimeError(f"Database error counting responses: {e}") from e
+
+    @timed_operation
+    async def update_response_metrics(self, run_id: str, responses: List[Response]) -> None:
+        """
+        Store individual metrics for responses of an evaluation run.
+        
+        Only the metrics field of each response document is updated, in a
+        single bulk write. Responses without metrics are skipped.
+        
+        Args:
+            run_id: Evaluation run ID
+            responses: Responses carrying calculated individual metrics
+            
+        Raises:
+            RuntimeError: If database operation fails
+        """
+        operations = [
+            UpdateOne(
+                {"runId": run_id, "testCaseId": response.test_case_id},
+                {"$set": {"individualMetrics": response.individual_metrics.model_dump()}}
+            )
+            for response in responses
+            if response.individual_metrics is not None
+        ]
+        
+        if not operations:
+            return
+        
+        try:
+            await self._db.evaluationResponses.bulk_write(operations, ordered=False)
+            logger.debug(f"Updated metrics for {len(operations)} responses of run: {run_id}")
+            
+        except PyMongoError as e:
+            logger.error(f"Failed to update response metrics for run {run_id}: {e}")
+            raise RuntimeError(f"Database error updating response metrics: {e}") from e
+
+    async def _find_responses(
+        self,
+        run_id: str,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Load response documents for a run from the evaluationResponses collection.
+        
+        Args:
+            run_id: Evaluation run ID
+            skip: Number of responses to skip
+            limit: Maximum number of responses to return (all if None)
+            
+        Returns:
+            Response dictionaries with snake_case keys, ordered by sequence
+        """
+        cursor = self._db.evaluationResponses.find(
+            {"runId": run_id},
+            {"_id": 0, "runId": 0, "customerId": 0, "sequence": 0}
+        ).sort("sequence", 1).skip(skip)
+        
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        
+        return [self._response_from_document(doc) async for doc in cursor]
+
+    # Run fields excluded when response bodies are not needed
+    _RUN_SUMMARY_PROJECTION = {"responses": 0, "responseSequence": 0}
+
+    @staticmethod
+    def _response_to_document(response: Response) -> Dict[str, Any]:
+        """
+        Convert a Response into its MongoDB document form.
+        
+        Args:
+            response: Response object to convert
+            
+        Returns:
+            Response dictionary with camelCase keys
+        """
+        response_dict = response.model_dump()
+        
+        # Convert snake_case to camelCase for MongoDB
+        if "test_case_id" in response_dict:
+            response_dict["testCaseId"] = response_dict.pop("test_case_id")
+        if "individual_metrics" in response_dict:
+            response_dict["individualMetrics"] = response_dict.pop("individual_metrics")
+        
+        return response_dict
+
+    @staticmethod
+    def _response_from_document(response_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a stored response document into Response field names.
+        
+        Accepts both camelCase documents and the snake_case documents
+        written by older versions.
+        
+        Args:
+            response_dict: Response document from MongoDB
+            
+        Returns:
+            Response dictionary with snake_case keys
+        """
+        # Convert camelCase to snake_case for Pydantic
+        if "testCaseId" in response_dict:
+            response_dict["test_case_id"] = response_dict.pop("testCaseId")
+        if "individualMetrics" in response_dict:
+            response_dict["individual_metrics"] = response_dict.pop("individualMetrics")
+        
+        return response_dict
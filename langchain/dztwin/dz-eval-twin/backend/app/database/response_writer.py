@@ -0,0 +1,149 @@
+"""Buffered writer for persisting evaluation responses in bulk."""
+
+import asyncio
+import logging
+from types import TracebackType
+from typing import List, Optional, Type
+
+from app.config import settings
+from app.database.repository import DataRepository
+from app.models.response import Response
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedResponseWriter:
+    """
+    Accumulates responses for an evaluation run and flushes them in bulk.
+
+    Responses are written with a single bulk write once the buffer reaches
+    ``batch_size`` or ``flush_interval`` seconds have passed, whichever
+    comes first. Use as an async context manager so the periodic
+    flush task is started and a final flush happens on exit:
+
+        async with BufferedResponseWriter(repository, run.id) as writer:
+            await writer.add(response)
+
+    Responses are always written in the order they were added. A failed
+    flush keeps its batch at the front of the buffer so the next flush
+    retries it.
+    """
+
+    def __init__(
+        self,
+        repository: DataRepository,
+        run_id: str,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            repository: Data repository for database operations
+            run_id: Evaluation run the responses belong to
+            batch_size: Number of buffered responses that triggers a flush
+            flush_interval: Maximum seconds a response stays buffered
+        """
+        self._repository = repository
+        self._run_id = run_id
+        self._batch_size = max(1, batch_size or settings.response_flush_batch_size)
+        self._flush_interval = flush_interval or settings.response_flush_interval_seconds
+        self._buffer: List[Response] = []
+        self._lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self.flushed_count = 0
+
+    async def __aenter__(self) -> "BufferedResponseWriter":
+        """Start the periodic flush task."""
+        self._flush_task = asyncio.create_task(self._flush_periodically())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType]
+    ) -> None:
+        """Stop the periodic flush task and flush remaining responses."""
+        await self.close()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of responses waiting to be written."""
+        return len(self._buffer)
+
+    async def add(self, response: Response) -> None:
+        """
+        Buffer a response, flushing if the batch size is reached.
+
+        Flush errors are logged rather than raised so that execution can
+        continue; the batch stays buffered and is retried later.
+
+        Args:
+            response: Response to persist
+        """
+        self._buffer.append(response)
+
+        if len(self._buffer) >= self._batch_size:
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(
+                    f"Failed to flush responses for run {self._run_id}, "
+                    f"will retry: {e}"
+                )
+
+    async def flush(self) -> None:
+        """
+        Write all buffered responses to the database.
+
+        Raises:
+            ValueError: If the evaluation run no longer exists
+            RuntimeError: If the database operation fails
+        """
+        async with self._lock:
+            if not self._buffer:
+                return
+
+            batch = self._buffer
+            self._buffer = []
+
+            try:
+                await self._repository.add_responses(self._run_id, batch)
+            except Exception:
+                # Put the batch back in front of anything added meanwhile
+                self._buffer[:0] = batch
+                raise
+
+            self.flushed_count += len(batch)
+            logger.debug(f"Flushed {len(batch)} responses for run {self._run_id}")
+
+    async def close(self) -> None:
+        """
+        Stop periodic flushing and write any remaining responses.
+
+        Raises:
+            ValueError: If the evaluation run no longer exists
+            RuntimeError: If the final flush fails
+        """
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        await self.flush()
+
+    async def _flush_periodically(self) -> None:
+        """Flush the buffer every flush interval until cancelled."""
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(
+                    f"Periodic flush failed for run {self._run_id}, will retry: {e}"
+                )
@@ -5,22 +5,63 @@ datasets against application profiles, captures responses, and handles
 errors gracefully.
 """
 
+import asyncio
 import logging
+import time
 import uuid
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from app.connectors.http_plugin import HTTPPlugin
 from app.connectors.plugin import ApplicationPlugin, ApplicationResponse
+from app.connectors.websocket_plugin import WebSocketPlugin
 from app.database.repository import DataRepository
+from app.database.response_writer import BufferedResponseWriter
+from app.engine.metrics_calculator import MetricsCalculator, RunMetricsAccumulator
+from app.engine.progress import RunProgress
+from app.engine.response_cache import ResponseCache, RunResponseReuse
 from app.models.application_profile import ApplicationProfile
 from app.models.dataset import Dataset
 from app.models.evaluation_run import EvaluationRun, EvaluationStatus
 from app.models.response import Response
+from app.models.test_case import TestCase
+from app.utils.instrumentation import span
 
 logger = logging.getLogger(__name__)
 
 
+class _RequestRateLimiter:
+    """
+    Spaces request start times to honour a requests-per-second cap.
+    
+    Each caller reserves the next free send slot under a lock and then
+    sleeps outside the lock until that slot arrives, so concurrent test
+    cases are released at a steady rate rather than in bursts.
+    """
+    
+    def __init__(self, requests_per_second: float):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            requests_per_second: Maximum number of requests per second
+        """
+        self._interval = 1.0 / requests_per_second
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until the caller is allowed to send its next request."""
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
 class EvaluationEngine:
     """
     Engine for executing evaluation runs.
@@ -28,23 +69,44 @@ class EvaluationEngine:
     The evaluation engine orchestrates the execution of test datasets
     against application profiles. It:
     - Validates customer_id matches for dataset and application profile
-    - Iterates through test cases and sends inputs to the application
+    - Fans test cases out to the application with bounded concurrency
     - Captures responses with timestamps and latency measurements
     - Handles partial failures and error recording
+    - Optionally scores responses as they arrive and aggregates metrics
+    - Optionally reuses responses for repeated inputs
     - Persists results to the database
+    - Times each stage of a run for the metrics endpoint
     
     Attributes:
         repository: Data repository for database operations
+        calculator: Optional metrics calculator; when set, metrics are
+                    calculated incrementally during the run
+        response_cache: Optional cache of responses shared across runs
+        deduplicate_inputs: Whether identical inputs within a run are
+                            sent to the application only once
     """
     
-    def __init__(self, repository: DataRepository):
+    def __init__(
+        self,
+        repository: DataRepository,
+        calculator: Optional[MetricsCalculator] = None,
+        response_cache: Optional[ResponseCache] = None,
+        deduplicate_inputs: bool = False
+    ):
         """
         Initialize the evaluation engine.
         
         Args:
             repository: Data repository for database operations
+            calculator: Optional metrics calculator for incremental metrics
+            response_cache: Optional response cache shared across runs
+            deduplicate_inputs: Whether to send identical inputs only once
+                                per run
         """
         self.repository = repository
+        self.calculator = calculator
+        self.response_cache = response_cache
+        self.deduplicate_inputs = deduplicate_inputs
     
     async def execute_run(
         self,
@@ -60,10 +122,10 @@ class EvaluationEngine:
         2. Load dataset and application profile from database
         3. Create evaluation run record with customer_id
         4. Connect to the application via the appropriate plugin
-        5. For each test case:
+        5. For each test case (up to the profile's max_concurrency at once):
            a. Send input to application via connector
            b. Capture response and latency
-           c. Store response in database
+           c. Buffer response for bulk storage, in dataset order
         6. Update run status to completed
         7. Return evaluation run
         
@@ -89,11 +151,15 @@ class EvaluationEngine:
             f"dataset {dataset_id}, profile {application_profile_id}"
         )
         
-        # Step 1 & 2: Load and validate dataset
-        dataset = await self._load_and_validate_dataset(customer_id, dataset_id)
-        
-        # Step 1 & 2: Load and validate application profile
-        profile = await self._load_and_validate_profile(customer_id, application_profile_id)
+        with span("load"):
+            # Step 1 & 2: Load and validate dataset
+            dataset = await self._load_and_validate_dataset(customer_id, dataset_id)
+            
+            # Step 1 & 2: Load and validate application profile
+            profile = await self._load_and_validate_profile(
+                customer_id,
+                application_profile_id
+            )
         
         # Step 3: Create evaluation run record
         run = await self._create_evaluation_run(
@@ -102,15 +168,166 @@ class EvaluationEngine:
             application_profile_id
         )
         
+        # Steps 4-7: Connect, execute test cases and complete the run
+        return await self._run_evaluation(run, dataset, profile)
+    
+    async def create_pending_run(
+        self,
+        customer_id: str,
+        dataset_id: str,
+        application_profile_id: str
+    ) -> EvaluationRun:
+        """
+        Validate inputs and create a pending run for background execution.
+        
+        Args:
+            customer_id: Customer ID for tenant isolation
+            dataset_id: ID of the dataset to evaluate
+            application_profile_id: ID of the application profile to test
+        
+        Returns:
+            Created EvaluationRun with status 'pending'
+        
+        Raises:
+            ValueError: If customer_id doesn't match dataset or profile,
+                       or if dataset/profile not found
+            RuntimeError: If database operations fail
+        """
+        await self._load_and_validate_dataset(customer_id, dataset_id)
+        await self._load_and_validate_profile(customer_id, application_profile_id)
+        
+        return await self._create_evaluation_run(
+            customer_id,
+            dataset_id,
+            application_profile_id,
+            status="pending"
+        )
+    
+    async def execute_pending_run(
+        self,
+        run: EvaluationRun,
+        progress: Optional[RunProgress] = None
+    ) -> EvaluationRun:
+        """
+        Execute a run created by create_pending_run.
+        
+        The dataset and application profile are reloaded, since they may
+        have changed while the run was queued.
+        
+        Args:
+            run: Pending evaluation run
+            progress: Optional tracker updated as test cases complete
+        
+        Returns:
+            EvaluationRun with all responses and status
+        
+        Raises:
+            ValueError: If the dataset or profile is no longer available
+            ConnectionError: If the application cannot be reached
+            RuntimeError: If database operations fail
+        """
+        try:
+            with span("load"):
+                dataset = await self._load_and_validate_dataset(
+                    run.customer_id,
+                    run.dataset_id
+                )
+                profile = await self._load_and_validate_profile(
+                    run.customer_id,
+                    run.application_profile_id
+                )
+            
+            await self.repository.update_evaluation_run(
+                run.id,
+                run.customer_id,
+                {"status": "running"}
+            )
+            run.status = "running"
+            
+        except Exception as e:
+            logger.error(f"Evaluation run {run.id} could not be started: {e}")
+            await self._fail_evaluation_run(run, str(e))
+            raise
+        
+        try:
+            return await self._run_evaluation(run, dataset, profile, progress)
+        except ConnectionError as e:
+            # Nobody is waiting on the request, so record the failure on the run
+            await self._fail_evaluation_run(run, str(e))
+            raise
+    
+    async def fail_pending_run(
+        self,
+        run: EvaluationRun,
+        error_message: str
+    ) -> EvaluationRun:
+        """
+        Mark a run created by create_pending_run as failed.
+        
+        Used when a queued run is cancelled or never reaches a worker, so
+        the stored run does not stay pending or running.
+        
+        Args:
+            run: Pending or running evaluation run
+            error_message: Reason the run did not complete
+        
+        Returns:
+            Updated EvaluationRun object
+        """
+        return await self._fail_evaluation_run(run, error_message)
+    
+    async def _run_evaluation(
+        self,
+        run: EvaluationRun,
+        dataset: Dataset,
+        profile: ApplicationProfile,
+        progress: Optional[RunProgress] = None
+    ) -> EvaluationRun:
+        """
+        Connect to the application, execute all test cases and complete the run.
+        
+        Args:
+            run: Running evaluation run
+            dataset: Dataset containing test cases
+            profile: Application profile with connection configuration
+            progress: Optional tracker updated as test cases complete
+        
+        Returns:
+            EvaluationRun with all responses and status
+        
+        Raises:
+            ConnectionError: If the application cannot be reached
+            RuntimeError: If database operations fail
+        """
         # Step 4: Connect to application
-        plugin = await self._connect_to_application(profile)
+        with span("connect"):
+            plugin = await self._connect_to_application(profile)
+        
+        metrics = (
+            self.calculator.start_run(dataset.test_cases) if self.calculator else None
+        )
         
         try:
             # Step 5: Execute test cases
-            await self._execute_test_cases(run, dataset, plugin)
+            with span("execute"):
+                await self._execute_test_cases(
+                    run,
+                    dataset,
+                    plugin,
+                    max_concurrency=profile.connection_config.max_concurrency,
+                    requests_per_second=profile.connection_config.requests_per_second,
+                    progress=progress,
+                    metrics=metrics,
+                    profile=profile
+                )
+            
+            if metrics and metrics.count:
+                with span("aggregate"):
+                    run.metrics = metrics.result()
             
             # Step 6: Update run status to completed
-            run = await self._complete_evaluation_run(run)
+            with span("complete"):
+                run = await self._complete_evaluation_run(run)
             
         except Exception as e:
             # If something goes catastrophically wrong, mark run as failed
@@ -209,7 +426,8 @@ class EvaluationEngine:
         self,
         customer_id: str,
         dataset_id: str,
-        application_profile_id: str
+        application_profile_id: str,
+        status: EvaluationStatus = "running"
     ) -> EvaluationRun:
         """
         Create a new evaluation run record in the database.
@@ -218,6 +436,7 @@ class EvaluationEngine:
             customer_id: Customer ID for tenant isolation
             dataset_id: Dataset ID
             application_profile_id: Application profile ID
+            status: Initial run status
         
         Returns:
             Created EvaluationRun object
@@ -230,7 +449,7 @@ class EvaluationEngine:
             customer_id=customer_id,
             dataset_id=dataset_id,
             application_profile_id=application_profile_id,
-            status="running",
+            status=status,
             start_time=datetime.utcnow(),
             responses=[]
         )
@@ -247,8 +466,8 @@ class EvaluationEngine:
         """
         Create and connect to application plugin based on profile type.
         
-        Currently supports HTTP plugin. Can be extended to support
-        WebSocket and other plugin types.
+        Endpoints with a ws:// or wss:// scheme use the WebSocket plugin;
+        other endpoints use the HTTP plugin.
         
         Args:
             profile: Application profile with connection configuration
@@ -260,12 +479,14 @@ class EvaluationEngine:
             ValueError: If plugin type is not supported
             ConnectionError: If connection fails
         """
-        # Determine plugin type from profile
-        # For now, we'll use HTTP plugin as the default
-        # In the future, this can be extended to support multiple plugin types
+        # Determine plugin from the endpoint scheme and profile type
         plugin_type = profile.type.lower()
+        endpoint = str(profile.connection_config.endpoint)
+        plugin: ApplicationPlugin
         
-        if plugin_type in ["http", "chatbot", "rag", "agent", "workflow"]:
+        if endpoint.startswith(("ws://", "wss://")):
+            plugin = WebSocketPlugin()
+        elif plugin_type in ["http", "chatbot", "rag", "agent", "workflow"]:
             plugin = HTTPPlugin()
         else:
             raise ValueError(f"Unsupported application type: {profile.type}")
@@ -286,86 +507,208 @@ class EvaluationEngine:
         self,
         run: EvaluationRun,
         dataset: Dataset,
-        plugin: ApplicationPlugin
+        plugin: ApplicationPlugin,
+        max_concurrency: int = 1,
+        requests_per_second: Optional[float] = None,
+        progress: Optional[RunProgress] = None,
+        metrics: Optional[RunMetricsAccumulator] = None,
+        profile: Optional[ApplicationProfile] = None
     ) -> None:
         """
         Execute all test cases in the dataset.
         
-        Iterates through test cases, sends inputs to the application,
-        captures responses with timestamps and latency, and handles
-        errors gracefully. If a test case fails, the error is recorded
-        and execution continues with remaining test cases.
+        Test cases are fanned out over a semaphore so that at most
+        ``max_concurrency`` inputs are in flight at once, optionally
+        throttled to ``requests_per_second``. Responses are persisted in
+        dataset order regardless of completion order: each finished
+        response is held until every earlier test case has been recorded.
+        Recorded responses are buffered and written to the database in
+        bulk, with a final flush once all test cases have finished.
+        If a test case fails, the error is recorded and execution
+        continues with remaining test cases.
+        
+        When a response cache or input deduplication is enabled and the
+        profile is given, repeated inputs reuse an earlier response
+        (flagged as cached) instead of being sent again.
         
         Args:
             run: Evaluation run to update with responses
             dataset: Dataset containing test cases
             plugin: Connected application plugin
+            max_concurrency: Maximum number of test cases in flight at once
+            requests_per_second: Optional cap on requests sent per second
+            progress: Optional tracker updated as responses are recorded
+            metrics: Optional accumulator that scores responses as they
+                     are recorded
+            profile: Application profile the run targets, used to key
+                     reused responses
         
         Raises:
-            RuntimeError: If database operations fail
+            RuntimeError: If the final flush of responses fails
         """
-        logger.info(f"Executing {len(dataset.test_cases)} test cases")
+        test_cases = dataset.test_cases
+        logger.info(
+            f"Executing {len(test_cases)} test cases "
+            f"(max_concurrency={max_concurrency}, "
+            f"requests_per_second={requests_per_second})"
+        )
         
-        for test_case in dataset.test_cases:
-            try:
-                # Send input to application and capture response
-                app_response = await plugin.send_input(test_case.input)
-                
-                # Create response record
-                response = Response(
-                    test_case_id=test_case.id,
-                    input=test_case.input,
-                    output=app_response.output,
-                    latency=app_response.latency,
-                    timestamp=datetime.utcnow(),
-                    error=app_response.error
-                )
-                
-                # Add response to database
-                await self.repository.add_response(run.id, response)
-                
-                # Update local run object
-                run.responses.append(response)
-                
-                if app_response.error:
-                    logger.warning(
-                        f"Test case {test_case.id} failed: {app_response.error}"
-                    )
-                else:
-                    logger.debug(
-                        f"Test case {test_case.id} completed in "
-                        f"{app_response.latency:.2f}ms"
+        if progress:
+            await progress.start(len(test_cases))
+        
+        if not test_cases:
+            return
+        
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        rate_limiter = (
+            _RequestRateLimiter(requests_per_second) if requests_per_second else None
+        )
+        
+        reuse = (
+            RunResponseReuse(profile, self.response_cache, self.deduplicate_inputs)
+            if profile and (self.response_cache is not None or self.deduplicate_inputs)
+            else None
+        )
+        
+        async def send(test_case: TestCase) -> Response:
+            async with semaphore:
+                if rate_limiter:
+                    await rate_limiter.acquire()
+                return await self._execute_test_case(test_case, plugin)
+        
+        # Completed responses waiting for earlier test cases to be recorded
+        completed: List[Optional[Response]] = [None] * len(test_cases)
+        next_to_record = 0
+        record_lock = asyncio.Lock()
+        
+        async def run_test_case(index: int, test_case: TestCase) -> None:
+            nonlocal next_to_record
+            
+            # Reused responses skip the concurrency and rate limits
+            if reuse:
+                completed[index] = await reuse.execute(test_case, send)
+            else:
+                completed[index] = await send(test_case)
+            
+            # Record the contiguous prefix of completed responses in order
+            async with record_lock:
+                while next_to_record < len(completed):
+                    response = completed[next_to_record]
+                    if response is None:
+                        break
+                    await self._record_response(
+                        run,
+                        response,
+                        writer,
+                        progress,
+                        metrics
                     )
+                    completed[next_to_record] = None
+                    next_to_record += 1
+        
+        # Responses are flushed in bulk; leaving the context flushes the rest
+        async with BufferedResponseWriter(self.repository, run.id) as writer:
+            await asyncio.gather(
+                *(run_test_case(i, tc) for i, tc in enumerate(test_cases))
+            )
+        
+        if reuse and reuse.reused_count:
+            logger.info(
+                f"Reused {reuse.reused_count} of {len(test_cases)} responses "
+                f"for run {run.id}"
+            )
+    
+    async def _execute_test_case(
+        self,
+        test_case: TestCase,
+        plugin: ApplicationPlugin
+    ) -> Response:
+        """
+        Send a single test case to the application and build its response.
+        
+        Errors raised while sending are captured as an error response
+        rather than propagated, so one failing test case never aborts
+        the run.
+        
+        Args:
+            test_case: Test case to execute
+            plugin: Connected application plugin
+        
+        Returns:
+            Response record for the test case
+        """
+        try:
+            # Send input to application and capture response
+            with span("target"):
+                app_response = await plugin.send_input(test_case.input)
             
-            except Exception as e:
-                # If something goes wrong capturing the response,
-                # record an error response and continue
-                logger.error(f"Error executing test case {test_case.id}: {e}")
-                
-                error_response = Response(
-                    test_case_id=test_case.id,
-                    input=test_case.input,
-                    output="",
-                    latency=0.0,
-                    timestamp=datetime.utcnow(),
-                    error=f"Execution error: {str(e)}"
+            if app_response.error:
+                logger.warning(
+                    f"Test case {test_case.id} failed: {app_response.error}"
                 )
-                
-                try:
-                    await self.repository.add_response(run.id, error_response)
-                    run.responses.append(error_response)
-                except Exception as db_error:
-                    logger.error(
-                        f"Failed to record error response for test case "
-                        f"{test_case.id}: {db_error}"
-                    )
-                    # Continue with next test case even if we can't record the error
+            else:
+                logger.debug(
+                    f"Test case {test_case.id} completed in "
+                    f"{app_response.latency:.2f}ms"
+                )
+            
+            return Response(
+                test_case_id=test_case.id,
+                input=test_case.input,
+                output=app_response.output,
+                latency=app_response.latency,
+                timestamp=datetime.utcnow(),
+                error=app_response.error
+            )
+        
+        except Exception as e:
+            # If something goes wrong capturing the response,
+            # record an error response and continue
+            logger.error(f"Error executing test case {test_case.id}: {e}")
+            
+            return Response(
+                test_case_id=test_case.id,
+                input=test_case.input,
+                output="",
+                latency=0.0,
+                timestamp=datetime.utcnow(),
+                error=f"Execution error: {str(e)}"
+            )
+    
+    async def _record_response(
+        self,
+        run: EvaluationRun,
+        response: Response,
+        writer: BufferedResponseWriter,
+        progress: Optional[RunProgress] = None,
+        metrics: Optional[RunMetricsAccumulator] = None
+    ) -> None:
+        """
+        Buffer a response for persistence and append it to the local run.
+        
+        Args:
+            run: Evaluation run to update
+            response: Response to record
+            writer: Buffered writer that persists responses in bulk
+            progress: Optional tracker to count the response in
+            metrics: Optional accumulator; scores the response before it
+                     is persisted so its individual metrics are stored
+        """
+        with span("record"):
+            if metrics:
+                with span("score"):
+                    metrics.add(response)
+            await writer.add(response)
+            run.responses.append(response)
+            if progress:
+                await progress.record(response)
     
     async def _complete_evaluation_run(self, run: EvaluationRun) -> EvaluationRun:
         """
         Mark evaluation run as completed.
         
-        Updates the run status to 'completed' and sets the end time.
+        Updates the run status to 'completed' and sets the end time,
+        storing aggregated metrics if they were calculated during the run.
         
         Args:
             run: Evaluation run to complete
@@ -380,6 +723,8 @@ class EvaluationEngine:
             "status": "completed",
             "end_time": datetime.utcnow()
         }
+        if run.metrics is not None:
+            updates["metrics"] = run.metrics.model_dump()
         
         updated_run = await self.repository.update_evaluation_run(
             run.id,
@@ -387,6 +732,9 @@ class EvaluationEngine:
             updates
         )
         
+        # The repository does not load responses; keep the ones collected
+        updated_run.responses = run.responses
+        
         logger.info(f"Marked evaluation run {run.id} as completed")
         
         return updated_run
@@ -422,6 +770,7 @@ class EvaluationEngine:
                 run.customer_id,
                 updates
             )
+            updated_run.responses = run.responses
             logger.error(f"Marked evaluation run {run.id} as failed: {error_message}")
             return updated_run
         except Exception as e:
@@ -0,0 +1,181 @@
+"""Background job queue for evaluation runs.
+
+Runs submitted in background mode are executed by a fixed pool of
+worker tasks so that the HTTP request can return as soon as the run
+has been created.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from app.config import settings
+from app.engine.progress import RunProgress
+
+logger = logging.getLogger(__name__)
+
+# A job receives the progress tracker of its run and executes the run
+EvaluationJob = Callable[[RunProgress], Awaitable[None]]
+
+# An abort handler receives the reason a run was stopped or never started
+# and records the failure on the stored run
+EvaluationAbort = Callable[[str], Awaitable[None]]
+
+QueuedJob = Tuple[RunProgress, EvaluationJob, Optional[EvaluationAbort]]
+
+
+class EvaluationJobQueue:
+    """
+    Queue of evaluation runs executed by a pool of background workers.
+
+    Progress for queued, running and recently finished runs is kept in
+    memory so it can be polled or streamed. Only the most recent
+    ``max_finished`` finished runs are retained. Runs cancelled or left
+    queued when the pool stops are marked failed through their abort
+    handler, so they do not stay pending or running in the database.
+    """
+
+    def __init__(
+        self,
+        worker_count: Optional[int] = None,
+        latency_window: Optional[int] = None,
+        max_finished: int = 1000
+    ):
+        """
+        Initialize the job queue.
+
+        Args:
+            worker_count: Number of runs executed concurrently
+            latency_window: Number of recent latencies used for percentiles
+            max_finished: Number of finished runs to keep progress for
+        """
+        self._worker_count = max(1, worker_count or settings.evaluation_worker_count)
+        self._latency_window = latency_window or settings.evaluation_progress_latency_window
+        self._max_finished = max_finished
+        self._queue: "asyncio.Queue[QueuedJob]" = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._progress: "OrderedDict[str, RunProgress]" = OrderedDict()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker pool has been started."""
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """Start the worker pool."""
+        if self._workers:
+            return
+
+        self._workers = [
+            asyncio.create_task(self._work(i)) for i in range(self._worker_count)
+        ]
+        logger.info(f"Started {self._worker_count} evaluation workers")
+
+    async def stop(self) -> None:
+        """Stop the worker pool, failing runs in progress and still queued."""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        dropped = 0
+        while not self._queue.empty():
+            progress, _, abort = self._queue.get_nowait()
+            self._queue.task_done()
+            await self._abort(progress, abort, "Evaluation worker stopped before the run started")
+            dropped += 1
+
+        if workers:
+            logger.info(f"Stopped evaluation workers ({dropped} queued runs failed)")
+
+    def submit(
+        self,
+        run_id: str,
+        customer_id: str,
+        job: EvaluationJob,
+        abort: Optional[EvaluationAbort] = None
+    ) -> RunProgress:
+        """
+        Queue a run for background execution.
+
+        Starts the worker pool if it is not running yet.
+
+        Args:
+            run_id: Evaluation run ID
+            customer_id: Customer ID the run belongs to
+            job: Coroutine function that executes the run
+            abort: Optional coroutine function that records the run as
+                failed if the pool stops before the run completes
+
+        Returns:
+            Progress tracker for the run
+        """
+        self.start()
+
+        progress = RunProgress(run_id, customer_id, self._latency_window)
+        self._progress[run_id] = progress
+        self._queue.put_nowait((progress, job, abort))
+        logger.info(f"Queued evaluation run {run_id} ({self._queue.qsize()} waiting)")
+
+        return progress
+
+    def get_progress(self, run_id: str, customer_id: str) -> Optional[RunProgress]:
+        """
+        Get progress for a run with tenant check.
+
+        Args:
+            run_id: Evaluation run ID
+            customer_id: Customer ID for tenant isolation
+
+        Returns:
+            RunProgress if tracked and owned by the customer, None otherwise
+        """
+        progress = self._progress.get(run_id)
+        if progress is None or progress.customer_id != customer_id:
+            return None
+        return progress
+
+    async def _work(self, worker_id: int) -> None:
+        """Execute queued jobs until cancelled."""
+        while True:
+            progress, job, abort = await self._queue.get()
+            try:
+                await job(progress)
+                if not progress.is_finished:
+                    await progress.finish("completed")
+            except asyncio.CancelledError:
+                await self._abort(progress, abort, "Evaluation worker stopped")
+                raise
+            except Exception as e:
+                logger.error(f"Worker {worker_id} failed evaluation run {progress.run_id}: {e}")
+                await progress.finish("failed", str(e))
+            finally:
+                self._queue.task_done()
+                self._forget_finished()
+
+    async def _abort(
+        self,
+        progress: RunProgress,
+        abort: Optional[EvaluationAbort],
+        reason: str
+    ) -> None:
+        """Mark a run that will not complete as failed."""
+        await progress.finish("failed", reason)
+        if abort is None:
+            return
+
+        try:
+            await abort(reason)
+        except Exception as e:
+            logger.error(f"Failed to record evaluation run {progress.run_id} as failed: {e}")
+
+    def _forget_finished(self) -> None:
+        """Drop the oldest finished runs beyond the retention limit."""
+        finished = [run_id for run_id, p in self._progress.items() if p.is_finished]
+        for run_id in finished[:max(0, len(finished) - self._max_finished)]:
+            del self._progress[run_id]
+
+
+# Global job queue instance
+evaluation_job_queue = EvaluationJobQueue()
@@ -4,9 +4,10 @@ This module implements the MetricsCalculator class that calculates
 individual and aggregated metrics for evaluation runs.
 """
 
+import bisect
 import logging
-import statistics
-from typing import List, Optional
+import re
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from app.models.metrics import AggregatedMetrics, IndividualMetrics
 from app.models.response import Response
@@ -14,6 +15,279 @@ from app.models.test_case import TestCase
 
 logger = logging.getLogger(__name__)
 
+# Common words ignored when matching input keywords against a response
+STOP_WORDS: FrozenSet[str] = frozenset({
+    'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'should', 'could', 'may', 'might', 'must', 'can',
+    'of', 'at', 'by', 'for', 'with', 'about', 'against', 'between',
+    'into', 'through', 'during', 'before', 'after', 'above', 'below',
+    'to', 'from', 'up', 'down', 'in', 'out', 'on', 'off', 'over',
+    'under', 'again', 'further', 'then', 'once'
+})
+
+_PUNCTUATION = re.compile(r'[^\w\s]')
+
+# Normalized text and its set of words, as used for accuracy
+AccuracyTokens = Tuple[str, FrozenSet[str]]
+
+
+def _accuracy_tokens(text: str) -> AccuracyTokens:
+    """Lowercase and strip text and split it into a set of words."""
+    normalized = text.lower().strip()
+    return normalized, frozenset(normalized.split())
+
+
+def _response_words(text: str) -> FrozenSet[str]:
+    """Words of a response with punctuation removed, as used for relevance."""
+    words = (_PUNCTUATION.sub('', word) for word in text.lower().split())
+    return frozenset(word for word in words if word)
+
+
+def _input_keywords(text: str) -> FrozenSet[str]:
+    """
+    Keywords of an input, as used for relevance.
+    
+    Stop words and single characters are dropped; if that leaves
+    nothing, all words are used instead.
+    """
+    words = _response_words(text)
+    keywords = frozenset(
+        word for word in words
+        if word not in STOP_WORDS and len(word) > 1
+    )
+    return keywords or words
+
+
+def _accuracy_from_tokens(response: AccuracyTokens, expected: AccuracyTokens) -> float:
+    """Accuracy of pre-tokenized response and expected output."""
+    response_normalized, response_words = response
+    expected_normalized, expected_words = expected
+    
+    # Exact match
+    if response_normalized == expected_normalized:
+        return 1.0
+    
+    # If either is empty, no match
+    if not response_normalized or not expected_normalized:
+        return 0.0
+    
+    if not expected_words:
+        return 0.0
+    
+    # Calculate Jaccard similarity (intersection over union)
+    union = response_words | expected_words
+    
+    if not union:
+        return 0.0
+    
+    return len(response_words & expected_words) / len(union)
+
+
+def _relevance_from_tokens(input_keywords: FrozenSet[str], response_words: FrozenSet[str]) -> float:
+    """Relevance of a response given pre-tokenized input keywords."""
+    # If either is empty, or no meaningful input words, return 0
+    if not input_keywords or not response_words:
+        return 0.0
+    
+    # Calculate how many input keywords appear in response
+    return len(input_keywords & response_words) / len(input_keywords)
+
+
+class DatasetIndex:
+    """
+    Test cases of a dataset indexed by ID, with pre-tokenized text.
+    
+    Built once per run so that looking up a response's test case is O(1)
+    and expected outputs and inputs are tokenized only once, however many
+    responses are scored against them.
+    """
+    
+    def __init__(self, test_cases: Optional[List[TestCase]] = None):
+        """
+        Build the index.
+        
+        Args:
+            test_cases: Test cases of the dataset
+        """
+        test_cases = test_cases or []
+        self._test_cases: Dict[str, TestCase] = {tc.id: tc for tc in test_cases}
+        self._expected: Dict[str, AccuracyTokens] = {
+            tc.id: _accuracy_tokens(tc.expected_output)
+            for tc in test_cases
+            if tc.expected_output is not None
+        }
+        self._input_keywords: Dict[str, FrozenSet[str]] = {
+            tc.id: _input_keywords(tc.input) for tc in test_cases
+        }
+    
+    def get(self, test_case_id: str) -> Optional[TestCase]:
+        """Get a test case by ID."""
+        return self._test_cases.get(test_case_id)
+    
+    def expected_tokens(self, test_case_id: str) -> Optional[AccuracyTokens]:
+        """Get the tokenized expected output of a test case, if it has one."""
+        return self._expected.get(test_case_id)
+    
+    def input_keywords(self, test_case_id: str, input_text: str) -> FrozenSet[str]:
+        """
+        Get the keywords of a response's input.
+        
+        Uses the pre-tokenized test case input when it matches, and
+        tokenizes the given input otherwise.
+        """
+        test_case = self._test_cases.get(test_case_id)
+        if test_case is not None and test_case.input == input_text:
+            return self._input_keywords[test_case_id]
+        return _input_keywords(input_text)
+
+
+class RunMetricsAccumulator:
+    """
+    Incrementally aggregates metrics for an evaluation run.
+    
+    Feed responses with ``add`` as they are recorded; running totals and
+    a sorted list of latencies are kept so ``result`` does no per-response
+    work at completion.
+    """
+    
+    def __init__(self, test_cases: Optional[List[TestCase]] = None):
+        """
+        Initialize the accumulator.
+        
+        Args:
+            test_cases: Test cases of the run's dataset, for expected outputs
+        """
+        self.index = DatasetIndex(test_cases)
+        self.count = 0
+        self.failed_count = 0
+        self._accuracy_sum = 0.0
+        self._accuracy_count = 0
+        self._relevance_sum = 0.0
+        self._relevance_count = 0
+        self._latency_sum = 0.0
+        self._sorted_latencies: List[float] = []
+    
+    def score(self, response: Response) -> IndividualMetrics:
+        """
+        Calculate individual metrics for a response.
+        
+        Args:
+            response: Response to score
+        
+        Returns:
+            IndividualMetrics with accuracy and relevance scores
+        """
+        expected = self.index.expected_tokens(response.test_case_id)
+        accuracy = (
+            _accuracy_from_tokens(_accuracy_tokens(response.output), expected)
+            if expected is not None else None
+        )
+        relevance = _relevance_from_tokens(
+            self.index.input_keywords(response.test_case_id, response.input),
+            _response_words(response.output)
+        )
+        return IndividualMetrics(accuracy=accuracy, relevance=relevance)
+    
+    def add(self, response: Response, assign: bool = True) -> Optional[IndividualMetrics]:
+        """
+        Add a response to the running aggregates.
+        
+        Failed responses only count towards failures and latency. Cached
+        responses never reached the application, so their latency is
+        left out of the latency statistics.
+        
+        Args:
+            response: Recorded response
+            assign: Whether to set individual_metrics on the response when
+                    its test case is part of the dataset
+        
+        Returns:
+            IndividualMetrics for successful responses, None for failures
+        """
+        self.count += 1
+        if not response.cached:
+            self._latency_sum += response.latency
+            bisect.insort(self._sorted_latencies, response.latency)
+        
+        if response.error:
+            self.failed_count += 1
+            return None
+        
+        metrics = self.score(response)
+        
+        if metrics.accuracy is not None:
+            self._accuracy_sum += metrics.accuracy
+            self._accuracy_count += 1
+        if metrics.relevance is not None:
+            self._relevance_sum += metrics.relevance
+            self._relevance_count += 1
+        
+        if assign and self.index.get(response.test_case_id) is not None:
+            response.individual_metrics = metrics
+        
+        return metrics
+    
+    def result(self) -> AggregatedMetrics:
+        """
+        Get the aggregated metrics for all responses added so far.
+        
+        Returns:
+            AggregatedMetrics with run-level statistics
+        
+        Raises:
+            ValueError: If no responses have been added
+        """
+        if not self.count:
+            raise ValueError("Cannot aggregate metrics for empty response list")
+        
+        total_test_cases = self.count
+        success_rate = (total_test_cases - self.failed_count) / total_test_cases
+        
+        # Average accuracy (only if we have accuracy scores)
+        average_accuracy = (
+            self._accuracy_sum / self._accuracy_count if self._accuracy_count else 0.0
+        )
+        
+        # Average relevance (only if we have relevance scores)
+        average_relevance = (
+            self._relevance_sum / self._relevance_count if self._relevance_count else 0.0
+        )
+        
+        # Latency statistics (only responses that reached the application)
+        latencies = self._sorted_latencies
+        latency_count = len(latencies)
+        if latency_count:
+            middle = latency_count // 2
+            average_latency = self._latency_sum / latency_count
+            median_latency = (
+                latencies[middle] if latency_count % 2
+                else (latencies[middle - 1] + latencies[middle]) / 2
+            )
+            
+            # P95 latency (95th percentile)
+            p95_index = int(latency_count * 0.95)
+            p95_latency = latencies[min(p95_index, latency_count - 1)]
+        else:
+            average_latency = median_latency = p95_latency = 0.0
+        
+        logger.info(
+            f"Aggregated metrics for {total_test_cases} responses: "
+            f"accuracy={average_accuracy:.2f}, relevance={average_relevance:.2f}, "
+            f"latency={average_latency:.2f}ms, success_rate={success_rate:.2f}"
+        )
+        
+        return AggregatedMetrics(
+            average_accuracy=average_accuracy,
+            average_relevance=average_relevance,
+            average_latency=average_latency,
+            median_latency=median_latency,
+            p95_latency=p95_latency,
+            success_rate=success_rate,
+            total_test_cases=total_test_cases,
+            failed_test_cases=self.failed_count
+        )
+
 
 class MetricsCalculator:
     """
@@ -66,33 +340,10 @@ class MetricsCalculator:
         if expected_output is None:
             return None
         
-        # Normalize strings: lowercase and strip whitespace
-        response_normalized = response.lower().strip()
-        expected_normalized = expected_output.lower().strip()
-        
-        # Exact match
-        if response_normalized == expected_normalized:
-            return 1.0
-        
-        # If either is empty, no match
-        if not response_normalized or not expected_normalized:
-            return 0.0
-        
-        # Partial match: calculate word overlap
-        response_words = set(response_normalized.split())
-        expected_words = set(expected_normalized.split())
-        
-        if not expected_words:
-            return 0.0
-        
-        # Calculate Jaccard similarity (intersection over union)
-        intersection = response_words & expected_words
-        union = response_words | expected_words
-        
-        if not union:
-            return 0.0
-        
-        accuracy = len(intersection) / len(union)
+        accuracy = _accuracy_from_tokens(
+            _accuracy_tokens(response),
+            _accuracy_tokens(expected_output)
+        )
         
         logger.debug(
             f"Calculated accuracy: {accuracy:.2f} "
@@ -126,52 +377,13 @@ class MetricsCalculator:
             >>> calc.calculate_relevance("weather", "The capital is Paris")
             0.0
         """
-        # Normalize strings: lowercase and strip whitespace
-        input_normalized = input_text.lower().strip()
-        response_normalized = response.lower().strip()
-        
-        # If either is empty, return 0
-        if not input_normalized or not response_normalized:
-            return 0.0
-        
-        # Extract words (filter out common stop words for better relevance)
-        stop_words = {
-            'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'been',
-            'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-            'would', 'should', 'could', 'may', 'might', 'must', 'can',
-            'of', 'at', 'by', 'for', 'with', 'about', 'against', 'between',
-            'into', 'through', 'during', 'before', 'after', 'above', 'below',
-            'to', 'from', 'up', 'down', 'in', 'out', 'on', 'off', 'over',
-            'under', 'again', 'further', 'then', 'once'
-        }
-        
-        # First try with stop words filtered and length > 1
-        # Remove punctuation from words
-        import re
-        input_words_raw = [re.sub(r'[^\w\s]', '', word) for word in input_normalized.split()]
-        input_words = set(
-            word for word in input_words_raw
-            if word and word not in stop_words and len(word) > 1
+        # Stop words are filtered from the input, falling back to all
+        # words if nothing meaningful is left
+        relevance = _relevance_from_tokens(
+            _input_keywords(input_text),
+            _response_words(response)
         )
         
-        # If no meaningful words after filtering, use all words (fallback)
-        if not input_words:
-            input_words = set(
-                word for word in input_words_raw
-                if word
-            )
-        
-        response_words_raw = [re.sub(r'[^\w\s]', '', word) for word in response_normalized.split()]
-        response_words = set(word for word in response_words_raw if word)
-        
-        # If no meaningful input words, return 0
-        if not input_words:
-            return 0.0
-        
-        # Calculate how many input keywords appear in response
-        matching_words = input_words & response_words
-        relevance = len(matching_words) / len(input_words)
-        
         logger.debug(
             f"Calculated relevance: {relevance:.2f} "
             f"(input: '{input_text[:50]}...', response: '{response[:50]}...')"
@@ -261,77 +473,20 @@ class MetricsCalculator:
         if not responses:
             raise ValueError("Cannot aggregate metrics for empty response list")
         
-        # Create a mapping of test_case_id to expected_output if test_cases provided
-        expected_outputs = {}
-        if test_cases:
-            expected_outputs = {
-                tc.id: tc.expected_output
-                for tc in test_cases
-                if tc.expected_output is not None
-            }
-        
-        # Calculate individual metrics for each response
-        accuracy_scores = []
-        relevance_scores = []
-        latencies = []
-        failed_count = 0
-        
+        accumulator = self.start_run(test_cases)
         for response in responses:
-            # Count failures
-            if response.error:
-                failed_count += 1
-            
-            # Calculate metrics only for successful responses
-            if not response.error:
-                # Accuracy (only if expected output exists)
-                expected = expected_outputs.get(response.test_case_id)
-                accuracy = self.calculate_accuracy(response.output, expected)
-                if accuracy is not None:
-                    accuracy_scores.append(accuracy)
-                
-                # Relevance
-                relevance = self.calculate_relevance(response.input, response.output)
-                relevance_scores.append(relevance)
-            
-            # Latency (include all responses, even failed ones)
-            latencies.append(response.latency)
-        
-        # Calculate aggregated metrics
-        total_test_cases = len(responses)
-        success_rate = (total_test_cases - failed_count) / total_test_cases
-        
-        # Average accuracy (only if we have accuracy scores)
-        average_accuracy = (
-            statistics.mean(accuracy_scores) if accuracy_scores else 0.0
-        )
-        
-        # Average relevance (only if we have relevance scores)
-        average_relevance = (
-            statistics.mean(relevance_scores) if relevance_scores else 0.0
-        )
+            accumulator.add(response, assign=False)
         
-        # Latency statistics
-        average_latency = statistics.mean(latencies)
-        median_latency = statistics.median(latencies)
-        
-        # P95 latency (95th percentile)
-        sorted_latencies = sorted(latencies)
-        p95_index = int(len(sorted_latencies) * 0.95)
-        p95_latency = sorted_latencies[min(p95_index, len(sorted_latencies) - 1)]
+        return accumulator.result()
+    
+    def start_run(self, test_cases: Optional[List[TestCase]] = None) -> RunMetricsAccumulator:
+        """
+        Start incremental metrics aggregation for a run.
         
-        logger.info(
-            f"Aggregated metrics for {total_test_cases} responses: "
-            f"accuracy={average_accuracy:.2f}, relevance={average_relevance:.2f}, "
-            f"latency={average_latency:.2f}ms, success_rate={success_rate:.2f}"
-        )
+        Args:
+            test_cases: Test cases of the run's dataset, for expected outputs
         
-        return AggregatedMetrics(
-            average_accuracy=average_accuracy,
-            average_relevance=average_relevance,
-            average_latency=average_latency,
-            median_latency=median_latency,
-            p95_latency=p95_latency,
-            success_rate=success_rate,
-            total_test_cases=total_test_cases,
-            failed_test_cases=failed_count
-        )
+        Returns:
+            RunMetricsAccumulator to feed responses into as they arrive
+        """
+        return RunMetricsAccumulator(test_cases)
@@ -0,0 +1,157 @@
+"""Progress tracking for evaluation runs.
+
+This module keeps live, in-memory progress for runs executing in the
+background so clients can poll it or subscribe to updates while the
+run is still in flight.
+"""
+
+import asyncio
+import statistics
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from app.models.evaluation_run import EvaluationStatus
+from app.models.response import Response
+
+
+class RunProgress:
+    """
+    Live progress of a single evaluation run.
+
+    Tracks completed and failed test cases against the total, and keeps
+    a rolling window of recent latencies for percentile reporting.
+    Every change bumps ``version`` and wakes anyone blocked in
+    ``wait_for_update``.
+
+    Attributes:
+        run_id: Evaluation run ID
+        customer_id: Customer ID the run belongs to
+        status: Current run status
+        total: Number of test cases in the run
+        completed: Number of test cases with a recorded response
+        failed: Number of recorded responses with an error
+        error: Error message if the run failed
+        version: Counter incremented on every change
+    """
+
+    def __init__(self, run_id: str, customer_id: str, latency_window: int = 100):
+        """
+        Initialize progress for a run.
+
+        Args:
+            run_id: Evaluation run ID
+            customer_id: Customer ID the run belongs to
+            latency_window: Number of recent latencies used for percentiles
+        """
+        self.run_id = run_id
+        self.customer_id = customer_id
+        self.status: EvaluationStatus = "pending"
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self.error: Optional[str] = None
+        self.updated_at = datetime.utcnow()
+        self.version = 0
+        self._latencies: Deque[float] = deque(maxlen=max(1, latency_window))
+        self._changed = asyncio.Condition()
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the run has completed or failed."""
+        return self.status in ("completed", "failed")
+
+    async def start(self, total: int) -> None:
+        """
+        Mark the run as running.
+
+        Args:
+            total: Number of test cases that will be executed
+        """
+        self.status = "running"
+        self.total = total
+        await self._notify()
+
+    async def record(self, response: Response) -> None:
+        """
+        Count a recorded response.
+
+        Args:
+            response: Response recorded for a test case
+        """
+        self.completed += 1
+        if response.error:
+            self.failed += 1
+        elif not response.cached:
+            self._latencies.append(response.latency)
+        await self._notify()
+
+    async def finish(self, status: EvaluationStatus, error: Optional[str] = None) -> None:
+        """
+        Mark the run as finished.
+
+        Args:
+            status: Final run status ('completed' or 'failed')
+            error: Optional error message for failed runs
+        """
+        self.status = status
+        self.error = error
+        await self._notify()
+
+    async def wait_for_update(self, version: int, timeout: float) -> bool:
+        """
+        Wait until progress changes past the given version.
+
+        Args:
+            version: Last version seen by the caller
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if progress changed, False if the wait timed out
+        """
+        async with self._changed:
+            try:
+                await asyncio.wait_for(
+                    self._changed.wait_for(lambda: self.version != version),
+                    timeout
+                )
+            except asyncio.TimeoutError:
+                return False
+        return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a point-in-time view of the progress.
+
+        Returns:
+            Dictionary with counts, status and rolling latency percentiles
+        """
+        latencies = sorted(self._latencies)
+
+        return {
+            "run_id": self.run_id,
+            "status": self.status,
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "latency_p50": statistics.median(latencies) if latencies else None,
+            "latency_p95": _percentile(latencies, 0.95),
+            "latency_p99": _percentile(latencies, 0.99),
+            "error": self.error,
+            "updated_at": self.updated_at,
+        }
+
+    async def _notify(self) -> None:
+        """Bump the version and wake waiting subscribers."""
+        self.updated_at = datetime.utcnow()
+        async with self._changed:
+            self.version += 1
+            self._changed.notify_all()
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return None
+    index = int(len(sorted_values) * fraction)
+    return sorted_values[min(index, len(sorted_values) - 1)]
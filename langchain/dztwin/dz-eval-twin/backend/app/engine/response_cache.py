@@ -0,0 +1,243 @@
+"""Response reuse for repeated evaluation inputs.
+
+This module provides an opt-in, process-wide cache of application
+responses and per-run deduplication of identical inputs. Reused
+responses are flagged as ``cached`` so latency metrics only reflect
+calls that actually reached the application.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from app.config import settings
+from app.models.application_profile import ApplicationProfile
+from app.models.response import Response
+from app.models.test_case import TestCase
+
+logger = logging.getLogger(__name__)
+
+# (application profile ID, profile version, normalized input digest)
+CacheKey = Tuple[str, str, str]
+
+
+def normalize_input(text: str) -> str:
+    """
+    Normalize input text for cache lookups.
+
+    Leading and trailing whitespace is removed and inner whitespace
+    runs are collapsed. Case is preserved since applications may
+    answer differently to differently cased inputs.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Normalized input text
+    """
+    return " ".join(text.split())
+
+
+def make_cache_key(profile: ApplicationProfile, text: str) -> CacheKey:
+    """
+    Build the cache key for an input sent to an application profile.
+
+    The profile's last update time is its version, so any change to the
+    profile (e.g. a new endpoint) stops earlier responses from matching.
+
+    Args:
+        profile: Application profile the input is sent to
+        text: Input text
+
+    Returns:
+        Cache key
+    """
+    digest = hashlib.sha256(normalize_input(text).encode("utf-8")).hexdigest()
+    return (profile.id, profile.updated_at.isoformat(), digest)
+
+
+class ResponseCache:
+    """
+    In-memory cache of successful responses with TTL and LRU eviction.
+
+    Entries expire ``ttl_seconds`` after they were stored. When the
+    cache holds ``max_entries`` entries, the least recently used entry
+    is evicted to make room.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds a response stays valid
+            max_entries: Maximum number of cached responses
+        """
+        self._ttl = ttl_seconds or settings.response_cache_ttl_seconds
+        self._max_entries = max(1, max_entries or settings.response_cache_max_entries)
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Response]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached responses, including expired ones not yet evicted."""
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> Optional[Response]:
+        """
+        Get a cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return response
+
+    def put(self, key: CacheKey, response: Response) -> None:
+        """
+        Cache a response. Failed responses are never cached.
+
+        Args:
+            key: Cache key
+            response: Response received from the application
+        """
+        if response.error or response.cached:
+            return
+
+        self._entries[key] = (time.monotonic() + self._ttl, response)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+
+class RunResponseReuse:
+    """
+    Reuses responses for repeated inputs within one evaluation run.
+
+    Looks inputs up in the optional shared cache and, when deduplication
+    is enabled, sends concurrent identical inputs to the application
+    only once: later occurrences wait for the first and reuse its
+    response. Failed responses are never reused; such test cases are
+    sent on their own.
+    """
+
+    def __init__(
+        self,
+        profile: ApplicationProfile,
+        cache: Optional[ResponseCache] = None,
+        deduplicate: bool = False
+    ):
+        """
+        Initialize response reuse for a run.
+
+        Args:
+            profile: Application profile the run targets
+            cache: Optional shared response cache
+            deduplicate: Whether to send identical inputs only once
+        """
+        self._profile = profile
+        self._cache = cache
+        self._deduplicate = deduplicate
+        self._inflight: Dict[CacheKey, "asyncio.Future[Response]"] = {}
+        self.reused_count = 0
+
+    async def execute(
+        self,
+        test_case: TestCase,
+        send: Callable[[TestCase], Awaitable[Response]]
+    ) -> Response:
+        """
+        Get the response for a test case, sending it only if needed.
+
+        Args:
+            test_case: Test case to execute
+            send: Coroutine function that sends the test case
+
+        Returns:
+            Response for the test case, flagged as cached if reused
+        """
+        key = make_cache_key(self._profile, test_case.input)
+
+        if self._cache is not None:
+            hit = self._cache.get(key)
+            if hit is not None:
+                return self._reuse(test_case, hit)
+
+        leader = self._inflight.get(key) if self._deduplicate else None
+        if leader is not None:
+            try:
+                response = await asyncio.shield(leader)
+            except asyncio.CancelledError:
+                if not leader.cancelled():
+                    raise
+                # The first occurrence was cancelled, send this one instead
+                return await send(test_case)
+            if not response.error:
+                return self._reuse(test_case, response)
+            return await send(test_case)
+
+        future: Optional["asyncio.Future[Response]"] = None
+        if self._deduplicate:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+
+        try:
+            response = await send(test_case)
+        except BaseException:
+            if future is not None:
+                self._inflight.pop(key, None)
+                future.cancel()
+            raise
+
+        if future is not None:
+            self._inflight.pop(key, None)
+            future.set_result(response)
+
+        if self._cache is not None:
+            self._cache.put(key, response)
+
+        return response
+
+    def _reuse(self, test_case: TestCase, source: Response) -> Response:
+        """Build a cached response for a test case from an earlier response."""
+        self.reused_count += 1
+        return Response(
+            test_case_id=test_case.id,
+            input=test_case.input,
+            output=source.output,
+            latency=source.latency,
+            timestamp=datetime.utcnow(),
+            cached=True
+        )
+
+
+# Global response cache instance, used when response caching is enabled
+response_cache = ResponseCache()
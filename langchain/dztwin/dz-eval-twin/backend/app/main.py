@@ -7,15 +7,19 @@ from typing import AsyncGenerator
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from app.config import settings
+from app.connectors.http_client_pool import http_client_pool
 from app.database.connection import database_manager
+from app.engine.job_queue import evaluation_job_queue
 from app.middleware import (
     CustomerContextMiddleware,
     LoggingMiddleware,
     error_handler_middleware,
 )
 from app.middleware.error_handler import validation_exception_handler
+from app.utils.instrumentation import CONTENT_TYPE, registry
 from app.api import customers, application_profiles, datasets, evaluations
 
 # Configure logging
@@ -38,10 +42,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.error(f"Failed to connect to database: {e}")
         raise
 
+    evaluation_job_queue.start()
+
     yield
 
     # Shutdown
     logger.info("Shutting down Gen AI Evaluation Platform API")
+    await evaluation_job_queue.stop()
+    await http_client_pool.close_all()
     await database_manager.disconnect()
     logger.info("Database connection closed")
 
@@ -95,6 +103,14 @@ async def health_check() -> dict[str, str]:
     }
 
 
+if settings.metrics_enabled:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> PlainTextResponse:
+        """Prometheus metrics endpoint with stage, database and request timings"""
+        return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -26,6 +26,7 @@ class CustomerContextMiddleware(BaseHTTPMiddleware):
     # Endpoints that don't require customer context
     EXEMPT_PATHS = [
         "/api/health",
+        "/metrics",
         "/api/customers",  # Admin endpoints for customer management
         "/docs",
         "/redoc",
@@ -7,6 +7,8 @@ from typing import Callable
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.utils.instrumentation import HTTP_REQUEST_DURATION
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +21,9 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     - Response status code
     - Request processing time
     - Any errors that occur during request processing
+    
+    Processing times are also recorded per method, route template and
+    status code for the metrics endpoint.
     """
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
@@ -54,6 +59,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             # Add processing time header
             response.headers["X-Process-Time"] = str(process_time)
             
+            self._observe(request, response.status_code, process_time)
+            
             return response
             
         except Exception as e:
@@ -66,4 +73,16 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 f"[customer_id={customer_id or 'none'}]",
                 exc_info=True
             )
+            self._observe(request, 500, process_time)
             raise
+    
+    @staticmethod
+    def _observe(request: Request, status_code: int, process_time: float) -> None:
+        """Record the processing time, labelled by route template to bound cardinality."""
+        route = request.scope.get("route")
+        HTTP_REQUEST_DURATION.observe(
+            process_time,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=str(status_code)
+        )
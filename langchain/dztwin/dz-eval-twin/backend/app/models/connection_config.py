@@ -34,6 +34,46 @@ class ConnectionConfig(BaseModel):
         default=None,
         description="Custom HTTP headers to include in requests"
     )
+    max_concurrency: int = Field(
+        default=1,
+        ge=1,
+        le=100,
+        description="Maximum number of test cases sent to the application at once"
+    )
+    requests_per_second: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        le=1000.0,
+        description="Optional cap on requests sent to the application per second"
+    )
+    http2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 with the application (requires the 'h2' package)"
+    )
+    max_connections: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Maximum open connections to the application endpoint"
+    )
+    max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        le=1000,
+        description="Maximum idle connections kept alive for reuse"
+    )
+    keepalive_expiry: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=300.0,
+        description="Seconds an idle connection is kept alive"
+    )
+    websocket_connections: int = Field(
+        default=1,
+        ge=1,
+        le=32,
+        description="Number of WebSocket connections opened per run (ws/wss endpoints)"
+    )
     
     @field_validator('endpoint')
     @classmethod
@@ -68,6 +108,16 @@ class ConnectionConfig(BaseModel):
             raise ValueError("Retries cannot exceed 10")
         return v
     
+    @field_validator('max_concurrency')
+    @classmethod
+    def validate_max_concurrency(cls, v: int) -> int:
+        """Validate concurrency limit is reasonable."""
+        if v < 1:
+            raise ValueError("Max concurrency must be at least 1")
+        if v > 100:
+            raise ValueError("Max concurrency cannot exceed 100")
+        return v
+    
     class Config:
         """Pydantic model configuration."""
         json_schema_extra = {
@@ -81,6 +131,13 @@ class ConnectionConfig(BaseModel):
                 "retries": 3,
                 "custom_headers": {
                     "X-Custom-Header": "value"
-                }
+                },
+                "max_concurrency": 8,
+                "requests_per_second": 20.0,
+                "http2": False,
+                "max_connections": 100,
+                "max_keepalive_connections": 20,
+                "keepalive_expiry": 5.0,
+                "websocket_connections": 1
             }
         }
@@ -82,7 +82,8 @@ class EvaluationRun(BaseModel):
         """Validate metrics consistency with responses."""
         if v is not None and 'responses' in info.data:
             responses = info.data['responses']
-            if v.total_test_cases != len(responses):
+            # Responses are stored separately and may not be loaded
+            if responses and v.total_test_cases != len(responses):
                 raise ValueError(
                     f"Metrics total_test_cases ({v.total_test_cases}) "
                     f"must match number of responses ({len(responses)})"
@@ -32,6 +32,14 @@ class Response(BaseModel):
         default=None,
         description="Quality metrics for this response"
     )
+    cached: bool = Field(
+        default=False,
+        description=(
+            "Whether the output was reused from an earlier identical input "
+            "instead of calling the application; latency is that of the "
+            "original call and is excluded from latency metrics"
+        )
+    )
     
     @field_validator('test_case_id')
     @classmethod
@@ -41,7 +41,14 @@ class ApplicationProfileService:
         timeout: int = 30,
         retries: int = 3,
         authentication: Optional[Dict[str, Any]] = None,
-        custom_headers: Optional[Dict[str, str]] = None
+        custom_headers: Optional[Dict[str, str]] = None,
+        max_concurrency: int = 1,
+        requests_per_second: Optional[float] = None,
+        http2: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        websocket_connections: int = 1
     ) -> ApplicationProfile:
         """
         Create a new application profile.
@@ -55,6 +62,13 @@ class ApplicationProfileService:
             retries: Number of retry attempts (0-10)
             authentication: Optional authentication configuration
             custom_headers: Optional custom HTTP headers
+            max_concurrency: Maximum test cases in flight during a run (1-100)
+            requests_per_second: Optional cap on requests per second
+            http2: Whether to negotiate HTTP/2 with the application
+            max_connections: Maximum open connections to the endpoint (1-1000)
+            max_keepalive_connections: Maximum idle connections kept alive (0-1000)
+            keepalive_expiry: Seconds an idle connection is kept alive (0-300)
+            websocket_connections: WebSocket connections opened per run (1-32)
             
         Returns:
             Created application profile
@@ -92,6 +106,13 @@ class ApplicationProfileService:
         if retries < 0 or retries > 10:
             raise ValueError("Retries must be between 0 and 10")
         
+        # Validate concurrency settings
+        self._validate_concurrency(max_concurrency, requests_per_second)
+        
+        # Validate connection pool settings
+        self._validate_connection_pool(max_connections, max_keepalive_connections, keepalive_expiry)
+        self._validate_websocket_connections(websocket_connections)
+        
         # Verify customer exists
         customer = await self._repository.get_customer_by_id(customer_id.strip())
         if not customer:
@@ -107,7 +128,14 @@ class ApplicationProfileService:
             authentication=authentication,
             timeout=timeout,
             retries=retries,
-            custom_headers=custom_headers
+            custom_headers=custom_headers,
+            max_concurrency=max_concurrency,
+            requests_per_second=requests_per_second,
+            http2=http2,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            websocket_connections=websocket_connections
         )
         
         # Create application profile object
@@ -183,7 +211,14 @@ class ApplicationProfileService:
         timeout: Optional[int] = None,
         retries: Optional[int] = None,
         authentication: Optional[Dict[str, Any]] = None,
-        custom_headers: Optional[Dict[str, str]] = None
+        custom_headers: Optional[Dict[str, str]] = None,
+        max_concurrency: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        http2: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        websocket_connections: Optional[int] = None
     ) -> ApplicationProfile:
         """
         Update application profile.
@@ -196,6 +231,13 @@ class ApplicationProfileService:
             retries: Optional new retry count
             authentication: Optional new authentication config
             custom_headers: Optional new custom headers
+            max_concurrency: Optional new concurrency limit
+            requests_per_second: Optional new requests-per-second cap
+            http2: Optional new HTTP/2 setting
+            max_connections: Optional new connection limit
+            max_keepalive_connections: Optional new idle connection limit
+            keepalive_expiry: Optional new idle connection expiry
+            websocket_connections: Optional new WebSocket connection count
             
         Returns:
             Updated application profile
@@ -217,7 +259,12 @@ class ApplicationProfileService:
         
         # For connection config updates, we need to get the current profile first
         # and update the connection_config object
-        if any(x is not None for x in [endpoint, timeout, retries, authentication, custom_headers]):
+        if any(x is not None for x in [
+            endpoint, timeout, retries, authentication, custom_headers,
+            max_concurrency, requests_per_second,
+            http2, max_connections, max_keepalive_connections, keepalive_expiry,
+            websocket_connections
+        ]):
             # Get current profile
             current_profile = await self._repository.get_application_profile_by_id(profile_id.strip())
             if not current_profile:
@@ -248,6 +295,33 @@ class ApplicationProfileService:
             if custom_headers is not None:
                 config_dict["custom_headers"] = custom_headers
             
+            if max_concurrency is not None or requests_per_second is not None:
+                self._validate_concurrency(max_concurrency, requests_per_second)
+                if max_concurrency is not None:
+                    config_dict["max_concurrency"] = max_concurrency
+                if requests_per_second is not None:
+                    config_dict["requests_per_second"] = requests_per_second
+            
+            if http2 is not None:
+                config_dict["http2"] = http2
+            
+            if any(x is not None for x in [
+                max_connections, max_keepalive_connections, keepalive_expiry
+            ]):
+                self._validate_connection_pool(
+                    max_connections, max_keepalive_connections, keepalive_expiry
+                )
+                if max_connections is not None:
+                    config_dict["max_connections"] = max_connections
+                if max_keepalive_connections is not None:
+                    config_dict["max_keepalive_connections"] = max_keepalive_connections
+                if keepalive_expiry is not None:
+                    config_dict["keepalive_expiry"] = keepalive_expiry
+            
+            if websocket_connections is not None:
+                self._validate_websocket_connections(websocket_connections)
+                config_dict["websocket_connections"] = websocket_connections
+            
             updates["connection_config"] = config_dict
         
         if not updates:
@@ -322,3 +396,67 @@ class ApplicationProfileService:
             return False
         
         return profile.customer_id == customer_id.strip()
+    
+    def _validate_concurrency(
+        self,
+        max_concurrency: Optional[int],
+        requests_per_second: Optional[float]
+    ) -> None:
+        """
+        Validate evaluation concurrency settings.
+        
+        Args:
+            max_concurrency: Maximum test cases in flight, if provided
+            requests_per_second: Requests-per-second cap, if provided
+            
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if max_concurrency is not None and (max_concurrency < 1 or max_concurrency > 100):
+            raise ValueError("Max concurrency must be between 1 and 100")
+        
+        if requests_per_second is not None and (
+            requests_per_second <= 0 or requests_per_second > 1000
+        ):
+            raise ValueError("Requests per second must be greater than 0 and at most 1000")
+    
+    def _validate_connection_pool(
+        self,
+        max_connections: Optional[int],
+        max_keepalive_connections: Optional[int],
+        keepalive_expiry: Optional[float]
+    ) -> None:
+        """
+        Validate HTTP connection pool settings.
+        
+        Args:
+            max_connections: Maximum open connections, if provided
+            max_keepalive_connections: Maximum idle connections kept alive, if provided
+            keepalive_expiry: Seconds an idle connection is kept alive, if provided
+            
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if max_connections is not None and (max_connections < 1 or max_connections > 1000):
+            raise ValueError("Max connections must be between 1 and 1000")
+        
+        if max_keepalive_connections is not None and (
+            max_keepalive_connections < 0 or max_keepalive_connections > 1000
+        ):
+            raise ValueError("Max keepalive connections must be between 0 and 1000")
+        
+        if keepalive_expiry is not None and (keepalive_expiry < 0 or keepalive_expiry > 300):
+            raise ValueError("Keepalive expiry must be between 0 and 300 seconds")
+    
+    def _validate_websocket_connections(self, websocket_connections: int) -> None:
+        """
+        Validate the number of WebSocket connections opened per run.
+        
+        Args:
+            websocket_connections: WebSocket connections per run
+            
+        Raises:
+            ValueError: If the count is out of range
+        """
+        if websocket_connections < 1 or websocket_connections > 32:
+            raise ValueError("WebSocket connections must be between 1 and 32")
@@ -3,16 +3,19 @@
 Provides business logic for dataset CRUD operations with tenant isolation.
 """
 
+import asyncio
 import logging
 import os
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 from app.config import settings
 from app.database.repository import DataRepository
 from app.models.dataset import Dataset
 from app.models.test_case import TestCase
+from app.utils.csv_parser import iter_csv_file_test_cases
 
 logger = logging.getLogger(__name__)
 
@@ -96,6 +99,131 @@ class DatasetService:
         logger.info(f"Created dataset: {created_dataset.id} for customer: {customer_id}")
         return created_dataset
     
+    async def create_dataset_from_file(
+        self,
+        customer_id: str,
+        application_profile_id: str,
+        name: str,
+        description: str,
+        file_path: str,
+        batch_size: Optional[int] = None
+    ) -> Tuple[Dataset, int]:
+        """
+        Create a dataset by incrementally parsing its saved CSV file.
+        
+        The file is parsed row by row off the event loop. The dataset is
+        created with the first batch of test cases and the remaining
+        test cases are appended in batches, so memory use is bounded by
+        the batch size rather than the size of the file. If parsing or
+        insertion fails, the partially created dataset and the file are
+        removed.
+        
+        Args:
+            customer_id: Customer ID for tenant isolation
+            application_profile_id: Application profile ID
+            name: Dataset name
+            description: Dataset description
+            file_path: Relative path of the saved CSV file
+            batch_size: Test cases inserted per database write
+            
+        Returns:
+            Tuple of the created dataset (holding only the first batch of
+            test cases) and the total number of test cases
+            
+        Raises:
+            ValueError: If validation fails
+            ValidationError: If the CSV format is invalid
+            RuntimeError: If database operation fails
+        """
+        batch_size = max(1, batch_size or settings.dataset_insert_batch_size)
+        full_path = os.path.join(settings.upload_dir, file_path)
+        test_cases = iter_csv_file_test_cases(full_path)
+        dataset = None
+        
+        try:
+            # The first batch also validates the header before anything is stored
+            batch = await asyncio.to_thread(_take, test_cases, batch_size)
+            dataset = await self.create_dataset(
+                customer_id=customer_id,
+                application_profile_id=application_profile_id,
+                name=name,
+                description=description,
+                file_path=file_path,
+                test_cases=batch
+            )
+            total = len(batch)
+            
+            while True:
+                batch = await asyncio.to_thread(_take, test_cases, batch_size)
+                if not batch:
+                    break
+                await self._repository.add_test_cases(dataset.id, dataset.customer_id, batch)
+                total += len(batch)
+        except Exception:
+            if dataset is not None:
+                try:
+                    await self._repository.delete_dataset(dataset.id, dataset.customer_id)
+                except Exception as e:
+                    logger.error(f"Failed to remove partial dataset {dataset.id}: {str(e)}")
+            _remove_file(full_path)
+            raise
+        finally:
+            test_cases.close()
+        
+        logger.info(f"Loaded {total} test cases into dataset: {dataset.id}")
+        return dataset, total
+    
+    async def save_dataset_file_stream(
+        self,
+        customer_id: str,
+        filename: str,
+        chunks: AsyncIterator[bytes],
+        max_size_bytes: Optional[int] = None
+    ) -> str:
+        """
+        Stream an uploaded CSV file to disk chunk by chunk.
+        
+        Args:
+            customer_id: Customer ID for tenant isolation
+            filename: Original filename
+            chunks: Async iterator over the file content
+            max_size_bytes: Optional maximum file size
+            
+        Returns:
+            Relative file path where file was saved
+            
+        Raises:
+            ValueError: If the file is empty or too large
+            RuntimeError: If file save fails
+        """
+        file_path, relative_path = self._new_dataset_file_path(customer_id, filename)
+        size = 0
+        
+        try:
+            with open(file_path, 'wb') as f:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if max_size_bytes is not None and size > max_size_bytes:
+                        raise ValueError(
+                            f"File size exceeds maximum allowed size of "
+                            f"{max_size_bytes // (1024 * 1024)}MB"
+                        )
+                    f.write(chunk)
+            
+            if size == 0:
+                raise ValueError("File is empty")
+            
+        except ValueError:
+            _remove_file(file_path)
+            raise
+        except Exception as e:
+            _remove_file(file_path)
+            logger.error(f"Failed to save dataset file: {str(e)}")
+            raise RuntimeError(f"Failed to save file: {str(e)}")
+        
+        logger.info(f"Saved dataset file: {relative_path} ({size} bytes)")
+        return relative_path
+    
     async def save_dataset_file(
         self,
         customer_id: str,
@@ -117,24 +245,12 @@ class DatasetService:
             RuntimeError: If file save fails
         """
         try:
-            # Create customer-specific directory
-            customer_dir = os.path.join(settings.upload_dir, customer_id)
-            os.makedirs(customer_dir, exist_ok=True)
-            
-            # Generate unique filename
-            file_id = uuid.uuid4().hex[:12]
-            file_extension = os.path.splitext(filename)[1]
-            unique_filename = f"{file_id}{file_extension}"
-            
-            # Full file path
-            file_path = os.path.join(customer_dir, unique_filename)
+            file_path, relative_path = self._new_dataset_file_path(customer_id, filename)
             
             # Write file
             with open(file_path, 'wb') as f:
                 f.write(content)
             
-            # Return relative path
-            relative_path = os.path.join(customer_id, unique_filename)
             logger.info(f"Saved dataset file: {relative_path}")
             return relative_path
             
@@ -142,6 +258,31 @@ class DatasetService:
             logger.error(f"Failed to save dataset file: {str(e)}")
             raise RuntimeError(f"Failed to save file: {str(e)}")
     
+    def _new_dataset_file_path(self, customer_id: str, filename: str) -> Tuple[str, str]:
+        """
+        Create a unique path for a customer's dataset file.
+        
+        Args:
+            customer_id: Customer ID for tenant isolation
+            filename: Original filename
+            
+        Returns:
+            Tuple of the full file path and the path relative to the upload directory
+        """
+        # Create customer-specific directory
+        customer_dir = os.path.join(settings.upload_dir, customer_id)
+        os.makedirs(customer_dir, exist_ok=True)
+        
+        # Generate unique filename
+        file_id = uuid.uuid4().hex[:12]
+        file_extension = os.path.splitext(filename)[1]
+        unique_filename = f"{file_id}{file_extension}"
+        
+        return (
+            os.path.join(customer_dir, unique_filename),
+            os.path.join(customer_id, unique_filename)
+        )
+    
     async def get_dataset_file_path(self, dataset_id: str, customer_id: str) -> str:
         """
         Get the full file path for a dataset's CSV file.
@@ -476,3 +617,18 @@ class DatasetService:
         )
         
         logger.info(f"Deleted test case {test_case_id} from dataset {dataset_id}")
+
+
+def _take(iterator: Iterator[TestCase], count: int) -> List[TestCase]:
+    """Take up to ``count`` items from an iterator."""
+    return list(islice(iterator, count))
+
+
+def _remove_file(file_path: str) -> None:
+    """Remove a file if it exists, logging failures."""
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to remove file {file_path}: {str(e)}")
@@ -3,7 +3,7 @@
 import csv
 import io
 import uuid
-from typing import List
+from typing import Generator, Iterable, Iterator, List, Optional
 
 from app.models.test_case import TestCase
 from app.middleware.error_handler import ValidationError
@@ -29,9 +29,51 @@ def parse_csv_to_test_cases(file_content: bytes) -> List[TestCase]:
     try:
         # Decode bytes to string
         content = file_content.decode('utf-8')
+    except UnicodeDecodeError:
+        raise ValidationError("File must be a valid UTF-8 encoded CSV file")
+    
+    return list(iter_csv_test_cases(io.StringIO(content)))
+
+
+def iter_csv_file_test_cases(file_path: str) -> Generator[TestCase, None, None]:
+    """
+    Incrementally parse a CSV file on disk into TestCase objects.
+    
+    The file is read row by row, so memory use does not grow with
+    the size of the file.
+    
+    Args:
+        file_path: Path of the CSV file
         
+    Yields:
+        TestCase objects in file order
+        
+    Raises:
+        ValidationError: If CSV format is invalid
+    """
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        yield from iter_csv_test_cases(f)
+
+
+def iter_csv_test_cases(lines: Iterable[str]) -> Iterator[TestCase]:
+    """
+    Incrementally parse CSV lines into TestCase objects.
+    
+    Rows are validated as they are read; an invalid row raises after
+    the rows before it have been yielded.
+    
+    Args:
+        lines: Iterable of CSV text lines (e.g. an open text file)
+        
+    Yields:
+        TestCase objects in row order
+        
+    Raises:
+        ValidationError: If CSV format is invalid
+    """
+    try:
         # Parse CSV
-        csv_reader = csv.DictReader(io.StringIO(content))
+        csv_reader = csv.DictReader(lines)
         
         # Validate headers
         if not csv_reader.fieldnames:
@@ -46,19 +88,19 @@ def parse_csv_to_test_cases(file_content: bytes) -> List[TestCase]:
             )
         
         # Parse rows into test cases
-        test_cases = []
+        count = 0
         for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 (header is row 1)
             # Skip empty rows
             if not any(row.values()):
                 continue
             
             # Validate input is not empty
-            input_text = row.get('input', '').strip()
+            input_text = (row.get('input') or '').strip()
             if not input_text:
                 raise ValidationError(f"Row {row_num}: 'input' field cannot be empty")
             
             # Get expected output (optional)
-            expected_output = row.get('expected_output', '').strip() or None
+            expected_output = (row.get('expected_output') or '').strip() or None
             
             # Parse metadata (optional, can be JSON-like or simple key-value)
             metadata = {}
@@ -67,19 +109,17 @@ def parse_csv_to_test_cases(file_content: bytes) -> List[TestCase]:
                     metadata[key] = value
             
             # Create test case
-            test_case = TestCase(
+            count += 1
+            yield TestCase(
                 id=f"tc_{uuid.uuid4().hex[:12]}",
                 input=input_text,
                 expected_output=expected_output,
                 metadata=metadata if metadata else None
             )
-            test_cases.append(test_case)
         
-        if not test_cases:
+        if not count:
             raise ValidationError("CSV file contains no valid test cases")
         
-        return test_cases
-        
     except UnicodeDecodeError:
         raise ValidationError("File must be a valid UTF-8 encoded CSV file")
     except csv.Error as e:
@@ -90,13 +130,14 @@ def parse_csv_to_test_cases(file_content: bytes) -> List[TestCase]:
         raise ValidationError(f"Error parsing CSV file: {str(e)}")
 
 
-def validate_csv_file(filename: str, file_size: int, max_size_mb: int = 10) -> None:
+def validate_csv_file(filename: str, file_size: Optional[int], max_size_mb: int = 10) -> None:
     """
     Validate CSV file before processing.
     
     Args:
         filename: Name of the uploaded file
-        file_size: Size of the file in bytes
+        file_size: Size of the file in bytes, or None if not known yet
+            (e.g. a streamed upload, whose size is checked while saving)
         max_size_mb: Maximum allowed file size in MB
         
     Raises:
@@ -106,6 +147,9 @@ def validate_csv_file(filename: str, file_size: int, max_size_mb: int = 10) -> N
     if not filename.lower().endswith('.csv'):
         raise ValidationError("File must be a CSV file (.csv extension)")
     
+    if file_size is None:
+        return
+    
     # Check file size
     max_size_bytes = max_size_mb * 1024 * 1024
     if file_size > max_size_bytes:
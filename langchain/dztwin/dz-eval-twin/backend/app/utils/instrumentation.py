@@ -0,0 +1,278 @@
+"""Timing instrumentation exposed in the Prometheus text format.
+
+This module provides lightweight in-process histograms for timing
+evaluation stages, database operations and API requests, and renders
+them for the ``/metrics`` endpoint without requiring a metrics client
+library.
+"""
+
+import bisect
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Coroutine, Dict, Iterator, List, ParamSpec, Sequence, Tuple, TypeVar
+
+# Upper bounds in seconds; fine-grained at the low end so per test case
+# overhead is visible next to slower target and database calls
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+class _HistogramSeries:
+    """Bucket counts, count and sum of one label combination."""
+
+    def __init__(self, bucket_count: int):
+        self.buckets = [0] * bucket_count
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram:
+    """
+    Histogram of durations in seconds, partitioned by label values.
+
+    Observations are cheap (a bisect and a few additions under a lock)
+    so they can be made on per test case paths.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        """
+        Initialize the histogram.
+
+        Args:
+            name: Metric name
+            documentation: Help text shown in the exposition
+            labelnames: Names of the labels observations are partitioned by
+            buckets: Sorted bucket upper bounds in seconds
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelValues, _HistogramSeries] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value: Observed duration in seconds
+            **labels: Value for every label name
+        """
+        key = self._label_values(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _HistogramSeries(len(self.buckets))
+            if index < len(self.buckets):
+                series.buckets[index] += 1
+            series.count += 1
+            series.sum += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """
+        Observe the duration of the enclosed block, also when it raises.
+
+        Args:
+            **labels: Value for every label name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def summary(self) -> Dict[LabelValues, Tuple[int, float]]:
+        """
+        Get the observation count and sum per label combination.
+
+        Returns:
+            Dictionary mapping label values to (count, sum in seconds)
+        """
+        with self._lock:
+            return {key: (s.count, s.sum) for key, s in self._series.items()}
+
+    def clear(self) -> None:
+        """Remove all observations."""
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> List[str]:
+        """
+        Render the histogram in the Prometheus text exposition format.
+
+        Returns:
+            Exposition lines
+        """
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series = [
+                (key, list(s.buckets), s.count, s.sum)
+                for key, s in sorted(self._series.items())
+            ]
+
+        for key, buckets, count, total in series:
+            labels = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, buckets):
+                cumulative += bucket_count
+                le = _format_labels(labels + [("le", _format_value(bound))])
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            le = _format_labels(labels + [("le", "+Inf")])
+            lines.append(f"{self.name}_bucket{le} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+    def _label_values(self, labels: Dict[str, str]) -> LabelValues:
+        """Order label values by label name, rejecting unknown or missing labels."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Histogram {self.name} expects labels {list(self.labelnames)}, "
+                f"got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+
+class MetricsRegistry:
+    """Collection of histograms rendered together by the metrics endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._histograms: List[Histogram] = []
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """
+        Create and register a histogram.
+
+        Args:
+            name: Metric name
+            documentation: Help text shown in the exposition
+            labelnames: Names of the labels observations are partitioned by
+            buckets: Sorted bucket upper bounds in seconds
+
+        Returns:
+            Registered histogram
+        """
+        histogram = Histogram(name, documentation, labelnames, buckets)
+        self._histograms.append(histogram)
+        return histogram
+
+    def clear(self) -> None:
+        """Remove all observations from every histogram."""
+        for histogram in self._histograms:
+            histogram.clear()
+
+    def render(self) -> str:
+        """
+        Render all histograms in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text
+        """
+        lines: List[str] = []
+        for histogram in self._histograms:
+            lines.extend(histogram.render())
+        return "\n".join(lines) + "\n"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample or bucket bound value."""
+    return repr(float(value))
+
+
+def _format_labels(labels: List[Tuple[str, str]]) -> str:
+    """Format label pairs, escaping values as the exposition format requires."""
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        )
+        for name, value in labels
+    )
+    return "{" + pairs + "}"
+
+
+# Global metrics registry rendered by the /metrics endpoint
+registry = MetricsRegistry()
+
+STAGE_DURATION = registry.histogram(
+    "dz_eval_stage_duration_seconds",
+    "Time spent in evaluation run stages",
+    ("stage",)
+)
+
+DB_OPERATION_DURATION = registry.histogram(
+    "dz_eval_db_operation_duration_seconds",
+    "Time spent in database repository operations",
+    ("operation",)
+)
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "dz_eval_http_request_duration_seconds",
+    "Time spent handling API requests",
+    ("method", "route", "status")
+)
+
+
+def span(stage: str) -> Any:
+    """
+    Time an evaluation stage.
+
+    Args:
+        stage: Stage name (e.g. "connect", "target", "record")
+
+    Returns:
+        Context manager observing the enclosed block's duration
+    """
+    return STAGE_DURATION.time(stage=stage)
+
+
+def timed_operation(
+    func: Callable[P, Coroutine[Any, Any, R]]
+) -> Callable[P, Coroutine[Any, Any, R]]:
+    """
+    Time every call of an async database operation, labelled by its name.
+
+    Args:
+        func: Async function to time
+
+    Returns:
+        Wrapped async function
+    """
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        with DB_OPERATION_DURATION.time(operation=func.__name__):
+            return await func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""Benchmark the evaluation engine against a local mock target.
+
+Starts a mock target application on localhost, stores a generated
+dataset and application profile in an in-memory MongoDB (mongomock) or
+a local MongoDB instance, then executes evaluation runs through the
+real engine, HTTP plugin and repository and reports:
+
+- runs/sec and test cases/sec
+- p50/p99 engine overhead per test case, i.e. the time between two
+  consecutive test cases minus the target's latency (sequential runs only)
+- time spent per engine stage and database operation
+
+Usage (from the backend directory):
+
+    pip install -r requirements-benchmark.txt
+    python -m benchmarks.engine_benchmark --runs 20 --test-cases 200
+    python -m benchmarks.engine_benchmark --mongo-url mongodb://localhost:27017
+
+Pass --max-overhead-p99-ms to exit with status 1 when the p99 overhead
+regresses past a threshold, e.g. in CI before deploying.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import socket
+import statistics
+import sys
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI
+
+from app.database.repository import DataRepository
+from app.engine.evaluation_engine import EvaluationEngine
+from app.engine.metrics_calculator import MetricsCalculator
+from app.models.application_profile import ApplicationProfile
+from app.models.connection_config import ConnectionConfig
+from app.models.dataset import Dataset
+from app.models.evaluation_run import EvaluationRun
+from app.models.test_case import TestCase
+from app.utils.instrumentation import DB_OPERATION_DURATION, STAGE_DURATION, registry
+
+BENCHMARK_CUSTOMER_ID = "cust_benchmark"
+
+
+def create_target_app(delay_seconds: float) -> FastAPI:
+    """Create a mock target that echoes inputs after a fixed delay."""
+    target = FastAPI()
+
+    @target.post("/chat")
+    async def chat(payload: Dict[str, Any]) -> Dict[str, Any]:
+        if delay_seconds:
+            await asyncio.sleep(delay_seconds)
+        return {"output": f"Answer: {payload.get('input', '')}"}
+
+    return target
+
+
+async def start_target(delay_seconds: float) -> "tuple[uvicorn.Server, asyncio.Task, str]":
+    """Serve the mock target on a free localhost port."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+
+    server = uvicorn.Server(
+        uvicorn.Config(create_target_app(delay_seconds), log_level="warning", access_log=False)
+    )
+    task = asyncio.create_task(server.serve(sockets=[sock]))
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+
+    return server, task, f"http://127.0.0.1:{port}/chat"
+
+
+def open_database(mongo_url: Optional[str], db_name: str) -> Any:
+    """Open a local MongoDB database, or an in-memory one via mongomock."""
+    if mongo_url:
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        return AsyncIOMotorClient(mongo_url)[db_name]
+
+    try:
+        from mongomock_motor import AsyncMongoMockClient
+    except ImportError:
+        sys.exit(
+            "mongomock-motor is required without --mongo-url: "
+            "pip install mongomock-motor"
+        )
+    return AsyncMongoMockClient()[db_name]
+
+
+async def seed(
+    repository: DataRepository,
+    endpoint: str,
+    test_case_count: int,
+    max_concurrency: int
+) -> "tuple[ApplicationProfile, Dataset]":
+    """Store the benchmark application profile and dataset."""
+    suffix = uuid.uuid4().hex[:8]
+    profile = await repository.create_application_profile(ApplicationProfile(
+        id=f"profile_benchmark_{suffix}",
+        customer_id=BENCHMARK_CUSTOMER_ID,
+        name="Benchmark Target",
+        type="chatbot",
+        connection_config=ConnectionConfig(
+            endpoint=endpoint,
+            timeout=30,
+            retries=0,
+            max_concurrency=max_concurrency
+        )
+    ))
+    dataset = await repository.create_dataset(Dataset(
+        id=f"dataset_benchmark_{suffix}",
+        customer_id=BENCHMARK_CUSTOMER_ID,
+        application_profile_id=profile.id,
+        name="Benchmark Dataset",
+        description="Generated benchmark dataset",
+        file_path="benchmark.csv",
+        test_cases=[
+            TestCase(
+                id=f"tc_{i:06d}",
+                input=f"Benchmark question {i}",
+                expected_output=f"Answer: Benchmark question {i}"
+            )
+            for i in range(test_case_count)
+        ]
+    ))
+    return profile, dataset
+
+
+def test_case_overheads(run: EvaluationRun) -> List[float]:
+    """
+    Engine overhead in milliseconds between consecutive test cases.
+
+    Only meaningful for sequential runs, where each test case is sent
+    once the previous response has been recorded.
+    """
+    responses = run.responses
+    return [
+        (current.timestamp - previous.timestamp).total_seconds() * 1000.0 - current.latency
+        for previous, current in zip(responses, responses[1:])
+    ]
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def timing_breakdown(histogram: Any) -> Dict[str, Dict[str, float]]:
+    """Count, total and mean milliseconds per label of a histogram."""
+    return {
+        ",".join(labels): {
+            "count": count,
+            "total_ms": total * 1000.0,
+            "mean_ms": total * 1000.0 / count if count else 0.0,
+        }
+        for labels, (count, total) in sorted(histogram.summary().items())
+    }
+
+
+async def benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the benchmark and collect its results."""
+    server, server_task, endpoint = await start_target(args.target_delay_ms / 1000.0)
+    try:
+        database = open_database(args.mongo_url, args.db_name)
+        repository = DataRepository(database)
+        engine = EvaluationEngine(repository, MetricsCalculator())
+        profile, dataset = await seed(
+            repository, endpoint, args.test_cases, args.concurrency
+        )
+
+        async def execute() -> EvaluationRun:
+            return await engine.execute_run(BENCHMARK_CUSTOMER_ID, dataset.id, profile.id)
+
+        for _ in range(args.warmup):
+            await execute()
+        registry.clear()
+
+        runs: List[EvaluationRun] = []
+        semaphore = asyncio.Semaphore(args.parallel_runs)
+
+        async def execute_limited() -> None:
+            async with semaphore:
+                runs.append(await execute())
+
+        start = time.perf_counter()
+        await asyncio.gather(*(execute_limited() for _ in range(args.runs)))
+        elapsed = time.perf_counter() - start
+
+        if args.mongo_url:
+            # Remove everything the benchmark stored in the local database
+            query = {"customerId": BENCHMARK_CUSTOMER_ID}
+            await database.evaluationResponses.delete_many(query)
+            await database.evaluationRuns.delete_many(query)
+            await repository.delete_dataset(dataset.id, BENCHMARK_CUSTOMER_ID)
+            await repository.delete_application_profile(profile.id)
+    finally:
+        server.should_exit = True
+        await server_task
+
+    total_test_cases = sum(len(run.responses) for run in runs)
+    results: Dict[str, Any] = {
+        "runs": len(runs),
+        "test_cases_per_run": args.test_cases,
+        "concurrency": args.concurrency,
+        "parallel_runs": args.parallel_runs,
+        "target_delay_ms": args.target_delay_ms,
+        "elapsed_seconds": elapsed,
+        "runs_per_second": len(runs) / elapsed,
+        "test_cases_per_second": total_test_cases / elapsed,
+        "failed_test_cases": sum(
+            1 for run in runs for response in run.responses if response.error
+        ),
+        "overhead_p50_ms": None,
+        "overhead_p99_ms": None,
+        "stages": timing_breakdown(STAGE_DURATION),
+        "db_operations": timing_breakdown(DB_OPERATION_DURATION),
+    }
+
+    if args.concurrency == 1:
+        overheads = [value for run in runs for value in test_case_overheads(run)]
+        if overheads:
+            results["overhead_p50_ms"] = statistics.median(overheads)
+            results["overhead_p99_ms"] = percentile(overheads, 0.99)
+
+    return results
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    """Print benchmark results as a readable report."""
+    print(
+        f"{results['runs']} runs x {results['test_cases_per_run']} test cases "
+        f"(concurrency={results['concurrency']}, parallel_runs={results['parallel_runs']}, "
+        f"target_delay={results['target_delay_ms']}ms)"
+    )
+    print(f"  runs/sec:            {results['runs_per_second']:.2f}")
+    print(f"  test cases/sec:      {results['test_cases_per_second']:.1f}")
+    print(f"  failed test cases:   {results['failed_test_cases']}")
+    if results["overhead_p50_ms"] is None:
+        print("  overhead/test case:  n/a (requires --concurrency 1)")
+    else:
+        print(
+            f"  overhead/test case:  p50={results['overhead_p50_ms']:.3f}ms "
+            f"p99={results['overhead_p99_ms']:.3f}ms"
+        )
+
+    for title, key in (("Stages", "stages"), ("Database operations", "db_operations")):
+        print(f"{title}:")
+        for name, timing in results[key].items():
+            print(
+                f"  {name:<32} count={timing['count']:<8} "
+                f"total={timing['total_ms']:10.1f}ms mean={timing['mean_ms']:8.3f}ms"
+            )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=10, help="Measured runs")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured warm-up runs")
+    parser.add_argument("--test-cases", type=int, default=100, help="Test cases per run")
+    parser.add_argument("--concurrency", type=int, default=1, help="Profile max_concurrency")
+    parser.add_argument("--parallel-runs", type=int, default=1, help="Runs executed at once")
+    parser.add_argument(
+        "--target-delay-ms", type=float, default=0.0, help="Mock target response delay"
+    )
+    parser.add_argument(
+        "--mongo-url", default=None, help="Local MongoDB URL (default: in-memory mongomock)"
+    )
+    parser.add_argument("--db-name", default="dz_eval_benchmark", help="Benchmark database")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument(
+        "--max-overhead-p99-ms",
+        type=float,
+        default=None,
+        help="Exit with status 1 if the p99 overhead per test case exceeds this"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line."""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    results = asyncio.run(benchmark(args))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results)
+
+    threshold = args.max_overhead_p99_ms
+    overhead = results["overhead_p99_ms"]
+    if threshold is not None and overhead is not None and overhead > threshold:
+        print(
+            f"p99 overhead {overhead:.3f}ms exceeds {threshold:.3f}ms",
+            file=sys.stderr
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -402,7 +402,7 @@ async def test_evaluation_run_queries_never_return_other_customer_data(
         runs_c2.append(run)
     
     # Mock the database to return appropriate runs based on customer_id
-    def mock_find_runs(query):
+    def mock_find_runs(query, projection=None):
         """Mock find that filters by customer_id."""
         customer_id = query.get("customerId")
         if customer_id == customer1.id:
@@ -544,7 +544,7 @@ async def test_get_evaluation_run_by_id_enforces_tenant_isolation(
     )
     
     # Mock the database find_one to enforce tenant check
-    async def mock_find_one_run(query):
+    async def mock_find_one_run(query, projection=None):
         """Mock find_one that enforces customer_id check."""
         if query.get("_id") == run_c1.id and query.get("customerId") == customer1.id:
             return _run_to_doc(run_c1)
@@ -182,10 +182,10 @@ async def test_evaluation_executes_all_test_cases(dataset: Dataset):
     # Track responses added
     responses_added = []
     
-    async def mock_add_response(run_id, response):
-        responses_added.append(response)
+    async def mock_add_responses(run_id, responses):
+        responses_added.extend(responses)
     
-    mock_repository.add_response.side_effect = mock_add_response
+    mock_repository.add_responses.side_effect = mock_add_responses
     
     # Mock update_evaluation_run
     completed_run = EvaluationRun(
@@ -298,10 +298,10 @@ async def test_response_metadata_completeness(dataset: Dataset, data):
     # Track responses added
     responses_added = []
     
-    async def mock_add_response(run_id, response):
-        responses_added.append(response)
+    async def mock_add_responses(run_id, responses):
+        responses_added.extend(responses)
     
-    mock_repository.add_response.side_effect = mock_add_response
+    mock_repository.add_responses.side_effect = mock_add_responses
     
     # Mock update_evaluation_run
     completed_run = EvaluationRun(
@@ -446,10 +446,10 @@ async def test_partial_failure_resilience(dataset: Dataset, data):
     # Track responses added
     responses_added = []
     
-    async def mock_add_response(run_id, response):
-        responses_added.append(response)
+    async def mock_add_responses(run_id, responses):
+        responses_added.extend(responses)
     
-    mock_repository.add_response.side_effect = mock_add_response
+    mock_repository.add_responses.side_effect = mock_add_responses
     
     # Mock update_evaluation_run
     completed_run = EvaluationRun(
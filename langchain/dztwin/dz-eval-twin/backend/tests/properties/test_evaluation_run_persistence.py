@@ -180,13 +180,59 @@ async def test_evaluation_run_persistence_round_trip(evaluation_run: EvaluationR
     mock_database.evaluationRuns.insert_one = mock_insert_one
     
     # Mock find_one to retrieve the stored evaluation run
-    async def mock_find_one(query):
+    async def mock_find_one(query, projection=None):
         if query.get("_id") == evaluation_run.id and query.get("customerId") == evaluation_run.customer_id:
             return stored_doc.copy()
         return None
     
     mock_database.evaluationRuns.find_one = mock_find_one
     
+    # Mock the sequence reservation made when responses are added
+    async def mock_find_one_and_update(query, update, projection=None, return_document=False):
+        if query.get("_id") != stored_doc.get("_id"):
+            return None
+        before = stored_doc.copy()
+        for field, amount in update.get("$inc", {}).items():
+            stored_doc[field] = stored_doc.get(field, 0) + amount
+        return before
+    
+    mock_database.evaluationRuns.find_one_and_update = mock_find_one_and_update
+    
+    # Storage for response documents in the evaluationResponses collection
+    stored_responses = []
+    
+    async def mock_bulk_write(operations, ordered=True):
+        stored_responses.extend(op._doc for op in operations)
+    
+    mock_database.evaluationResponses.bulk_write = mock_bulk_write
+    
+    class MockCursor:
+        def __init__(self, docs, projection):
+            self._docs = docs
+            self._excluded = [k for k, v in (projection or {}).items() if v == 0]
+        
+        def sort(self, key, direction):
+            self._docs = sorted(self._docs, key=lambda d: d[key], reverse=direction < 0)
+            return self
+        
+        def skip(self, count):
+            self._docs = self._docs[count:]
+            return self
+        
+        def limit(self, count):
+            self._docs = self._docs[:count]
+            return self
+        
+        async def __aiter__(self):
+            for doc in self._docs:
+                yield {k: v for k, v in doc.items() if k not in self._excluded}
+    
+    def mock_find(query, projection=None):
+        docs = [doc.copy() for doc in stored_responses if doc["runId"] == query["runId"]]
+        return MockCursor(docs, projection)
+    
+    mock_database.evaluationResponses.find = mock_find
+    
     # Create the evaluation run
     created = await repository.create_evaluation_run(evaluation_run)
     
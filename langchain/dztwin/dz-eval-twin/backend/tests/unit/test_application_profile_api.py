@@ -191,6 +191,109 @@ class TestCreateApplicationProfile:
         assert "error" in data
 
 
+    def test_create_application_profile_connection_pool_settings(
+        self,
+        client,
+        mock_application_profile_service,
+        sample_application_profile
+    ):
+        """Test HTTP/2 and connection pool settings are passed to the service."""
+        mock_application_profile_service.create_application_profile = AsyncMock(
+            return_value=sample_application_profile
+        )
+        
+        response = client.post(
+            "/api/customers/cust_test456/application-profiles",
+            json={
+                "name": "Test Chatbot",
+                "type": "chatbot",
+                "endpoint": "https://api.example.com/v1/chat",
+                "http2": True,
+                "maxConnections": 50,
+                "maxKeepaliveConnections": 10,
+                "keepaliveExpiry": 30.0
+            }
+        )
+        
+        assert response.status_code == status.HTTP_201_CREATED
+        kwargs = mock_application_profile_service.create_application_profile.call_args.kwargs
+        assert kwargs["http2"] is True
+        assert kwargs["max_connections"] == 50
+        assert kwargs["max_keepalive_connections"] == 10
+        assert kwargs["keepalive_expiry"] == 30.0
+    
+    @pytest.mark.parametrize("settings", [
+        {"maxConnections": 0},
+        {"maxConnections": 1001},
+        {"maxKeepaliveConnections": -1},
+        {"keepaliveExpiry": 301.0}
+    ])
+    def test_create_application_profile_invalid_connection_pool_settings(
+        self,
+        client,
+        mock_application_profile_service,
+        settings
+    ):
+        """Test out-of-range connection pool settings are rejected."""
+        response = client.post(
+            "/api/customers/cust_test456/application-profiles",
+            json={
+                "name": "Test Chatbot",
+                "type": "chatbot",
+                "endpoint": "https://api.example.com/v1/chat",
+                **settings
+            }
+        )
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        mock_application_profile_service.create_application_profile.assert_not_called()
+
+
+    def test_create_application_profile_websocket_connections(
+        self,
+        client,
+        mock_application_profile_service,
+        sample_application_profile
+    ):
+        """Test the WebSocket connection count is passed to the service."""
+        mock_application_profile_service.create_application_profile = AsyncMock(
+            return_value=sample_application_profile
+        )
+        
+        response = client.post(
+            "/api/customers/cust_test456/application-profiles",
+            json={
+                "name": "Test Chatbot",
+                "type": "chatbot",
+                "endpoint": "https://api.example.com/v1/chat",
+                "websocketConnections": 4
+            }
+        )
+        
+        assert response.status_code == status.HTTP_201_CREATED
+        kwargs = mock_application_profile_service.create_application_profile.call_args.kwargs
+        assert kwargs["websocket_connections"] == 4
+    
+    def test_create_application_profile_invalid_websocket_connections(
+        self,
+        client,
+        mock_application_profile_service
+    ):
+        """Test a WebSocket connection count above the limit is rejected."""
+        response = client.post(
+            "/api/customers/cust_test456/application-profiles",
+            json={
+                "name": "Test Chatbot",
+                "type": "chatbot",
+                "endpoint": "https://api.example.com/v1/chat",
+                "websocketConnections": 33
+            }
+        )
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        mock_application_profile_service.create_application_profile.assert_not_called()
+
+
 class TestListCustomerApplicationProfiles:
     """Tests for GET /api/customers/{customer_id}/application-profiles endpoint."""
     
@@ -396,6 +499,65 @@ class TestUpdateApplicationProfile:
         assert data["error"]["code"] == "VALIDATION_ERROR"
 
 
+    def test_update_application_profile_connection_pool_settings(
+        self,
+        client,
+        mock_application_profile_service,
+        sample_application_profile
+    ):
+        """Test connection pool settings alone are a valid update."""
+        mock_application_profile_service.update_application_profile = AsyncMock(
+            return_value=sample_application_profile
+        )
+        
+        response = client.put(
+            "/api/application-profiles/app_test123",
+            json={"http2": False, "maxConnections": 200}
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        kwargs = mock_application_profile_service.update_application_profile.call_args.kwargs
+        assert kwargs["http2"] is False
+        assert kwargs["max_connections"] == 200
+        assert kwargs["max_keepalive_connections"] is None
+        assert kwargs["keepalive_expiry"] is None
+    
+    def test_update_application_profile_invalid_keepalive_expiry(
+        self,
+        client,
+        mock_application_profile_service
+    ):
+        """Test an out-of-range keepalive expiry is rejected."""
+        response = client.put(
+            "/api/application-profiles/app_test123",
+            json={"keepaliveExpiry": -1.0}
+        )
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        mock_application_profile_service.update_application_profile.assert_not_called()
+
+
+    def test_update_application_profile_websocket_connections(
+        self,
+        client,
+        mock_application_profile_service,
+        sample_application_profile
+    ):
+        """Test the WebSocket connection count alone is a valid update."""
+        mock_application_profile_service.update_application_profile = AsyncMock(
+            return_value=sample_application_profile
+        )
+        
+        response = client.put(
+            "/api/application-profiles/app_test123",
+            json={"websocketConnections": 8}
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        kwargs = mock_application_profile_service.update_application_profile.call_args.kwargs
+        assert kwargs["websocket_connections"] == 8
+
+
 class TestDeleteApplicationProfile:
     """Tests for DELETE /api/application-profiles/{profile_id} endpoint."""
     
@@ -283,6 +283,85 @@ async def test_create_profile_with_custom_headers(profile_service, mock_reposito
     assert result.connection_config.custom_headers is not None
 
 
+@pytest.mark.asyncio
+async def test_create_profile_with_connection_pool_settings(profile_service, mock_repository, sample_customer, sample_profile):
+    """Test profile creation stores HTTP/2 and connection pool settings."""
+    mock_repository.get_customer_by_id = AsyncMock(return_value=sample_customer)
+    mock_repository.create_application_profile = AsyncMock(return_value=sample_profile)
+    
+    await profile_service.create_application_profile(
+        customer_id="cust_123",
+        name="Test Profile",
+        app_type="chatbot",
+        endpoint="https://api.example.com",
+        http2=True,
+        max_connections=50,
+        max_keepalive_connections=10,
+        keepalive_expiry=30.0
+    )
+    
+    config = mock_repository.create_application_profile.call_args.args[0].connection_config
+    assert config.http2 is True
+    assert config.max_connections == 50
+    assert config.max_keepalive_connections == 10
+    assert config.keepalive_expiry == 30.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("settings,message", [
+    ({"max_connections": 0}, "Max connections must be between 1 and 1000"),
+    ({"max_keepalive_connections": 1001}, "Max keepalive connections must be between 0 and 1000"),
+    ({"keepalive_expiry": -1.0}, "Keepalive expiry must be between 0 and 300 seconds"),
+])
+async def test_create_profile_invalid_connection_pool_settings(
+    profile_service, mock_repository, sample_customer, settings, message
+):
+    """Test profile creation fails with out-of-range connection pool settings."""
+    mock_repository.get_customer_by_id = AsyncMock(return_value=sample_customer)
+    
+    with pytest.raises(ValueError, match=message):
+        await profile_service.create_application_profile(
+            customer_id="cust_123",
+            name="Test Profile",
+            app_type="chatbot",
+            endpoint="https://api.example.com",
+            **settings
+        )
+
+
+@pytest.mark.asyncio
+async def test_create_profile_with_websocket_connections(profile_service, mock_repository, sample_customer, sample_profile):
+    """Test profile creation stores the WebSocket connection count."""
+    mock_repository.get_customer_by_id = AsyncMock(return_value=sample_customer)
+    mock_repository.create_application_profile = AsyncMock(return_value=sample_profile)
+    
+    await profile_service.create_application_profile(
+        customer_id="cust_123",
+        name="Test Profile",
+        app_type="chatbot",
+        endpoint="https://api.example.com",
+        websocket_connections=4
+    )
+    
+    config = mock_repository.create_application_profile.call_args.args[0].connection_config
+    assert config.websocket_connections == 4
+
+
+@pytest.mark.asyncio
+async def test_create_profile_invalid_websocket_connections(profile_service, mock_repository, sample_customer):
+    """Test profile creation fails with too many WebSocket connections."""
+    mock_repository.get_customer_by_id = AsyncMock(return_value=sample_customer)
+    
+    with pytest.raises(ValueError, match="WebSocket connections must be between 1 and 32"):
+        await profile_service.create_application_profile(
+            customer_id="cust_123",
+            name="Test Profile",
+            app_type="chatbot",
+            endpoint="https://api.example.com",
+            websocket_connections=33
+        )
+
+
 # ==================== Get Profile Tests ====================
 
 @pytest.mark.asyncio
@@ -470,6 +549,68 @@ async def test_update_profile_empty_id(profile_service):
         )
 
 
+@pytest.mark.asyncio
+async def test_update_profile_connection_pool_settings(profile_service, mock_repository, sample_profile):
+    """Test updating HTTP/2 and connection pool settings keeps the other settings."""
+    mock_repository.get_application_profile_by_id = AsyncMock(return_value=sample_profile)
+    mock_repository.update_application_profile = AsyncMock(return_value=sample_profile)
+    
+    await profile_service.update_application_profile(
+        profile_id="app_123",
+        http2=True,
+        max_connections=200,
+        keepalive_expiry=0.0
+    )
+    
+    config = mock_repository.update_application_profile.call_args.args[1]["connection_config"]
+    assert config["http2"] is True
+    assert config["max_connections"] == 200
+    assert config["max_keepalive_connections"] == 20
+    assert config["keepalive_expiry"] == 0.0
+    assert config["endpoint"] == "https://api.example.com"
+
+
+@pytest.mark.asyncio
+async def test_update_profile_invalid_max_connections(profile_service, mock_repository, sample_profile):
+    """Test updating profile with an out-of-range connection limit fails."""
+    mock_repository.get_application_profile_by_id = AsyncMock(return_value=sample_profile)
+    
+    with pytest.raises(ValueError, match="Max connections must be between 1 and 1000"):
+        await profile_service.update_application_profile(
+            profile_id="app_123",
+            max_connections=1001
+        )
+    
+    mock_repository.update_application_profile.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_profile_websocket_connections(profile_service, mock_repository, sample_profile):
+    """Test updating the WebSocket connection count."""
+    mock_repository.get_application_profile_by_id = AsyncMock(return_value=sample_profile)
+    mock_repository.update_application_profile = AsyncMock(return_value=sample_profile)
+    
+    await profile_service.update_application_profile(
+        profile_id="app_123",
+        websocket_connections=8
+    )
+    
+    config = mock_repository.update_application_profile.call_args.args[1]["connection_config"]
+    assert config["websocket_connections"] == 8
+
+
+@pytest.mark.asyncio
+async def test_update_profile_invalid_websocket_connections(profile_service, mock_repository, sample_profile):
+    """Test updating profile with zero WebSocket connections fails."""
+    mock_repository.get_application_profile_by_id = AsyncMock(return_value=sample_profile)
+    
+    with pytest.raises(ValueError, match="WebSocket connections must be between 1 and 32"):
+        await profile_service.update_application_profile(
+            profile_id="app_123",
+            websocket_connections=0
+        )
+
+
 # ==================== Delete Profile Tests ====================
 
 @pytest.mark.asyncio
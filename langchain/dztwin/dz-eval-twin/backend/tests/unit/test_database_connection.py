@@ -26,6 +26,7 @@ async def test_connect_success_first_attempt(db_manager):
         mock_db.applicationProfiles.create_index = AsyncMock()
         mock_db.datasets.create_index = AsyncMock()
         mock_db.evaluationRuns.create_index = AsyncMock()
+        mock_db.evaluationResponses.create_index = AsyncMock()
         mock_client.__getitem__.return_value = mock_db
         
         await db_manager.connect()
@@ -54,6 +55,7 @@ async def test_connect_retry_success(db_manager):
         mock_db.applicationProfiles.create_index = AsyncMock()
         mock_db.datasets.create_index = AsyncMock()
         mock_db.evaluationRuns.create_index = AsyncMock()
+        mock_db.evaluationResponses.create_index = AsyncMock()
         mock_client.__getitem__.return_value = mock_db
         
         with patch('asyncio.sleep', new_callable=AsyncMock):
@@ -106,6 +108,7 @@ async def test_connect_server_selection_timeout(db_manager):
         mock_db.applicationProfiles.create_index = AsyncMock()
         mock_db.datasets.create_index = AsyncMock()
         mock_db.evaluationRuns.create_index = AsyncMock()
+        mock_db.evaluationResponses.create_index = AsyncMock()
         mock_client.__getitem__.return_value = mock_db
         
         with patch('asyncio.sleep', new_callable=AsyncMock):
@@ -139,6 +142,7 @@ async def test_disconnect(db_manager):
         mock_db.applicationProfiles.create_index = AsyncMock()
         mock_db.datasets.create_index = AsyncMock()
         mock_db.evaluationRuns.create_index = AsyncMock()
+        mock_db.evaluationResponses.create_index = AsyncMock()
         mock_client.__getitem__.return_value = mock_db
         
         await db_manager.connect()
@@ -162,6 +166,7 @@ async def test_health_check_connected_and_healthy(db_manager):
         mock_db.applicationProfiles.create_index = AsyncMock()
         mock_db.datasets.create_index = AsyncMock()
         mock_db.evaluationRuns.create_index = AsyncMock()
+        mock_db.evaluationResponses.create_index = AsyncMock()
         mock_client.__getitem__.return_value = mock_db
         
         await db_manager.connect()
@@ -199,6 +204,7 @@ async def test_health_check_connection_lost(db_manager):
         mock_db.applicationProfiles.create_index = AsyncMock()
         mock_db.datasets.create_index = AsyncMock()
         mock_db.evaluationRuns.create_index = AsyncMock()
+        mock_db.evaluationResponses.create_index = AsyncMock()
         mock_client.__getitem__.return_value = mock_db
         
         await db_manager.connect()
@@ -243,6 +249,7 @@ async def test_index_creation(db_manager):
         mock_db.applicationProfiles.create_index = AsyncMock()
         mock_db.datasets.create_index = AsyncMock()
         mock_db.evaluationRuns.create_index = AsyncMock()
+        mock_db.evaluationResponses.create_index = AsyncMock()
         mock_client.__getitem__.return_value = mock_db
         
         await db_manager.connect()
@@ -252,6 +259,11 @@ async def test_index_creation(db_manager):
         mock_db.datasets.create_index.assert_called_once_with("customerId")
         # evaluationRuns should have 3 indexes
         assert mock_db.evaluationRuns.create_index.call_count == 3
+        # evaluationResponses should be unique per run and test case
+        mock_db.evaluationResponses.create_index.assert_any_call(
+            [("runId", 1), ("testCaseId", 1)], unique=True
+        )
+        assert mock_db.evaluationResponses.create_index.call_count == 2
 
 
 @pytest.mark.asyncio
@@ -23,9 +23,22 @@ def mock_database():
     db.applicationProfiles = MagicMock()
     db.datasets = MagicMock()
     db.evaluationRuns = MagicMock()
+    db.evaluationResponses = MagicMock()
+    mock_response_cursor(db, [])
     return db
 
 
+def mock_response_cursor(db, docs):
+    """Make evaluationResponses.find return a cursor over the given documents."""
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.skip.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.__aiter__.return_value = docs
+    db.evaluationResponses.find = MagicMock(return_value=cursor)
+    return cursor
+
+
 @pytest.fixture
 def repository(mock_database):
     """Create a DataRepository with mock database."""
@@ -394,6 +407,29 @@ async def test_delete_dataset_tenant_check(repository, mock_database):
     assert call_args["customerId"] == "cust_123"
 
 
+
+@pytest.mark.asyncio
+async def test_add_test_cases_appends_batch(repository, mock_database):
+    """Test a batch of test cases is appended in one tenant-scoped update."""
+    mock_database.datasets.update_one = AsyncMock(return_value=MagicMock(matched_count=1))
+    test_cases = [TestCase(id=f"tc_{i}", input=f"Question {i}") for i in range(3)]
+    
+    await repository.add_test_cases("dataset_123", "cust_123", test_cases)
+    
+    query, update = mock_database.datasets.update_one.call_args.args
+    assert query == {"_id": "dataset_123", "customerId": "cust_123"}
+    assert [tc["id"] for tc in update["$push"]["testCases"]["$each"]] == ["tc_0", "tc_1", "tc_2"]
+
+
+@pytest.mark.asyncio
+async def test_add_test_cases_dataset_not_found(repository, mock_database):
+    """Test appending to a missing or foreign dataset raises ValueError."""
+    mock_database.datasets.update_one = AsyncMock(return_value=MagicMock(matched_count=0))
+    
+    with pytest.raises(ValueError, match="not found"):
+        await repository.add_test_cases("dataset_123", "cust_other", [TestCase(id="tc_1", input="Q")])
+
+
 # ==================== Evaluation Run Tests (Tenant-Scoped) ====================
 
 @pytest.mark.asyncio
@@ -469,11 +505,17 @@ async def test_add_response_success(repository, mock_database):
         latency=1.5,
         timestamp=datetime.utcnow()
     )
-    mock_database.evaluationRuns.update_one = AsyncMock(return_value=MagicMock(matched_count=1))
+    mock_database.evaluationRuns.find_one_and_update = AsyncMock(
+        return_value={"_id": "run_123", "customerId": "cust_123"}
+    )
+    mock_database.evaluationResponses.bulk_write = AsyncMock()
     
     await repository.add_response("run_123", response)
     
-    mock_database.evaluationRuns.update_one.assert_called_once()
+    mock_database.evaluationResponses.bulk_write.assert_called_once()
+    # The run document itself must not receive the response body
+    run_update = mock_database.evaluationRuns.find_one_and_update.call_args[0][1]
+    assert "$push" not in run_update
 
 
 @pytest.mark.asyncio
@@ -486,10 +528,101 @@ async def test_add_response_run_not_found(repository, mock_database):
         latency=1.5,
         timestamp=datetime.utcnow()
     )
-    mock_database.evaluationRuns.update_one = AsyncMock(return_value=MagicMock(matched_count=0))
+    mock_database.evaluationRuns.find_one_and_update = AsyncMock(return_value=None)
+    mock_database.evaluationResponses.bulk_write = AsyncMock()
     
     with pytest.raises(ValueError, match="not found"):
         await repository.add_response("nonexistent", response)
+    mock_database.evaluationResponses.bulk_write.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_add_responses_writes_batch(repository, mock_database):
+    """Test adding a batch of responses uses a single bulk upsert in order."""
+    responses = [
+        Response(
+            test_case_id=f"tc_{i:03d}",
+            input="Test input",
+            output="Test output",
+            latency=1.5,
+            timestamp=datetime.utcnow()
+        )
+        for i in range(3)
+    ]
+    mock_database.evaluationRuns.find_one_and_update = AsyncMock(
+        return_value={"_id": "run_123", "customerId": "cust_123", "responseSequence": 5}
+    )
+    mock_database.evaluationResponses.bulk_write = AsyncMock()
+    
+    await repository.add_responses("run_123", responses)
+    
+    # One sequence block is reserved for the whole batch
+    run_update = mock_database.evaluationRuns.find_one_and_update.call_args[0][1]
+    assert run_update == {"$inc": {"responseSequence": 3}}
+    
+    mock_database.evaluationResponses.bulk_write.assert_called_once()
+    operations = mock_database.evaluationResponses.bulk_write.call_args[0][0]
+    documents = [op._doc for op in operations]
+    assert [d["testCaseId"] for d in documents] == ["tc_000", "tc_001", "tc_002"]
+    assert [d["sequence"] for d in documents] == [5, 6, 7]
+    assert all(d["runId"] == "run_123" and d["customerId"] == "cust_123" for d in documents)
+    assert [op._filter for op in operations][0] == {"runId": "run_123", "testCaseId": "tc_000"}
+
+
+@pytest.mark.asyncio
+async def test_add_responses_empty_batch(repository, mock_database):
+    """Test adding an empty batch does not touch the database."""
+    mock_database.evaluationRuns.find_one_and_update = AsyncMock()
+    mock_database.evaluationResponses.bulk_write = AsyncMock()
+    
+    await repository.add_responses("run_123", [])
+    
+    mock_database.evaluationRuns.find_one_and_update.assert_not_called()
+    mock_database.evaluationResponses.bulk_write.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_add_responses_run_not_found(repository, mock_database):
+    """Test adding a batch of responses to non-existent run."""
+    response = Response(
+        test_case_id="tc_001",
+        input="Test input",
+        output="Test output",
+        latency=1.5,
+        timestamp=datetime.utcnow()
+    )
+    mock_database.evaluationRuns.find_one_and_update = AsyncMock(return_value=None)
+    
+    with pytest.raises(ValueError, match="not found"):
+        await repository.add_responses("nonexistent", [response])
+
+
+@pytest.mark.asyncio
+async def test_get_evaluation_run_converts_stored_responses(repository, mock_database):
+    """Test camelCase response documents are converted when loading a run."""
+    mock_database.evaluationRuns.find_one = AsyncMock(return_value={
+        "_id": "run_123",
+        "customerId": "cust_123",
+        "datasetId": "dataset_123",
+        "applicationProfileId": "app_123",
+        "status": "completed",
+        "startTime": datetime.utcnow(),
+        "responses": [
+            {
+                "testCaseId": "tc_001",
+                "input": "Test input",
+                "output": "Test output",
+                "latency": 1.5,
+                "timestamp": datetime.utcnow(),
+                "individualMetrics": {"accuracy": 1.0, "relevance": 0.5}
+            }
+        ]
+    })
+    
+    run = await repository.get_evaluation_run_by_id("run_123", "cust_123")
+    
+    assert run.responses[0].test_case_id == "tc_001"
+    assert run.responses[0].individual_metrics.accuracy == 1.0
 
 
 @pytest.mark.asyncio
@@ -514,6 +647,109 @@ async def test_get_responses_success(repository, mock_database):
     assert result[0].test_case_id == "tc_001"
 
 
+@pytest.mark.asyncio
+async def test_get_responses_paginated_from_collection(repository, mock_database):
+    """Test responses are paged from the responses collection in sequence order."""
+    mock_database.evaluationRuns.find_one = AsyncMock(return_value={"_id": "run_123"})
+    cursor = mock_response_cursor(mock_database, [
+        {
+            "testCaseId": "tc_011",
+            "input": "Test input",
+            "output": "Test output",
+            "latency": 1.5,
+            "timestamp": datetime.utcnow(),
+            "individualMetrics": {"accuracy": 0.8, "relevance": 0.9}
+        }
+    ])
+    
+    result = await repository.get_responses("run_123", "cust_123", skip=10, limit=1)
+    
+    assert [r.test_case_id for r in result] == ["tc_011"]
+    assert result[0].individual_metrics.accuracy == 0.8
+    run_query = mock_database.evaluationRuns.find_one.call_args[0][0]
+    assert run_query == {"_id": "run_123", "customerId": "cust_123"}
+    assert mock_database.evaluationResponses.find.call_args[0][0] == {"runId": "run_123"}
+    cursor.sort.assert_called_once_with("sequence", 1)
+    cursor.skip.assert_called_once_with(10)
+    cursor.limit.assert_called_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_get_evaluation_runs_projects_out_responses(repository, mock_database):
+    """Test listing runs does not load response bodies."""
+    mock_cursor = AsyncMock()
+    mock_cursor.__aiter__.return_value = []
+    mock_database.evaluationRuns.find = MagicMock(return_value=mock_cursor)
+    
+    await repository.get_evaluation_runs("cust_123")
+    
+    projection = mock_database.evaluationRuns.find.call_args[0][1]
+    assert projection["responses"] == 0
+    mock_database.evaluationResponses.find.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_evaluation_run_without_responses(repository, mock_database):
+    """Test a run can be loaded without its responses."""
+    mock_database.evaluationRuns.find_one = AsyncMock(return_value={
+        "_id": "run_123",
+        "customerId": "cust_123",
+        "datasetId": "dataset_123",
+        "applicationProfileId": "app_123",
+        "status": "completed",
+        "startTime": datetime.utcnow()
+    })
+    
+    run = await repository.get_evaluation_run_by_id("run_123", "cust_123", include_responses=False)
+    
+    assert run.responses == []
+    assert mock_database.evaluationRuns.find_one.call_args[0][1]["responses"] == 0
+    mock_database.evaluationResponses.find.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_count_responses(repository, mock_database):
+    """Test counting responses stored in the responses collection."""
+    mock_database.evaluationRuns.find_one = AsyncMock(return_value={"_id": "run_123"})
+    mock_database.evaluationResponses.count_documents = AsyncMock(return_value=42)
+    
+    assert await repository.count_responses("run_123", "cust_123") == 42
+    mock_database.evaluationResponses.count_documents.assert_called_once_with({"runId": "run_123"})
+
+
+@pytest.mark.asyncio
+async def test_update_response_metrics(repository, mock_database):
+    """Test individual metrics are written with one bulk update."""
+    responses = [
+        Response(
+            test_case_id="tc_001",
+            input="Test input",
+            output="Test output",
+            latency=1.5,
+            timestamp=datetime.utcnow(),
+            individual_metrics={"accuracy": 1.0, "relevance": 0.5}
+        ),
+        Response(
+            test_case_id="tc_002",
+            input="Test input",
+            output="",
+            latency=1.5,
+            timestamp=datetime.utcnow(),
+            error="Timeout"
+        )
+    ]
+    mock_database.evaluationResponses.bulk_write = AsyncMock()
+    
+    await repository.update_response_metrics("run_123", responses)
+    
+    operations = mock_database.evaluationResponses.bulk_write.call_args[0][0]
+    assert len(operations) == 1
+    assert operations[0]._filter == {"runId": "run_123", "testCaseId": "tc_001"}
+    assert operations[0]._doc == {
+        "$set": {"individualMetrics": {"accuracy": 1.0, "relevance": 0.5}}
+    }
+
+
 # ==================== Edge Cases ====================
 
 @pytest.mark.asyncio
@@ -786,7 +1022,10 @@ async def test_add_response_database_error(repository, mock_database):
         latency=1.5,
         timestamp=datetime.utcnow()
     )
-    mock_database.evaluationRuns.update_one = AsyncMock(side_effect=PyMongoError("DB Error"))
+    mock_database.evaluationRuns.find_one_and_update = AsyncMock(
+        return_value={"_id": "run_123", "customerId": "cust_123"}
+    )
+    mock_database.evaluationResponses.bulk_write = AsyncMock(side_effect=PyMongoError("DB Error"))
     
     with pytest.raises(RuntimeError, match="Database error"):
         await repository.add_response("run_123", response)
@@ -0,0 +1,155 @@
+"""Unit tests for DatasetService file streaming and incremental dataset loading."""
+
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.middleware.error_handler import ValidationError
+from app.services.dataset_service import DatasetService
+
+
+async def iter_chunks(*chunks):
+    """Yield the given byte chunks."""
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.fixture
+def upload_dir(tmp_path):
+    """Point uploads at a temporary directory."""
+    with patch("app.services.dataset_service.settings.upload_dir", str(tmp_path)):
+        yield tmp_path
+
+
+@pytest.fixture
+def mock_repository():
+    """Create a mock repository that echoes created datasets."""
+    repository = MagicMock()
+    repository.create_dataset = AsyncMock(side_effect=lambda dataset: dataset)
+    repository.add_test_cases = AsyncMock()
+    repository.delete_dataset = AsyncMock()
+    return repository
+
+
+@pytest.fixture
+def dataset_service(mock_repository):
+    """Create a DatasetService with mock repository."""
+    return DatasetService(mock_repository)
+
+
+def write_csv(upload_dir, rows, header="input,expected_output"):
+    """Write a CSV file under the upload directory and return its relative path."""
+    customer_dir = upload_dir / "cust_123"
+    customer_dir.mkdir(exist_ok=True)
+    (customer_dir / "data.csv").write_text("\n".join([header] + rows) + "\n", encoding="utf-8")
+    return os.path.join("cust_123", "data.csv")
+
+
+# ==================== Save Dataset File Stream Tests ====================
+
+@pytest.mark.asyncio
+async def test_save_dataset_file_stream_writes_chunks(dataset_service, upload_dir):
+    """Test streamed chunks are written to a customer-scoped file."""
+    relative_path = await dataset_service.save_dataset_file_stream(
+        "cust_123", "data.csv", iter_chunks(b"input\n", b"Question 1\n", b"Question 2\n")
+    )
+
+    assert relative_path.startswith("cust_123")
+    assert relative_path.endswith(".csv")
+    assert (upload_dir / relative_path).read_bytes() == b"input\nQuestion 1\nQuestion 2\n"
+
+
+@pytest.mark.asyncio
+async def test_save_dataset_file_stream_enforces_max_size(dataset_service, upload_dir):
+    """Test an oversized upload is rejected and the partial file removed."""
+    with pytest.raises(ValueError, match="exceeds maximum"):
+        await dataset_service.save_dataset_file_stream(
+            "cust_123", "data.csv", iter_chunks(b"x" * 600, b"x" * 600), max_size_bytes=1000
+        )
+
+    assert os.listdir(upload_dir / "cust_123") == []
+
+
+@pytest.mark.asyncio
+async def test_save_dataset_file_stream_rejects_empty_file(dataset_service, upload_dir):
+    """Test an empty upload is rejected."""
+    with pytest.raises(ValueError, match="File is empty"):
+        await dataset_service.save_dataset_file_stream("cust_123", "data.csv", iter_chunks())
+
+
+# ==================== Create Dataset From File Tests ====================
+
+@pytest.mark.asyncio
+async def test_create_dataset_from_file_inserts_in_batches(
+    dataset_service,
+    mock_repository,
+    upload_dir
+):
+    """Test test cases are created with the dataset and appended in batches."""
+    file_path = write_csv(upload_dir, [f"Question {i},Answer {i}" for i in range(7)])
+
+    dataset, count = await dataset_service.create_dataset_from_file(
+        customer_id="cust_123",
+        application_profile_id="app_123",
+        name="Large Dataset",
+        description="",
+        file_path=file_path,
+        batch_size=3
+    )
+
+    assert count == 7
+    assert [tc.input for tc in dataset.test_cases] == ["Question 0", "Question 1", "Question 2"]
+
+    batches = [call.args[2] for call in mock_repository.add_test_cases.call_args_list]
+    assert [len(batch) for batch in batches] == [3, 1]
+    assert batches[1][0].expected_output == "Answer 6"
+    assert all(call.args[:2] == (dataset.id, "cust_123")
+               for call in mock_repository.add_test_cases.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_create_dataset_from_file_invalid_header(
+    dataset_service,
+    mock_repository,
+    upload_dir
+):
+    """Test a file without an input column creates nothing and is removed."""
+    file_path = write_csv(upload_dir, ["a,b"], header="question,answer")
+
+    with pytest.raises(ValidationError, match="must contain 'input' column"):
+        await dataset_service.create_dataset_from_file(
+            customer_id="cust_123",
+            application_profile_id="app_123",
+            name="Broken Dataset",
+            description="",
+            file_path=file_path
+        )
+
+    mock_repository.create_dataset.assert_not_called()
+    assert not (upload_dir / file_path).exists()
+
+
+@pytest.mark.asyncio
+async def test_create_dataset_from_file_invalid_row_removes_partial_dataset(
+    dataset_service,
+    mock_repository,
+    upload_dir
+):
+    """Test an invalid row after the first batch removes the partial dataset."""
+    rows = [f"Question {i},Answer {i}" for i in range(4)] + [",Missing input"]
+    file_path = write_csv(upload_dir, rows)
+
+    with pytest.raises(ValidationError, match="Row 6"):
+        await dataset_service.create_dataset_from_file(
+            customer_id="cust_123",
+            application_profile_id="app_123",
+            name="Broken Dataset",
+            description="",
+            file_path=file_path,
+            batch_size=2
+        )
+
+    created = mock_repository.create_dataset.call_args.args[0]
+    mock_repository.delete_dataset.assert_called_once_with(created.id, "cust_123")
+    assert not (upload_dir / file_path).exists()
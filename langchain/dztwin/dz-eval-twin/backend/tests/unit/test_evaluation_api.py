@@ -1,5 +1,6 @@
 """Unit tests for evaluation API endpoints."""
 
+import asyncio
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -135,14 +136,12 @@ class TestStartEvaluationRun:
         mock_repository.get_dataset_by_id = AsyncMock(return_value=dataset)
         
         # Mock metrics calculator
-        mock_metrics_calculator.calculate_individual_metrics = MagicMock(
-            return_value=IndividualMetrics(accuracy=1.0, relevance=0.85)
-        )
-        mock_metrics_calculator.aggregate_metrics = MagicMock(
-            return_value=sample_aggregated_metrics
-        )
+        accumulator = MagicMock()
+        accumulator.result.return_value = sample_aggregated_metrics
+        mock_metrics_calculator.start_run = MagicMock(return_value=accumulator)
         
         # Mock repository update
+        mock_repository.update_response_metrics = AsyncMock()
         mock_repository.update_evaluation_run = AsyncMock(
             return_value=sample_evaluation_run
         )
@@ -465,6 +464,137 @@ class TestGetEvaluationRun:
         assert len(data["responses"]) == 2
 
 
+class TestBackgroundEvaluationRun:
+    """Tests for background mode and progress endpoints."""
+    
+    def test_start_evaluation_run_in_background(
+        self,
+        client,
+        mock_evaluation_engine,
+        sample_evaluation_run
+    ):
+        """Test background mode returns 202 with the run ID without executing."""
+        pending_run = sample_evaluation_run.model_copy(update={"status": "pending"})
+        mock_evaluation_engine.create_pending_run = AsyncMock(return_value=pending_run)
+        mock_evaluation_engine.execute_run = AsyncMock()
+        
+        with patch("app.api.evaluations.evaluation_job_queue") as mock_queue:
+            response = client.post(
+                "/api/evaluations?background=true",
+                json={
+                    "dataset_id": "ds_test789",
+                    "application_profile_id": "prof_test012"
+                },
+                headers={"X-Customer-ID": "cust_test456"}
+            )
+        
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        data = response.json()
+        assert data["runId"] == "run_test123"
+        assert data["status"] == "pending"
+        assert data["progressUrl"] == "/api/evaluations/run_test123/progress"
+        mock_queue.submit.assert_called_once()
+        mock_evaluation_engine.execute_run.assert_not_called()
+    
+    def test_background_run_is_failed_when_aborted(
+        self,
+        client,
+        mock_evaluation_engine,
+        sample_evaluation_run
+    ):
+        """Test the queued run's abort handler records the run as failed."""
+        pending_run = sample_evaluation_run.model_copy(update={"status": "pending"})
+        mock_evaluation_engine.create_pending_run = AsyncMock(return_value=pending_run)
+        mock_evaluation_engine.fail_pending_run = AsyncMock()
+        
+        with patch("app.api.evaluations.evaluation_job_queue") as mock_queue:
+            client.post(
+                "/api/evaluations?background=true",
+                json={
+                    "dataset_id": "ds_test789",
+                    "application_profile_id": "prof_test012"
+                },
+                headers={"X-Customer-ID": "cust_test456"}
+            )
+        
+        abort = mock_queue.submit.call_args.args[3]
+        asyncio.run(abort("Evaluation worker stopped"))
+        
+        mock_evaluation_engine.fail_pending_run.assert_awaited_once_with(
+            pending_run,
+            "Evaluation worker stopped"
+        )
+    
+    def test_get_progress_of_untracked_run(
+        self,
+        client,
+        mock_repository,
+        sample_evaluation_run
+    ):
+        """Test progress of a run not in the job queue is read from the database."""
+        mock_repository.get_evaluation_run_by_id = AsyncMock(
+            return_value=sample_evaluation_run
+        )
+        mock_repository.count_responses = AsyncMock(return_value=1)
+        
+        response = client.get(
+            "/api/evaluations/run_test123/progress",
+            headers={"X-Customer-ID": "cust_test456"}
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["completed"] == 1
+        assert data["total"] == 1
+
+
+class TestListEvaluationResponses:
+    """Tests for GET /api/evaluations/{run_id}/responses endpoint."""
+    
+    def test_list_evaluation_responses_paginated(
+        self,
+        client,
+        mock_repository,
+        sample_response
+    ):
+        """Test a page of responses is returned with the total count."""
+        mock_repository.count_responses = AsyncMock(return_value=25)
+        mock_repository.get_responses = AsyncMock(return_value=[sample_response])
+        
+        response = client.get(
+            "/api/evaluations/run_test123/responses?skip=10&limit=1",
+            headers={"X-Customer-ID": "cust_test456"}
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total"] == 25
+        assert data["skip"] == 10
+        assert data["limit"] == 1
+        assert len(data["items"]) == 1
+        mock_repository.get_responses.assert_called_once_with(
+            "run_test123", "cust_test456", skip=10, limit=1
+        )
+    
+    def test_list_evaluation_responses_not_found(
+        self,
+        client,
+        mock_repository
+    ):
+        """Test listing responses of a non-existent run."""
+        mock_repository.count_responses = AsyncMock(
+            side_effect=ValueError("Evaluation run with ID run_nonexistent not found")
+        )
+        
+        response = client.get(
+            "/api/evaluations/run_nonexistent/responses",
+            headers={"X-Customer-ID": "cust_test456"}
+        )
+        
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 class TestCompareRuns:
     """Tests for POST /api/evaluations/compare endpoint."""
     
@@ -650,12 +780,10 @@ class TestEvaluationEndpointsIntegration:
         mock_repository.get_dataset_by_id = AsyncMock(return_value=dataset)
         
         # Mock metrics
-        mock_metrics_calculator.calculate_individual_metrics = MagicMock(
-            return_value=IndividualMetrics(accuracy=1.0, relevance=0.85)
-        )
-        mock_metrics_calculator.aggregate_metrics = MagicMock(
-            return_value=sample_aggregated_metrics
-        )
+        accumulator = MagicMock()
+        accumulator.result.return_value = sample_aggregated_metrics
+        mock_metrics_calculator.start_run = MagicMock(return_value=accumulator)
+        mock_repository.update_response_metrics = AsyncMock()
         mock_repository.update_evaluation_run = AsyncMock(
             return_value=sample_evaluation_run
         )
@@ -759,6 +887,7 @@ class TestEvaluationEndpointsIntegration:
             updated_at=datetime.utcnow()
         )
         mock_repository.get_dataset_by_id = AsyncMock(return_value=dataset)
+        mock_repository.update_response_metrics = AsyncMock()
         mock_repository.update_evaluation_run = AsyncMock(
             return_value=sample_evaluation_run
         )
@@ -5,6 +5,8 @@ customer validation, response capture, error handling, and partial
 failure resilience.
 """
 
+import asyncio
+import time
 import uuid
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -13,12 +15,16 @@ import pytest
 
 from app.connectors.plugin import ApplicationResponse
 from app.engine.evaluation_engine import EvaluationEngine
+from app.engine.metrics_calculator import MetricsCalculator
+from app.engine.progress import RunProgress
+from app.engine.response_cache import ResponseCache
 from app.models.application_profile import ApplicationProfile
 from app.models.connection_config import ConnectionConfig
 from app.models.dataset import Dataset
 from app.models.evaluation_run import EvaluationRun
 from app.models.response import Response
 from app.models.test_case import TestCase
+from app.utils.instrumentation import STAGE_DURATION
 
 
 class TestEvaluationEngineInitialization:
@@ -117,8 +123,8 @@ class TestEvaluationEngineExecuteRun:
         )
         mock_repository.create_evaluation_run.return_value = created_run
         
-        # Mock add_response
-        mock_repository.add_response.return_value = None
+        # Mock add_responses
+        mock_repository.add_responses.return_value = None
         
         # Mock update_evaluation_run to return completed run
         completed_run = EvaluationRun(
@@ -165,8 +171,9 @@ class TestEvaluationEngineExecuteRun:
             mock_plugin.connect.assert_called_once()
             mock_plugin.disconnect.assert_called_once()
             
-            # Verify responses were added
-            assert mock_repository.add_response.call_count == 2
+            # Verify responses were added in a single bulk write
+            mock_repository.add_responses.assert_called_once()
+            assert len(mock_repository.add_responses.call_args[0][1]) == 2
             
             # Verify run was completed
             mock_repository.update_evaluation_run.assert_called_once()
@@ -304,8 +311,8 @@ class TestEvaluationEngineExecuteRun:
         )
         mock_repository.create_evaluation_run.return_value = created_run
         
-        # Mock add_response
-        mock_repository.add_response.return_value = None
+        # Mock add_responses
+        mock_repository.add_responses.return_value = None
         
         # Mock update_evaluation_run
         completed_run = EvaluationRun(
@@ -343,7 +350,7 @@ class TestEvaluationEngineExecuteRun:
             )
             
             # Verify both responses were recorded
-            assert mock_repository.add_response.call_count == 2
+            assert len(mock_repository.add_responses.call_args[0][1]) == 2
             
             # Verify run was completed (not failed)
             assert result.status == "completed"
@@ -433,8 +440,8 @@ class TestEvaluationEngineExecuteRun:
         )
         mock_repository.create_evaluation_run.return_value = created_run
         
-        # Mock add_response
-        mock_repository.add_response.return_value = None
+        # Mock add_responses
+        mock_repository.add_responses.return_value = None
         
         # Mock update_evaluation_run
         completed_run = EvaluationRun(
@@ -468,7 +475,8 @@ class TestEvaluationEngineExecuteRun:
             )
             
             # Verify single response was added
-            assert mock_repository.add_response.call_count == 1
+            mock_repository.add_responses.assert_called_once()
+            assert len(mock_repository.add_responses.call_args[0][1]) == 1
             
             # Verify plugin was called once
             assert mock_plugin.send_input.call_count == 1
@@ -538,7 +546,7 @@ class TestEvaluationEngineExecuteRun:
             )
             
             # Verify no responses were added
-            mock_repository.add_response.assert_not_called()
+            mock_repository.add_responses.assert_not_called()
             
             # Verify run was completed
             assert result.status == "completed"
@@ -614,3 +622,436 @@ class TestEvaluationEngineGetRunStatus:
         # Get status and expect ValueError
         with pytest.raises(ValueError, match="not found"):
             await engine.get_run_status(run_id, customer_id)
+
+
+class TestEvaluationEngineConcurrency:
+    """Test bounded-concurrency execution of test cases."""
+    
+    @pytest.fixture
+    def mock_repository(self):
+        """Create mock repository."""
+        return AsyncMock()
+    
+    @pytest.fixture
+    def engine(self, mock_repository):
+        """Create evaluation engine instance."""
+        return EvaluationEngine(mock_repository)
+    
+    @pytest.fixture
+    def dataset(self):
+        """Create dataset with several test cases."""
+        return Dataset(
+            id="dataset_concurrency",
+            customer_id="cust_test123",
+            application_profile_id="profile_test123",
+            name="Concurrency Dataset",
+            description="Dataset for concurrency tests",
+            file_path="datasets/cust_test123/concurrency.csv",
+            test_cases=[
+                TestCase(id=f"tc_{i:03d}", input=f"Question {i}")
+                for i in range(6)
+            ]
+        )
+    
+    @pytest.fixture
+    def run(self):
+        """Create running evaluation run."""
+        return EvaluationRun(
+            id="run_concurrency",
+            customer_id="cust_test123",
+            dataset_id="dataset_concurrency",
+            application_profile_id="profile_test123",
+            status="running",
+            responses=[]
+        )
+    
+    def _make_plugin(self, delays):
+        """Create a plugin whose latency per input is taken from delays."""
+        state = {"in_flight": 0, "peak": 0}
+        
+        async def send_input(input_text):
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(delays[input_text])
+            state["in_flight"] -= 1
+            return ApplicationResponse(output=f"Answer to {input_text}", latency=1.0)
+        
+        plugin = AsyncMock()
+        plugin.send_input.side_effect = send_input
+        return plugin, state
+    
+    @pytest.mark.asyncio
+    async def test_default_runs_sequentially(self, engine, dataset, run):
+        """Test default concurrency sends one test case at a time."""
+        delays = {tc.input: 0.001 for tc in dataset.test_cases}
+        plugin, state = self._make_plugin(delays)
+        
+        await engine._execute_test_cases(run, dataset, plugin)
+        
+        assert state["peak"] == 1
+        assert len(run.responses) == len(dataset.test_cases)
+    
+    @pytest.mark.asyncio
+    async def test_respects_max_concurrency(self, engine, dataset, run):
+        """Test no more than max_concurrency test cases are in flight."""
+        delays = {tc.input: 0.01 for tc in dataset.test_cases}
+        plugin, state = self._make_plugin(delays)
+        
+        await engine._execute_test_cases(run, dataset, plugin, max_concurrency=3)
+        
+        assert state["peak"] == 3
+        assert len(run.responses) == len(dataset.test_cases)
+    
+    @pytest.mark.asyncio
+    async def test_preserves_dataset_order(self, engine, mock_repository, dataset, run):
+        """Test responses are recorded in dataset order, not completion order."""
+        # Earlier test cases finish last
+        delays = {
+            tc.input: 0.005 * (len(dataset.test_cases) - i)
+            for i, tc in enumerate(dataset.test_cases)
+        }
+        plugin, _ = self._make_plugin(delays)
+        
+        await engine._execute_test_cases(run, dataset, plugin, max_concurrency=6)
+        
+        expected_ids = [tc.id for tc in dataset.test_cases]
+        assert [r.test_case_id for r in run.responses] == expected_ids
+        recorded_ids = [
+            response.test_case_id
+            for call in mock_repository.add_responses.call_args_list
+            for response in call.args[1]
+        ]
+        assert recorded_ids == expected_ids
+    
+    @pytest.mark.asyncio
+    async def test_failure_does_not_stop_other_cases(self, engine, dataset, run):
+        """Test an exception in one test case is recorded as an error response."""
+        async def send_input(input_text):
+            if input_text == "Question 2":
+                raise RuntimeError("boom")
+            return ApplicationResponse(output="ok", latency=1.0)
+        
+        plugin = AsyncMock()
+        plugin.send_input.side_effect = send_input
+        
+        await engine._execute_test_cases(run, dataset, plugin, max_concurrency=4)
+        
+        assert len(run.responses) == len(dataset.test_cases)
+        assert run.responses[2].error == "Execution error: boom"
+        assert all(r.error is None for i, r in enumerate(run.responses) if i != 2)
+    
+    @pytest.mark.asyncio
+    async def test_requests_per_second_cap(self, engine, dataset, run):
+        """Test request starts are spaced by the requests-per-second cap."""
+        start_times = []
+        
+        async def send_input(input_text):
+            start_times.append(time.monotonic())
+            return ApplicationResponse(output="ok", latency=1.0)
+        
+        plugin = AsyncMock()
+        plugin.send_input.side_effect = send_input
+        
+        await engine._execute_test_cases(
+            run,
+            dataset,
+            plugin,
+            max_concurrency=6,
+            requests_per_second=100.0
+        )
+        
+        # 6 requests at 100/s need at least 5 intervals of 10ms
+        assert start_times[-1] - start_times[0] >= 0.045
+    
+    @pytest.mark.asyncio
+    async def test_progress_tracks_recorded_responses(self, engine, dataset, run):
+        """Test progress counts responses and failures as they are recorded."""
+        async def send_input(input_text):
+            if input_text == "Question 1":
+                return ApplicationResponse(output="", latency=0.0, error="HTTP 500")
+            return ApplicationResponse(output="ok", latency=5.0)
+        
+        plugin = AsyncMock()
+        plugin.send_input.side_effect = send_input
+        progress = RunProgress(run.id, run.customer_id)
+        
+        await engine._execute_test_cases(run, dataset, plugin, max_concurrency=3, progress=progress)
+        
+        snapshot = progress.snapshot()
+        assert snapshot["status"] == "running"
+        assert snapshot["total"] == 6
+        assert snapshot["completed"] == 6
+        assert snapshot["failed"] == 1
+        assert snapshot["latency_p95"] == 5.0
+    
+    @pytest.mark.asyncio
+    async def test_records_stage_timings(self, engine, dataset, run):
+        """Test target and record stages are timed for every test case."""
+        delays = {tc.input: 0.001 for tc in dataset.test_cases}
+        plugin, _ = self._make_plugin(delays)
+        before = STAGE_DURATION.summary()
+        
+        await engine._execute_test_cases(run, dataset, plugin, max_concurrency=3)
+        
+        after = STAGE_DURATION.summary()
+        for stage in ("target", "record"):
+            count = after[(stage,)][0] - before.get((stage,), (0, 0.0))[0]
+            assert count == len(dataset.test_cases)
+    
+    @pytest.mark.asyncio
+    async def test_response_cache_skips_repeated_inputs(self, mock_repository, dataset, run):
+        """Test cached inputs are flagged and not sent on a second run."""
+        profile = ApplicationProfile(
+            id="profile_test123",
+            customer_id="cust_test123",
+            name="Test Application",
+            type="chatbot",
+            connection_config=ConnectionConfig(endpoint="https://api.example.com/v1/chat")
+        )
+        engine = EvaluationEngine(
+            mock_repository,
+            MetricsCalculator(),
+            response_cache=ResponseCache(ttl_seconds=60, max_entries=100)
+        )
+        delays = {tc.input: 0.001 for tc in dataset.test_cases}
+        plugin, _ = self._make_plugin(delays)
+        
+        await engine._execute_test_cases(run, dataset, plugin, profile=profile)
+        second_run = run.model_copy(update={"id": "run_cached", "responses": []})
+        metrics = engine.calculator.start_run(dataset.test_cases)
+        await engine._execute_test_cases(
+            second_run, dataset, plugin, metrics=metrics, profile=profile
+        )
+        
+        assert plugin.send_input.call_count == len(dataset.test_cases)
+        assert all(r.cached for r in second_run.responses)
+        assert [r.test_case_id for r in second_run.responses] == [
+            tc.id for tc in dataset.test_cases
+        ]
+        # Cached responses never reached the application
+        assert metrics.result().average_latency == 0.0
+
+
+class TestEvaluationEngineBackgroundRuns:
+    """Test creating and executing runs in background mode."""
+    
+    @pytest.fixture
+    def mock_repository(self):
+        """Create mock repository."""
+        return AsyncMock()
+    
+    @pytest.fixture
+    def engine(self, mock_repository):
+        """Create evaluation engine instance."""
+        return EvaluationEngine(mock_repository)
+    
+    @pytest.fixture
+    def dataset(self):
+        """Create dataset with test cases."""
+        return Dataset(
+            id="dataset_background",
+            customer_id="cust_test123",
+            application_profile_id="profile_test123",
+            name="Background Dataset",
+            description="Dataset for background run tests",
+            file_path="datasets/cust_test123/background.csv",
+            test_cases=[
+                TestCase(id=f"tc_{i:03d}", input=f"Question {i}")
+                for i in range(3)
+            ]
+        )
+    
+    @pytest.fixture
+    def application_profile(self):
+        """Create test application profile."""
+        return ApplicationProfile(
+            id="profile_test123",
+            customer_id="cust_test123",
+            name="Test Application",
+            type="chatbot",
+            connection_config=ConnectionConfig(
+                endpoint="https://api.example.com/v1/chat",
+                timeout=30,
+                retries=3
+            )
+        )
+    
+    @pytest.fixture
+    def pending_run(self):
+        """Create pending evaluation run."""
+        return EvaluationRun(
+            id="run_background",
+            customer_id="cust_test123",
+            dataset_id="dataset_background",
+            application_profile_id="profile_test123",
+            status="pending",
+            responses=[]
+        )
+    
+    @pytest.mark.asyncio
+    async def test_create_pending_run(self, engine, mock_repository, dataset, application_profile):
+        """Test a background run is validated and created as pending without executing."""
+        mock_repository.get_dataset_by_id.return_value = dataset
+        mock_repository.get_application_profile_by_id.return_value = application_profile
+        mock_repository.create_evaluation_run.side_effect = lambda run: run
+        
+        run = await engine.create_pending_run("cust_test123", dataset.id, application_profile.id)
+        
+        assert run.status == "pending"
+        mock_repository.add_responses.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_create_pending_run_validates_customer(self, engine, mock_repository, dataset):
+        """Test a background run for another customer's dataset is rejected."""
+        mock_repository.get_dataset_by_id.return_value = None
+        
+        with pytest.raises(ValueError, match="not found"):
+            await engine.create_pending_run("cust_other", dataset.id, "profile_test123")
+        
+        mock_repository.create_evaluation_run.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_execute_pending_run_reports_progress(
+        self,
+        engine,
+        mock_repository,
+        dataset,
+        application_profile,
+        pending_run
+    ):
+        """Test executing a pending run marks it running and reports progress."""
+        mock_repository.get_dataset_by_id.return_value = dataset
+        mock_repository.get_application_profile_by_id.return_value = application_profile
+        mock_repository.update_evaluation_run.return_value = pending_run.model_copy(
+            update={"status": "completed"}
+        )
+        progress = RunProgress(pending_run.id, pending_run.customer_id)
+        
+        with patch("app.engine.evaluation_engine.HTTPPlugin") as mock_plugin_class:
+            mock_plugin = AsyncMock()
+            mock_plugin.send_input.return_value = ApplicationResponse(output="ok", latency=2.0)
+            mock_plugin_class.return_value = mock_plugin
+            
+            run = await engine.execute_pending_run(pending_run, progress)
+        
+        first_update = mock_repository.update_evaluation_run.call_args_list[0]
+        assert first_update.args[2] == {"status": "running"}
+        assert run.status == "completed"
+        assert progress.completed == 3
+        assert progress.total == 3
+    
+    @pytest.mark.asyncio
+    async def test_execute_pending_run_fails_when_dataset_removed(
+        self,
+        engine,
+        mock_repository,
+        pending_run
+    ):
+        """Test a queued run whose dataset was deleted is marked failed."""
+        mock_repository.get_dataset_by_id.return_value = None
+        
+        with pytest.raises(ValueError, match="not found"):
+            await engine.execute_pending_run(pending_run)
+        
+        update = mock_repository.update_evaluation_run.call_args.args[2]
+        assert update["status"] == "failed"
+    
+    @pytest.mark.asyncio
+    async def test_fail_pending_run(self, engine, mock_repository, pending_run):
+        """Test a queued run that will not execute is stored as failed."""
+        mock_repository.update_evaluation_run.return_value = pending_run.model_copy(
+            update={"status": "failed"}
+        )
+        
+        run = await engine.fail_pending_run(pending_run, "Evaluation worker stopped")
+        
+        assert run.status == "failed"
+        update = mock_repository.update_evaluation_run.call_args.args[2]
+        assert update["status"] == "failed"
+        assert update["end_time"] is not None
+    
+    @pytest.mark.asyncio
+    async def test_metrics_calculated_incrementally(
+        self,
+        mock_repository,
+        dataset,
+        application_profile,
+        pending_run
+    ):
+        """Test an engine with a calculator stores metrics with the responses and run."""
+        engine = EvaluationEngine(mock_repository, MetricsCalculator())
+        mock_repository.get_dataset_by_id.return_value = dataset
+        mock_repository.get_application_profile_by_id.return_value = application_profile
+        mock_repository.update_evaluation_run.return_value = pending_run.model_copy(
+            update={"status": "completed"}
+        )
+        
+        with patch("app.engine.evaluation_engine.HTTPPlugin") as mock_plugin_class:
+            mock_plugin = AsyncMock()
+            mock_plugin.send_input.return_value = ApplicationResponse(output="Question", latency=2.0)
+            mock_plugin_class.return_value = mock_plugin
+            
+            run = await engine.execute_pending_run(pending_run)
+        
+        persisted = [
+            response
+            for call in mock_repository.add_responses.call_args_list
+            for response in call.args[1]
+        ]
+        assert all(r.individual_metrics is not None for r in persisted)
+        
+        completion = mock_repository.update_evaluation_run.call_args.args[2]
+        assert completion["status"] == "completed"
+        assert completion["metrics"]["total_test_cases"] == 3
+        assert completion["metrics"]["average_latency"] == 2.0
+        assert len(run.responses) == 3
+
+
+class TestEvaluationEngineConnectToApplication:
+    """Test plugin selection for application profiles."""
+    
+    def make_profile(self, endpoint: str) -> ApplicationProfile:
+        """Create an application profile for the given endpoint."""
+        return ApplicationProfile(
+            id="profile_test123",
+            customer_id="cust_test123",
+            name="Test Application",
+            type="agent",
+            connection_config=ConnectionConfig(endpoint=endpoint),
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow()
+        )
+    
+    @pytest.mark.asyncio
+    async def test_websocket_endpoint_uses_websocket_plugin(self):
+        """Test ws:// and wss:// endpoints connect through the WebSocket plugin."""
+        engine = EvaluationEngine(AsyncMock())
+        
+        with patch("app.engine.evaluation_engine.WebSocketPlugin") as mock_ws_class, \
+                patch("app.engine.evaluation_engine.HTTPPlugin") as mock_http_class:
+            mock_ws_class.return_value = AsyncMock()
+            
+            plugin = await engine._connect_to_application(
+                self.make_profile("wss://agent.example.com/ws")
+            )
+        
+        assert plugin is mock_ws_class.return_value
+        plugin.connect.assert_awaited_once()
+        mock_http_class.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_http_endpoint_uses_http_plugin(self):
+        """Test HTTP endpoints keep using the HTTP plugin."""
+        engine = EvaluationEngine(AsyncMock())
+        
+        with patch("app.engine.evaluation_engine.WebSocketPlugin") as mock_ws_class, \
+                patch("app.engine.evaluation_engine.HTTPPlugin") as mock_http_class:
+            mock_http_class.return_value = AsyncMock()
+            
+            plugin = await engine._connect_to_application(
+                self.make_profile("https://agent.example.com/chat")
+            )
+        
+        assert plugin is mock_http_class.return_value
+        mock_ws_class.assert_not_called()
+
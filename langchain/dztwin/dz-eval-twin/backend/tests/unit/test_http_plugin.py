@@ -11,7 +11,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
-from app.connectors.http_plugin import HTTPPlugin
+from app.connectors.http_client_pool import HTTPClientPool
+from app.connectors.http_plugin import RETRY_BACKOFF_MAX_SECONDS, HTTPPlugin
 from app.connectors.plugin import ApplicationResponse
 from app.models.connection_config import ConnectionConfig
 
@@ -743,3 +744,167 @@ class TestHTTPPluginBuildHeaders:
         headers = plugin._build_headers(config)
         
         assert headers["Content-Type"] == "application/xml"
+
+
+class TestHTTPPluginClientPool:
+    """Test HTTP client pooling across plugin instances."""
+    
+    @pytest.fixture
+    async def pool(self):
+        """Create a client pool and close its clients afterwards."""
+        pool = HTTPClientPool()
+        yield pool
+        await pool.close_all()
+    
+    @pytest.fixture
+    def config(self):
+        """Create connection config."""
+        return ConnectionConfig(
+            endpoint="https://api.example.com/v1/chat",
+            timeout=30,
+            retries=3,
+            max_connections=8,
+            max_keepalive_connections=4,
+            keepalive_expiry=30.0
+        )
+    
+    async def _connect(self, pool, config):
+        """Connect a new plugin using the given pool."""
+        plugin = HTTPPlugin(client_pool=pool)
+        with patch.object(plugin, '_test_connection', new_callable=AsyncMock):
+            await plugin.connect(config)
+        return plugin
+    
+    @pytest.mark.asyncio
+    async def test_plugins_share_client_for_same_endpoint(self, pool, config):
+        """Test concurrent runs against one endpoint reuse a single client."""
+        first = await self._connect(pool, config)
+        second = await self._connect(pool, config)
+        
+        assert first._client is second._client
+        assert pool.size == 1
+        
+        await first.disconnect()
+        await second.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_different_settings_use_separate_clients(self, pool, config):
+        """Test clients are not shared between different headers."""
+        other_config = config.model_copy(update={"custom_headers": {"X-Tenant": "b"}})
+        
+        first = await self._connect(pool, config)
+        second = await self._connect(pool, other_config)
+        
+        assert first._client is not second._client
+        assert pool.size == 2
+        
+        await first.disconnect()
+        await second.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_released_client_is_reused_until_expiry(self, pool, config):
+        """Test an idle client is kept for the next run, then closed."""
+        plugin = await self._connect(pool, config)
+        client = plugin._client
+        await plugin.disconnect()
+        
+        assert not client.is_closed
+        
+        plugin = await self._connect(pool, config)
+        assert plugin._client is client
+        await plugin.disconnect()
+        
+        expired_config = config.model_copy(update={"keepalive_expiry": 0.0})
+        plugin = await self._connect(pool, expired_config)
+        expired_client = plugin._client
+        await plugin.disconnect()
+        plugin = await self._connect(pool, config)
+        
+        assert plugin._client is client
+        assert expired_client.is_closed
+        assert pool.size == 1
+        await plugin.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_client_uses_configured_limits(self, pool, config):
+        """Test connection limits come from the connection config."""
+        with patch('app.connectors.http_client_pool.httpx.AsyncClient') as mock_client:
+            plugin = await self._connect(pool, config)
+            
+            limits = mock_client.call_args.kwargs["limits"]
+            assert limits.max_connections == 8
+            assert limits.max_keepalive_connections == 4
+            assert limits.keepalive_expiry == 30.0
+            
+            await pool.release(plugin._client)
+            pool._clients.clear()
+    
+    @pytest.mark.asyncio
+    async def test_http2_falls_back_without_h2(self, pool, config):
+        """Test HTTP/2 is only enabled when the h2 package is available."""
+        http2_config = config.model_copy(update={"http2": True})
+        
+        with patch('app.connectors.http_client_pool.http2_available', return_value=False):
+            with patch('app.connectors.http_client_pool.httpx.AsyncClient') as mock_client:
+                await self._connect(pool, http2_config)
+                
+                assert mock_client.call_args.kwargs["http2"] is False
+                pool._clients.clear()
+    
+    @pytest.mark.asyncio
+    async def test_connect_failure_releases_client(self, pool, config):
+        """Test a failed connection test releases the pooled client."""
+        plugin = HTTPPlugin(client_pool=pool)
+        
+        with patch.object(plugin, '_test_connection', side_effect=ConnectionError("Test error")):
+            with pytest.raises(ConnectionError):
+                await plugin.connect(config)
+        
+        pooled = next(iter(pool._clients.values()))
+        assert pooled.references == 0
+    
+    @pytest.mark.asyncio
+    async def test_basic_auth_built_once_on_connect(self, pool):
+        """Test basic auth is created on connect and reused per request."""
+        config = ConnectionConfig(
+            endpoint="https://api.example.com/v1/chat",
+            authentication={"type": "basic", "username": "user", "password": "pass"},
+            retries=1
+        )
+        plugin = await self._connect(pool, config)
+        auth = plugin._auth
+        assert isinstance(auth, httpx.BasicAuth)
+        
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"output": "Success"}
+        mock_post = AsyncMock(return_value=mock_response)
+        
+        with patch.object(plugin._client, 'post', mock_post):
+            await plugin.send_input("First")
+            await plugin.send_input("Second")
+        
+        assert all(call.kwargs["auth"] is auth for call in mock_post.call_args_list)
+        await plugin.disconnect()
+        assert plugin._auth is None
+
+
+class TestHTTPPluginBackoff:
+    """Test jittered retry backoff."""
+    
+    def test_backoff_delay_is_jittered_within_window(self):
+        """Test delays fall within the exponential window."""
+        plugin = HTTPPlugin()
+        
+        for attempt in range(4):
+            delays = [plugin._backoff_delay(attempt) for _ in range(50)]
+            assert all(0 <= d <= 2 ** attempt for d in delays)
+            assert len(set(delays)) > 1
+    
+    def test_backoff_delay_is_capped(self):
+        """Test delays never exceed the maximum backoff."""
+        plugin = HTTPPlugin()
+        
+        assert all(
+            plugin._backoff_delay(20) <= RETRY_BACKOFF_MAX_SECONDS
+            for _ in range(50)
+        )
@@ -0,0 +1,109 @@
+"""Unit tests for timing instrumentation and the metrics endpoint."""
+
+import httpx
+import pytest
+
+from app.utils.instrumentation import (
+    CONTENT_TYPE,
+    HTTP_REQUEST_DURATION,
+    DB_OPERATION_DURATION,
+    Histogram,
+    MetricsRegistry,
+    timed_operation,
+)
+
+
+@pytest.fixture
+def histogram():
+    """Create a histogram with a few buckets."""
+    return Histogram("test_duration_seconds", "Test durations", ("stage",), buckets=(0.1, 1.0))
+
+
+# ==================== Histogram Tests ====================
+
+def test_histogram_renders_cumulative_buckets(histogram):
+    """Test observations render as cumulative buckets with sum and count."""
+    histogram.observe(0.05, stage="connect")
+    histogram.observe(0.5, stage="connect")
+    histogram.observe(5.0, stage="connect")
+
+    assert histogram.render() == [
+        "# HELP test_duration_seconds Test durations",
+        "# TYPE test_duration_seconds histogram",
+        'test_duration_seconds_bucket{stage="connect",le="0.1"} 1',
+        'test_duration_seconds_bucket{stage="connect",le="1.0"} 2',
+        'test_duration_seconds_bucket{stage="connect",le="+Inf"} 3',
+        'test_duration_seconds_sum{stage="connect"} 5.55',
+        'test_duration_seconds_count{stage="connect"} 3',
+    ]
+
+
+def test_histogram_escapes_label_values(histogram):
+    """Test quotes, backslashes and newlines in label values are escaped."""
+    histogram.observe(0.05, stage='a"b\\c\nd')
+
+    assert 'stage="a\\"b\\\\c\\nd"' in histogram.render()[2]
+
+
+def test_histogram_rejects_wrong_labels(histogram):
+    """Test observing with missing or unknown labels raises ValueError."""
+    with pytest.raises(ValueError, match="expects labels"):
+        histogram.observe(0.05)
+    with pytest.raises(ValueError, match="expects labels"):
+        histogram.observe(0.05, stage="connect", extra="x")
+
+
+def test_histogram_time_records_when_block_raises(histogram):
+    """Test a timed block is observed even if it raises."""
+    with pytest.raises(RuntimeError):
+        with histogram.time(stage="target"):
+            raise RuntimeError("boom")
+
+    assert histogram.summary()[("target",)][0] == 1
+
+
+def test_registry_renders_and_clears_histograms():
+    """Test the registry renders every histogram and clears observations."""
+    registry = MetricsRegistry()
+    first = registry.histogram("first_seconds", "First", ("stage",))
+    registry.histogram("second_seconds", "Second")
+    first.observe(0.01, stage="load")
+
+    text = registry.render()
+    assert "# TYPE first_seconds histogram" in text
+    assert "# TYPE second_seconds histogram" in text
+    assert 'first_seconds_count{stage="load"} 1' in text
+
+    registry.clear()
+    assert first.summary() == {}
+
+
+@pytest.mark.asyncio
+async def test_timed_operation_labels_by_function_name():
+    """Test timed operations are recorded under the function name."""
+    @timed_operation
+    async def load_things(value):
+        return value * 2
+
+    before = DB_OPERATION_DURATION.summary().get(("load_things",), (0, 0.0))[0]
+
+    assert await load_things(21) == 42
+    assert DB_OPERATION_DURATION.summary()[("load_things",)][0] == before + 1
+
+
+# ==================== Metrics Endpoint Tests ====================
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exposes_request_timings():
+    """Test /metrics serves the exposition including timed API requests."""
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/api/health")
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == CONTENT_TYPE
+    assert "# TYPE dz_eval_stage_duration_seconds histogram" in response.text
+    assert ("GET", "/api/health", "200") in HTTP_REQUEST_DURATION.summary()
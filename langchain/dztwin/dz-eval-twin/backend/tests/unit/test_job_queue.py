@@ -0,0 +1,212 @@
+"""Unit tests for the evaluation job queue and run progress tracking."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.engine.job_queue import EvaluationJobQueue
+from app.engine.progress import RunProgress
+from app.models.response import Response
+
+
+def make_response(latency: float, error: str = None) -> Response:
+    """Create a response with the given latency."""
+    return Response(
+        test_case_id="tc_001",
+        input="Question",
+        output="" if error else "Answer",
+        latency=latency,
+        timestamp=datetime.utcnow(),
+        error=error
+    )
+
+
+@pytest.fixture
+async def job_queue():
+    """Create a job queue and stop its workers afterwards."""
+    queue = EvaluationJobQueue(worker_count=2, latency_window=10)
+    yield queue
+    await queue.stop()
+
+
+class TestRunProgress:
+    """Test run progress tracking."""
+
+    @pytest.mark.asyncio
+    async def test_counts_and_percentiles(self):
+        """Test progress counts responses and reports latency percentiles."""
+        progress = RunProgress("run_1", "cust_1")
+        await progress.start(total=101)
+
+        for latency in range(1, 101):
+            await progress.record(make_response(float(latency)))
+        await progress.record(make_response(0.0, error="Timeout"))
+
+        snapshot = progress.snapshot()
+        assert snapshot["status"] == "running"
+        assert snapshot["total"] == 101
+        assert snapshot["completed"] == 101
+        assert snapshot["failed"] == 1
+        assert snapshot["latency_p50"] == 50.5
+        assert snapshot["latency_p95"] == 96.0
+        assert snapshot["latency_p99"] == 100.0
+
+    @pytest.mark.asyncio
+    async def test_latency_window_is_rolling(self):
+        """Test percentiles only use the most recent latencies."""
+        progress = RunProgress("run_1", "cust_1", latency_window=2)
+
+        for latency in (1000.0, 1.0, 2.0):
+            await progress.record(make_response(latency))
+
+        assert progress.snapshot()["latency_p99"] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_wait_for_update(self):
+        """Test waiters are woken by changes and time out otherwise."""
+        progress = RunProgress("run_1", "cust_1")
+        version = progress.version
+
+        assert await progress.wait_for_update(version, timeout=0.01) is False
+
+        waiter = asyncio.create_task(progress.wait_for_update(version, timeout=1.0))
+        await asyncio.sleep(0)
+        await progress.finish("completed")
+
+        assert await waiter is True
+        assert progress.is_finished
+
+
+class TestEvaluationJobQueue:
+    """Test background execution of evaluation jobs."""
+
+    @pytest.mark.asyncio
+    async def test_submitted_job_runs_in_background(self, job_queue):
+        """Test submit returns immediately and a worker executes the job."""
+        release = asyncio.Event()
+
+        async def job(progress):
+            await progress.start(total=1)
+            await release.wait()
+            await progress.record(make_response(10.0))
+
+        progress = job_queue.submit("run_1", "cust_1", job)
+        assert progress.status == "pending"
+
+        await asyncio.sleep(0.01)
+        assert progress.status == "running"
+
+        release.set()
+        await progress.wait_for_update(progress.version, timeout=1.0)
+        await asyncio.sleep(0.01)
+
+        assert progress.status == "completed"
+        assert progress.completed == 1
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_bounds_concurrency(self, job_queue):
+        """Test no more jobs run at once than there are workers."""
+        state = {"running": 0, "peak": 0}
+
+        async def job(progress):
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            await asyncio.sleep(0.01)
+            state["running"] -= 1
+
+        trackers = [job_queue.submit(f"run_{i}", "cust_1", job) for i in range(5)]
+
+        while not all(p.is_finished for p in trackers):
+            await asyncio.sleep(0.005)
+
+        assert state["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_job_marks_progress_failed(self, job_queue):
+        """Test an exception in a job is reported on its progress."""
+        async def job(progress):
+            raise ConnectionError("Application unavailable")
+
+        progress = job_queue.submit("run_1", "cust_1", job)
+        await progress.wait_for_update(progress.version, timeout=1.0)
+
+        assert progress.status == "failed"
+        assert progress.error == "Application unavailable"
+
+    @pytest.mark.asyncio
+    async def test_stop_fails_running_and_queued_runs(self):
+        """Test stopping the pool records running and queued runs as failed."""
+        queue = EvaluationJobQueue(worker_count=1)
+        aborted = {}
+
+        async def job(progress):
+            await progress.start(total=1)
+            await asyncio.Event().wait()
+
+        def make_abort(run_id):
+            async def abort(error_message):
+                aborted[run_id] = error_message
+            return abort
+
+        running = queue.submit("run_1", "cust_1", job, make_abort("run_1"))
+        queued = queue.submit("run_2", "cust_1", job, make_abort("run_2"))
+        await asyncio.sleep(0.01)
+        assert running.status == "running"
+
+        await queue.stop()
+
+        assert running.status == "failed"
+        assert queued.status == "failed"
+        assert aborted == {
+            "run_1": "Evaluation worker stopped",
+            "run_2": "Evaluation worker stopped before the run started"
+        }
+
+    @pytest.mark.asyncio
+    async def test_failing_abort_handler_does_not_block_stop(self):
+        """Test an abort handler error is logged and the remaining runs still fail."""
+        queue = EvaluationJobQueue(worker_count=1)
+
+        async def job(progress):
+            await asyncio.Event().wait()
+
+        async def abort(error_message):
+            raise RuntimeError("Database unavailable")
+
+        trackers = [queue.submit(f"run_{i}", "cust_1", job, abort) for i in range(3)]
+        await asyncio.sleep(0.01)
+
+        await queue.stop()
+
+        assert [p.status for p in trackers] == ["failed"] * 3
+
+    @pytest.mark.asyncio
+    async def test_get_progress_is_tenant_scoped(self, job_queue):
+        """Test progress is only visible to the customer that owns the run."""
+        async def job(progress):
+            pass
+
+        progress = job_queue.submit("run_1", "cust_1", job)
+
+        assert job_queue.get_progress("run_1", "cust_1") is progress
+        assert job_queue.get_progress("run_1", "cust_2") is None
+        assert job_queue.get_progress("run_unknown", "cust_1") is None
+
+    @pytest.mark.asyncio
+    async def test_finished_runs_are_pruned(self):
+        """Test only the most recent finished runs keep their progress."""
+        queue = EvaluationJobQueue(worker_count=1, max_finished=2)
+
+        async def job(progress):
+            pass
+
+        try:
+            trackers = [queue.submit(f"run_{i}", "cust_1", job) for i in range(4)]
+            while not all(p.is_finished for p in trackers):
+                await asyncio.sleep(0.005)
+        finally:
+            await queue.stop()
+
+        assert queue.get_progress("run_0", "cust_1") is None
+        assert queue.get_progress("run_3", "cust_1") is not None
@@ -330,6 +330,58 @@ class TestAggregateMetrics:
         assert metrics.median_latency == 150.0
         assert metrics.p95_latency == 200.0
     
+    def test_incremental_matches_batch(self, calculator, sample_responses, sample_test_cases):
+        """Test feeding responses one by one gives the same aggregates."""
+        accumulator = calculator.start_run(sample_test_cases)
+        for response in sample_responses:
+            accumulator.add(response, assign=False)
+        
+        incremental = accumulator.result()
+        batch = calculator.aggregate_metrics(sample_responses, sample_test_cases)
+        
+        assert incremental.model_dump() == pytest.approx(batch.model_dump())
+    
+    def test_incremental_assigns_individual_metrics(self, calculator, sample_responses, sample_test_cases):
+        """Test the accumulator scores responses like calculate_individual_metrics."""
+        accumulator = calculator.start_run(sample_test_cases)
+        for response in sample_responses:
+            accumulator.add(response)
+        
+        for response, test_case in zip(sample_responses, sample_test_cases):
+            expected = calculator.calculate_individual_metrics(response, test_case.expected_output)
+            assert response.individual_metrics == expected
+    
+    def test_incremental_skips_failures_and_unknown_test_cases(self, calculator, sample_test_cases):
+        """Test failed responses are not scored and unknown test cases get no metrics."""
+        accumulator = calculator.start_run(sample_test_cases)
+        failed = Response(
+            test_case_id="tc_001",
+            input="What is 2+2?",
+            output="",
+            latency=0.0,
+            timestamp=datetime.utcnow(),
+            error="Timeout"
+        )
+        unknown = Response(
+            test_case_id="tc_999",
+            input="What is 2+2?",
+            output="4",
+            latency=10.0,
+            timestamp=datetime.utcnow()
+        )
+        
+        assert accumulator.add(failed) is None
+        assert accumulator.add(unknown).relevance == 0.0
+        
+        assert failed.individual_metrics is None
+        assert unknown.individual_metrics is None
+        assert accumulator.result().failed_test_cases == 1
+    
+    def test_incremental_empty_raises_error(self, calculator):
+        """Test results cannot be taken before any response is added."""
+        with pytest.raises(ValueError, match="empty"):
+            calculator.start_run([]).result()
+    
     def test_aggregate_with_failures(self, calculator):
         """Test aggregation with failed responses."""
         responses = [
@@ -425,6 +477,28 @@ class TestAggregateMetrics:
         # P95 should be around 940 (95th percentile of 0-990)
         assert 930.0 <= metrics.p95_latency <= 950.0
     
+    def test_aggregate_excludes_cached_latency(self, calculator):
+        """Test cached responses count as results but not towards latency."""
+        responses = [
+            Response(
+                test_case_id=f"tc_{i:03d}",
+                input=f"test{i}",
+                output=f"result{i}",
+                latency=latency,
+                timestamp=datetime.utcnow(),
+                cached=cached
+            )
+            for i, (latency, cached) in enumerate([(100.0, False), (300.0, False), (100.0, True)])
+        ]
+        
+        metrics = calculator.aggregate_metrics(responses)
+        
+        assert metrics.total_test_cases == 3
+        assert metrics.success_rate == 1.0
+        assert metrics.average_latency == 200.0
+        assert metrics.median_latency == 200.0
+        assert metrics.p95_latency == 300.0
+    
     def test_aggregate_all_failures(self, calculator):
         """Test aggregation when all responses failed."""
         responses = [
@@ -0,0 +1,181 @@
+"""Unit tests for response caching and in-run input deduplication."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from app.engine.response_cache import (
+    ResponseCache,
+    RunResponseReuse,
+    make_cache_key,
+    normalize_input,
+)
+from app.models.application_profile import ApplicationProfile
+from app.models.connection_config import ConnectionConfig
+from app.models.response import Response
+from app.models.test_case import TestCase
+
+
+@pytest.fixture
+def profile():
+    """Create an application profile."""
+    return ApplicationProfile(
+        id="profile_test123",
+        customer_id="cust_test123",
+        name="Test Application",
+        type="chatbot",
+        connection_config=ConnectionConfig(endpoint="https://api.example.com/v1/chat"),
+        updated_at=datetime(2024, 1, 1)
+    )
+
+
+def make_response(test_case_id="tc_001", output="Answer", latency=100.0, error=None):
+    """Create a response received from the application."""
+    return Response(
+        test_case_id=test_case_id,
+        input="Question",
+        output=output,
+        latency=latency,
+        timestamp=datetime.utcnow(),
+        error=error
+    )
+
+
+# ==================== Cache Key Tests ====================
+
+def test_normalize_input_collapses_whitespace():
+    """Test surrounding and repeated whitespace is ignored but case is kept."""
+    assert normalize_input("  What is\tAI?\n ") == "What is AI?"
+    assert normalize_input("What is AI?") != normalize_input("what is ai?")
+
+
+def test_cache_key_includes_profile_version(profile):
+    """Test updating the profile changes the cache key."""
+    key = make_cache_key(profile, "What is AI?")
+    updated = profile.model_copy(update={"updated_at": profile.updated_at + timedelta(seconds=1)})
+
+    assert make_cache_key(profile, " What  is AI? ") == key
+    assert make_cache_key(updated, "What is AI?") != key
+
+
+# ==================== Response Cache Tests ====================
+
+def test_cache_returns_stored_response(profile):
+    """Test a stored response is returned and counted as a hit."""
+    cache = ResponseCache(ttl_seconds=60, max_entries=10)
+    key = make_cache_key(profile, "Question")
+
+    assert cache.get(key) is None
+    cache.put(key, make_response())
+
+    assert cache.get(key).output == "Answer"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_expires_entries(profile):
+    """Test entries are not returned after their TTL."""
+    cache = ResponseCache(ttl_seconds=10, max_entries=10)
+    key = make_cache_key(profile, "Question")
+
+    with patch("app.engine.response_cache.time.monotonic", return_value=100.0):
+        cache.put(key, make_response())
+    with patch("app.engine.response_cache.time.monotonic", return_value=110.0):
+        assert cache.get(key) is None
+
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used(profile):
+    """Test the least recently used entry is evicted when full."""
+    cache = ResponseCache(ttl_seconds=60, max_entries=2)
+    keys = [make_cache_key(profile, f"Question {i}") for i in range(3)]
+
+    cache.put(keys[0], make_response())
+    cache.put(keys[1], make_response())
+    cache.get(keys[0])
+    cache.put(keys[2], make_response())
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_cache_skips_failed_responses(profile):
+    """Test error responses are never cached."""
+    cache = ResponseCache(ttl_seconds=60, max_entries=10)
+    key = make_cache_key(profile, "Question")
+
+    cache.put(key, make_response(output="", error="HTTP 500"))
+
+    assert len(cache) == 0
+
+
+# ==================== Run Response Reuse Tests ====================
+
+@pytest.mark.asyncio
+async def test_reuse_flags_cache_hits(profile):
+    """Test a cache hit is returned as a cached response without sending."""
+    cache = ResponseCache(ttl_seconds=60, max_entries=10)
+    cache.put(make_cache_key(profile, "Question"), make_response(latency=250.0))
+    reuse = RunResponseReuse(profile, cache)
+    sent = []
+
+    async def send(test_case):
+        sent.append(test_case.id)
+        return make_response(test_case.id)
+
+    response = await reuse.execute(TestCase(id="tc_002", input="Question"), send)
+
+    assert sent == []
+    assert response.cached is True
+    assert response.test_case_id == "tc_002"
+    assert response.latency == 250.0
+    assert reuse.reused_count == 1
+
+
+@pytest.mark.asyncio
+async def test_reuse_deduplicates_concurrent_inputs(profile):
+    """Test identical inputs within a run are sent only once."""
+    reuse = RunResponseReuse(profile, deduplicate=True)
+    sent = []
+
+    async def send(test_case):
+        sent.append(test_case.id)
+        await asyncio.sleep(0.01)
+        return make_response(test_case.id)
+
+    test_cases = [
+        TestCase(id="tc_001", input="Question"),
+        TestCase(id="tc_002", input=" Question "),
+        TestCase(id="tc_003", input="Other question"),
+    ]
+    responses = await asyncio.gather(*(reuse.execute(tc, send) for tc in test_cases))
+
+    assert sent == ["tc_001", "tc_003"]
+    assert [r.test_case_id for r in responses] == ["tc_001", "tc_002", "tc_003"]
+    assert [r.cached for r in responses] == [False, True, False]
+
+
+@pytest.mark.asyncio
+async def test_reuse_sends_again_after_failed_response(profile):
+    """Test a failed first occurrence is not reused by waiting duplicates."""
+    reuse = RunResponseReuse(profile, deduplicate=True)
+    sent = []
+
+    async def send(test_case):
+        sent.append(test_case.id)
+        await asyncio.sleep(0.01)
+        if test_case.id == "tc_001":
+            return make_response(test_case.id, output="", error="HTTP 500")
+        return make_response(test_case.id)
+
+    responses = await asyncio.gather(
+        reuse.execute(TestCase(id="tc_001", input="Question"), send),
+        reuse.execute(TestCase(id="tc_002", input="Question"), send),
+    )
+
+    assert sent == ["tc_001", "tc_002"]
+    assert responses[1].error is None
+    assert responses[1].cached is False
@@ -0,0 +1,117 @@
+"""Unit tests for BufferedResponseWriter."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.database.response_writer import BufferedResponseWriter
+from app.models.response import Response
+
+
+def make_response(index: int) -> Response:
+    """Create a response for the given test case index."""
+    return Response(
+        test_case_id=f"tc_{index:03d}",
+        input=f"Question {index}",
+        output=f"Answer {index}",
+        latency=10.0,
+        timestamp=datetime.utcnow()
+    )
+
+
+def written_ids(mock_repository) -> list:
+    """Collect test case IDs from all add_responses calls in order."""
+    return [
+        response.test_case_id
+        for call in mock_repository.add_responses.call_args_list
+        for response in call.args[1]
+    ]
+
+
+@pytest.fixture
+def mock_repository():
+    """Create mock repository."""
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_size_reached(mock_repository):
+    """Test a full batch is written in a single call."""
+    writer = BufferedResponseWriter(mock_repository, "run_123", batch_size=3, flush_interval=60)
+
+    for i in range(3):
+        await writer.add(make_response(i))
+
+    mock_repository.add_responses.assert_called_once()
+    assert written_ids(mock_repository) == ["tc_000", "tc_001", "tc_002"]
+    assert writer.pending_count == 0
+    assert writer.flushed_count == 3
+
+
+@pytest.mark.asyncio
+async def test_buffers_below_batch_size(mock_repository):
+    """Test responses stay buffered until a threshold is reached."""
+    writer = BufferedResponseWriter(mock_repository, "run_123", batch_size=10, flush_interval=60)
+
+    await writer.add(make_response(0))
+
+    mock_repository.add_responses.assert_not_called()
+    assert writer.pending_count == 1
+
+
+@pytest.mark.asyncio
+async def test_final_flush_on_exit(mock_repository):
+    """Test leaving the context writes remaining responses."""
+    async with BufferedResponseWriter(
+        mock_repository, "run_123", batch_size=10, flush_interval=60
+    ) as writer:
+        for i in range(4):
+            await writer.add(make_response(i))
+
+    assert written_ids(mock_repository) == ["tc_000", "tc_001", "tc_002", "tc_003"]
+
+
+@pytest.mark.asyncio
+async def test_flushes_on_interval(mock_repository):
+    """Test buffered responses are written after the flush interval."""
+    async with BufferedResponseWriter(
+        mock_repository, "run_123", batch_size=10, flush_interval=0.01
+    ) as writer:
+        await writer.add(make_response(0))
+        await asyncio.sleep(0.05)
+
+        mock_repository.add_responses.assert_called_once()
+        assert writer.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_is_retried_in_order(mock_repository):
+    """Test a failed batch is kept and retried ahead of newer responses."""
+    mock_repository.add_responses.side_effect = [RuntimeError("Database error"), None]
+    writer = BufferedResponseWriter(mock_repository, "run_123", batch_size=2, flush_interval=60)
+
+    await writer.add(make_response(0))
+    await writer.add(make_response(1))
+    assert writer.pending_count == 2
+
+    await writer.add(make_response(2))
+
+    assert mock_repository.add_responses.call_count == 2
+    assert [r.test_case_id for r in mock_repository.add_responses.call_args.args[1]] == [
+        "tc_000", "tc_001", "tc_002"
+    ]
+    assert writer.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_final_flush_failure_raises(mock_repository):
+    """Test an error during the final flush is propagated."""
+    mock_repository.add_responses.side_effect = RuntimeError("Database error")
+
+    with pytest.raises(RuntimeError, match="Database error"):
+        async with BufferedResponseWriter(
+            mock_repository, "run_123", batch_size=10, flush_interval=60
+        ) as writer:
+            await writer.add(make_response(0))
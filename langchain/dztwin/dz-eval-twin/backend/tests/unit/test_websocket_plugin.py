@@ -734,3 +734,158 @@ class TestWebSocketPluginBuildHeaders:
         
         # Custom header should override auth header
         assert headers["Authorization"] == "Custom auth"
+
+
+class FakeWebSocket:
+    """In-memory WebSocket that lets tests reply to sent messages."""
+    
+    def __init__(self):
+        self.open = True
+        self.sent = []
+        self.close = AsyncMock()
+        self._incoming = asyncio.Queue()
+        self._sent_event = asyncio.Event()
+    
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+        self._sent_event.set()
+    
+    async def recv(self):
+        message = await self._incoming.get()
+        if isinstance(message, Exception):
+            raise message
+        return message
+    
+    def reply(self, message):
+        self._incoming.put_nowait(message)
+    
+    async def wait_for_sent(self, count):
+        while len(self.sent) < count:
+            self._sent_event.clear()
+            await self._sent_event.wait()
+
+
+class TestWebSocketPluginMultiplexing:
+    """Test concurrent requests over correlation ids and socket pools."""
+    
+    async def connect(self, sockets, **config_overrides):
+        """Connect a plugin whose sockets are the given fakes."""
+        plugin = WebSocketPlugin()
+        config = ConnectionConfig(
+            endpoint="wss://api.example.com/v1/chat",
+            websocket_connections=len(sockets),
+            **config_overrides
+        )
+        with patch('websockets.connect', AsyncMock(side_effect=sockets)):
+            await plugin.connect(config)
+        return plugin
+    
+    @pytest.mark.asyncio
+    async def test_out_of_order_replies_are_correlated(self):
+        """Test replies are routed to their request by correlation id."""
+        socket = FakeWebSocket()
+        plugin = await self.connect([socket])
+        
+        tasks = [
+            asyncio.create_task(plugin.send_input(f"Question {i}"))
+            for i in range(3)
+        ]
+        await socket.wait_for_sent(3)
+        
+        for sent in reversed(socket.sent):
+            socket.reply(json.dumps({"id": sent["id"], "output": f"Answer to {sent['input']}"}))
+        
+        responses = await asyncio.gather(*tasks)
+        
+        assert [r.output for r in responses] == [f"Answer to Question {i}" for i in range(3)]
+        assert len({sent["id"] for sent in socket.sent}) == 3
+        await plugin.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_late_reply_for_timed_out_request_is_dropped(self):
+        """Test a reply arriving after its request timed out is not misrouted."""
+        socket = FakeWebSocket()
+        plugin = await self.connect([socket], timeout=1)
+        
+        with patch('app.connectors.websocket_plugin.asyncio.wait_for') as mock_wait_for:
+            async def expire_replies(awaitable, timeout):
+                if isinstance(awaitable, asyncio.Future):
+                    raise asyncio.TimeoutError()
+                return await awaitable
+            mock_wait_for.side_effect = expire_replies
+            
+            timed_out = await plugin.send_input("Slow question")
+        
+        assert "timeout" in timed_out.error.lower()
+        
+        task = asyncio.create_task(plugin.send_input("Next question"))
+        await socket.wait_for_sent(2)
+        socket.reply(json.dumps({"id": socket.sent[0]["id"], "output": "Stale answer"}))
+        socket.reply(json.dumps({"id": socket.sent[1]["id"], "output": "Fresh answer"}))
+        
+        assert (await task).output == "Fresh answer"
+        await plugin.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_requests_spread_over_socket_pool(self):
+        """Test in-flight requests go to the least busy pooled socket."""
+        sockets = [FakeWebSocket(), FakeWebSocket()]
+        plugin = await self.connect(sockets)
+        
+        tasks = [
+            asyncio.create_task(plugin.send_input(f"Question {i}"))
+            for i in range(4)
+        ]
+        for socket in sockets:
+            await socket.wait_for_sent(2)
+            for sent in socket.sent:
+                socket.reply(json.dumps({"id": sent["id"], "output": sent["input"]}))
+        
+        responses = await asyncio.gather(*tasks)
+        
+        assert [r.output for r in responses] == [f"Question {i}" for i in range(4)]
+        assert [len(socket.sent) for socket in sockets] == [2, 2]
+        
+        await plugin.disconnect()
+        for socket in sockets:
+            socket.close.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_closed_socket_fails_in_flight_requests(self):
+        """Test losing the connection fails every waiting request."""
+        socket = FakeWebSocket()
+        plugin = await self.connect([socket])
+        
+        tasks = [
+            asyncio.create_task(plugin.send_input(f"Question {i}"))
+            for i in range(2)
+        ]
+        await socket.wait_for_sent(2)
+        socket.reply(ConnectionClosed(None, None))
+        
+        responses = await asyncio.gather(*tasks)
+        
+        assert all("connection closed" in r.error.lower() for r in responses)
+        assert not plugin.is_connected()
+        await plugin.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_failed_pool_connect_closes_opened_sockets(self):
+        """Test a pool that cannot be fully opened closes its sockets."""
+        socket = FakeWebSocket()
+        plugin = WebSocketPlugin()
+        config = ConnectionConfig(
+            endpoint="wss://api.example.com/v1/chat",
+            retries=0,
+            websocket_connections=2
+        )
+        mock_connect = AsyncMock(side_effect=[socket, WebSocketException("Connection failed")])
+        
+        with patch('websockets.connect', mock_connect):
+            with pytest.raises(ConnectionError, match="Failed to connect"):
+                await plugin.connect(config)
+        
+        socket.close.assert_called_once()
+        assert plugin._websocket is None
+        assert not plugin.is_connected()
+
@@ -45,7 +45,7 @@ async def route_request(request: Request, background_tasks: BackgroundTasks):
         bedrock_agent_client = clients["bedrock_agent_client"]
         
         if client_session_id:
-            if client_session_id in conversation_memory.conversations:
+            if conversation_memory.has_session(client_session_id):
                 session_id = client_session_id
                 logger.info(f"Reusing session: {session_id}")
                 
@@ -108,6 +108,10 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     global mcp_processes
+    logger.info("Closing MCP client sessions")
+    from app.libs.mcp_client_factory import mcp_client_pool
+    await mcp_client_pool.close()
+
     logger.info("Shutting down MCP servers")
 
     for server_name, process in mcp_processes.items():
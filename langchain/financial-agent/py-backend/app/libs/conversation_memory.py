@@ -2,8 +2,10 @@ import logging
 import json
 import uuid
 import base64
+import threading
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
+from app.libs.conversation_store import create_conversation_store, blob_digest
 
 logger = logging.getLogger(__name__)
 
@@ -18,64 +20,40 @@ class ConversationMemoryManager:
     
     def _initialize(self):
         """Initialize the conversation memory manager."""
-        self.conversations = {} 
-        self.files = {} 
-        self.active_sessions = set()  
         self.session_expiry_seconds = 3600
+        self.cleanup_interval_seconds = 300
         self.max_messages_per_conversation = 50
         self.sliding_window_size = 30  # Keep only the most recent 30 messages
-        logger.info("ConversationMemoryManager initialized")
+        self.store = create_conversation_store(window_size=self.sliding_window_size)
+        self._start_cleanup_timer()
+        logger.info(f"ConversationMemoryManager initialized with {type(self.store).__name__}")
     
-    def _apply_sliding_window(self, session_id: str) -> None:
-        """Apply sliding window to keep only the most recent messages."""
-        if session_id not in self.conversations:
-            return
-            
-        messages = self.conversations[session_id]["messages"]
-        if len(messages) <= self.sliding_window_size:
-            return
-            
-        # Separate system messages from other messages
-        system_messages = []
-        other_messages = []
-        
-        for msg in messages:
-            if msg.get('role') == 'system':
-                system_messages.append(msg)
-            else:
-                other_messages.append(msg)
+    def _start_cleanup_timer(self) -> None:
+        """Expire inactive sessions periodically on a daemon thread."""
+        def run():
+            while not self._stop_cleanup.wait(self.cleanup_interval_seconds):
+                try:
+                    self.cleanup_expired_sessions()
+                except Exception as e:
+                    logger.error(f"Error cleaning up expired sessions: {str(e)}")
         
-        # Keep all system messages + most recent user/assistant messages
-        if len(other_messages) > self.sliding_window_size:
-            # Keep the most recent messages within the window
-            recent_messages = other_messages[-self.sliding_window_size:]
-            self.conversations[session_id]["messages"] = system_messages + recent_messages
-            
-            removed_count = len(other_messages) - self.sliding_window_size
-            logger.info(f"Applied sliding window to session {session_id}: removed {removed_count} old messages, kept {len(recent_messages)} recent + {len(system_messages)} system messages")
+        self._stop_cleanup = threading.Event()
+        threading.Thread(target=run, name="conversation-memory-cleanup", daemon=True).start()
     
     def ensure_session_exists(self, session_id: str) -> bool:
-        if session_id in self.conversations:
-            return True
-            
-        self.conversations[session_id] = {
-            "messages": [],
-            "metadata": {
-                "created_at": datetime.now().isoformat(),
-                "last_updated": datetime.now().isoformat(),
-                "message_count": 0,
-                "turn_count": 0
-            }
-        }
-        
-        logger.info(f"Initialized conversation memory for session: {session_id}")
+        if self.store.create_session(session_id):
+            logger.info(f"Initialized conversation memory for session: {session_id}")
         return True
     
+    def has_session(self, session_id: str) -> bool:
+        return self.store.has_session(session_id)
+    
     def add_user_message(self, session_id: str, content: str, file_data: Optional[Dict[str, Any]] = None) -> bool:
         if not self._validate_session(session_id):
             return False
                 
         message_content = []
+        blobs = {}
         if content:
             message_content.append({"text": content})
         
@@ -87,32 +65,20 @@ class ConversationMemoryManager:
                 try:
                     image_bytes = base64.b64decode(image_bytes)
                 except:
-                    pass
+                    image_bytes = image_bytes.encode("utf-8")
             
+            # The image is stored once by content hash and resolved when the history is read
+            digest = blob_digest(image_bytes)
+            blobs[digest] = image_bytes
             message_content.append({
                 "image": {
                     "format": "png",
                     "source": {
-                        "bytes": image_bytes
+                        "blob": digest
                     },
                     "id": image_id 
                 }
             })
-            
-            if session_id not in self.files:
-                self.files[session_id] = []
-            
-            self.files[session_id].append({
-                "name": image_id,
-                "source": {
-                    "byteContent": {
-                        "data": image_bytes,
-                        "mediaType": "image/png"
-                    },
-                    "sourceType": "BYTE_CONTENT"
-                },
-                "useCase": "CHAT"
-            })
         
         message = {
             "role": "user",
@@ -120,12 +86,7 @@ class ConversationMemoryManager:
             "timestamp": datetime.now().isoformat()
         }
         
-        self.conversations[session_id]["messages"].append(message)
-        self._update_session_metadata(session_id, increment_turn=True)
-        
-        # Apply sliding window after adding message
-        self._apply_sliding_window(session_id)
-        
+        self._append_message(session_id, message, blobs, increment_turn=True)
         return True
 
     
@@ -140,11 +101,7 @@ class ConversationMemoryManager:
             "metadata": {"source": source}
         }
         
-        self.conversations[session_id]["messages"].append(message)
-        self._update_session_metadata(session_id, increment_turn=True)
-        
-        # Apply sliding window after adding message
-        self._apply_sliding_window(session_id)
+        self._append_message(session_id, message, increment_turn=True)
         
         logger.debug(f"Added assistant message from {source} to session {session_id}: {content[:50]}...")
         return True
@@ -155,7 +112,7 @@ class ConversationMemoryManager:
         if not self._validate_session(session_id):
             return {"conversationHistory": {"messages": []}}
         
-        all_messages = self.conversations[session_id]["messages"]
+        all_messages = self.store.get_session(session_id)["messages"]
 
         processed_messages = []
         current_role = None
@@ -208,8 +165,7 @@ class ConversationMemoryManager:
             "metadata": {"type": "tool_usage", "tool": tool_name}
         }
         
-        self.conversations[session_id]["messages"].append(message)
-        self._update_session_metadata(session_id)
+        self._append_message(session_id, message)
         logger.debug(f"Added tool usage message to session {session_id}: {tool_name}")
         return True
     
@@ -232,16 +188,17 @@ class ConversationMemoryManager:
             "metadata": {"type": "tool_result", "tool": tool_name}
         }
         
-        self.conversations[session_id]["messages"].append(message)
-        self._update_session_metadata(session_id)
+        self._append_message(session_id, message)
         logger.debug(f"Added tool result message to session {session_id} from {tool_name}")
         return True
     
     def get_conversation_history(self, session_id: str, max_messages: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
-        if not self._validate_session(session_id):
+        session = self.store.get_session(session_id)
+        if session is None:
+            logger.warning(f"Session {session_id} not found")
             return {"messages": []}
         
-        messages = self.conversations[session_id]["messages"]
+        messages = session["messages"]
         
         # Apply message limit if specified
         if max_messages and len(messages) > max_messages:
@@ -254,63 +211,49 @@ class ConversationMemoryManager:
             # Strip internal metadata before sending to Bedrock
             cleaned_msg = {
                 "role": msg["role"],
-                "content": msg["content"]
+                "content": self._resolve_content(msg["content"])
             }
             history["messages"].append(cleaned_msg)
             
         return history
 
     def get_raw_conversation(self, session_id: str) -> Dict[str, Any]:
-        if not self._validate_session(session_id):
+        session = self.store.get_session(session_id)
+        if session is None:
+            logger.warning(f"Session {session_id} not found")
             return {"messages": [], "metadata": {}}
-            
-        return self.conversations[session_id]
+        
+        session["messages"] = [
+            {**msg, "content": self._resolve_content(msg["content"])}
+            for msg in session["messages"]
+        ]
+        return session
     
     def clear_conversation(self, session_id: str) -> bool:
-        if not self._validate_session(session_id):
+        if not self.store.trim_messages(session_id, 0, reset_turns=True):
+            logger.warning(f"Session {session_id} not found")
             return False
-            
-        metadata = self.conversations[session_id]["metadata"].copy()
-        metadata["last_updated"] = datetime.now().isoformat()
-        metadata["message_count"] = 0
-        metadata["turn_count"] = 0
-        
-        self.conversations[session_id] = {
-            "messages": [],
-            "metadata": metadata
-        }
         
         logger.info(f"Cleared conversation for session {session_id}")
         return True
     
     def delete_session(self, session_id: str) -> bool:
-        if session_id not in self.conversations:
+        if not self.store.delete_session(session_id):
             logger.warning(f"Session {session_id} not found for deletion")
             return False
             
-        del self.conversations[session_id]
-        
-        if session_id in self.active_sessions:
-            self.active_sessions.remove(session_id)
-            
         logger.info(f"Deleted session {session_id}")
         return True
     
     def trim_conversation(self, session_id: str, max_messages: Optional[int] = None) -> bool:
-        if not self._validate_session(session_id):
-            return False
-            
         if max_messages is None:
             max_messages = self.max_messages_per_conversation
             
-        messages = self.conversations[session_id]["messages"]
+        if not self.store.trim_messages(session_id, max_messages):
+            logger.warning(f"Session {session_id} not found")
+            return False
         
-        if len(messages) > max_messages:
-            # Keep only the most recent messages
-            self.conversations[session_id]["messages"] = messages[-max_messages:]
-            self._update_session_metadata(session_id)
-            logger.info(f"Trimmed session {session_id} to {max_messages} messages")
-            
+        logger.info(f"Trimmed session {session_id} to at most {max_messages} messages")
         return True
     
     def set_max_messages(self, max_messages: int) -> None:
@@ -321,38 +264,18 @@ class ConversationMemoryManager:
         if max_age_seconds is None:
             max_age_seconds = self.session_expiry_seconds
             
-        now = datetime.now()
-        sessions_to_delete = []
-        
-        for session_id, conversation in self.conversations.items():
-            last_updated_str = conversation["metadata"].get("last_updated")
-            if not last_updated_str:
-                continue
-                
-            try:
-                last_updated = datetime.fromisoformat(last_updated_str)
-                age_seconds = (now - last_updated).total_seconds()
-                
-                if age_seconds > max_age_seconds:
-                    sessions_to_delete.append(session_id)
-            except ValueError:
-                logger.error(f"Invalid timestamp format in session {session_id}: {last_updated_str}")
-                
-        for session_id in sessions_to_delete:
-            self.delete_session(session_id)
+        expired = self.store.expire_sessions(max_age_seconds)
             
-        if sessions_to_delete:
-            logger.info(f"Cleaned up {len(sessions_to_delete)} expired sessions")
+        if expired:
+            logger.info(f"Cleaned up {len(expired)} expired sessions")
             
-        return len(sessions_to_delete)
+        return len(expired)
 
     def get_session_stats(self) -> Dict[str, Any]:
-        stats = {
-            "total_sessions": len(self.conversations),
-            "active_sessions": len(self.active_sessions),
-            "total_messages": sum(conv["metadata"].get("message_count", 0) for conv in self.conversations.values()),
-            "average_messages_per_session": 0
-        }
+        stats = self.store.stats()
+        # Expired sessions are removed, so every stored session is active
+        stats["active_sessions"] = stats["total_sessions"]
+        stats["average_messages_per_session"] = 0
         
         if stats["total_sessions"] > 0:
             stats["average_messages_per_session"] = stats["total_messages"] / stats["total_sessions"]
@@ -360,20 +283,37 @@ class ConversationMemoryManager:
         return stats
     
     def _validate_session(self, session_id: str) -> bool:
-        if session_id not in self.conversations:
+        if not self.store.has_session(session_id):
             logger.warning(f"Session {session_id} not found")
             return False
             
         return True
     
-    def _update_session_metadata(self, session_id: str, increment_turn: bool = False) -> None:
-        if session_id in self.conversations:
-            metadata = self.conversations[session_id]["metadata"]
-            metadata["last_updated"] = datetime.now().isoformat()
-            metadata["message_count"] = len(self.conversations[session_id]["messages"])
-            
-            if increment_turn:
-                metadata["turn_count"] = metadata.get("turn_count", 0) + 1
+    def _append_message(
+        self,
+        session_id: str,
+        message: Dict[str, Any],
+        blobs: Optional[Dict[str, bytes]] = None,
+        increment_turn: bool = False
+    ) -> None:
+        """Store a message, letting the store apply the sliding window and byte budget."""
+        evicted = self.store.append_message(session_id, message, blobs, increment_turn)
+        if evicted:
+            logger.info(f"Applied sliding window to session {session_id}: removed {evicted} old messages")
+    
+    def _resolve_content(self, content: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Replace file references in message content with the stored bytes."""
+        resolved = []
+        for block in content:
+            source = block.get("image", {}).get("source", {}) if isinstance(block, dict) else {}
+            if "blob" in source:
+                data = self.store.get_blob(source["blob"])
+                if data is None:
+                    logger.warning(f"File {source['blob']} of a message is no longer stored")
+                    continue
+                block = {"image": {**block["image"], "source": {"bytes": data}}}
+            resolved.append(block)
+        return resolved
 
 # Create singleton instance
 conversation_memory = ConversationMemoryManager()
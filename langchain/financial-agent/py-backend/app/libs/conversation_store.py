@@ -0,0 +1,500 @@
+"""
+Storage backends for conversation memory.
+
+A store keeps each session's metadata and a window of its most recent
+messages, bounded by a message count and a byte budget. System messages
+are always kept. Files attached to messages (e.g. uploaded images) are
+stored out of line by content hash, shared between messages and sessions,
+and deleted once no message references them.
+
+Backends:
+
+- "memory" (default): an in-process LRU of sessions
+- "sqlite": a SQLite file (CONVERSATION_DB) shared by all worker processes
+  on the host
+
+Set CONVERSATION_STORE to choose the backend.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Messages kept per session, besides system messages
+DEFAULT_WINDOW_SIZE = 30
+# Bytes of messages and attached files kept per session
+DEFAULT_MAX_SESSION_BYTES = 8 * 1024 * 1024
+# Sessions and total bytes kept by the in-memory store
+DEFAULT_MAX_SESSIONS = 1000
+DEFAULT_MAX_TOTAL_BYTES = 256 * 1024 * 1024
+
+
+def blob_digest(data: bytes) -> str:
+    """Content hash under which a file is stored"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def message_size(message: Dict[str, Any], blobs: Dict[str, bytes]) -> int:
+    """Bytes a stored message takes up, including its attached files"""
+    return len(json.dumps(message, ensure_ascii=False, default=str)) + sum(len(data) for data in blobs.values())
+
+
+def evict_count(sizes: List[int], total_bytes: int, window_size: int, max_bytes: int) -> int:
+    """
+    Number of oldest messages to drop so that at most window_size messages
+    and max_bytes remain. The newest message is always kept.
+    """
+    count = max(0, len(sizes) - window_size)
+    total_bytes -= sum(sizes[:count])
+    while total_bytes > max_bytes and count < len(sizes) - 1:
+        total_bytes -= sizes[count]
+        count += 1
+    return count
+
+
+def new_metadata() -> Dict[str, Any]:
+    now = datetime.now().isoformat()
+    return {
+        "created_at": now,
+        "last_updated": now,
+        "message_count": 0,
+        "turn_count": 0
+    }
+
+
+class ConversationStore(ABC):
+    """Interface of the conversation memory backends"""
+
+    def __init__(self, window_size: int = DEFAULT_WINDOW_SIZE, max_session_bytes: int = DEFAULT_MAX_SESSION_BYTES):
+        self.window_size = window_size
+        self.max_session_bytes = max_session_bytes
+
+    @abstractmethod
+    def create_session(self, session_id: str) -> bool:
+        """Create an empty session; returns False if it already exists"""
+
+    @abstractmethod
+    def has_session(self, session_id: str) -> bool:
+        """Whether a session exists"""
+
+    @abstractmethod
+    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get {"messages": [...], "metadata": {...}} of a session, with file references unresolved"""
+
+    @abstractmethod
+    def append_message(
+        self,
+        session_id: str,
+        message: Dict[str, Any],
+        blobs: Optional[Dict[str, bytes]] = None,
+        increment_turn: bool = False
+    ) -> int:
+        """
+        Append a message and the files it references by digest, then apply the
+        window and byte budget. Returns the number of evicted messages.
+        """
+
+    @abstractmethod
+    def trim_messages(self, session_id: str, keep: int, reset_turns: bool = False) -> bool:
+        """Keep only the newest keep messages of a session, optionally resetting its turn count"""
+
+    @abstractmethod
+    def delete_session(self, session_id: str) -> bool:
+        """Delete a session and the files only it references; returns False if it did not exist"""
+
+    @abstractmethod
+    def expire_sessions(self, max_age_seconds: float) -> List[str]:
+        """Delete sessions without activity for max_age_seconds; returns their ids"""
+
+    @abstractmethod
+    def get_blob(self, digest: str) -> Optional[bytes]:
+        """Get a stored file by its digest"""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Session, message and byte counts"""
+
+
+class _Session:
+    """A session held by the in-memory store"""
+
+    def __init__(self):
+        self.metadata = new_metadata()
+        self.system: List[Tuple[Dict[str, Any], int, Tuple[str, ...]]] = []
+        # (message, size, blob digests), oldest first
+        self.window: deque = deque()
+        self.size = 0
+        self.touched_at = time.time()
+
+    def messages(self) -> List[Dict[str, Any]]:
+        return [entry[0] for entry in self.system] + [entry[0] for entry in self.window]
+
+
+class InMemoryConversationStore(ConversationStore):
+    """Sessions in this process, evicting the least recently used beyond max_sessions or max_total_bytes"""
+
+    def __init__(
+        self,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        max_session_bytes: int = DEFAULT_MAX_SESSION_BYTES,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES
+    ):
+        super().__init__(window_size, max_session_bytes)
+        self.max_sessions = max(1, max_sessions)
+        self.max_total_bytes = max_total_bytes
+        # Least recently used first, which is also least recently active first
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        # digest -> [data, references]
+        self._blobs: Dict[str, List[Any]] = {}
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+    def create_session(self, session_id: str) -> bool:
+        with self._lock:
+            if session_id in self._sessions:
+                self._touch(session_id)
+                return False
+            self._sessions[session_id] = _Session()
+            self._evict_sessions()
+            return True
+
+    def has_session(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._sessions
+
+    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            session = self._touch(session_id)
+            if session is None:
+                return None
+            return {"messages": session.messages(), "metadata": dict(session.metadata)}
+
+    def append_message(
+        self,
+        session_id: str,
+        message: Dict[str, Any],
+        blobs: Optional[Dict[str, bytes]] = None,
+        increment_turn: bool = False
+    ) -> int:
+        blobs = blobs or {}
+        with self._lock:
+            session = self._touch(session_id)
+            if session is None:
+                return 0
+            for digest, data in blobs.items():
+                self._blobs.setdefault(digest, [data, 0])[1] += 1
+            entry = (message, message_size(message, blobs), tuple(blobs))
+            (session.system if message.get("role") == "system" else session.window).append(entry)
+            self._resize(session, entry[1])
+
+            evicted = 0
+            while session.window and (
+                len(session.window) > self.window_size
+                or (session.size > self.max_session_bytes and len(session.window) > 1)
+            ):
+                self._release(session, session.window.popleft())
+                evicted += 1
+
+            self._update_metadata(session, increment_turn)
+            self._evict_sessions()
+            return evicted
+
+    def trim_messages(self, session_id: str, keep: int, reset_turns: bool = False) -> bool:
+        with self._lock:
+            session = self._touch(session_id)
+            if session is None:
+                return False
+            while session.system and len(session.system) + len(session.window) > keep:
+                self._release(session, session.system.pop(0))
+            while session.window and len(session.system) + len(session.window) > keep:
+                self._release(session, session.window.popleft())
+            if reset_turns:
+                session.metadata["turn_count"] = 0
+            self._update_metadata(session)
+            return True
+
+    def delete_session(self, session_id: str) -> bool:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            if session is None:
+                return False
+            for entry in session.system + list(session.window):
+                self._release(session, entry)
+            return True
+
+    def expire_sessions(self, max_age_seconds: float) -> List[str]:
+        cutoff = time.time() - max_age_seconds
+        expired = []
+        with self._lock:
+            # Sessions are ordered by last activity, so only expired ones are visited
+            for session_id, session in self._sessions.items():
+                if session.touched_at > cutoff:
+                    break
+                expired.append(session_id)
+            for session_id in expired:
+                self.delete_session(session_id)
+        return expired
+
+    def get_blob(self, digest: str) -> Optional[bytes]:
+        with self._lock:
+            blob = self._blobs.get(digest)
+            return blob[0] if blob else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "total_sessions": len(self._sessions),
+                "total_messages": sum(s.metadata["message_count"] for s in self._sessions.values()),
+                "total_bytes": self._total_bytes,
+                "total_blobs": len(self._blobs)
+            }
+
+    def _touch(self, session_id: str) -> Optional[_Session]:
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session.touched_at = time.time()
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def _resize(self, session: _Session, delta: int) -> None:
+        session.size += delta
+        self._total_bytes += delta
+
+    def _release(self, session: _Session, entry: Tuple[Dict[str, Any], int, Tuple[str, ...]]) -> None:
+        self._resize(session, -entry[1])
+        for digest in entry[2]:
+            blob = self._blobs.get(digest)
+            if blob is not None:
+                blob[1] -= 1
+                if blob[1] <= 0:
+                    del self._blobs[digest]
+
+    def _update_metadata(self, session: _Session, increment_turn: bool = False) -> None:
+        session.metadata["last_updated"] = datetime.now().isoformat()
+        session.metadata["message_count"] = len(session.system) + len(session.window)
+        if increment_turn:
+            session.metadata["turn_count"] = session.metadata.get("turn_count", 0) + 1
+
+    def _evict_sessions(self) -> None:
+        while len(self._sessions) > 1 and (
+            len(self._sessions) > self.max_sessions or self._total_bytes > self.max_total_bytes
+        ):
+            session_id = next(iter(self._sessions))
+            self.delete_session(session_id)
+            logger.info(f"Evicted least recently used session {session_id}")
+
+
+class SQLiteConversationStore(ConversationStore):
+    """Sessions in a SQLite database shared by processes on the same host"""
+
+    def __init__(
+        self,
+        path: str,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        max_session_bytes: int = DEFAULT_MAX_SESSION_BYTES
+    ):
+        super().__init__(window_size, max_session_bytes)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY, metadata TEXT, size INTEGER, touched_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS sessions_touched_at ON sessions (touched_at);
+            CREATE TABLE IF NOT EXISTS messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, session_id TEXT, is_system INTEGER,
+                body TEXT, size INTEGER, blobs TEXT
+            );
+            CREATE INDEX IF NOT EXISTS messages_session ON messages (session_id, id);
+            CREATE TABLE IF NOT EXISTS blobs (digest TEXT PRIMARY KEY, data BLOB, refs INTEGER);
+        """)
+
+    def create_session(self, session_id: str) -> bool:
+        with self._transaction():
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO sessions (session_id, metadata, size, touched_at) VALUES (?, ?, 0, ?)",
+                (session_id, json.dumps(new_metadata()), time.time())
+            )
+            if cursor.rowcount == 0:
+                self._touch(session_id)
+            return cursor.rowcount > 0
+
+    def has_session(self, session_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone() is not None
+
+    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._transaction():
+            row = self._conn.execute(
+                "SELECT metadata FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._touch(session_id)
+            messages = self._conn.execute(
+                "SELECT body FROM messages WHERE session_id = ? ORDER BY is_system DESC, id", (session_id,)
+            ).fetchall()
+            return {"messages": [json.loads(body) for body, in messages], "metadata": json.loads(row[0])}
+
+    def append_message(
+        self,
+        session_id: str,
+        message: Dict[str, Any],
+        blobs: Optional[Dict[str, bytes]] = None,
+        increment_turn: bool = False
+    ) -> int:
+        blobs = blobs or {}
+        with self._transaction():
+            row = self._conn.execute(
+                "SELECT size FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            if row is None:
+                return 0
+            for digest, data in blobs.items():
+                self._conn.execute(
+                    "INSERT INTO blobs (digest, data, refs) VALUES (?, ?, 1) "
+                    "ON CONFLICT (digest) DO UPDATE SET refs = refs + 1",
+                    (digest, data)
+                )
+            size = message_size(message, blobs)
+            self._conn.execute(
+                "INSERT INTO messages (session_id, is_system, body, size, blobs) VALUES (?, ?, ?, ?, ?)",
+                (session_id, int(message.get("role") == "system"),
+                 json.dumps(message, ensure_ascii=False, default=str), size, json.dumps(list(blobs)))
+            )
+
+            window = self._conn.execute(
+                "SELECT id, size, blobs FROM messages WHERE session_id = ? AND is_system = 0 ORDER BY id",
+                (session_id,)
+            ).fetchall()
+            evicted = evict_count([s for _, s, _ in window], row[0] + size, self.window_size, self.max_session_bytes)
+            self._delete_messages(window[:evicted])
+            self._update_session(session_id, increment_turn)
+            return evicted
+
+    def trim_messages(self, session_id: str, keep: int, reset_turns: bool = False) -> bool:
+        with self._transaction():
+            if not self._conn.execute("SELECT 1 FROM sessions WHERE session_id = ?", (session_id,)).fetchone():
+                return False
+            rows = self._conn.execute(
+                "SELECT id, size, blobs FROM messages WHERE session_id = ? ORDER BY is_system DESC, id",
+                (session_id,)
+            ).fetchall()
+            self._delete_messages(rows[:max(0, len(rows) - keep)])
+            self._update_session(session_id, reset_turns=reset_turns)
+            return True
+
+    def delete_session(self, session_id: str) -> bool:
+        with self._transaction():
+            return self._delete_session(session_id)
+
+    def expire_sessions(self, max_age_seconds: float) -> List[str]:
+        with self._transaction():
+            expired = [session_id for session_id, in self._conn.execute(
+                "SELECT session_id FROM sessions WHERE touched_at <= ?", (time.time() - max_age_seconds,)
+            ).fetchall()]
+            for session_id in expired:
+                self._delete_session(session_id)
+            return expired
+
+    def get_blob(self, digest: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            return bytes(row[0]) if row else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sessions, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM sessions"
+            ).fetchone()
+            return {
+                "total_sessions": sessions,
+                "total_messages": self._conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0],
+                "total_bytes": total_bytes,
+                "total_blobs": self._conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+            }
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            # An immediate transaction serializes concurrent processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _touch(self, session_id: str) -> None:
+        self._conn.execute("UPDATE sessions SET touched_at = ? WHERE session_id = ?", (time.time(), session_id))
+
+    def _delete_messages(self, rows: List[Tuple[int, int, str]]) -> None:
+        for message_id, _, blobs in rows:
+            self._conn.execute("DELETE FROM messages WHERE id = ?", (message_id,))
+            for digest in json.loads(blobs):
+                self._conn.execute("UPDATE blobs SET refs = refs - 1 WHERE digest = ?", (digest,))
+        if rows:
+            self._conn.execute("DELETE FROM blobs WHERE refs <= 0")
+
+    def _delete_session(self, session_id: str) -> bool:
+        rows = self._conn.execute(
+            "SELECT id, size, blobs FROM messages WHERE session_id = ?", (session_id,)
+        ).fetchall()
+        self._delete_messages(rows)
+        return self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,)).rowcount > 0
+
+    def _update_session(self, session_id: str, increment_turn: bool = False, reset_turns: bool = False) -> None:
+        """Refresh the size, activity time and metadata counts of a session"""
+        metadata_json, = self._conn.execute(
+            "SELECT metadata FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        count, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM messages WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        metadata = json.loads(metadata_json)
+        metadata["last_updated"] = datetime.now().isoformat()
+        metadata["message_count"] = count
+        if reset_turns:
+            metadata["turn_count"] = 0
+        if increment_turn:
+            metadata["turn_count"] = metadata.get("turn_count", 0) + 1
+        self._conn.execute(
+            "UPDATE sessions SET metadata = ?, size = ?, touched_at = ? WHERE session_id = ?",
+            (json.dumps(metadata), size, time.time(), session_id)
+        )
+
+
+def create_conversation_store(window_size: int = DEFAULT_WINDOW_SIZE) -> ConversationStore:
+    """Create the store selected by CONVERSATION_STORE"""
+    kind = os.environ.get("CONVERSATION_STORE", "memory").lower()
+    max_session_bytes = int(os.environ.get("CONVERSATION_MAX_SESSION_BYTES", DEFAULT_MAX_SESSION_BYTES))
+    if kind == "sqlite":
+        path = os.environ.get(
+            "CONVERSATION_DB",
+            os.path.join(tempfile.gettempdir(), "financial-agent-conversations.db")
+        )
+        try:
+            return SQLiteConversationStore(path, window_size, max_session_bytes)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open conversation database {path}, keeping conversations in memory: {str(e)}")
+    elif kind != "memory":
+        logger.warning(f"Unknown CONVERSATION_STORE {kind}, keeping conversations in memory")
+    return InMemoryConversationStore(window_size, max_session_bytes)
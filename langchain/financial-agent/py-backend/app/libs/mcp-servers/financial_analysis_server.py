@@ -2,11 +2,12 @@ from typing import List, Dict, Any, Optional
 from mcp.server.fastmcp import FastMCP
 import logging
 import asyncio
-import pandas as pd
-import yfinance as yf
+import json
 from datetime import datetime, timedelta
-import time
 import argparse
+from market_data import get_market_data_service
+from rate_limiter import create_rate_limiter, add_metrics_route
+from indicators import IndicatorEngine
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -15,40 +16,16 @@ logger = logging.getLogger("financial-analysis-server")
 # Initialize FastMCP server
 mcp = FastMCP("financial-analysis", log_level="INFO")
 
-# Rate limiting implementation
-RATE_LIMIT = {
-    "per_minute": 10,
-    "per_day": 300
-}
-
-request_count = {
-    "minute": 0,
-    "day": 0,
-    "last_minute_reset": time.time(),
-    "last_day_reset": time.time()
-}
-
-def check_rate_limit():
-    now = time.time()
-    
-    if now - request_count["last_minute_reset"] > 60:
-        request_count["minute"] = 0
-        request_count["last_minute_reset"] = now
-    
-    if now - request_count["last_day_reset"] > 86400:
-        request_count["day"] = 0
-        request_count["last_day_reset"] = now
-    
-    if (request_count["minute"] >= RATE_LIMIT["per_minute"] or 
-            request_count["day"] >= RATE_LIMIT["per_day"]):
-        raise Exception('Rate limit exceeded. Please try again later.')
-    
-    request_count["minute"] += 1
-    request_count["day"] += 1
+# Rate limiting implementation, shared across server processes
+rate_limiter = create_rate_limiter("financial-analysis", per_minute=10, per_day=300)
+add_metrics_route(mcp, rate_limiter)
 
 class APIError(Exception):
     pass
 
+# Indicators of every symbol seen, updated incrementally as new bars arrive
+indicator_engine = IndicatorEngine()
+
 # Helper functions for analysis interpretation
 def interpret_rsi(rsi: float) -> str:
     if rsi >= 70: return "Overbought"
@@ -71,11 +48,8 @@ def interpret_relative_strength(stock_change: float, sp500_change: float) -> str
     else: return "Market performer"
 
 async def fetch_fundamental_analysis(equity):
-    check_rate_limit()
-    
     try:
-        ticker = yf.Ticker(equity)
-        info = ticker.info
+        info = await get_market_data_service().get_quote(equity)
         if not info:
             raise ValueError(f"No fundamental data available for {equity}")
         
@@ -157,83 +131,52 @@ async def fetch_fundamental_analysis(equity):
         raise APIError(f"Fundamental analysis failed: {str(e)}")
 
 async def fetch_technical_analysis(equity):
-    check_rate_limit()
-    
     try:
-        ticker = yf.Ticker(equity)
-        hist = ticker.history(period="1y")
+        hist = await get_market_data_service().get_history(equity, period="1y")
         if hist.empty:
             raise ValueError(f"No historical data available for {equity}")
 
-        current_price = hist["Close"].iloc[-1]
-        avg_volume = hist["Volume"].mean()
-
-        sma_20 = hist["Close"].rolling(window=20).mean().iloc[-1]
-        sma_50 = hist["Close"].rolling(window=50).mean().iloc[-1]
-        sma_200 = hist["Close"].rolling(window=200).mean().iloc[-1]
-
-        delta = hist["Close"].diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-        avg_gain = gain.rolling(window=14).mean()
-        avg_loss = loss.rolling(window=14).mean()
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs)).iloc[-1]
-
-        high_low = hist["High"] - hist["Low"]
-        high_close = (hist["High"] - hist["Close"].shift()).abs()
-        low_close = (hist["Low"] - hist["Close"].shift()).abs()
-        ranges = pd.concat([high_low, high_close, low_close], axis=1)
-        true_range = ranges.max(axis=1)
-        atr = true_range.rolling(window=14).mean().iloc[-1]
-
-        ema12 = hist["Close"].ewm(span=12, adjust=False).mean()
-        ema26 = hist["Close"].ewm(span=26, adjust=False).mean()
-        macd = ema12 - ema26
-        signal_line = macd.ewm(span=9, adjust=False).mean()
-        macd_histogram = macd - signal_line
-
-        price_changes = {
-            "1d": hist["Close"].pct_change(periods=1).iloc[-1] * 100,
-            "5d": hist["Close"].pct_change(periods=5).iloc[-1] * 100,
-            "20d": hist["Close"].pct_change(periods=20).iloc[-1] * 100
-        }
-
-        ma_distances = {
-            "from_20sma": ((current_price / sma_20) - 1) * 100,
-            "from_50sma": ((current_price / sma_50) - 1) * 100,
-            "from_200sma": ((current_price / sma_200) - 1) * 100
-        }
-
-        return {
-            "price": current_price,
-            "avg_volume": avg_volume,
-            "moving_averages": {
-                "sma_20": sma_20,
-                "sma_50": sma_50,
-                "sma_200": sma_200
-            },
-            "indicators": {
-                "rsi": rsi,
-                "atr": atr,
-                "atr_percent": (atr / current_price) * 100,
-                "macd": macd.iloc[-1],
-                "macd_signal": signal_line.iloc[-1],
-                "macd_histogram": macd_histogram.iloc[-1]
-            },
-            "trend_analysis": price_changes,
-            "ma_distances": ma_distances
-        }
+        symbol = equity.strip().upper()
+        indicator_engine.update({symbol: hist})
+        return indicator_engine.compute([symbol])[symbol]
     except Exception as e:
         logger.error(f"Error in technical analysis for {equity}: {str(e)}")
         raise APIError(f"Technical analysis failed: {str(e)}")
 
+async def fetch_technical_batch(equities):
+    """Compute technical analysis for many symbols in one vectorized pass"""
+    await rate_limiter.acquire("technical_data_for_symbols")
+    
+    symbols = list(dict.fromkeys(equity.strip().upper() for equity in equities if equity.strip()))
+    market_data = get_market_data_service()
+    histories = await asyncio.gather(
+        *(market_data.get_history(symbol, period="1y") for symbol in symbols),
+        return_exceptions=True
+    )
+    
+    errors = {}
+    valid = {}
+    for symbol, hist in zip(symbols, histories):
+        if isinstance(hist, Exception):
+            logger.error(f"Error fetching history for {symbol}: {str(hist)}")
+            errors[symbol] = f"Technical analysis failed: {str(hist)}"
+        elif hist.empty:
+            errors[symbol] = f"No historical data available for {symbol}"
+        else:
+            valid[symbol] = hist
+    
+    indicator_engine.update(valid)
+    results = indicator_engine.compute(list(valid))
+    return {symbol: results.get(symbol, errors.get(symbol)) for symbol in symbols}
+
 async def fetch_comprehensive_analysis(equity):
-    check_rate_limit()
+    await rate_limiter.acquire("comprehensive_analysis")
     
     try:
-        fundamental_data = await fetch_fundamental_analysis(equity)
-        technical_data = await fetch_technical_analysis(equity)
+        fundamental_data, technical_data = await asyncio.gather(
+            fetch_fundamental_analysis(equity),
+            fetch_technical_analysis(equity)
+        )
         
         current_price = technical_data["price"]
         target_price = fundamental_data["analyst_opinions"]["targetMeanPrice"]
@@ -311,7 +254,7 @@ async def fetch_comprehensive_analysis(equity):
         raise APIError(f"Comprehensive analysis failed: {str(e)}")
 
 async def fetch_fundamental_by_groups(equity, groups):
-    check_rate_limit()
+    await rate_limiter.acquire("fundamental_data_by_category")
     
     try:
         full_data = await fetch_fundamental_analysis(equity)
@@ -325,7 +268,7 @@ async def fetch_fundamental_by_groups(equity, groups):
         raise APIError(f"Fundamental groups analysis failed: {str(e)}")
 
 async def fetch_technical_by_groups(equity, groups):
-    check_rate_limit()
+    await rate_limiter.acquire("technical_data_by_category")
     
     try:
         full_data = await fetch_technical_analysis(equity)
@@ -376,6 +319,18 @@ def format_analysis_results(data, indent=0):
     else:
         return str(data)
 
+def parse_list_argument(value):
+    """Parse a comma-separated string or JSON array string into a list"""
+    if value.startswith('[') and value.endswith(']'):
+        # Try to parse as JSON array
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            # Fallback to comma-separated if JSON parse fails
+            return [item.strip() for item in value.strip('[]').split(',')]
+    # Process as comma-separated string
+    return [item.strip() for item in value.split(',')]
+
 # MCP tool definitions
 @mcp.tool()
 async def fundamental_data_by_category(equity: str, categories: str) -> str:
@@ -389,21 +344,7 @@ async def fundamental_data_by_category(equity: str, categories: str) -> str:
                    margins_and_returns, dividends, balance_sheet, ownership, analyst_opinions, risk_metrics
     """
     try:
-        # Convert string categories to list
-        category_list = []
-        if categories.startswith('[') and categories.endswith(']'):
-            # Try to parse as JSON array
-            import json
-            try:
-                category_list = json.loads(categories)
-            except json.JSONDecodeError:
-                # Fallback to comma-separated if JSON parse fails
-                category_list = [cat.strip() for cat in categories.strip('[]').split(',')] 
-        else:
-            # Process as comma-separated string
-            category_list = [cat.strip() for cat in categories.split(',')]
-            
-        # Continue with the list
+        category_list = parse_list_argument(categories)
         data = await fetch_fundamental_by_groups(equity, category_list)
         return format_analysis_results(data)
     except Exception as e:
@@ -420,26 +361,41 @@ async def technical_data_by_category(equity: str, categories: str) -> str:
                    Available categories: moving_averages, indicators, trend_analysis, ma_distances, price, avg_volume
     """
     try:
-        # Convert string categories to list
-        category_list = []
-        if categories.startswith('[') and categories.endswith(']'):
-            # Try to parse as JSON array
-            import json
-            try:
-                category_list = json.loads(categories)
-            except json.JSONDecodeError:
-                # Fallback to comma-separated if JSON parse fails
-                category_list = [cat.strip() for cat in categories.strip('[]').split(',')] 
-        else:
-            # Process as comma-separated string
-            category_list = [cat.strip() for cat in categories.split(',')]
-            
-        # Continue with the list
+        category_list = parse_list_argument(categories)
         data = await fetch_technical_by_groups(equity, category_list)
         return format_analysis_results(data)
     except Exception as e:
         return f"Error retrieving technical data: {str(e)}"
 
+@mcp.tool()
+async def technical_data_for_symbols(symbols: str, categories: str = "price,indicators,trend_analysis,ma_distances") -> str:
+    """
+    Get specific categories of technical data for several stocks at once.
+    Use this to compare holdings or a watchlist instead of requesting technical data symbol by symbol.
+    
+    Args:
+        symbols: Comma-separated string or JSON array string of ticker symbols (e.g., "AAPL,MSFT,NVDA")
+        categories: Comma-separated string or JSON array string of categories to retrieve (e.g., "indicators,moving_averages,trend_analysis")
+                   Available categories: moving_averages, indicators, trend_analysis, ma_distances, price, avg_volume
+    """
+    try:
+        symbol_list = [symbol for symbol in parse_list_argument(symbols) if symbol]
+        if not symbol_list:
+            return "Please provide at least one stock ticker symbol."
+        category_list = parse_list_argument(categories)
+        
+        data = await fetch_technical_batch(symbol_list)
+        result = ""
+        for symbol, analysis in data.items():
+            if isinstance(analysis, str):
+                result += f"{symbol}:\n  Error: {analysis}\n\n"
+                continue
+            groups = {group: analysis[group] for group in category_list if group in analysis}
+            result += f"{symbol}:\n{format_analysis_results(groups, 2)}\n"
+        return result
+    except Exception as e:
+        return f"Error retrieving technical data: {str(e)}"
+
 @mcp.tool()
 async def comprehensive_analysis(equity: str) -> str:
     """
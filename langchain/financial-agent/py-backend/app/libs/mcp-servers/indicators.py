@@ -0,0 +1,231 @@
+"""
+Batch technical indicator engine.
+
+Computes SMA, RSI, ATR, MACD, price changes and moving average distances
+for many symbols at once. Each symbol's most recent bars are right-aligned
+into one wide array (bars x symbols), so every indicator is a single
+vectorized operation across all symbols while still using each symbol's
+own bars, whatever its trading calendar.
+
+The engine keeps the last bars and the MACD moving averages of every
+symbol, so an update only processes bars newer than the ones it has seen.
+The latest bar may be revised (e.g. during the session) and is recomputed
+whenever it changes. If a history rewrites older bars the engine has seen,
+e.g. prices adjusted for a split or dividend, the symbol is rebuilt from
+that history.
+
+Only the last max_bars bars of a symbol are kept. For histories up to that
+length the indicators equal a per-symbol pandas computation over the whole
+history. avg_volume is the average over the kept bars, so for longer or
+accumulated histories it is a trailing one-year average rather than the
+average of every bar passed in.
+"""
+
+from typing import Dict, Any, List, Optional
+import logging
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger("indicators")
+
+SMA_WINDOWS = (20, 50, 200)
+RSI_WINDOW = 14
+ATR_WINDOW = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+PRICE_CHANGE_PERIODS = {"1d": 1, "5d": 5, "20d": 20}
+# Bars kept per symbol: about one trading year, for the 200-day SMA and average volume
+MAX_BARS = 252
+
+BAR_COLUMNS = ["Close", "High", "Low", "Volume"]
+
+
+def _alpha(span: int) -> float:
+    return 2.0 / (span + 1.0)
+
+
+def _right_aligned(series: List[np.ndarray], rows: int) -> np.ndarray:
+    """Stack per-symbol arrays into a (rows x symbols) array, padding the top with NaN"""
+    stacked = np.full((rows, len(series)), np.nan)
+    for column, values in enumerate(series):
+        values = values[-rows:]
+        if len(values):
+            stacked[rows - len(values):, column] = values
+    return stacked
+
+
+def _last_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Mean of the last window rows per column, NaN if any of them is missing"""
+    if values.shape[0] < window:
+        return np.full(values.shape[1], np.nan)
+    with np.errstate(invalid="ignore"):
+        return values[-window:].mean(axis=0)
+
+
+class IndicatorEngine:
+    """Technical indicators for many symbols, updated incrementally"""
+
+    def __init__(self, max_bars: int = MAX_BARS):
+        self.max_bars = max(max_bars, max(SMA_WINDOWS) + 1)
+        # Bar timestamps (ns since epoch) and values (bars x BAR_COLUMNS) per symbol
+        self._timestamps: Dict[str, np.ndarray] = {}
+        self._bars: Dict[str, np.ndarray] = {}
+        # MACD EMAs (fast, slow, signal) as of each symbol's second to last bar,
+        # the last bar that is final once a newer bar exists
+        self._confirmed: Dict[str, np.ndarray] = {}
+        # MACD EMAs as of each symbol's last bar
+        self._latest: Dict[str, np.ndarray] = {}
+
+    def update(self, histories: Dict[str, pd.DataFrame]) -> None:
+        """
+        Add bars for a set of symbols.
+        Accepts full histories or only the new bars. Bars older than the
+        symbol's second to last known bar are only compared with the stored
+        ones; if any differ, the symbol is rebuilt from the passed history.
+        """
+        symbols, new_closes = [], []
+        for symbol, history in histories.items():
+            if history is None or history.empty:
+                continue
+            # Indexes may come in any resolution (e.g. read back from the disk cache)
+            timestamps = history.index.values.astype("datetime64[ns]").astype(np.int64)
+            bars = history[BAR_COLUMNS].to_numpy(dtype=float)
+            known_timestamps = self._timestamps.get(symbol)
+            if known_timestamps is not None and self._rewrites_history(symbol, timestamps, bars):
+                # Adjusted prices invalidate the stored bars and MACD state
+                logger.info(f"History of {symbol} was rewritten, recomputing its indicators")
+                known_timestamps = None
+            if known_timestamps is not None and len(known_timestamps) >= 2:
+                # Re-apply from the last known bar, which may have been revised
+                confirmed_at = known_timestamps[-2]
+                new = timestamps > confirmed_at
+                if not new.any():
+                    continue
+                timestamps, new_bars = timestamps[new], bars[new]
+                known_bars = self._bars[symbol]
+                if timestamps[0] > known_timestamps[-1]:
+                    # Only newer bars were passed; the last known bar still applies
+                    timestamps = np.concatenate([known_timestamps[-1:], timestamps])
+                    new_bars = np.concatenate([known_bars[-1:], new_bars])
+                all_timestamps = np.concatenate([known_timestamps[:-1], timestamps])
+                bars = np.concatenate([known_bars[:-1], new_bars])
+                state = self._confirmed[symbol]
+            else:
+                all_timestamps, new_bars = timestamps, bars
+                state = np.full(3, np.nan)
+
+            self._timestamps[symbol] = all_timestamps[-self.max_bars:]
+            self._bars[symbol] = bars[-self.max_bars:]
+            self._confirmed[symbol] = state
+            symbols.append(symbol)
+            new_closes.append(new_bars[:, 0])
+
+        if symbols:
+            self._advance_emas(symbols, new_closes)
+
+    def _rewrites_history(self, symbol: str, timestamps: np.ndarray, bars: np.ndarray) -> bool:
+        """Whether bars passed for a symbol differ from its stored bars before the last one"""
+        known_timestamps, known_bars = self._timestamps[symbol], self._bars[symbol]
+        _, known_index, index = np.intersect1d(known_timestamps[:-1], timestamps, return_indices=True)
+        if not len(index):
+            return False
+        return not np.allclose(bars[index], known_bars[known_index], rtol=1e-9, atol=0.0, equal_nan=True)
+
+    def _advance_emas(self, symbols: List[str], new_closes: List[np.ndarray]) -> None:
+        """Run the MACD EMA recursion over the new bars of all symbols together"""
+        steps = max(len(closes) for closes in new_closes)
+        closes = _right_aligned(new_closes, steps)
+        state = np.stack([self._confirmed[symbol] for symbol in symbols])
+        confirmed = state.copy()
+
+        fast, slow, signal = _alpha(MACD_FAST), _alpha(MACD_SLOW), _alpha(MACD_SIGNAL)
+        for step in range(steps):
+            if step == steps - 1:
+                # Everything before the last bar is final
+                confirmed = state.copy()
+            price = closes[step]
+            valid = ~np.isnan(price)
+            start = valid & np.isnan(state[:, 0])
+            update = valid & ~start
+
+            # An EMA without adjustment starts at the first value
+            state[start, 0] = price[start]
+            state[start, 1] = price[start]
+            state[start, 2] = 0.0
+            state[update, 0] += fast * (price[update] - state[update, 0])
+            state[update, 1] += slow * (price[update] - state[update, 1])
+            macd = state[update, 0] - state[update, 1]
+            state[update, 2] += signal * (macd - state[update, 2])
+
+        for index, symbol in enumerate(symbols):
+            self._confirmed[symbol] = confirmed[index]
+            self._latest[symbol] = state[index]
+
+    def compute(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Compute the indicators of symbols with known bars (all by default).
+        Returns the same structure as a single-symbol technical analysis;
+        avg_volume covers at most the last max_bars bars.
+        """
+        symbols = [s for s in (symbols or list(self._bars)) if s in self._bars]
+        if not symbols:
+            return {}
+
+        rows = min(self.max_bars, max(len(self._bars[s]) for s in symbols))
+        def wide(column: str) -> np.ndarray:
+            position = BAR_COLUMNS.index(column)
+            return _right_aligned([self._bars[s][:, position] for s in symbols], rows)
+        close, high, low, volume = wide("Close"), wide("High"), wide("Low"), wide("Volume")
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            price = close[-1]
+            # Trailing average over the kept bars, not the whole history
+            avg_volume = np.nanmean(volume, axis=0)
+            sma = {window: _last_mean(close, window) for window in SMA_WINDOWS}
+
+            previous_close = np.vstack([np.full((1, close.shape[1]), np.nan), close[:-1]])
+            delta = close - previous_close
+            bar_exists = ~np.isnan(close)
+            # A missing change (first bar) counts as no gain and no loss
+            gain = np.where(bar_exists, np.where(delta > 0, delta, 0.0), np.nan)
+            loss = np.where(bar_exists, np.where(delta < 0, -delta, 0.0), np.nan)
+            rs = _last_mean(gain, RSI_WINDOW) / _last_mean(loss, RSI_WINDOW)
+            rsi = 100 - (100 / (1 + rs))
+
+            true_range = np.fmax(
+                high - low,
+                np.fmax(np.abs(high - previous_close), np.abs(low - previous_close))
+            )
+            atr = _last_mean(true_range, ATR_WINDOW)
+
+            price_changes = {}
+            for name, periods in PRICE_CHANGE_PERIODS.items():
+                base = close[-1 - periods] if rows > periods else np.full(len(symbols), np.nan)
+                price_changes[name] = (price / base - 1) * 100
+
+            emas = np.stack([self._latest[s] for s in symbols])
+            macd = emas[:, 0] - emas[:, 1]
+            macd_signal = emas[:, 2]
+
+            distances = {window: ((price / sma[window]) - 1) * 100 for window in SMA_WINDOWS}
+            atr_percent = (atr / price) * 100
+
+        results = {}
+        for i, symbol in enumerate(symbols):
+            results[symbol] = {
+                "price": float(price[i]),
+                "avg_volume": float(avg_volume[i]),
+                "moving_averages": {f"sma_{w}": float(sma[w][i]) for w in SMA_WINDOWS},
+                "indicators": {
+                    "rsi": float(rsi[i]),
+                    "atr": float(atr[i]),
+                    "atr_percent": float(atr_percent[i]),
+                    "macd": float(macd[i]),
+                    "macd_signal": float(macd_signal[i]),
+                    "macd_histogram": float(macd[i] - macd_signal[i])
+                },
+                "trend_analysis": {name: float(change[i]) for name, change in price_changes.items()},
+                "ma_distances": {f"from_{w}sma": float(distances[w][i]) for w in SMA_WINDOWS}
+            }
+        return results
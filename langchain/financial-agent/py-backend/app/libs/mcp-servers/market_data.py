@@ -0,0 +1,258 @@
+"""
+Shared market data service for the MCP servers.
+
+Fetches quotes, price history and news from Yahoo Finance on a thread pool
+so the servers' event loops are never blocked, and caches the results:
+
+- in memory, with concurrent requests for the same data sharing one fetch
+- on disk (MARKET_DATA_CACHE_DIR, a temp directory by default), so the
+  separate server processes reuse each other's fetches
+
+Quotes and history expire quickly while the US market is open and stay
+valid until the next open while it is closed. Market holidays are treated
+as trading days.
+
+Upstream fetches share one rate limit across all servers
+(YAHOO_FINANCE_REQUESTS_PER_MINUTE, 60 by default).
+"""
+
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from datetime import datetime, timedelta, time as dt_time
+from io import StringIO
+from zoneinfo import ZoneInfo
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+import pandas as pd
+import yfinance as yf
+from rate_limiter import RateLimiter, create_rate_limiter
+
+logger = logging.getLogger("market-data")
+
+MARKET_TIMEZONE = ZoneInfo("America/New_York")
+MARKET_OPEN = dt_time(9, 30)
+MARKET_CLOSE = dt_time(16, 0)
+
+# Seconds a quote snapshot stays valid while the market is open
+QUOTE_TTL_OPEN = 60
+# Seconds daily (or longer) bars stay valid while the market is open
+DAILY_HISTORY_TTL_OPEN = 300
+# Seconds news stays valid, regardless of market hours
+NEWS_TTL = 300
+# Shortest TTL of any entry, so a stale clock never disables caching
+MIN_TTL = 60
+
+INTERVAL_SECONDS = {
+    "1m": 60, "2m": 120, "5m": 300, "15m": 900, "30m": 1800,
+    "60m": 3600, "90m": 5400, "1h": 3600,
+}
+
+
+def is_market_open(now: Optional[datetime] = None) -> bool:
+    """Check whether the US stock market is in its regular session"""
+    now = (now or datetime.now(MARKET_TIMEZONE)).astimezone(MARKET_TIMEZONE)
+    return now.weekday() < 5 and MARKET_OPEN <= now.time() < MARKET_CLOSE
+
+
+def seconds_until_market_open(now: Optional[datetime] = None) -> float:
+    """Seconds until the next regular session opens, 0 while it is open"""
+    now = (now or datetime.now(MARKET_TIMEZONE)).astimezone(MARKET_TIMEZONE)
+    if is_market_open(now):
+        return 0.0
+
+    next_open = datetime.combine(now.date(), MARKET_OPEN, tzinfo=MARKET_TIMEZONE)
+    if now >= next_open:
+        next_open += timedelta(days=1)
+    while next_open.weekday() >= 5:
+        next_open += timedelta(days=1)
+    return (next_open - now).total_seconds()
+
+
+def market_ttl(open_ttl: float, now: Optional[datetime] = None) -> float:
+    """TTL of market data: open_ttl during the session, until the next open otherwise"""
+    if is_market_open(now):
+        return max(open_ttl, MIN_TTL)
+    return max(seconds_until_market_open(now), MIN_TTL)
+
+
+def history_ttl(interval: str, now: Optional[datetime] = None) -> float:
+    """TTL of price history, which changes once per bar during the session"""
+    return market_ttl(INTERVAL_SECONDS.get(interval, DAILY_HISTORY_TTL_OPEN), now)
+
+
+class MarketDataService:
+    """Cached, non-blocking access to Yahoo Finance data"""
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        max_entries: int = 256,
+        cache_dir: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        self.max_entries = max(1, max_entries)
+        self.cache_dir = cache_dir
+        # Limits upstream fetches only; cache hits are never throttled
+        self.rate_limiter = rate_limiter
+        self.hits = 0
+        self.misses = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="market-data")
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    async def get_quote(self, symbol: str) -> Dict[str, Any]:
+        """
+        Get the quote snapshot of a symbol, i.e. yfinance's Ticker.info.
+        Contains prices as well as company fundamentals.
+        """
+        symbol = symbol.strip().upper()
+        return await self._get(
+            ("quote", symbol),
+            lambda: yf.Ticker(symbol).info or {},
+            lambda: market_ttl(QUOTE_TTL_OPEN)
+        )
+
+    async def get_history(self, symbol: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+        """
+        Get OHLCV bars of a symbol.
+        The returned frame is shared between callers and must not be modified.
+        """
+        symbol = symbol.strip().upper()
+        return await self._get(
+            ("history", symbol, period, interval),
+            lambda: yf.Ticker(symbol).history(period=period, interval=interval),
+            lambda: history_ttl(interval)
+        )
+
+    async def get_news(self, symbol: str) -> List[Dict[str, Any]]:
+        """Get the latest news items of a symbol"""
+        symbol = symbol.strip().upper()
+        return await self._get(
+            ("news", symbol),
+            lambda: yf.Ticker(symbol).news or [],
+            lambda: NEWS_TTL
+        )
+
+    async def _get(self, key: Tuple, fetch, ttl) -> Any:
+        """Return a cached value, or fetch it once for all concurrent callers"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.time():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.hits += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            loop = asyncio.get_running_loop()
+            cached = await loop.run_in_executor(self._executor, self._read_disk, key)
+            if cached is not None:
+                self.hits += 1
+                expires_at, value = cached
+            else:
+                self.misses += 1
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire(key[0])
+                value = await loop.run_in_executor(self._executor, fetch)
+                expires_at = time.time() + ttl()
+                if not _is_empty(value):
+                    await loop.run_in_executor(self._executor, self._write_disk, key, expires_at, value)
+
+            # Empty results are not cached so a transient upstream failure is retried
+            if not _is_empty(value):
+                self._entries[key] = (expires_at, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieve the exception so it is not reported as never retrieved
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    def _path(self, key: Tuple) -> str:
+        digest = hashlib.sha256("\n".join(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key[0]}-{digest}.json")
+
+    def _read_disk(self, key: Tuple) -> Optional[Tuple[float, Any]]:
+        """Load an unexpired entry from the disk cache"""
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                record = json.load(f)
+            if record["expires_at"] <= time.time():
+                return None
+            value = record["value"]
+            if key[0] == "history":
+                value = pd.read_json(StringIO(value), orient="split")
+                if record.get("tz"):
+                    value.index = pd.to_datetime(value.index, utc=True).tz_convert(record["tz"])
+            return record["expires_at"], value
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable market data cache entry {key}: {str(e)}")
+            return None
+
+    def _write_disk(self, key: Tuple, expires_at: float, value: Any) -> None:
+        """Store an entry in the disk cache, replacing it atomically"""
+        if not self.cache_dir:
+            return
+        record = {"expires_at": expires_at, "value": value}
+        if isinstance(value, pd.DataFrame):
+            record["value"] = value.to_json(orient="split", date_format="iso", date_unit="ns")
+            record["tz"] = str(value.index.tz) if getattr(value.index, "tz", None) else None
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(record, f, default=str)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write market data cache entry {key}: {str(e)}")
+
+
+def _is_empty(value: Any) -> bool:
+    if isinstance(value, pd.DataFrame):
+        return value.empty
+    return not value
+
+
+_service: Optional[MarketDataService] = None
+
+def get_market_data_service() -> MarketDataService:
+    """Get the market data service shared by all tools of this process"""
+    global _service
+    if _service is None:
+        cache_dir = os.environ.get(
+            "MARKET_DATA_CACHE_DIR",
+            os.path.join(tempfile.gettempdir(), "financial-agent-market-data")
+        )
+        _service = MarketDataService(
+            max_workers=int(os.environ.get("MARKET_DATA_WORKERS", "8")),
+            cache_dir=cache_dir or None,
+            # Shared by every server process fetching from Yahoo Finance
+            rate_limiter=create_rate_limiter(
+                "yahoo-finance",
+                per_minute=int(os.environ.get("YAHOO_FINANCE_REQUESTS_PER_MINUTE", "60"))
+            )
+        )
+    return _service
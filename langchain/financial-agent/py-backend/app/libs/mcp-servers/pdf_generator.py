@@ -2,13 +2,13 @@ from typing import List, Dict, Any, Optional
 from mcp.server.fastmcp import FastMCP
 import logging
 import asyncio
-import time
 import argparse
 import os
 import json
 import subprocess
 import platform
 import shutil
+from rate_limiter import create_rate_limiter, add_metrics_route
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -17,36 +17,9 @@ logger = logging.getLogger("pdf-generator-server")
 # Initialize FastMCP server
 mcp = FastMCP("pdf-generator", log_level="INFO")
 
-# Rate limiting implementation
-RATE_LIMIT = {
-    "per_minute": 10,
-    "per_day": 300
-}
-
-request_count = {
-    "minute": 0,
-    "day": 0,
-    "last_minute_reset": time.time(),
-    "last_day_reset": time.time()
-}
-
-def check_rate_limit():
-    now = time.time()
-    
-    if now - request_count["last_minute_reset"] > 60:
-        request_count["minute"] = 0
-        request_count["last_minute_reset"] = now
-    
-    if now - request_count["last_day_reset"] > 86400:
-        request_count["day"] = 0
-        request_count["last_day_reset"] = now
-    
-    if (request_count["minute"] >= RATE_LIMIT["per_minute"] or 
-            request_count["day"] >= RATE_LIMIT["per_day"]):
-        raise Exception('Rate limit exceeded. Please try again later.')
-    
-    request_count["minute"] += 1
-    request_count["day"] += 1
+# Rate limiting implementation, shared across server processes
+rate_limiter = create_rate_limiter("pdf-generator", per_minute=10, per_day=300)
+add_metrics_route(mcp, rate_limiter)
 
 class APIError(Exception):
     pass
@@ -113,7 +86,7 @@ async def convert_docx_to_pdf(filename: str, output_filename: Optional[str] = No
     Returns:
         Status message with result of conversion
     """
-    check_rate_limit()
+    await rate_limiter.acquire("convert_docx_to_pdf")
     
     try:
         filename = ensure_docx_extension(filename)
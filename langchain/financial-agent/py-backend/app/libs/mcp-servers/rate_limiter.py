@@ -0,0 +1,223 @@
+"""
+Token-bucket rate limiting for the MCP servers.
+
+Every limit is a token bucket that holds up to `capacity` requests and
+refills continuously over its period, so bursts are allowed up to the
+capacity and sustained traffic is spread evenly. Requests that find a
+bucket empty wait for a token, up to a deadline, instead of failing
+immediately.
+
+Buckets live in a pluggable backend:
+
+- "sqlite" (default): a SQLite file (RATE_LIMIT_DB, in the temp directory
+  by default) shared by all server processes on the host, which stands in
+  for a Redis instance
+- "memory": per-process buckets
+
+Set RATE_LIMIT_BACKEND to choose the backend. Wait and rejection counts
+per tool are available from RateLimiter.metrics() and are served by each
+server at GET /rate-limits.
+"""
+
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger("rate-limiter")
+
+# Longest a request waits for a token before it is rejected
+DEFAULT_MAX_WAIT_SECONDS = float(os.environ.get("RATE_LIMIT_MAX_WAIT_SECONDS", "30"))
+
+# (bucket key, capacity, tokens refilled per second)
+Bucket = Tuple[str, float, float]
+
+
+class RateLimitExceeded(Exception):
+    pass
+
+
+class InMemoryBackend:
+    """Token buckets held in this process"""
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def try_acquire(self, buckets: List[Bucket], cost: float = 1.0) -> float:
+        """
+        Take cost tokens from every bucket, or from none of them.
+        Returns 0 on success, otherwise the seconds until all buckets have enough tokens.
+        """
+        with self._lock:
+            now = time.monotonic()
+            levels = [_refill(self._buckets.get(key), capacity, rate, now) for key, capacity, rate in buckets]
+            wait = _wait_seconds(buckets, levels, cost)
+            if wait == 0:
+                for (key, _, _), tokens in zip(buckets, levels):
+                    self._buckets[key] = (tokens - cost, now)
+            return wait
+
+
+class SQLiteBackend:
+    """Token buckets in a SQLite database shared by processes on the same host"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL, updated_at REAL)"
+        )
+
+    def try_acquire(self, buckets: List[Bucket], cost: float = 1.0) -> float:
+        """
+        Take cost tokens from every bucket, or from none of them.
+        Returns 0 on success, otherwise the seconds until all buckets have enough tokens.
+        """
+        with self._lock:
+            # An immediate transaction serializes concurrent processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                levels = []
+                for key, capacity, rate in buckets:
+                    row = self._conn.execute(
+                        "SELECT tokens, updated_at FROM buckets WHERE key = ?", (key,)
+                    ).fetchone()
+                    levels.append(_refill(row, capacity, rate, now))
+
+                wait = _wait_seconds(buckets, levels, cost)
+                if wait == 0:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO buckets (key, tokens, updated_at) VALUES (?, ?, ?)",
+                        [(key, tokens - cost, now) for (key, _, _), tokens in zip(buckets, levels)]
+                    )
+                self._conn.execute("COMMIT")
+                return wait
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+
+def _refill(state: Optional[Tuple[float, float]], capacity: float, rate: float, now: float) -> float:
+    """Current tokens of a bucket, given its stored (tokens, updated_at)"""
+    if state is None:
+        return capacity
+    tokens, updated_at = state
+    return min(capacity, tokens + max(0.0, now - updated_at) * rate)
+
+
+def _wait_seconds(buckets: List[Bucket], levels: List[float], cost: float) -> float:
+    """Seconds until every bucket holds cost tokens"""
+    wait = 0.0
+    for (_, capacity, rate), tokens in zip(buckets, levels):
+        needed = min(cost, capacity) - tokens
+        if needed > 0:
+            wait = max(wait, needed / rate if rate > 0 else float("inf"))
+    return wait
+
+
+class RateLimiter:
+    """Rate limits of one server, with per-tool wait and rejection metrics"""
+
+    def __init__(self, name: str, limits: Dict[str, Tuple[float, float]], backend):
+        """
+        limits maps a limit name to (capacity, period in seconds),
+        e.g. {"minute": (10, 60), "day": (300, 86400)}
+        """
+        self.name = name
+        self.backend = backend
+        self.buckets: List[Bucket] = [
+            (f"{name}:{limit}", float(capacity), float(capacity) / period)
+            for limit, (capacity, period) in limits.items()
+        ]
+        self._metrics: Dict[str, Dict[str, float]] = {}
+
+    async def acquire(self, tool: str, max_wait: Optional[float] = None, cost: float = 1.0) -> None:
+        """
+        Wait until a request of a tool may run.
+        Raises RateLimitExceeded if no token becomes available within max_wait seconds.
+        """
+        max_wait = DEFAULT_MAX_WAIT_SECONDS if max_wait is None else max_wait
+        stats = self._metrics.setdefault(tool, {
+            "requests": 0, "waited": 0, "rejected": 0,
+            "wait_seconds_total": 0.0, "wait_seconds_max": 0.0
+        })
+        stats["requests"] += 1
+        deadline = time.monotonic() + max_wait
+        # Only time spent sleeping for a token counts as waiting, not the backend calls
+        waited = 0.0
+
+        while True:
+            wait = await asyncio.to_thread(self.backend.try_acquire, self.buckets, cost)
+            if wait <= 0:
+                break
+            now = time.monotonic()
+            if now + wait > deadline:
+                stats["rejected"] += 1
+                logger.warning(f"Rate limit of {self.name} rejected {tool} (next token in {wait:.1f}s)")
+                raise RateLimitExceeded('Rate limit exceeded. Please try again later.')
+            # Another waiter may take the token first, so check again after sleeping
+            await asyncio.sleep(wait)
+            waited += time.monotonic() - now
+
+        if waited > 0:
+            stats["waited"] += 1
+            stats["wait_seconds_total"] += waited
+            stats["wait_seconds_max"] = max(stats["wait_seconds_max"], waited)
+            logger.info(f"{tool} waited {waited:.2f}s for the {self.name} rate limit")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-tool request, wait and rejection counts and the configured limits"""
+        return {
+            "limits": {key: {"capacity": capacity, "per_second": rate} for key, capacity, rate in self.buckets},
+            "tools": {tool: dict(stats) for tool, stats in self._metrics.items()}
+        }
+
+
+_backend = None
+
+def get_backend():
+    """Get the backend selected by RATE_LIMIT_BACKEND, shared by all limiters of this process"""
+    global _backend
+    if _backend is None:
+        kind = os.environ.get("RATE_LIMIT_BACKEND", "sqlite").lower()
+        if kind == "sqlite":
+            path = os.environ.get(
+                "RATE_LIMIT_DB",
+                os.path.join(tempfile.gettempdir(), "financial-agent-rate-limits.db")
+            )
+            try:
+                _backend = SQLiteBackend(path)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not open rate limit database {path}, limiting per process: {str(e)}")
+        elif kind != "memory":
+            logger.warning(f"Unknown RATE_LIMIT_BACKEND {kind}, limiting per process")
+        if _backend is None:
+            _backend = InMemoryBackend()
+    return _backend
+
+
+def create_rate_limiter(name: str, per_minute: Optional[int] = None, per_day: Optional[int] = None) -> RateLimiter:
+    """Create a rate limiter with per-minute and per-day limits on the shared backend"""
+    limits = {}
+    if per_minute:
+        limits["minute"] = (per_minute, 60)
+    if per_day:
+        limits["day"] = (per_day, 86400)
+    return RateLimiter(name, limits, get_backend())
+
+
+def add_metrics_route(mcp, rate_limiter: RateLimiter) -> None:
+    """Serve the rate limiter metrics of a FastMCP server at GET /rate-limits"""
+    from starlette.responses import JSONResponse
+
+    @mcp.custom_route("/rate-limits", methods=["GET"])
+    async def rate_limit_metrics(request):
+        return JSONResponse(rate_limiter.metrics())
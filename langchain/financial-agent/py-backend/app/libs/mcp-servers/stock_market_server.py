@@ -2,12 +2,12 @@ from typing import List, Union, Dict, Any, Optional
 from mcp.server.fastmcp import FastMCP
 import logging
 import json
-import time
 import asyncio
 import aiohttp
 from datetime import datetime, timedelta
 import argparse
-import yfinance as yf
+from market_data import get_market_data_service
+from rate_limiter import create_rate_limiter, add_metrics_route
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -16,37 +16,9 @@ logger = logging.getLogger("stock-market-server")
 # Initialize FastMCP server
 mcp = FastMCP("stock_market", log_level="INFO")
 
-# Rate limiting implementation
-RATE_LIMIT = {
-    "per_minute": 20,  
-    "per_day": 500
-}
-
-request_count = {
-    "minute": 0,
-    "day": 0,
-    "last_minute_reset": time.time(),
-    "last_day_reset": time.time()
-}
-
-def check_rate_limit():
-    """Check and update rate limits for API calls"""
-    now = time.time()
-    
-    if now - request_count["last_minute_reset"] > 60:
-        request_count["minute"] = 0
-        request_count["last_minute_reset"] = now
-    
-    if now - request_count["last_day_reset"] > 86400:
-        request_count["day"] = 0
-        request_count["last_day_reset"] = now
-    
-    if (request_count["minute"] >= RATE_LIMIT["per_minute"] or 
-            request_count["day"] >= RATE_LIMIT["per_day"]):
-        raise Exception('Rate limit exceeded. Please try again later.')
-    
-    request_count["minute"] += 1
-    request_count["day"] += 1
+# Rate limiting implementation, shared across server processes
+rate_limiter = create_rate_limiter("stock-market", per_minute=20, per_day=500)
+add_metrics_route(mcp, rate_limiter)
 
 # Helper functions for formatting output
 def format_number(num):
@@ -119,10 +91,7 @@ async def yahoo_stock_quote(symbol: str) -> str:
         symbol: Stock ticker symbol (e.g., AAPL, MSFT, TSLA)
     """
     try:
-        # Use yfinance library
-        loop = asyncio.get_event_loop()
-        ticker = await loop.run_in_executor(None, yf.Ticker, symbol)
-        info = await loop.run_in_executor(None, lambda: ticker.info)
+        info = await get_market_data_service().get_quote(symbol)
         
         if not info:
             return f"No data found for symbol: {symbol}"
@@ -167,7 +136,7 @@ async def yahoo_stock_history(symbol: str, period: str = "1mo", interval: str =
         interval: Data interval (1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo)
     """
     try:
-        check_rate_limit()
+        await rate_limiter.acquire("yahoo_stock_history")
         
         # Validate period and interval
         valid_periods = ['1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max']
@@ -179,17 +148,19 @@ async def yahoo_stock_history(symbol: str, period: str = "1mo", interval: str =
         if interval not in valid_intervals:
             raise ValueError(f"Invalid interval: {interval}. Valid intervals are: {', '.join(valid_intervals)}")
         
-        # Use yfinance library
-        loop = asyncio.get_event_loop()
-        ticker = await loop.run_in_executor(None, yf.Ticker, symbol)
-        history = await loop.run_in_executor(None, lambda: ticker.history(period=period, interval=interval))
+        # Fetch the bars and the quote (for the currency) concurrently
+        market_data = get_market_data_service()
+        history, info = await asyncio.gather(
+            market_data.get_history(symbol, period=period, interval=interval),
+            market_data.get_quote(symbol)
+        )
         
         if history.empty:
             return f"No historical data found for symbol: {symbol}"
         
         # Format the output
         result = f"Historical data for {symbol} ({period}, {interval} intervals)\n"
-        result += f"Currency: {ticker.info.get('currency', 'USD')}\n\n"
+        result += f"Currency: {info.get('currency', 'USD')}\n\n"
         
         # Table header
         result += "Date       | Open     | High     | Low      | Close    | Volume\n"
@@ -244,18 +215,22 @@ async def yahoo_market_data(indices: List[str] = None) -> str:
                 Default: ["^GSPC", "^DJI", "^IXIC"] (S&P 500, Dow Jones, NASDAQ)
     """
     try:
-        check_rate_limit()
+        await rate_limiter.acquire("yahoo_market_data")
         
         if indices is None:
             indices = ["^GSPC", "^DJI", "^IXIC"]  # Default indices: S&P 500, Dow Jones, NASDAQ
         
-        loop = asyncio.get_event_loop()
+        market_data = get_market_data_service()
+        index_infos = await asyncio.gather(
+            *(market_data.get_quote(index_symbol) for index_symbol in indices),
+            return_exceptions=True
+        )
         index_results = []
         
-        for index_symbol in indices:
+        for index_symbol, info in zip(indices, index_infos):
             try:
-                ticker = await loop.run_in_executor(None, yf.Ticker, index_symbol)
-                info = await loop.run_in_executor(None, lambda: ticker.info)
+                if isinstance(info, Exception):
+                    raise info
                 
                 if info:
                     index_results.append({
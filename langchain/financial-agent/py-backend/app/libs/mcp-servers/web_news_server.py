@@ -2,7 +2,6 @@ from typing import List, Dict, Any, Optional
 from mcp.server.fastmcp import FastMCP
 import logging
 import asyncio
-import yfinance as yf
 from pydantic import Field
 from datetime import datetime
 import httpx
@@ -10,36 +9,16 @@ from bs4 import BeautifulSoup
 from duckduckgo_search import DDGS
 import argparse
 import sys
-import time
+from market_data import get_market_data_service
+from rate_limiter import create_rate_limiter, add_metrics_route
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("financial-news-server")
 
 mcp = FastMCP("financial-news", log_level="INFO")
 
-RATE_LIMIT = {"per_minute": 15, "per_day": 300}
-request_count = {
-    "minute": 0, "day": 0,
-    "last_minute_reset": time.time(),
-    "last_day_reset": time.time()
-}
-
-def check_rate_limit():
-    now = time.time()
-    
-    if now - request_count["last_minute_reset"] > 60:
-        request_count["minute"] = 0
-        request_count["last_minute_reset"] = now
-    
-    if now - request_count["last_day_reset"] > 86400:
-        request_count["day"] = 0
-        request_count["last_day_reset"] = now
-    
-    if (request_count["minute"] >= RATE_LIMIT["per_minute"] or request_count["day"] >= RATE_LIMIT["per_day"]):
-        raise Exception('Rate limit exceeded. Please try again later.')
-    
-    request_count["minute"] += 1
-    request_count["day"] += 1
+rate_limiter = create_rate_limiter("financial-news", per_minute=15, per_day=300)
+add_metrics_route(mcp, rate_limiter)
 
 class APIError(Exception):
     pass
@@ -115,7 +94,7 @@ async def financial_news(
 ) -> str:
     """Get the latest financial news for a specific stock ticker symbol."""
     try:
-        check_rate_limit()
+        await rate_limiter.acquire("financial_news")
         
         if not symbol or len(symbol.strip()) == 0:
             return "Please provide a valid stock ticker symbol."
@@ -125,9 +104,7 @@ async def financial_news(
         
         logger.info(f"Getting latest news for ticker: {symbol}, count: {count}")
         
-        loop = asyncio.get_event_loop()
-        ticker = await loop.run_in_executor(None, yf.Ticker, symbol)
-        news_data = await loop.run_in_executor(None, lambda: ticker.news)
+        news_data = await get_market_data_service().get_news(symbol)
         
         if not news_data:
             logger.info(f"No news found for ticker {symbol}")
@@ -3,7 +3,6 @@ from mcp.server.fastmcp import FastMCP
 import logging
 import argparse
 import os
-import time
 import platform
 import re
 from docx import Document
@@ -15,6 +14,7 @@ import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 import json as json_lib
+from rate_limiter import create_rate_limiter, add_metrics_route
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -23,36 +23,9 @@ logger = logging.getLogger("word-generator-server")
 # Initialize FastMCP server
 mcp = FastMCP("word-generator", log_level="INFO")
 
-# Rate limiting implementation
-RATE_LIMIT = {
-    "per_minute": 20,
-    "per_day": 500
-}
-
-request_count = {
-    "minute": 0,
-    "day": 0,
-    "last_minute_reset": time.time(),
-    "last_day_reset": time.time()
-}
-
-def check_rate_limit():
-    now = time.time()
-    
-    if now - request_count["last_minute_reset"] > 60:
-        request_count["minute"] = 0
-        request_count["last_minute_reset"] = now
-    
-    if now - request_count["last_day_reset"] > 86400:
-        request_count["day"] = 0
-        request_count["last_day_reset"] = now
-    
-    if (request_count["minute"] >= RATE_LIMIT["per_minute"] or 
-            request_count["day"] >= RATE_LIMIT["per_day"]):
-        raise Exception('Rate limit exceeded. Please try again later.')
-    
-    request_count["minute"] += 1
-    request_count["day"] += 1
+# Rate limiting implementation, shared across server processes
+rate_limiter = create_rate_limiter("word-generator", per_minute=20, per_day=500)
+add_metrics_route(mcp, rate_limiter)
 
 class APIError(Exception):
     pass
@@ -229,7 +202,7 @@ async def create_word_document(filename: str, content: str, title: Optional[str]
     Returns:
         Status message with result and download info
     """
-    check_rate_limit()
+    await rate_limiter.acquire("create_word_document")
     
     try:
         filename = ensure_docx_extension(filename)
@@ -458,7 +431,7 @@ async def parse_table_from_text(text: str) -> List[List[str]]:
     Returns:
         2D list of rows and columns
     """
-    check_rate_limit()
+    await rate_limiter.acquire("parse_table_from_text")
     
     try:
         rows = []
@@ -1,14 +1,191 @@
+import asyncio
 import logging
+import time
 from typing import Dict, List, Any, Tuple, Callable, Optional
-from contextlib import ExitStack
 from mcp.client.streamable_http import streamablehttp_client
 from strands.tools.mcp.mcp_client import MCPClient
 
 logger = logging.getLogger(__name__)
 
+# Seconds between health checks of connected servers
+HEALTH_CHECK_INTERVAL = 30
+# Seconds a health check may take before the server is considered down
+HEALTH_CHECK_TIMEOUT = 10
+# Reconnect backoff of unavailable servers, doubling from min to max seconds
+RECONNECT_MIN_BACKOFF = 5
+RECONNECT_MAX_BACKOFF = 300
+
+
+class PooledMCPServer:
+    """Connection state of one MCP server in the pool"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.client: Optional[MCPClient] = None
+        self.tools: List[Any] = []
+        self.connected = False
+        self.last_error: Optional[str] = None
+        self.failures = 0
+        self.retry_at = 0.0
+        self.lock = asyncio.Lock()
+
+
+class MCPClientPool:
+    """
+    Long-lived MCP client sessions shared by all requests.
+
+    Each server is connected once and its tool schemas are cached, so a
+    request reuses the open session instead of connecting and listing tools
+    again. A background task health-checks connected servers, refreshing the
+    cached tools, and reconnects unavailable servers with exponential backoff.
+    Servers in backoff are skipped by requests rather than retried inline.
+    """
+
+    def __init__(self, health_check_interval: float = HEALTH_CHECK_INTERVAL):
+        self.health_check_interval = health_check_interval
+        self._servers: Dict[str, PooledMCPServer] = {}
+        self._monitor_task: Optional[asyncio.Task] = None
+
+    async def get_clients(self, server_urls: List[str]) -> Tuple[List[MCPClient], List[Any]]:
+        """
+        Get connected clients and their cached tools for a set of servers.
+        Servers that are not connected yet are connected concurrently.
+
+        Args:
+            server_urls: List of MCP server URLs
+
+        Returns:
+            Tuple containing:
+            - List of connected MCPClient objects
+            - List of all tools collected from the servers
+        """
+        self._ensure_monitor()
+        servers = [self._servers.setdefault(url, PooledMCPServer(url)) for url in dict.fromkeys(server_urls)]
+        await asyncio.gather(*(
+            self._connect(server) for server in servers
+            if not server.connected and server.retry_at <= time.monotonic()
+        ))
+
+        mcp_clients, all_tools = [], []
+        for server in servers:
+            if server.connected and server.tools:
+                mcp_clients.append(server.client)
+                all_tools.extend(server.tools)
+        return mcp_clients, all_tools
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Connection state and cached tool names of every known server"""
+        return [
+            {
+                "url": server.url,
+                "connected": server.connected,
+                "tools": [getattr(tool, 'tool_name', str(tool)) for tool in server.tools],
+                "last_error": server.last_error,
+                "failures": server.failures
+            }
+            for server in self._servers.values()
+        ]
+
+    async def close(self) -> None:
+        """Stop the health checks and close all sessions"""
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            self._monitor_task = None
+        for server in self._servers.values():
+            async with server.lock:
+                await asyncio.to_thread(self._disconnect, server)
+        self._servers.clear()
+
+    def _ensure_monitor(self) -> None:
+        if self._monitor_task is None or self._monitor_task.done():
+            self._monitor_task = asyncio.create_task(self._monitor())
+
+    async def _monitor(self) -> None:
+        """Periodically check connected servers and reconnect unavailable ones"""
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            now = time.monotonic()
+            await asyncio.gather(*(
+                self._check(server) if server.connected else self._connect(server)
+                for server in list(self._servers.values())
+                if server.connected or server.retry_at <= now
+            ))
+
+    async def _connect(self, server: PooledMCPServer) -> None:
+        async with server.lock:
+            # Another request may have connected the server while this one waited
+            if server.connected:
+                return
+            try:
+                server.client, server.tools = await asyncio.to_thread(self._open, server.url)
+                server.connected = True
+                server.failures = 0
+                server.last_error = None
+                logger.info(f"Successfully connected to MCP server {server.url}, found {len(server.tools)} tools")
+            except Exception as e:
+                self._mark_failed(server, e)
+
+    async def _check(self, server: PooledMCPServer) -> None:
+        async with server.lock:
+            if not server.connected:
+                return
+            try:
+                # Listing tools proves the session works and refreshes the cached schemas
+                tools = await asyncio.wait_for(
+                    asyncio.to_thread(server.client.list_tools_sync),
+                    timeout=HEALTH_CHECK_TIMEOUT
+                )
+                server.tools = list(tools)
+            except Exception as e:
+                logger.warning(f"Health check of MCP server {server.url} failed: {str(e) or type(e).__name__}")
+                await asyncio.to_thread(self._disconnect, server)
+                self._mark_failed(server, e)
+
+    def _mark_failed(self, server: PooledMCPServer, error: Exception) -> None:
+        server.failures += 1
+        server.last_error = str(error) or type(error).__name__
+        backoff = min(RECONNECT_MAX_BACKOFF, RECONNECT_MIN_BACKOFF * 2 ** (server.failures - 1))
+        server.retry_at = time.monotonic() + backoff
+        logger.error(f"MCP server {server.url} is unavailable, retrying in {backoff}s: {server.last_error}")
+
+    @staticmethod
+    def _open(url: str) -> Tuple[MCPClient, List[Any]]:
+        """Open a session to a server and list its tools (blocking)"""
+        def create_transport():
+            logger.info(f"Creating transport for MCP server: {url}")
+            return streamablehttp_client(url)
+
+        logger.info(f"Initializing MCP client for {url}")
+        mcp_client = MCPClient(create_transport)
+        mcp_client.start()
+        try:
+            tools = list(mcp_client.list_tools_sync())
+        except Exception:
+            mcp_client.stop(None, None, None)
+            raise
+        if not tools:
+            logger.warning(f"Connected to MCP server {url}, but no tools were found")
+        return mcp_client, tools
+
+    @staticmethod
+    def _disconnect(server: PooledMCPServer) -> None:
+        """Close the session of a server (blocking), keeping its cached tools"""
+        client, server.client, server.connected = server.client, None, False
+        if client is None:
+            return
+        try:
+            client.stop(None, None, None)
+        except Exception as e:
+            logger.warning(f"Error closing MCP client for {server.url}: {str(e)}")
+
+
+# Process-wide pool shared by all graph nodes
+mcp_client_pool = MCPClientPool()
+
 async def create_mcp_clients(server_urls: List[str]) -> Tuple[List[MCPClient], List[Any]]:
     """
-    Create MCP clients and collect tools from multiple MCP servers.
+    Get connected MCP clients and their tools from the shared pool.
+    The clients stay open and must not be entered or stopped by the caller.
     
     Args:
         server_urls: List of MCP server URLs to connect to
@@ -18,75 +195,7 @@ async def create_mcp_clients(server_urls: List[str]) -> Tuple[List[MCPClient], L
         - List of connected MCPClient objects
         - List of all tools collected from the servers
     """
-    all_tools = []
-    mcp_clients = []
-    
-    for url in server_urls:
-        try:
-            # Create transport function with proper error handling
-            def create_transport(url=url):
-                try:
-                    logger.info(f"Creating transport for MCP server: {url}")
-                    return streamablehttp_client(url)
-                except Exception as e:
-                    logger.error(f"Transport error for {url}: {str(e)}")
-                    raise
-            
-            # Create MCP client
-            logger.info(f"Initializing MCP client for {url}")
-            mcp_client = MCPClient(create_transport)
-            
-            # We're going to safely test the connection first
-            try:
-                with mcp_client:
-                    logger.info(f"Testing connection to MCP server {url}")
-                    tools = mcp_client.list_tools_sync()
-                    
-                    if tools:
-                        tool_names = [getattr(tool, 'tool_name', str(tool)) for tool in tools]
-                        logger.info(f"Found tools at {url}: {', '.join(tool_names[:5])}{'...' if len(tool_names) > 5 else ''}")
-                        
-                        all_tools.extend(tools)
-                        mcp_clients.append(mcp_client)
-                        logger.info(f"Successfully connected to MCP server {url}, found {len(tools)} tools")
-                    else:
-                        logger.warning(f"Connected to MCP server {url}, but no tools were found")
-            except Exception as e:
-                logger.error(f"MCP client initialization failed for {url}: {str(e)}")
-                continue 
-
-        except Exception as e:
-            logger.error(f"Failed to connect to MCP server {url}: {str(e)}")
-    
-    return mcp_clients, all_tools
-
-class MCPClientContext:
-    """Context manager for handling multiple MCP clients."""
-    
-    def __init__(self, clients: List[MCPClient]):
-        """
-        Initialize with a list of MCP clients.
-        
-        Args:
-            clients: List of MCPClient objects to manage
-        """
-        self.clients = clients
-        self.stack = ExitStack()
-    
-    def __enter__(self):
-        """Enter the context, managing all client connections."""
-        for client in self.clients:
-            self.stack.enter_context(client)
-        return self
-    
-    def __exit__(self, *args):
-        """Exit the context, closing all client connections."""
-        self.stack.close()
-    
-    @property
-    def is_empty(self):
-        """Check if there are any clients."""
-        return len(self.clients) == 0
+    return await mcp_client_pool.get_clients(server_urls)
 
 def get_mcp_server_urls_from_config(config: Dict[str, Any]) -> List[str]:
     """
@@ -4,7 +4,7 @@ from app.libs.types import GraphState
 from app.libs.decorators import with_thought_callback, log_thought
 from app.libs.conversation_memory import conversation_memory
 from app.libs.prompts import FINANCIAL_SYSTEM_PROMPT
-from app.libs.mcp_client_factory import create_mcp_clients, MCPClientContext
+from app.libs.mcp_client_factory import create_mcp_clients
 from strands.agent import Agent
 
 logger = logging.getLogger("strands_reasoning")
@@ -57,7 +57,7 @@ async def execute_financial_analysis(state: GraphState) -> GraphState:
             content=f"Loaded conversation history with {len(conversation_history)} messages"
         )
 
-        # Initialize MCP clients using our factory utility
+        # Get pooled MCP clients and their cached tools
         mcp_clients = []
         all_tools = []
         
@@ -99,44 +99,43 @@ async def execute_financial_analysis(state: GraphState) -> GraphState:
                 tool_names = [getattr(tool, 'tool_name', str(tool)) for tool in all_tools]
                 logger.info(f"Available tools: {', '.join(tool_names[:5])}{'...' if len(tool_names) > 5 else ''}")
                 
-                # Use our new MCPClientContext for managing connections
-                client_context = MCPClientContext(mcp_clients)
-                with client_context:
-                    # Create enhanced callback handler for streaming visibility
-                    callback = create_enhanced_callback_handler(session_id)
-                    tool_names = [getattr(tool, 'tool_name', str(tool)) for tool in all_tools]
-                    logger.info(f"Configuring Strands agent with tools: {', '.join(tool_names)}")
+                # Pooled clients stay connected across requests, so they are used without re-entering them
+
+                # Create enhanced callback handler for streaming visibility
+                callback = create_enhanced_callback_handler(session_id)
+                tool_names = [getattr(tool, 'tool_name', str(tool)) for tool in all_tools]
+                logger.info(f"Configuring Strands agent with tools: {', '.join(tool_names)}")
                     
-                    # Configure the Strands agent with proper tools and callbacks
-                    agent = Agent(
-                        model=model,
-                        system_prompt=FINANCIAL_SYSTEM_PROMPT,
-                        messages=conversation_history[-10:] if conversation_history else [],
-                        tools=all_tools,
-                        callback_handler=callback
-                    )
+                # Configure the Strands agent with proper tools and callbacks
+                agent = Agent(
+                    model=model,
+                    system_prompt=FINANCIAL_SYSTEM_PROMPT,
+                    messages=conversation_history[-10:] if conversation_history else [],
+                    tools=all_tools,
+                    callback_handler=callback
+                )
                     
-                    # Execute the agent with streaming support if enabled
-                    if stream_enabled:
-                        final_answer = ""
-                        result = None
+                # Execute the agent with streaming support if enabled
+                if stream_enabled:
+                    final_answer = ""
+                    result = None
                         
-                        # Process the agent execution as an async stream
-                        async for event in agent.stream_async(query):
-                            if "data" in event and isinstance(event["data"], str):
-                                final_answer += event["data"]
-                            if "message" in event:
-                                result = event
-                    else:
-                        # Execute without streaming
-                        final_answer = ""
-                        result = None
+                    # Process the agent execution as an async stream
+                    async for event in agent.stream_async(query):
+                        if "data" in event and isinstance(event["data"], str):
+                            final_answer += event["data"]
+                        if "message" in event:
+                            result = event
+                else:
+                    # Execute without streaming
+                    final_answer = ""
+                    result = None
                         
-                        async for event in agent.stream_async(query):
-                            if "data" in event and isinstance(event["data"], str):
-                                final_answer += event["data"]
-                            if "message" in event:
-                                result = event
+                    async for event in agent.stream_async(query):
+                        if "data" in event and isinstance(event["data"], str):
+                            final_answer += event["data"]
+                        if "message" in event:
+                            result = event
             except Exception as e:
                 logger.error(f"Error executing Strands Agent with tools: {str(e)}")
                 log_thought(
@@ -84,6 +84,7 @@ TOOL EXECUTION STRATEGY:
 - Prioritize tools based on primary user questions
 - For stock queries: Start with comprehensive_analysis
 - For specific needs: Use targeted tools like fundamental_data_by_category
+- For comparing several stocks: Use technical_data_for_symbols once with all symbols
 - Execute tools iteratively - start with one, add more only if needed
 
 DATA COLLECTION STRATEGY:
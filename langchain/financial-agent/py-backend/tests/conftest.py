@@ -0,0 +1,13 @@
+"""
+Shared test setup.
+
+The MCP servers run as standalone scripts from app/libs/mcp-servers and
+import their sibling modules directly, so that directory is put on the
+import path the same way.
+"""
+
+import os
+import sys
+
+MCP_SERVERS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "app", "libs", "mcp-servers")
+sys.path.insert(0, MCP_SERVERS_DIR)
@@ -0,0 +1,197 @@
+import base64
+import os
+import time
+
+import pytest
+
+from app.libs.conversation_memory import conversation_memory
+from app.libs.conversation_store import (
+    ConversationStore,
+    InMemoryConversationStore,
+    SQLiteConversationStore,
+    blob_digest,
+    create_conversation_store,
+    evict_count,
+)
+
+
+def text_message(text, role="user"):
+    return {"role": role, "content": [{"text": text}]}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryConversationStore(window_size=5)
+    return SQLiteConversationStore(str(tmp_path / "conversations.db"), window_size=5)
+
+
+@pytest.fixture
+def memory(store, monkeypatch):
+    """The conversation memory manager backed by the store under test"""
+    monkeypatch.setattr(conversation_memory, "store", store)
+    return conversation_memory
+
+
+def test_evict_count():
+    # Window of 3 messages
+    assert evict_count([10] * 5, 50, 3, 1000) == 2
+    # Byte budget of 25 bytes
+    assert evict_count([10] * 5, 50, 10, 25) == 3
+    # The newest message is kept even if it alone is over the budget
+    assert evict_count([10, 100], 110, 10, 50) == 1
+
+
+def test_window_bounds_messages(store):
+    store.create_session("s")
+    evicted = [store.append_message("s", text_message(f"m{i}"), increment_turn=True) for i in range(8)]
+
+    session = store.get_session("s")
+    assert [m["content"][0]["text"] for m in session["messages"]] == ["m3", "m4", "m5", "m6", "m7"]
+    assert sum(evicted) == 3
+    assert session["metadata"]["message_count"] == 5
+    assert session["metadata"]["turn_count"] == 8
+
+
+def test_system_messages_are_kept(store):
+    store.create_session("s")
+    store.append_message("s", text_message("rules", role="system"))
+    for i in range(8):
+        store.append_message("s", text_message(f"m{i}"))
+
+    messages = store.get_session("s")["messages"]
+    assert messages[0]["role"] == "system"
+    assert len(messages) == 6
+
+
+def test_byte_budget_bounds_sessions(store):
+    store.max_session_bytes = 500
+    store.create_session("s")
+    for _ in range(5):
+        store.append_message("s", text_message("x" * 150))
+
+    assert 2 <= len(store.get_session("s")["messages"]) <= 3
+    store.append_message("s", text_message("y" * 2000))
+    assert len(store.get_session("s")["messages"]) == 1
+
+
+def test_blobs_are_shared_and_released(store):
+    data = os.urandom(100)
+    digest = blob_digest(data)
+    for session_id in ("a", "b"):
+        store.create_session(session_id)
+        store.append_message(session_id, text_message(digest), blobs={digest: data})
+
+    assert store.get_blob(digest) == data
+    assert store.stats()["total_blobs"] == 1
+    store.delete_session("a")
+    assert store.get_blob(digest) == data
+    store.delete_session("b")
+    assert store.get_blob(digest) is None
+
+
+def test_trim_and_expire(store):
+    for session_id in ("old", "new"):
+        store.create_session(session_id)
+        store.append_message(session_id, text_message("hello"), increment_turn=True)
+        store.append_message(session_id, text_message("again"), increment_turn=True)
+
+    assert store.trim_messages("old", 1)
+    assert [m["content"][0]["text"] for m in store.get_session("old")["messages"]] == ["again"]
+    assert store.trim_messages("new", 0, reset_turns=True)
+    assert store.get_session("new")["metadata"]["turn_count"] == 0
+    assert not store.trim_messages("missing", 1)
+
+    time.sleep(0.2)
+    store.append_message("new", text_message("active"))
+    assert store.expire_sessions(0.1) == ["old"]
+    assert not store.has_session("old")
+    assert store.has_session("new")
+
+
+def test_in_memory_store_evicts_least_recently_used_sessions():
+    store = InMemoryConversationStore(max_sessions=3)
+    for i in range(3):
+        store.create_session(f"s{i}")
+    store.get_session("s0")
+    store.create_session("s3")
+
+    assert [store.has_session(f"s{i}") for i in range(4)] == [True, False, True, True]
+
+
+def test_in_memory_store_bounds_total_bytes():
+    store = InMemoryConversationStore(max_total_bytes=2000)
+    for i in range(5):
+        store.create_session(f"s{i}")
+        store.append_message(f"s{i}", text_message("x" * 500))
+
+    assert store.stats()["total_bytes"] <= 2000
+    assert not store.has_session("s0")
+    assert store.has_session("s4")
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "conversations.db")
+    first, second = SQLiteConversationStore(path), SQLiteConversationStore(path)
+
+    first.create_session("s")
+    first.append_message("s", text_message("hi"))
+
+    assert second.has_session("s")
+    assert second.get_session("s")["messages"] == [text_message("hi")]
+
+
+def test_manager_resolves_stored_images(memory):
+    image = b"\x89PNG" + os.urandom(200)
+    memory.ensure_session_exists("s")
+    memory.add_user_message("s", "look", {"image": base64.b64encode(image).decode()})
+    memory.add_assistant_message("s", "nice chart")
+
+    messages = memory.get_conversation_history("s")["messages"]
+    assert messages[0]["content"][1]["image"]["source"]["bytes"] == image
+    assert messages[1]["content"][0]["text"] == "nice chart"
+    assert memory.get_raw_conversation("s")["metadata"]["turn_count"] == 2
+
+
+def test_store_is_selected_by_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("CONVERSATION_STORE", "sqlite")
+    monkeypatch.setenv("CONVERSATION_DB", str(tmp_path / "conversations.db"))
+    assert isinstance(create_conversation_store(), SQLiteConversationStore)
+
+    monkeypatch.setenv("CONVERSATION_STORE", "memory")
+    store = create_conversation_store(window_size=7)
+    assert isinstance(store, InMemoryConversationStore)
+    assert store.window_size == 7
+
+    monkeypatch.setenv("CONVERSATION_STORE", "unknown")
+    assert isinstance(create_conversation_store(), InMemoryConversationStore)
+
+
+def test_backends_must_implement_the_interface():
+    class PartialStore(ConversationStore):
+        def create_session(self, session_id):
+            return True
+
+    with pytest.raises(TypeError):
+        PartialStore()
+
+
+def test_manager_uses_a_custom_backend(monkeypatch):
+    class RecordingStore(InMemoryConversationStore):
+        def __init__(self):
+            super().__init__(window_size=2)
+            self.appended = []
+
+        def append_message(self, session_id, message, blobs=None, increment_turn=False):
+            self.appended.append(message["role"])
+            return super().append_message(session_id, message, blobs, increment_turn)
+
+    store = RecordingStore()
+    monkeypatch.setattr(conversation_memory, "store", store)
+    conversation_memory.ensure_session_exists("s")
+    conversation_memory.add_user_message("s", "question")
+    conversation_memory.add_assistant_message("s", "answer")
+    conversation_memory.add_user_message("s", "follow-up")
+
+    assert store.appended == ["user", "assistant", "user"]
+    assert len(conversation_memory.get_conversation_history("s")["messages"]) == 2
@@ -0,0 +1,172 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import MAX_BARS, IndicatorEngine
+
+
+def per_symbol(hist):
+    """The per-symbol pandas computation the engine replaces"""
+    close = hist["Close"]
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    rs = gain.rolling(window=14).mean() / loss.rolling(window=14).mean()
+    true_range = pd.concat([
+        hist["High"] - hist["Low"],
+        (hist["High"] - close.shift()).abs(),
+        (hist["Low"] - close.shift()).abs()
+    ], axis=1).max(axis=1)
+    macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    signal = macd.ewm(span=9, adjust=False).mean()
+    sma = {w: close.rolling(window=w).mean().iloc[-1] for w in (20, 50, 200)}
+    atr = true_range.rolling(window=14).mean().iloc[-1]
+    price = close.iloc[-1]
+    return {
+        "price": price,
+        "avg_volume": hist["Volume"].mean(),
+        "sma_20": sma[20],
+        "sma_50": sma[50],
+        "sma_200": sma[200],
+        "rsi": 100 - (100 / (1 + rs)).iloc[-1],
+        "atr": atr,
+        "atr_percent": atr / price * 100,
+        "macd": macd.iloc[-1],
+        "macd_signal": signal.iloc[-1],
+        "1d": close.pct_change(periods=1).iloc[-1] * 100,
+        "5d": close.pct_change(periods=5).iloc[-1] * 100,
+        "20d": close.pct_change(periods=20).iloc[-1] * 100,
+        "from_50sma": (price / sma[50] - 1) * 100,
+    }
+
+
+def flatten(result):
+    return {
+        "price": result["price"],
+        "avg_volume": result["avg_volume"],
+        **result["moving_averages"],
+        "rsi": result["indicators"]["rsi"],
+        "atr": result["indicators"]["atr"],
+        "atr_percent": result["indicators"]["atr_percent"],
+        "macd": result["indicators"]["macd"],
+        "macd_signal": result["indicators"]["macd_signal"],
+        **result["trend_analysis"],
+        "from_50sma": result["ma_distances"]["from_50sma"],
+    }
+
+
+def assert_matches(result, expected):
+    actual = flatten(result)
+    for key, value in expected.items():
+        if np.isnan(value):
+            assert np.isnan(actual[key]), key
+        else:
+            assert actual[key] == pytest.approx(value, rel=1e-9), key
+
+
+def make_history(bars, seed, start="2025-01-01", freq="B"):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(size=bars))
+    return pd.DataFrame({
+        "Open": close,
+        "High": close + rng.random(bars),
+        "Low": close - rng.random(bars),
+        "Close": close,
+        "Volume": rng.integers(100_000, 1_000_000, bars).astype(float),
+    }, index=pd.date_range(start, periods=bars, freq=freq))
+
+
+def test_batch_matches_per_symbol_results():
+    histories = {f"S{bars}": make_history(bars, bars) for bars in (MAX_BARS, 250, 120, 30, 10, 1)}
+    # A symbol on a different trading calendar
+    histories["CRYPTO"] = make_history(200, 7, freq="D")
+
+    engine = IndicatorEngine()
+    engine.update(histories)
+    results = engine.compute()
+
+    assert set(results) == set(histories)
+    for symbol, history in histories.items():
+        assert_matches(results[symbol], per_symbol(history))
+
+
+def test_incremental_updates_match_a_full_recomputation():
+    history = make_history(MAX_BARS, 1)
+    engine = IndicatorEngine()
+    engine.update({"X": history.iloc[:200]})
+    # Only new bars, then a full history with the last bar revised
+    engine.update({"X": history.iloc[200:240]})
+    revised = history.copy()
+    revised.iloc[-1, revised.columns.get_loc("Close")] += 5
+    revised.iloc[-1, revised.columns.get_loc("High")] += 5
+    engine.update({"X": revised})
+
+    assert_matches(engine.compute(["X"])["X"], per_symbol(revised))
+
+
+def test_unchanged_history_is_ignored():
+    history = make_history(MAX_BARS, 2)
+    engine = IndicatorEngine()
+    engine.update({"X": history})
+    before = engine.compute()
+    engine.update({"X": history.iloc[:100], "EMPTY": history.iloc[:0]})
+
+    assert engine.compute() == before
+
+
+def test_average_volume_covers_the_last_max_bars():
+    history = make_history(MAX_BARS + 100, 3)
+    engine = IndicatorEngine()
+    engine.update({"X": history})
+    result = engine.compute(["X"])["X"]
+
+    kept = history.iloc[-MAX_BARS:]
+    assert result["avg_volume"] == pytest.approx(kept["Volume"].mean(), rel=1e-9)
+    # MACD still runs over every bar
+    assert_matches(result, {**per_symbol(kept), "macd": per_symbol(history)["macd"],
+                            "macd_signal": per_symbol(history)["macd_signal"]})
+
+
+def test_compute_selected_and_unknown_symbols():
+    engine = IndicatorEngine()
+    engine.update({"A": make_history(30, 4), "B": make_history(30, 5)})
+
+    assert list(engine.compute(["B", "UNKNOWN"])) == ["B"]
+    assert IndicatorEngine().compute() == {}
+
+
+def test_updates_with_different_index_resolutions():
+    history = make_history(61, 6)
+    nanoseconds = history.iloc[:60].copy()
+    nanoseconds.index = nanoseconds.index.as_unit("ns")
+    engine = IndicatorEngine()
+    engine.update({"X": history.iloc[:50].set_axis(history.index[:50].as_unit("us"))})
+    engine.update({"X": nanoseconds})
+    engine.update({"X": history.set_axis(history.index.as_unit("s"))})
+
+    assert_matches(engine.compute(["X"])["X"], per_symbol(history))
+
+
+def test_adjusted_history_rebuilds_the_symbol():
+    history = make_history(MAX_BARS + 1, 8)
+    engine = IndicatorEngine()
+    engine.update({"X": history.iloc[:-1]})
+
+    # A 10:1 split: the next fetch adjusts every past bar
+    adjusted = history.copy()
+    adjusted[["Open", "High", "Low", "Close"]] /= 10
+    adjusted["Volume"] *= 10
+    engine.update({"X": adjusted})
+    assert_matches(engine.compute(["X"])["X"], per_symbol(adjusted.iloc[1:]) | {
+        "macd": per_symbol(adjusted)["macd"],
+        "macd_signal": per_symbol(adjusted)["macd_signal"],
+    })
+
+    # A dividend adjustment without any new bar
+    dividend = adjusted.copy()
+    dividend.iloc[:-20, dividend.columns.get_loc("Close")] *= 0.99
+    engine.update({"X": dividend})
+    assert_matches(engine.compute(["X"])["X"], per_symbol(dividend.iloc[1:]) | {
+        "macd": per_symbol(dividend)["macd"],
+        "macd_signal": per_symbol(dividend)["macd_signal"],
+    })
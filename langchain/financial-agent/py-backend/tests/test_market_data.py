@@ -0,0 +1,158 @@
+import asyncio
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import market_data
+from market_data import (
+    MARKET_TIMEZONE,
+    MIN_TTL,
+    MarketDataService,
+    history_ttl,
+    is_market_open,
+    market_ttl,
+    seconds_until_market_open,
+)
+from rate_limiter import InMemoryBackend, RateLimiter
+
+
+def market_time(value):
+    return datetime.fromisoformat(value).replace(tzinfo=MARKET_TIMEZONE)
+
+
+class FakeTicker:
+    """Stands in for yfinance.Ticker, counting upstream fetches"""
+
+    calls = []
+    empty = False
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+
+    @property
+    def info(self):
+        self.calls.append(("info", self.symbol))
+        time.sleep(0.05)
+        return {} if self.empty else {"shortName": self.symbol, "regularMarketPrice": 10.0}
+
+    def history(self, period, interval):
+        self.calls.append(("history", self.symbol, period, interval))
+        index = pd.date_range("2025-01-01", periods=30, freq="B", tz="America/New_York")
+        close = 100.25 + np.arange(30.0) * 0.5
+        return pd.DataFrame(
+            {"Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+             "Volume": np.arange(30) * 1000 + 50_000},
+            index=index
+        )
+
+    @property
+    def news(self):
+        self.calls.append(("news", self.symbol))
+        return [{"content": {"title": "Headline"}}]
+
+
+@pytest.fixture(autouse=True)
+def fake_ticker(monkeypatch):
+    FakeTicker.calls = []
+    FakeTicker.empty = False
+    monkeypatch.setattr(market_data.yf, "Ticker", FakeTicker)
+    return FakeTicker
+
+
+def test_market_hours():
+    assert is_market_open(market_time("2026-10-16 10:00"))
+    assert not is_market_open(market_time("2026-10-16 17:00"))
+    assert not is_market_open(market_time("2026-10-17 12:00"))
+    assert seconds_until_market_open(market_time("2026-10-16 10:00")) == 0
+    # Friday after the close until Monday's open
+    assert seconds_until_market_open(market_time("2026-10-16 16:00")) == (2 * 24 + 17.5) * 3600
+
+
+def test_ttls_follow_the_session():
+    assert market_ttl(1, market_time("2026-10-16 10:00")) == MIN_TTL
+    assert market_ttl(300, market_time("2026-10-16 10:00")) == 300
+    assert market_ttl(300, market_time("2026-10-19 09:00")) == 30 * 60
+    assert history_ttl("5m", market_time("2026-10-16 10:00")) == 300
+    assert history_ttl("1d", market_time("2026-10-16 10:00")) == market_data.DAILY_HISTORY_TTL_OPEN
+
+
+def test_concurrent_requests_share_one_fetch(fake_ticker):
+    service = MarketDataService()
+
+    async def main():
+        return await asyncio.gather(*(service.get_quote(" aapl ") for _ in range(5)))
+
+    quotes = asyncio.run(main())
+
+    assert all(quote["shortName"] == "AAPL" for quote in quotes)
+    assert fake_ticker.calls == [("info", "AAPL")]
+    assert (service.hits, service.misses) == (4, 1)
+
+
+def test_cached_until_expired(fake_ticker, monkeypatch):
+    service = MarketDataService()
+
+    async def main():
+        await service.get_news("AAPL")
+        await service.get_news("AAPL")
+        monkeypatch.setattr(market_data, "NEWS_TTL", -1)
+        service._entries.clear()
+        await service.get_news("AAPL")
+        await service.get_news("AAPL")
+
+    asyncio.run(main())
+    assert fake_ticker.calls == [("news", "AAPL")] * 3
+
+
+def test_empty_results_are_not_cached(fake_ticker):
+    fake_ticker.empty = True
+    service = MarketDataService()
+
+    async def main():
+        await service.get_quote("AAPL")
+        await service.get_quote("AAPL")
+
+    asyncio.run(main())
+    assert len(fake_ticker.calls) == 2
+
+
+def test_memory_cache_is_bounded(fake_ticker):
+    service = MarketDataService(max_entries=2)
+
+    async def main():
+        for symbol in ("A", "B", "C", "A"):
+            await service.get_news(symbol)
+
+    asyncio.run(main())
+    assert [call[1] for call in fake_ticker.calls] == ["A", "B", "C", "A"]
+
+
+def test_disk_cache_is_shared_between_services(fake_ticker, tmp_path):
+    async def main():
+        first = await MarketDataService(cache_dir=str(tmp_path)).get_history("AAPL", "1y")
+        second = await MarketDataService(cache_dir=str(tmp_path)).get_history("AAPL", "1y")
+        return first, second
+
+    first, second = asyncio.run(main())
+
+    assert len(fake_ticker.calls) == 1
+    assert str(second.index.tz) == "America/New_York"
+    # The index resolution may differ after the JSON round trip
+    pd.testing.assert_frame_equal(second, first, check_freq=False, check_index_type=False)
+
+
+def test_only_upstream_fetches_are_rate_limited(fake_ticker):
+    limiter = RateLimiter("yahoo", {"minute": (60, 60)}, InMemoryBackend())
+    service = MarketDataService(rate_limiter=limiter)
+
+    async def main():
+        await service.get_quote("AAPL")
+        await service.get_quote("AAPL")
+        await service.get_history("AAPL")
+
+    asyncio.run(main())
+    requests = {tool: stats["requests"] for tool, stats in limiter.metrics()["tools"].items()}
+    assert requests == {"quote": 1, "history": 1}
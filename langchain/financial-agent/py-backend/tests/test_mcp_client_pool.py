@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from app.libs import mcp_client_factory
+from app.libs.mcp_client_factory import MCPClientPool
+
+
+class FakeClient:
+    """Stands in for a started strands MCPClient"""
+
+    def __init__(self, url, tools):
+        self.url = url
+        self.tools = tools
+        self.healthy = True
+        self.stopped = False
+
+    def list_tools_sync(self):
+        if not self.healthy:
+            raise ConnectionError(f"{self.url} went away")
+        return self.tools
+
+    def stop(self, *args):
+        self.stopped = True
+
+
+@pytest.fixture
+def servers(monkeypatch):
+    """Fake MCP servers by URL; opening a URL that is not up fails"""
+    state = {"up": {}, "opened": []}
+
+    def open_session(url):
+        state["opened"].append(url)
+        if url not in state["up"]:
+            raise ConnectionError(f"cannot connect to {url}")
+        client = FakeClient(url, list(state["up"][url]))
+        state.setdefault("clients", []).append(client)
+        return client, list(client.tools)
+
+    monkeypatch.setattr(MCPClientPool, "_open", staticmethod(open_session))
+    monkeypatch.setattr(mcp_client_factory, "RECONNECT_MIN_BACKOFF", 0.05)
+    return state
+
+
+def test_sessions_are_reused(servers):
+    servers["up"] = {"http://a/mcp": ["a1", "a2"], "http://b/mcp": ["b1"]}
+    pool = MCPClientPool()
+
+    async def main():
+        results = await asyncio.gather(*(
+            pool.get_clients(["http://a/mcp", "http://b/mcp", "http://a/mcp"]) for _ in range(3)
+        ))
+        again = await pool.get_clients(["http://b/mcp"])
+        await pool.close()
+        return results, again
+
+    results, again = asyncio.run(main())
+
+    assert sorted(servers["opened"]) == ["http://a/mcp", "http://b/mcp"]
+    clients, tools = results[0]
+    assert [client.url for client in clients] == ["http://a/mcp", "http://b/mcp"]
+    assert tools == ["a1", "a2", "b1"]
+    assert all(result[0] == clients for result in results)
+    assert again[0] == [clients[1]]
+    assert all(client.stopped for client in clients)
+
+
+def test_unavailable_servers_are_skipped_until_their_backoff_ends(servers):
+    servers["up"] = {"http://a/mcp": ["a1"]}
+    pool = MCPClientPool()
+
+    async def main():
+        first = await pool.get_clients(["http://a/mcp", "http://down/mcp"])
+        # Still in backoff, so the request does not try again
+        second = await pool.get_clients(["http://a/mcp", "http://down/mcp"])
+        status = pool.status()
+        await asyncio.sleep(0.1)
+        servers["up"]["http://down/mcp"] = ["d1"]
+        third = await pool.get_clients(["http://down/mcp"])
+        await pool.close()
+        return first, second, status, third
+
+    first, second, status, third = asyncio.run(main())
+
+    assert first[1] == second[1] == ["a1"]
+    assert servers["opened"].count("http://down/mcp") == 2
+    down = next(server for server in status if server["url"] == "http://down/mcp")
+    assert not down["connected"]
+    assert down["failures"] == 1
+    assert "cannot connect" in down["last_error"]
+    assert third[1] == ["d1"]
+
+
+def test_health_checks_refresh_tools_and_evict_dead_sessions(servers):
+    servers["up"] = {"http://a/mcp": ["a1"]}
+    pool = MCPClientPool(health_check_interval=0.02)
+
+    async def main():
+        await pool.get_clients(["http://a/mcp"])
+        client = servers["clients"][0]
+        client.tools = ["a1", "a2"]
+        await asyncio.sleep(0.05)
+        refreshed = await pool.get_clients(["http://a/mcp"])
+
+        client.healthy = False
+        del servers["up"]["http://a/mcp"]
+        await asyncio.sleep(0.05)
+        evicted = await pool.get_clients(["http://a/mcp"])
+        status = pool.status()
+
+        # The monitor reconnects once the server is back and the backoff ended
+        servers["up"]["http://a/mcp"] = ["a3"]
+        await asyncio.sleep(0.2)
+        reconnected = await pool.get_clients(["http://a/mcp"])
+        await pool.close()
+        return client, refreshed, evicted, status, reconnected
+
+    client, refreshed, evicted, status, reconnected = asyncio.run(main())
+
+    assert refreshed[1] == ["a1", "a2"]
+    assert client.stopped
+    assert evicted == ([], [])
+    assert status[0]["connected"] is False
+    assert "went away" in status[0]["last_error"]
+    assert reconnected[1] == ["a3"]
+    assert reconnected[0][0] is not client
+
+
+def test_server_urls_from_config():
+    config = {"mcp_servers": [
+        {"host": "localhost", "port": 8083},
+        {"host": "example.com", "port": 443, "protocol": "https"},
+        {"host": "missing-port"},
+    ]}
+
+    assert mcp_client_factory.get_mcp_server_urls_from_config(config) == [
+        "http://localhost:8083", "https://example.com:443"
+    ]
+    assert mcp_client_factory.get_mcp_server_urls_from_config({}) == []
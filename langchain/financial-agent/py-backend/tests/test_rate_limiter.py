@@ -0,0 +1,115 @@
+import asyncio
+import time
+
+import pytest
+
+import rate_limiter
+from rate_limiter import InMemoryBackend, RateLimiter, RateLimitExceeded, SQLiteBackend
+
+
+class SlowBackend(InMemoryBackend):
+    """In-memory buckets behind a slow store, like a busy SQLite file"""
+
+    def try_acquire(self, buckets, cost=1.0):
+        time.sleep(0.05)
+        return super().try_acquire(buckets, cost)
+
+
+def test_bucket_allows_bursts_up_to_capacity():
+    backend = InMemoryBackend()
+    buckets = [("b", 3.0, 1.0)]
+
+    assert [backend.try_acquire(buckets) for _ in range(3)] == [0, 0, 0]
+    assert backend.try_acquire(buckets) == pytest.approx(1.0, abs=0.05)
+
+
+def test_bucket_refills_over_its_period():
+    backend = InMemoryBackend()
+    buckets = [("b", 1.0, 20.0)]
+
+    assert backend.try_acquire(buckets) == 0
+    assert backend.try_acquire(buckets) > 0
+    time.sleep(0.06)
+    assert backend.try_acquire(buckets) == 0
+
+
+def test_all_buckets_or_none():
+    backend = InMemoryBackend()
+    minute, day = ("minute", 5.0, 5.0 / 60), ("day", 1.0, 1.0 / 86400)
+
+    assert backend.try_acquire([minute, day]) == 0
+    assert backend.try_acquire([minute, day]) > 60
+    # The rejected request did not take a token from the minute bucket
+    assert [backend.try_acquire([minute]) for _ in range(4)] == [0, 0, 0, 0]
+
+
+def test_sqlite_buckets_are_shared_between_backends(tmp_path):
+    path = str(tmp_path / "limits.db")
+    first, second = SQLiteBackend(path), SQLiteBackend(path)
+    buckets = [("shared", 2.0, 2.0 / 60)]
+
+    assert first.try_acquire(buckets) == 0
+    assert second.try_acquire(buckets) == 0
+    assert first.try_acquire(buckets) > 0
+
+
+def test_acquire_waits_for_a_token():
+    limiter = RateLimiter("test", {"second": (2, 0.2)}, InMemoryBackend())
+
+    async def main():
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire("tool") for _ in range(4)))
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(main())
+
+    # Two requests burst, the other two wait for refilled tokens
+    assert 0.15 <= elapsed < 1.0
+    stats = limiter.metrics()["tools"]["tool"]
+    assert stats["requests"] == 4
+    assert stats["waited"] == 2
+    assert stats["rejected"] == 0
+    assert 0 < stats["wait_seconds_max"] <= stats["wait_seconds_total"]
+
+
+def test_acquire_rejects_after_max_wait():
+    limiter = RateLimiter("test", {"minute": (1, 60)}, InMemoryBackend())
+
+    async def main():
+        await limiter.acquire("tool")
+        await limiter.acquire("tool", max_wait=1)
+
+    with pytest.raises(RateLimitExceeded):
+        asyncio.run(main())
+    stats = limiter.metrics()["tools"]["tool"]
+    assert (stats["requests"], stats["waited"], stats["rejected"]) == (2, 0, 1)
+
+
+def test_slow_backend_calls_are_not_counted_as_waits():
+    limiter = RateLimiter("test", {"minute": (10, 60)}, SlowBackend())
+
+    async def main():
+        for _ in range(3):
+            await limiter.acquire("tool")
+
+    asyncio.run(main())
+    stats = limiter.metrics()["tools"]["tool"]
+    assert stats["waited"] == 0
+    assert stats["wait_seconds_total"] == 0
+
+
+def test_metrics_report_limits():
+    limiter = RateLimiter("test", {"minute": (10, 60)}, InMemoryBackend())
+
+    assert limiter.metrics()["limits"] == {"test:minute": {"capacity": 10.0, "per_second": 10.0 / 60}}
+
+
+def test_backend_selection(monkeypatch, tmp_path):
+    monkeypatch.setattr(rate_limiter, "_backend", None)
+    monkeypatch.setenv("RATE_LIMIT_BACKEND", "memory")
+    assert isinstance(rate_limiter.get_backend(), InMemoryBackend)
+
+    monkeypatch.setattr(rate_limiter, "_backend", None)
+    monkeypatch.setenv("RATE_LIMIT_BACKEND", "sqlite")
+    monkeypatch.setenv("RATE_LIMIT_DB", str(tmp_path / "limits.db"))
+    assert isinstance(rate_limiter.get_backend(), SQLiteBackend)